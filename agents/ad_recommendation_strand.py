@@ -18,6 +18,9 @@ class AdRecommendationStrand(BaseStrandAgent):
             name="광고 추천 에이전트"
         )
         
+        # 공유 메모리에서 읽는 데이터를 만드는 선행 에이전트
+        self.dependencies = ['data_analyst', 'article_writer']
+        
         self.capabilities = [
             "contextual_ad_matching",
             "financial_product_recommendation",
@@ -6,11 +6,75 @@
 import os
 import json
 import logging
+import asyncio
+import time
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Callable
 
 from .strands_framework import BaseStrandAgent, StrandContext, StrandMessage, MessageType
 
+# LLM 응답 형식의 섹션 표시 (검사 순서 유지)
+SECTION_MARKERS = {
+    'TITLE:': 'title',
+    'LEAD:': 'lead',
+    'BODY:': 'body',
+    'CONCLUSION:': 'conclusion',
+    'IMAGE_PROMPT:': 'image_prompt',
+}
+
+# 제목은 한 줄만 사용하고 나머지 섹션은 이어지는 줄을 붙임
+MULTILINE_SECTIONS = ('lead', 'body', 'conclusion', 'image_prompt')
+
+
+class ArticleStreamParser:
+    """TITLE/LEAD/BODY/CONCLUSION/IMAGE_PROMPT 형식 응답을 줄 단위로 점진 파싱"""
+    
+    def __init__(self):
+        self.sections: Dict[str, str] = {name: "" for name in SECTION_MARKERS.values()}
+        self.current_section: Optional[str] = None
+        self._buffer = ""
+    
+    def feed(self, chunk: str) -> bool:
+        """텍스트 조각 추가 (새 섹션이 시작되면 True)"""
+        self._buffer += chunk
+        section_started = False
+        while '\n' in self._buffer:
+            line, self._buffer = self._buffer.split('\n', 1)
+            section_started |= self._consume_line(line, self.sections)
+        return section_started
+    
+    def close(self):
+        """남은 마지막 줄 처리"""
+        if self._buffer:
+            self._consume_line(self._buffer, self.sections)
+            self._buffer = ""
+    
+    def snapshot(self) -> Dict[str, str]:
+        """현재까지의 섹션 내용 (아직 줄바꿈이 오지 않은 부분 포함)"""
+        sections = dict(self.sections)
+        current = self.current_section
+        if self._buffer.strip():
+            self._consume_line(self._buffer, sections)
+            self.current_section = current
+        return sections
+    
+    def _consume_line(self, line: str, sections: Dict[str, str]) -> bool:
+        line = line.strip()
+        if not line:
+            return False
+        
+        for marker, name in SECTION_MARKERS.items():
+            if line.startswith(marker):
+                sections[name] = line.replace(marker, '').strip()
+                self.current_section = name
+                return True
+        
+        # 현재 섹션에 내용 추가
+        if self.current_section in MULTILINE_SECTIONS and sections[self.current_section]:
+            sections[self.current_section] += " " + line
+        return False
+
+
 class ArticleWriterStrand(BaseStrandAgent):
     """기사 작성 Strand Agent"""
     
@@ -20,6 +84,9 @@ class ArticleWriterStrand(BaseStrandAgent):
             name="기사 작성 에이전트"
         )
         
+        # 공유 메모리에서 읽는 데이터를 만드는 선행 에이전트
+        self.dependencies = ['data_analyst']
+        
         self.capabilities = [
             "economic_article_writing",
             "market_analysis_writing",
@@ -46,6 +113,9 @@ class ArticleWriterStrand(BaseStrandAgent):
                 'focus_areas': ['변동성 원인', '시장 불안 요인', '투자 전략', '리스크 관리']
             }
         }
+        
+        # 스트리밍 생성 시 부분 기사 전달 최소 간격 (초)
+        self.stream_update_interval = 0.3
     
     def get_capabilities(self) -> List[str]:
         """에이전트 능력 반환"""
@@ -68,8 +138,10 @@ class ArticleWriterStrand(BaseStrandAgent):
             # 1. 기사 구조 생성
             article_structure = await self._create_article_structure(event_data, data_analysis)
             
-            # 2. 기사 내용 생성
-            article_content = await self._generate_article_content(article_structure, event_data, data_analysis)
+            # 2. 기사 내용 생성 (스트리밍 콜백이 있으면 섹션을 받는 대로 전달)
+            stream_callback = context.input_data.get('article_stream_callback')
+            article_content = await self._generate_article_content(article_structure, event_data, data_analysis,
+                                                                   stream_callback=stream_callback)
             
             # 3. 기사 메타데이터 생성
             article_metadata = await self._create_article_metadata(event_data, article_content)
@@ -128,8 +200,13 @@ class ArticleWriterStrand(BaseStrandAgent):
         
         return structure
     
-    async def _generate_article_content(self, structure: Dict[str, Any], event_data: Dict[str, Any], data_analysis: Optional[Dict[str, Any]]) -> Dict[str, Any]:
-        """기사 내용 생성"""
+    async def _generate_article_content(self, structure: Dict[str, Any], event_data: Dict[str, Any], data_analysis: Optional[Dict[str, Any]],
+                                        stream_callback: Optional[Callable] = None) -> Dict[str, Any]:
+        """기사 내용 생성
+
+        stream_callback(sections, done)이 주어지면 LLM 응답을 스트리밍으로 받으면서
+        파싱된 섹션을 중간중간 전달
+        """
         
         symbol = event_data.get('symbol', 'Unknown')
         event_type = event_data.get('event_type', 'unknown')
@@ -143,7 +220,10 @@ class ArticleWriterStrand(BaseStrandAgent):
         # LLM 호출
         if self.llm:
             try:
-                article_text = await self.call_llm(system_prompt, user_prompt)
+                if stream_callback:
+                    article_text = await self._stream_article_text(system_prompt, user_prompt, stream_callback)
+                else:
+                    article_text = await self.call_llm(system_prompt, user_prompt)
                 
                 # 기사 파싱
                 parsed_article = await self._parse_article_response(article_text)
@@ -157,6 +237,34 @@ class ArticleWriterStrand(BaseStrandAgent):
             # LLM이 없으면 템플릿 기반 생성
             return await self._generate_template_article(structure, event_data, data_analysis)
     
+    async def _stream_article_text(self, system_prompt: str, user_prompt: str, stream_callback: Callable) -> str:
+        """LLM 응답을 스트리밍으로 받으면서 부분 섹션을 콜백으로 전달하고 전체 텍스트 반환"""
+        parser = ArticleStreamParser()
+        chunks = []
+        last_emit = 0.0
+        
+        async for chunk in self.call_llm_stream(system_prompt, user_prompt):
+            chunks.append(chunk)
+            section_started = parser.feed(chunk)
+            now = time.monotonic()
+            # 새 섹션 시작 시 또는 일정 간격마다 화면 갱신
+            if section_started or now - last_emit >= self.stream_update_interval:
+                await self._emit_partial_article(stream_callback, parser.snapshot(), False)
+                last_emit = now
+        
+        parser.close()
+        await self._emit_partial_article(stream_callback, parser.snapshot(), True)
+        return "".join(chunks)
+    
+    async def _emit_partial_article(self, stream_callback: Callable, sections: Dict[str, str], done: bool):
+        """부분 기사 전달 (콜백 오류는 기사 생성에 영향을 주지 않음)"""
+        try:
+            result = stream_callback(sections, done)
+            if asyncio.iscoroutine(result):
+                await result
+        except Exception as e:
+            self.logger.warning(f"⚠️ 부분 기사 전달 실패: {e}")
+    
     def _create_system_prompt(self) -> str:
         """시스템 프롬프트 생성"""
         return """당신은 전문 경제 기자입니다. 주어진 경제 이벤트와 데이터 분석을 바탕으로 정확하고 객관적인 경제 기사를 작성해주세요.
@@ -258,46 +366,15 @@ IMAGE_PROMPT: [기사 내용을 바탕으로 한 이미지 생성 프롬프트 -
         """LLM 응답 파싱"""
         
         try:
-            lines = article_text.strip().split('\n')
-            
-            title = ""
-            lead = ""
-            body = ""
-            conclusion = ""
-            image_prompt = ""
-            
-            current_section = None
+            parser = ArticleStreamParser()
+            parser.feed(article_text.strip())
+            parser.close()
             
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-                
-                if line.startswith('TITLE:'):
-                    title = line.replace('TITLE:', '').strip()
-                    current_section = 'title'
-                elif line.startswith('LEAD:'):
-                    lead = line.replace('LEAD:', '').strip()
-                    current_section = 'lead'
-                elif line.startswith('BODY:'):
-                    body = line.replace('BODY:', '').strip()
-                    current_section = 'body'
-                elif line.startswith('CONCLUSION:'):
-                    conclusion = line.replace('CONCLUSION:', '').strip()
-                    current_section = 'conclusion'
-                elif line.startswith('IMAGE_PROMPT:'):
-                    image_prompt = line.replace('IMAGE_PROMPT:', '').strip()
-                    current_section = 'image_prompt'
-                else:
-                    # 현재 섹션에 내용 추가
-                    if current_section == 'lead' and lead:
-                        lead += " " + line
-                    elif current_section == 'body' and body:
-                        body += " " + line
-                    elif current_section == 'conclusion' and conclusion:
-                        conclusion += " " + line
-                    elif current_section == 'image_prompt' and image_prompt:
-                        image_prompt += " " + line
+            title = parser.sections['title']
+            lead = parser.sections['lead']
+            body = parser.sections['body']
+            conclusion = parser.sections['conclusion']
+            image_prompt = parser.sections['image_prompt']
             
             return {
                 'title': title or "경제 뉴스",
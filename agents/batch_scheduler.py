@@ -0,0 +1,205 @@
+"""
+다중 이벤트 배치 스케줄러
+자원 종류(시장 데이터 조회, LLM 호출, 차트 렌더링)별 동시 실행 수를 제한하고
+심각도가 높은 이벤트부터 처리하며, 완료되는 순서대로 결과를 돌려줌
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+RESOURCE_MARKET_DATA = "market_data"
+RESOURCE_LLM = "llm"
+RESOURCE_CHART = "chart"
+
+# 자원별 기본 동시 실행 한도
+DEFAULT_RESOURCE_LIMITS = {
+    RESOURCE_MARKET_DATA: 4,
+    RESOURCE_LLM: 3,
+    RESOURCE_CHART: 2,
+}
+
+# 동시에 진행할 이벤트 수 기본값
+DEFAULT_MAX_CONCURRENT_EVENTS = 4
+
+# 문자열 심각도 순위 (숫자 심각도는 0-1 값을 그대로 사용)
+SEVERITY_RANK = {
+    'critical': 1.0,
+    'high': 0.8,
+    'medium': 0.5,
+    'low': 0.2,
+}
+
+
+def severity_priority(event: Dict[str, Any]) -> float:
+    """이벤트 심각도를 정렬용 점수로 변환 (클수록 먼저 처리)"""
+    severity = event.get('severity', 0)
+    if isinstance(severity, str):
+        return SEVERITY_RANK.get(severity.lower(), 0.0)
+    try:
+        return float(severity)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class ResourceLimiter:
+    """자원 종류별 동시 실행 제한기
+
+    세마포어는 실행 중인 이벤트 루프별로 만들어 asyncio.run()을 여러 번 호출해도 안전함
+    """
+
+    def __init__(self, limits: Optional[Dict[str, int]] = None):
+        self.limits = {**DEFAULT_RESOURCE_LIMITS, **(limits or {})}
+        self.logger = logging.getLogger(__name__)
+        self._semaphores: Dict[Any, Dict[str, asyncio.Semaphore]] = {}
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    def _semaphore(self, resource: str) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        per_loop = self._semaphores.setdefault(loop, {})
+        if resource not in per_loop:
+            # 이전 루프의 세마포어는 더 이상 쓸 수 없으므로 정리
+            for stale in [key for key in self._semaphores if key is not loop and key.is_closed()]:
+                del self._semaphores[stale]
+            per_loop[resource] = asyncio.Semaphore(max(1, int(self.limits.get(resource, 1))))
+        return per_loop[resource]
+
+    @asynccontextmanager
+    async def limit(self, resource: str):
+        """자원 사용 구간 (한도를 넘으면 대기)"""
+        stats = self._stats.setdefault(resource, {'acquired': 0, 'active': 0, 'peak': 0, 'wait_seconds': 0.0})
+        semaphore = self._semaphore(resource)
+        started = time.perf_counter()
+        async with semaphore:
+            stats['wait_seconds'] += time.perf_counter() - started
+            stats['acquired'] += 1
+            stats['active'] += 1
+            stats['peak'] = max(stats['peak'], stats['active'])
+            try:
+                yield
+            finally:
+                stats['active'] -= 1
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """자원별 사용 통계"""
+        return {
+            resource: {**stats, 'limit': self.limits.get(resource)}
+            for resource, stats in self._stats.items()
+        }
+
+
+_resource_limiter: Optional[ResourceLimiter] = None
+_resource_limiter_lock = threading.Lock()
+
+
+def get_resource_limiter() -> ResourceLimiter:
+    """프로세스 전역 자원 제한기"""
+    global _resource_limiter
+    with _resource_limiter_lock:
+        if _resource_limiter is None:
+            _resource_limiter = ResourceLimiter()
+        return _resource_limiter
+
+
+def set_resource_limiter(limiter: ResourceLimiter):
+    """전역 자원 제한기 교체 (한도 변경/테스트용)"""
+    global _resource_limiter
+    with _resource_limiter_lock:
+        _resource_limiter = limiter
+
+
+@dataclass
+class EventResult:
+    """이벤트 1건의 처리 결과와 소요 시간"""
+    index: int
+    event: Dict[str, Any]
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    queued_seconds: float = 0.0
+    duration_seconds: float = 0.0
+    finished_at: float = field(default_factory=time.time)
+
+    @property
+    def success(self) -> bool:
+        return self.error is None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'index': self.index,
+            'symbol': self.event.get('symbol', 'Unknown'),
+            'severity': self.event.get('severity'),
+            'success': self.success,
+            'error': self.error,
+            'queued_seconds': round(self.queued_seconds, 3),
+            'duration_seconds': round(self.duration_seconds, 3),
+        }
+
+
+class EventBatchScheduler:
+    """심각도 우선순위 기반 이벤트 배치 실행기"""
+
+    def __init__(self, handler: Callable[[int, Dict[str, Any]], Awaitable[Dict[str, Any]]],
+                 max_concurrent_events: int = DEFAULT_MAX_CONCURRENT_EVENTS,
+                 event_timeout: Optional[float] = None):
+        self.handler = handler
+        self.max_concurrent_events = max(1, max_concurrent_events)
+        self.event_timeout = event_timeout
+        self.logger = logging.getLogger(__name__)
+
+    def order_events(self, events: List[Dict[str, Any]]) -> List[int]:
+        """처리 순서 (심각도 내림차순, 같으면 입력 순서)"""
+        return sorted(range(len(events)), key=lambda i: (-severity_priority(events[i]), i))
+
+    async def iter_results(self, events: List[Dict[str, Any]]) -> AsyncIterator[EventResult]:
+        """완료되는 순서대로 EventResult를 돌려주는 비동기 이터레이터"""
+        if not events:
+            return
+
+        pending = asyncio.Queue()
+        for index in self.order_events(events):
+            pending.put_nowait(index)
+
+        completed: asyncio.Queue = asyncio.Queue()
+        batch_started = time.perf_counter()
+
+        async def worker():
+            while True:
+                try:
+                    index = pending.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                await completed.put(await self._run_event(index, events[index], batch_started))
+
+        workers = [asyncio.create_task(worker()) for _ in range(min(self.max_concurrent_events, len(events)))]
+        try:
+            for _ in range(len(events)):
+                yield await completed.get()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def run(self, events: List[Dict[str, Any]]) -> List[EventResult]:
+        """전체 배치 실행 (결과는 입력 순서로 정렬)"""
+        results = [result async for result in self.iter_results(events)]
+        return sorted(results, key=lambda result: result.index)
+
+    async def _run_event(self, index: int, event: Dict[str, Any], batch_started: float) -> EventResult:
+        started = time.perf_counter()
+        outcome = EventResult(index=index, event=event, queued_seconds=started - batch_started)
+        try:
+            if self.event_timeout is not None:
+                outcome.result = await asyncio.wait_for(self.handler(index, event), timeout=self.event_timeout)
+            else:
+                outcome.result = await self.handler(index, event)
+        except asyncio.TimeoutError:
+            outcome.error = f"처리 시간 초과 ({self.event_timeout}초)"
+        except Exception as e:
+            outcome.error = str(e) or e.__class__.__name__
+        outcome.duration_seconds = time.perf_counter() - started
+        outcome.finished_at = time.time()
+        return outcome
@@ -9,67 +9,34 @@ import yfinance as yf
 import pandas as pd
 import numpy as np
 import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import matplotlib.pyplot as plt
-import matplotlib
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 import json
 
-# Matplotlib 설정 개선
-matplotlib.use('Agg')
-
-# 한글 폰트 설정
-import matplotlib.font_manager as fm
-import platform
-
-# 시스템별 폰트 설정
-def setup_matplotlib_fonts():
-    """matplotlib 폰트 설정"""
-    if platform.system() == 'Linux':
-        # Linux에서 사용 가능한 폰트들 시도
-        font_candidates = [
-            'NanumGothic', 'NanumBarunGothic', 'DejaVu Sans', 
-            'Liberation Sans', 'Arial', 'sans-serif'
-        ]
-        
-        for font_name in font_candidates:
-            try:
-                # 폰트가 존재하는지 확인
-                font_path = fm.findfont(fm.FontProperties(family=font_name))
-                if font_path:
-                    plt.rcParams['font.family'] = font_name
-                    break
-            except:
-                continue
-        else:
-            # 모든 폰트가 실패한 경우 기본 설정
-            plt.rcParams['font.family'] = 'sans-serif'
-    
-    # 공통 설정
-    plt.rcParams['axes.unicode_minus'] = False
-    plt.rcParams['font.size'] = 12
-    plt.rcParams['axes.titlesize'] = 16
-    plt.rcParams['axes.labelsize'] = 14
-    plt.rcParams['xtick.labelsize'] = 12
-    plt.rcParams['ytick.labelsize'] = 12
-    plt.rcParams['legend.fontsize'] = 12
-
-# 폰트 설정 실행
-setup_matplotlib_fonts()
-
 from .strands_framework import BaseStrandAgent, StrandContext, StrandMessage, MessageType
+from .batch_scheduler import get_resource_limiter, RESOURCE_MARKET_DATA, RESOURCE_CHART
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_monitoring.history_cache import HistoryCache, get_history_cache
+from data_monitoring.indicators import latest_values, indicator_series
+from utils.chart_renderer import ChartRenderService, ChartSpec, get_chart_renderer
 
 class DataAnalysisStrand(BaseStrandAgent):
     """데이터 분석 Strand Agent"""
     
-    def __init__(self):
+    def __init__(self, history_cache: Optional[HistoryCache] = None,
+                 chart_renderer: Optional[ChartRenderService] = None):
         super().__init__(
             agent_id="data_analyst",
             name="데이터 분석 에이전트"
         )
         
+        # 공유 OHLCV 히스토리 캐시 (같은 심볼의 중복 다운로드 방지)
+        self.history_cache = history_cache or get_history_cache()
+        
+        # 차트 렌더링 서비스 (워커 프로세스에서 렌더링, 같은 데이터의 차트는 캐시 재사용)
+        self.chart_renderer = chart_renderer or get_chart_renderer()
+        
         # 출력 디렉토리 설정
         self.charts_dir = "output/charts"
         os.makedirs(self.charts_dir, exist_ok=True)
@@ -100,24 +67,33 @@ class DataAnalysisStrand(BaseStrandAgent):
         
         self.logger.info(f"📊 {symbol} 데이터 분석 시작")
         
+        # 렌더링 워커 예열 (데이터 수집과 겹쳐서 진행, 이미 예열됐으면 무시)
+        self.chart_renderer.start()
+        
         try:
-            # 1. 기본 데이터 수집
-            analysis_result = await self._collect_basic_data(symbol)
-            
-            # 2. 기술적 지표 계산
-            technical_indicators = await self._calculate_technical_indicators(symbol)
-            analysis_result['technical_indicators'] = technical_indicators
-            
-            # 3. 통계 분석
-            statistics = await self._calculate_statistics(symbol)
-            analysis_result['statistics'] = statistics
-            
-            # 4. 시장 비교 분석
-            market_comparison = await self._market_comparison_analysis(symbol)
-            analysis_result['market_comparison'] = market_comparison
+            limiter = get_resource_limiter()
+            async with limiter.limit(RESOURCE_MARKET_DATA):
+                # 0. 가장 넓은 구간(3개월)을 먼저 받아 두면 이후 1개월 조회는 캐시에서 잘라서 사용
+                self.history_cache.get_history(symbol, period="3mo")
+                
+                # 1. 기본 데이터 수집
+                analysis_result = await self._collect_basic_data(symbol)
+                
+                # 2. 기술적 지표 계산
+                technical_indicators = await self._calculate_technical_indicators(symbol)
+                analysis_result['technical_indicators'] = technical_indicators
+                
+                # 3. 통계 분석
+                statistics = await self._calculate_statistics(symbol)
+                analysis_result['statistics'] = statistics
+                
+                # 4. 시장 비교 분석
+                market_comparison = await self._market_comparison_analysis(symbol)
+                analysis_result['market_comparison'] = market_comparison
             
             # 5. 차트 생성
-            chart_paths = await self._generate_charts(symbol, analysis_result)
+            async with limiter.limit(RESOURCE_CHART):
+                chart_paths = await self._generate_charts(symbol, analysis_result)
             analysis_result['chart_paths'] = chart_paths
             
             # 6. 이벤트 영향 분석
@@ -140,7 +116,7 @@ class DataAnalysisStrand(BaseStrandAgent):
         try:
             ticker = yf.Ticker(symbol)
             info = ticker.info
-            hist = ticker.history(period="1mo")
+            hist = self.history_cache.get_history(symbol, period="1mo")
             
             if hist.empty:
                 raise Exception(f"데이터를 가져올 수 없습니다: {symbol}")
@@ -168,45 +144,22 @@ class DataAnalysisStrand(BaseStrandAgent):
     async def _calculate_technical_indicators(self, symbol: str) -> Dict[str, Any]:
         """기술적 지표 계산"""
         try:
-            ticker = yf.Ticker(symbol)
-            hist = ticker.history(period="3mo")
+            hist = self.history_cache.get_history(symbol, period="3mo")
             
             if len(hist) < 20:
                 return {}
             
-            # 이동평균
-            sma_20 = hist['Close'].rolling(window=20).mean().iloc[-1]
-            sma_50 = hist['Close'].rolling(window=50).mean().iloc[-1] if len(hist) >= 50 else None
-            
-            # MACD
-            exp1 = hist['Close'].ewm(span=12).mean()
-            exp2 = hist['Close'].ewm(span=26).mean()
-            macd = exp1 - exp2
-            macd_signal = macd.ewm(span=9).mean()
-            
-            # RSI
-            delta = hist['Close'].diff()
-            gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-            rs = gain / loss
-            rsi = 100 - (100 / (1 + rs))
-            
-            # 볼린저 밴드
-            bb_period = 20
-            bb_std = 2
-            sma = hist['Close'].rolling(window=bb_period).mean()
-            std = hist['Close'].rolling(window=bb_period).std()
-            bb_upper = sma + (std * bb_std)
-            bb_lower = sma - (std * bb_std)
+            # 공유 지표 엔진에서 최신 값만 계산 (NaN은 None)
+            values = latest_values(hist)
             
             return {
-                'sma_20': float(sma_20) if not pd.isna(sma_20) else None,
-                'sma_50': float(sma_50) if sma_50 and not pd.isna(sma_50) else None,
-                'macd': float(macd.iloc[-1]) if not pd.isna(macd.iloc[-1]) else None,
-                'macd_signal': float(macd_signal.iloc[-1]) if not pd.isna(macd_signal.iloc[-1]) else None,
-                'rsi': float(rsi.iloc[-1]) if not pd.isna(rsi.iloc[-1]) else None,
-                'bb_upper': float(bb_upper.iloc[-1]) if not pd.isna(bb_upper.iloc[-1]) else None,
-                'bb_lower': float(bb_lower.iloc[-1]) if not pd.isna(bb_lower.iloc[-1]) else None,
+                'sma_20': values['sma_20'],
+                'sma_50': values['sma_50'],
+                'macd': values['macd'],
+                'macd_signal': values['macd_signal'],
+                'rsi': values['rsi'],
+                'bb_upper': values['bollinger_upper'],
+                'bb_lower': values['bollinger_lower'],
                 'current_price': float(hist['Close'].iloc[-1])
             }
         except Exception as e:
@@ -216,8 +169,7 @@ class DataAnalysisStrand(BaseStrandAgent):
     async def _calculate_statistics(self, symbol: str) -> Dict[str, Any]:
         """통계 분석"""
         try:
-            ticker = yf.Ticker(symbol)
-            hist = ticker.history(period="1mo")
+            hist = self.history_cache.get_history(symbol, period="1mo")
             
             if hist.empty:
                 return {}
@@ -257,11 +209,8 @@ class DataAnalysisStrand(BaseStrandAgent):
         """시장 비교 분석"""
         try:
             # SPY와 비교
-            ticker = yf.Ticker(symbol)
-            spy_ticker = yf.Ticker("SPY")
-            
-            hist = ticker.history(period="1mo")
-            spy_hist = spy_ticker.history(period="1mo")
+            hist = self.history_cache.get_history(symbol, period="1mo")
+            spy_hist = self.history_cache.get_history("SPY", period="1mo")
             
             if hist.empty or spy_hist.empty:
                 return {}
@@ -301,36 +250,29 @@ class DataAnalysisStrand(BaseStrandAgent):
             return {}
     
     async def _generate_charts(self, symbol: str, analysis_data: Dict[str, Any]) -> List[str]:
-        """차트 생성"""
+        """차트 생성 (명세를 만들어 렌더링 서비스에서 병렬 렌더링)"""
         chart_paths = []
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
         try:
-            ticker = yf.Ticker(symbol)
-            hist = ticker.history(period="1mo")
+            hist = self.history_cache.get_history(symbol, period="1mo")
             
             if hist.empty:
                 return chart_paths
             
-            # 1. 가격/거래량 차트
-            chart_path = await self._create_price_volume_chart(symbol, hist, timestamp)
-            if chart_path:
-                chart_paths.append(chart_path)
-            
-            # 2. 기술적 분석 차트
-            chart_path = await self._create_technical_chart(symbol, hist, analysis_data, timestamp)
-            if chart_path:
-                chart_paths.append(chart_path)
-            
-            # 3. 최근 동향 차트
-            chart_path = await self._create_recent_trend_chart(symbol, hist, timestamp)
-            if chart_path:
-                chart_paths.append(chart_path)
-            
-            # 4. 시장 비교 차트
-            chart_path = await self._create_market_comparison_chart(symbol, timestamp)
-            if chart_path:
-                chart_paths.append(chart_path)
+            specs = [
+                self._price_volume_chart_spec(symbol, hist),   # 1. 가격/거래량 차트
+                self._technical_chart_spec(symbol, hist, analysis_data),  # 2. 기술적 분석 차트
+                self._recent_trend_chart_spec(symbol, hist),   # 3. 최근 동향 차트
+                self._market_comparison_chart_spec(symbol),    # 4. 시장 비교 차트
+            ]
+            specs = [spec for spec in specs if spec is not None]
+            
+            results = await self.chart_renderer.render_many(specs, self.charts_dir)
+            for spec, result in zip(specs, results):
+                if isinstance(result, Exception):
+                    self.logger.error(f"{spec.chart_type} 차트 생성 실패: {result}")
+                elif result:
+                    chart_paths.append(result)
             
             self.logger.info(f"✅ {symbol} 차트 생성 완료: {len(chart_paths)}개")
             return chart_paths
@@ -339,202 +281,41 @@ class DataAnalysisStrand(BaseStrandAgent):
             self.logger.error(f"차트 생성 실패: {e}")
             return chart_paths
     
-    async def _create_price_volume_chart(self, symbol: str, hist: pd.DataFrame, timestamp: str) -> Optional[str]:
-        """가격/거래량 차트 생성"""
-        try:
-            fig = make_subplots(
-                rows=2, cols=1,
-                shared_xaxes=True,
-                vertical_spacing=0.1,
-                subplot_titles=(f'{symbol} 가격', '거래량'),
-                row_width=[0.7, 0.3]
-            )
-            
-            # 가격 차트
-            fig.add_trace(
-                go.Candlestick(
-                    x=hist.index,
-                    open=hist['Open'],
-                    high=hist['High'],
-                    low=hist['Low'],
-                    close=hist['Close'],
-                    name='가격'
-                ),
-                row=1, col=1
-            )
-            
-            # 거래량 차트
-            fig.add_trace(
-                go.Bar(
-                    x=hist.index,
-                    y=hist['Volume'],
-                    name='거래량',
-                    marker_color='lightblue'
-                ),
-                row=2, col=1
-            )
-            
-            fig.update_layout(
-                title=f'{symbol} 가격 및 거래량',
-                xaxis_rangeslider_visible=False,
-                height=600
-            )
-            
-            chart_path = os.path.join(self.charts_dir, f"{symbol}_price_volume_{timestamp}.html")
-            fig.write_html(chart_path)
-            return chart_path
-            
-        except Exception as e:
-            self.logger.error(f"가격/거래량 차트 생성 실패: {e}")
-            return None
+    def _price_volume_chart_spec(self, symbol: str, hist: pd.DataFrame) -> ChartSpec:
+        """가격/거래량 차트 명세"""
+        return ChartSpec('price_volume', symbol, {'hist': hist[['Open', 'High', 'Low', 'Close', 'Volume']]}, fmt='html')
     
-    async def _create_technical_chart(self, symbol: str, hist: pd.DataFrame, analysis_data: Dict[str, Any], timestamp: str) -> Optional[str]:
-        """기술적 분석 차트 생성"""
-        try:
-            fig = go.Figure()
-            
-            # 가격 라인
-            fig.add_trace(go.Scatter(
-                x=hist.index,
-                y=hist['Close'],
-                mode='lines',
-                name='종가',
-                line=dict(color='blue')
-            ))
-            
-            # 이동평균선
-            technical = analysis_data.get('technical_indicators', {})
-            if technical.get('sma_20'):
-                sma_20_series = hist['Close'].rolling(window=20).mean()
-                fig.add_trace(go.Scatter(
-                    x=hist.index,
-                    y=sma_20_series,
-                    mode='lines',
-                    name='SMA 20',
-                    line=dict(color='orange', dash='dash')
-                ))
-            
-            # 볼린저 밴드
-            if technical.get('bb_upper') and technical.get('bb_lower'):
-                bb_period = 20
-                sma = hist['Close'].rolling(window=bb_period).mean()
-                std = hist['Close'].rolling(window=bb_period).std()
-                bb_upper = sma + (std * 2)
-                bb_lower = sma - (std * 2)
-                
-                fig.add_trace(go.Scatter(
-                    x=hist.index,
-                    y=bb_upper,
-                    mode='lines',
-                    name='볼린저 상단',
-                    line=dict(color='red', dash='dot')
-                ))
-                
-                fig.add_trace(go.Scatter(
-                    x=hist.index,
-                    y=bb_lower,
-                    mode='lines',
-                    name='볼린저 하단',
-                    line=dict(color='red', dash='dot'),
-                    fill='tonexty',
-                    fillcolor='rgba(255,0,0,0.1)'
-                ))
-            
-            fig.update_layout(
-                title=f'{symbol} 기술적 분석',
-                xaxis_title='날짜',
-                yaxis_title='가격',
-                height=500
-            )
-            
-            chart_path = os.path.join(self.charts_dir, f"{symbol}_technical_{timestamp}.html")
-            fig.write_html(chart_path)
-            return chart_path
-            
-        except Exception as e:
-            self.logger.error(f"기술적 분석 차트 생성 실패: {e}")
-            return None
+    def _technical_chart_spec(self, symbol: str, hist: pd.DataFrame, analysis_data: Dict[str, Any]) -> ChartSpec:
+        """기술적 분석 차트 명세 (분석 결과에 있는 지표만 표시)"""
+        # 지표 시계열 (공유 지표 엔진)
+        series = indicator_series(hist['Close'], ['sma_20', 'bollinger_upper', 'bollinger_lower'])
+        technical = analysis_data.get('technical_indicators', {})
+        
+        data = {'close': hist['Close']}
+        if technical.get('sma_20'):
+            data['sma_20'] = series['sma_20']
+        if technical.get('bb_upper') and technical.get('bb_lower'):
+            data['bollinger_upper'] = series['bollinger_upper']
+            data['bollinger_lower'] = series['bollinger_lower']
+        return ChartSpec('technical', symbol, data, fmt='html')
     
-    async def _create_recent_trend_chart(self, symbol: str, hist: pd.DataFrame, timestamp: str) -> Optional[str]:
-        """최근 동향 차트 생성"""
-        try:
-            # 최근 7일 데이터
-            recent_data = hist.tail(7)
-            
-            fig = go.Figure()
-            
-            fig.add_trace(go.Scatter(
-                x=recent_data.index,
-                y=recent_data['Close'],
-                mode='lines+markers',
-                name='종가',
-                line=dict(color='green', width=3),
-                marker=dict(size=8)
-            ))
-            
-            fig.update_layout(
-                title=f'{symbol} 최근 7일 동향',
-                xaxis_title='날짜',
-                yaxis_title='가격',
-                height=400
-            )
-            
-            chart_path = os.path.join(self.charts_dir, f"{symbol}_recent_{timestamp}.html")
-            fig.write_html(chart_path)
-            return chart_path
-            
-        except Exception as e:
-            self.logger.error(f"최근 동향 차트 생성 실패: {e}")
-            return None
+    def _recent_trend_chart_spec(self, symbol: str, hist: pd.DataFrame) -> ChartSpec:
+        """최근 동향 차트 명세 (최근 7일)"""
+        return ChartSpec('recent', symbol, {'close': hist['Close'].tail(7)}, fmt='html')
     
-    async def _create_market_comparison_chart(self, symbol: str, timestamp: str) -> Optional[str]:
-        """시장 비교 차트 생성"""
-        try:
-            ticker = yf.Ticker(symbol)
-            spy_ticker = yf.Ticker("SPY")
-            
-            hist = ticker.history(period="1mo")
-            spy_hist = spy_ticker.history(period="1mo")
-            
-            if hist.empty or spy_hist.empty:
-                return None
-            
-            # 정규화 (첫날을 100으로)
-            symbol_normalized = (hist['Close'] / hist['Close'].iloc[0]) * 100
-            spy_normalized = (spy_hist['Close'] / spy_hist['Close'].iloc[0]) * 100
-            
-            fig = go.Figure()
-            
-            fig.add_trace(go.Scatter(
-                x=hist.index,
-                y=symbol_normalized,
-                mode='lines',
-                name=symbol,
-                line=dict(color='blue')
-            ))
-            
-            fig.add_trace(go.Scatter(
-                x=spy_hist.index,
-                y=spy_normalized,
-                mode='lines',
-                name='SPY (시장)',
-                line=dict(color='red')
-            ))
-            
-            fig.update_layout(
-                title=f'{symbol} vs 시장(SPY) 비교',
-                xaxis_title='날짜',
-                yaxis_title='정규화된 가격 (시작일=100)',
-                height=400
-            )
-            
-            chart_path = os.path.join(self.charts_dir, f"{symbol}_comparison_{timestamp}.html")
-            fig.write_html(chart_path)
-            return chart_path
-            
-        except Exception as e:
-            self.logger.error(f"시장 비교 차트 생성 실패: {e}")
+    def _market_comparison_chart_spec(self, symbol: str) -> Optional[ChartSpec]:
+        """시장 비교 차트 명세 (데이터가 없으면 None)"""
+        hist = self.history_cache.get_history(symbol, period="1mo")
+        spy_hist = self.history_cache.get_history("SPY", period="1mo")
+        
+        if hist.empty or spy_hist.empty:
             return None
+        
+        return ChartSpec('comparison', symbol, {
+            'close': hist['Close'],
+            'market_close': spy_hist['Close'],
+            'market_symbol': 'SPY',
+        }, fmt='html')
     
     async def _analyze_event_impact(self, event_data: Dict[str, Any], analysis_data: Dict[str, Any]) -> Dict[str, Any]:
         """이벤트 영향 분석"""
@@ -4,20 +4,25 @@
 """
 
 import os
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-import numpy as np
+import sys
+import asyncio
 from datetime import datetime
 from typing import Dict, List, Any, Optional
-from wordcloud import WordCloud
 import re
 
 from .strands_framework import BaseStrandAgent, StrandContext, StrandMessage, MessageType
+from .batch_scheduler import get_resource_limiter, RESOURCE_CHART
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.chart_renderer import ChartRenderService, ChartSpec, get_chart_renderer
+
+# 이미지에 표시하는 시각 형식 (분 단위, 캐시 키에 포함됨)
+DISPLAY_TIME_FORMAT = '%Y-%m-%d %H:%M'
 
 class ImageGeneratorStrand(BaseStrandAgent):
     """이미지 생성 Strand Agent"""
     
-    def __init__(self):
+    def __init__(self, chart_renderer: Optional[ChartRenderService] = None):
         super().__init__(
             agent_id="image_generator",
             name="이미지 생성 에이전트"
@@ -27,6 +32,13 @@ class ImageGeneratorStrand(BaseStrandAgent):
         self.images_dir = "output/images"
         os.makedirs(self.images_dir, exist_ok=True)
         
+        # 이미지 렌더링 서비스 (워커 프로세스에서 렌더링, 같은 기사/데이터의 이미지는 캐시 재사용)
+        # 이미지 스타일(폰트/크기)은 렌더링 워커에서 적용
+        self.chart_renderer = chart_renderer or get_chart_renderer()
+        
+        # 공유 메모리에서 읽는 데이터를 만드는 선행 에이전트
+        self.dependencies = ['data_analyst', 'article_writer']
+        
         self.capabilities = [
             "article_illustration",
             "data_visualization",
@@ -34,13 +46,6 @@ class ImageGeneratorStrand(BaseStrandAgent):
             "chart_annotation",
             "infographic_creation"
         ]
-        
-        # 이미지 스타일 설정
-        plt.style.use('default')
-        plt.rcParams['font.family'] = 'DejaVu Sans'
-        plt.rcParams['font.size'] = 10
-        plt.rcParams['axes.titlesize'] = 14
-        plt.rcParams['axes.labelsize'] = 12
     
     def get_capabilities(self) -> List[str]:
         """에이전트 능력 반환"""
@@ -62,23 +67,27 @@ class ImageGeneratorStrand(BaseStrandAgent):
         
         self.logger.info("🖼️ 기사 이미지 생성 시작")
         
+        # 렌더링 워커 예열 (이미 예열됐으면 무시)
+        self.chart_renderer.start()
+        
         try:
-            # 1. 기사 내용 기반 이미지 생성
-            article_image = await self._generate_article_based_image(article, symbol, event_data)
-            
-            # 2. 이벤트 유형별 이미지 생성
-            event_image = None
-            if event_type == 'volume_spike':
-                event_image = await self._create_volume_spike_image(symbol, event_data, data_analysis)
-            elif event_type == 'price_change':
-                event_image = await self._create_price_change_image(symbol, event_data, data_analysis)
-            elif event_type == 'high_volatility':
-                event_image = await self._create_volatility_image(symbol, event_data, data_analysis)
-            else:
-                event_image = await self._create_default_image(symbol, event_data, article)
-            
-            # 3. 워드클라우드 생성
-            wordcloud_path = await self._create_wordcloud(article, symbol)
+            async with get_resource_limiter().limit(RESOURCE_CHART):
+                # 2. 이벤트 유형별 이미지
+                if event_type == 'volume_spike':
+                    event_task = self._create_volume_spike_image(symbol, event_data, data_analysis)
+                elif event_type == 'price_change':
+                    event_task = self._create_price_change_image(symbol, event_data, data_analysis)
+                elif event_type == 'high_volatility':
+                    event_task = self._create_volatility_image(symbol, event_data, data_analysis)
+                else:
+                    event_task = self._create_default_image(symbol, event_data, article)
+                
+                # 1. 기사 내용 기반 이미지, 2. 이벤트 이미지, 3. 워드클라우드를 워커에서 병렬 렌더링
+                article_image, event_image, wordcloud_path = await asyncio.gather(
+                    self._generate_article_based_image(article, symbol, event_data),
+                    event_task,
+                    self._create_wordcloud(article, symbol)
+                )
             
             result = {
                 'article_image': article_image,  # 기사 내용 기반 이미지
@@ -98,326 +107,119 @@ class ImageGeneratorStrand(BaseStrandAgent):
             self.logger.error(f"❌ 이미지 생성 실패: {e}")
             raise
     
+    def _display_time(self, event_data: Optional[Dict[str, Any]],
+                      data_analysis: Optional[Dict[str, Any]] = None) -> str:
+        """이미지에 표시할 시각 (분석 시각 → 이벤트 시각 → 현재 시각 순)
+
+        렌더링 결과는 캐시되어 며칠 뒤 기사에서도 재사용되므로 렌더러가 현재 시각을 그리지 않고
+        명세 데이터에 넣어서 캐시 키에 포함시킴
+        """
+        candidates = [(data_analysis or {}).get('analysis_timestamp'), (event_data or {}).get('timestamp')]
+        for value in candidates:
+            if isinstance(value, datetime):
+                return value.strftime(DISPLAY_TIME_FORMAT)
+            if value:
+                try:
+                    return datetime.fromisoformat(str(value)).strftime(DISPLAY_TIME_FORMAT)
+                except ValueError:
+                    continue
+        return datetime.now().strftime(DISPLAY_TIME_FORMAT)
+    
+    async def _render_image(self, spec: ChartSpec, symbol: str, fallback_title: str, label: str) -> str:
+        """이미지 명세 렌더링 (실패 시 폴백 이미지)"""
+        try:
+            path = await self.chart_renderer.render(spec, self.images_dir)
+            if path:
+                return path
+        except Exception as e:
+            self.logger.error(f"{label} 생성 실패: {e}")
+        return await self._create_simple_fallback_image(symbol, fallback_title, spec.data.get('display_time'))
+    
     async def _generate_article_based_image(self, article: Dict[str, Any], symbol: str, event_data: Dict[str, Any]) -> str:
         """기사 내용을 바탕으로 한 이미지 생성"""
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{symbol}_article_illustration_{timestamp}.png"
-        filepath = os.path.join(self.images_dir, filename)
+        # 기사에서 이미지 프롬프트 추출
+        image_prompt = article.get('image_prompt', '')
         
-        try:
-            # 기사에서 이미지 프롬프트 추출
-            image_prompt = article.get('image_prompt', '')
-            
-            if not image_prompt:
-                # 기사 내용을 바탕으로 프롬프트 생성
-                title = article.get('title', '')
-                body = article.get('body', '')
-                
-                # 키워드 추출
-                keywords = []
-                if 'price' in body.lower() or '가격' in body:
-                    keywords.append('stock price chart')
-                if 'volume' in body.lower() or '거래량' in body:
-                    keywords.append('trading volume')
-                if 'market' in body.lower() or '시장' in body:
-                    keywords.append('financial market')
-                if symbol:
-                    keywords.append(f'{symbol} stock')
-                
-                image_prompt = f"professional financial illustration, {', '.join(keywords)}, modern business style, blue and green color scheme"
-            
-            # 텍스트 기반 이미지 생성 (실제 AI 이미지 생성 대신 정보 이미지 생성)
-            fig, ax = plt.subplots(1, 1, figsize=(12, 8))
-            
-            # 배경 설정
-            ax.set_facecolor('#f8f9fa')
-            fig.patch.set_facecolor('#ffffff')
-            
-            # 제목
-            title_text = article.get('title', '경제 뉴스')
-            ax.text(0.5, 0.85, title_text, ha='center', va='center',
-                   fontsize=20, fontweight='bold', transform=ax.transAxes,
-                   bbox=dict(boxstyle='round,pad=0.5', facecolor='lightblue', alpha=0.8))
-            
-            # 주요 내용 요약
-            lead_text = article.get('lead', '')[:200] + "..."
-            ax.text(0.5, 0.65, lead_text, ha='center', va='center',
-                   fontsize=14, transform=ax.transAxes, wrap=True,
-                   bbox=dict(boxstyle='round,pad=0.5', facecolor='lightyellow', alpha=0.7))
-            
-            # 심볼 및 이벤트 정보
-            info_text = f"심볼: {symbol}\n이벤트: {event_data.get('event_type', 'N/A')}\n생성시간: {datetime.now().strftime('%Y-%m-%d %H:%M')}"
-            ax.text(0.5, 0.35, info_text, ha='center', va='center',
-                   fontsize=12, transform=ax.transAxes,
-                   bbox=dict(boxstyle='round,pad=0.5', facecolor='lightgreen', alpha=0.7))
-            
-            # 이미지 프롬프트 표시
-            if image_prompt:
-                ax.text(0.5, 0.15, f"이미지 컨셉: {image_prompt[:100]}...", 
-                       ha='center', va='center', fontsize=10, 
-                       transform=ax.transAxes, style='italic',
-                       bbox=dict(boxstyle='round,pad=0.3', facecolor='lightgray', alpha=0.5))
-            
-            # 장식 요소 추가
-            ax.add_patch(patches.Rectangle((0.05, 0.05), 0.9, 0.9, 
-                                         linewidth=3, edgecolor='navy', 
-                                         facecolor='none', transform=ax.transAxes))
-            
-            ax.set_xlim(0, 1)
-            ax.set_ylim(0, 1)
-            ax.axis('off')
-            
-            plt.tight_layout()
-            plt.savefig(filepath, dpi=150, bbox_inches='tight', facecolor='white')
-            plt.close()
-            
-            self.logger.info(f"📰 기사 기반 이미지 생성: {filename}")
-            return filepath
-            
-        except Exception as e:
-            self.logger.error(f"기사 기반 이미지 생성 실패: {e}")
-            return await self._create_simple_fallback_image(symbol, "기사 일러스트", timestamp)
+        if not image_prompt:
+            # 기사 내용을 바탕으로 프롬프트 생성
+            body = article.get('body', '')
+            
+            # 키워드 추출
+            keywords = []
+            if 'price' in body.lower() or '가격' in body:
+                keywords.append('stock price chart')
+            if 'volume' in body.lower() or '거래량' in body:
+                keywords.append('trading volume')
+            if 'market' in body.lower() or '시장' in body:
+                keywords.append('financial market')
+            if symbol:
+                keywords.append(f'{symbol} stock')
+            
+            image_prompt = f"professional financial illustration, {', '.join(keywords)}, modern business style, blue and green color scheme"
+        
+        spec = ChartSpec('article_illustration', symbol, {
+            'title': article.get('title', '경제 뉴스'),
+            'lead': article.get('lead', ''),
+            'event_type': event_data.get('event_type', 'N/A'),
+            'image_prompt': image_prompt,
+            'display_time': self._display_time(event_data),
+        })
+        filepath = await self._render_image(spec, symbol, "기사 일러스트", "기사 기반 이미지")
+        self.logger.info(f"📰 기사 기반 이미지 생성: {os.path.basename(filepath)}")
+        return filepath
     
     async def _create_volume_spike_image(self, symbol: str, event_data: Dict[str, Any], data_analysis: Optional[Dict[str, Any]]) -> str:
         """거래량 급증 이미지 생성"""
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{symbol}_volume_spike_{timestamp}.png"
-        filepath = os.path.join(self.images_dir, filename)
-        
-        try:
-            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 8))
-            
-            # 상단: 거래량 비교 차트
-            if data_analysis and data_analysis.get('statistics', {}).get('volume_ratio'):
-                volume_ratio = data_analysis['statistics']['volume_ratio']
-                
-                categories = ['평균 거래량', '현재 거래량']
-                values = [1.0, volume_ratio]
-                colors = ['lightblue', 'red' if volume_ratio > 2 else 'orange']
-                
-                bars = ax1.bar(categories, values, color=colors, alpha=0.7)
-                ax1.set_title(f'{symbol} 거래량 비교', fontsize=16, fontweight='bold')
-                ax1.set_ylabel('거래량 비율')
-                ax1.grid(True, alpha=0.3)
-                
-                # 값 표시
-                for bar, value in zip(bars, values):
-                    height = bar.get_height()
-                    ax1.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                            f'{value:.1f}배', ha='center', va='bottom', fontweight='bold')
-            
-            # 하단: 이벤트 정보
-            ax2.axis('off')
-            
-            # 정보 박스 생성
-            info_text = f"""
-거래량 급증 이벤트
-
-심볼: {symbol}
-이벤트 시간: {event_data.get('timestamp', 'Unknown')[:19]}
-심각도: {event_data.get('severity', 'Unknown').upper()}
-설명: {event_data.get('description', 'N/A')}
-            """.strip()
-            
-            # 텍스트 박스 추가
-            props = dict(boxstyle='round', facecolor='lightgray', alpha=0.8)
-            ax2.text(0.05, 0.95, info_text, transform=ax2.transAxes, fontsize=11,
-                    verticalalignment='top', bbox=props, family='monospace')
-            
-            plt.tight_layout()
-            plt.savefig(filepath, dpi=150, bbox_inches='tight')
-            plt.close()
-            
-            return filepath
-            
-        except Exception as e:
-            self.logger.error(f"거래량 급증 이미지 생성 실패: {e}")
-            # 간단한 폴백 이미지 생성
-            return await self._create_simple_fallback_image(symbol, "거래량 급증", timestamp)
+        statistics = (data_analysis or {}).get('statistics', {})
+        spec = ChartSpec('volume_spike', symbol, {
+            'volume_ratio': statistics.get('volume_ratio'),
+            'timestamp': str(event_data.get('timestamp', 'Unknown'))[:19],
+            'severity': str(event_data.get('severity', 'Unknown')).upper(),
+            'description': event_data.get('description', 'N/A'),
+        })
+        return await self._render_image(spec, symbol, "거래량 급증", "거래량 급증 이미지")
     
     async def _create_price_change_image(self, symbol: str, event_data: Dict[str, Any], data_analysis: Optional[Dict[str, Any]]) -> str:
         """가격 변동 이미지 생성"""
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{symbol}_price_change_{timestamp}.png"
-        filepath = os.path.join(self.images_dir, filename)
-        
-        try:
-            fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 6))
-            
-            # 좌측: 가격 변동 화살표
-            change_percent = event_data.get('change_percent', 0)
-            
-            if change_percent > 0:
-                # 상승 화살표
-                ax1.arrow(0.5, 0.2, 0, 0.6, head_width=0.1, head_length=0.1, 
-                         fc='green', ec='green', linewidth=3)
-                ax1.text(0.5, 0.1, f'+{change_percent:.1f}%', ha='center', va='center',
-                        fontsize=20, fontweight='bold', color='green')
-                direction_text = "상승"
-                color = 'green'
-            else:
-                # 하락 화살표
-                ax1.arrow(0.5, 0.8, 0, -0.6, head_width=0.1, head_length=0.1,
-                         fc='red', ec='red', linewidth=3)
-                ax1.text(0.5, 0.9, f'{change_percent:.1f}%', ha='center', va='center',
-                        fontsize=20, fontweight='bold', color='red')
-                direction_text = "하락"
-                color = 'red'
-            
-            ax1.set_xlim(0, 1)
-            ax1.set_ylim(0, 1)
-            ax1.set_title(f'{symbol} 가격 {direction_text}', fontsize=16, fontweight='bold')
-            ax1.axis('off')
-            
-            # 우측: 기술적 정보
-            ax2.axis('off')
-            
-            info_lines = [f"{symbol} 가격 변동 분석", ""]
-            
-            if data_analysis:
-                raw_data = data_analysis.get('raw_data', {})
-                if raw_data.get('current_price'):
-                    info_lines.append(f"현재가: ${raw_data['current_price']:.2f}")
-                
-                technical = data_analysis.get('technical_indicators', {})
-                if technical.get('rsi'):
-                    rsi = technical['rsi']
-                    rsi_status = "과매수" if rsi > 70 else "과매도" if rsi < 30 else "중립"
-                    info_lines.append(f"RSI: {rsi:.1f} ({rsi_status})")
-                
-                if technical.get('sma_20'):
-                    info_lines.append(f"20일 이평: ${technical['sma_20']:.2f}")
-            
-            info_lines.extend(["", f"분석 시간: {datetime.now().strftime('%Y-%m-%d %H:%M')}"])
-            
-            info_text = "\n".join(info_lines)
-            ax2.text(0.05, 0.95, info_text, transform=ax2.transAxes, fontsize=12,
-                    verticalalignment='top', family='monospace')
-            
-            plt.tight_layout()
-            plt.savefig(filepath, dpi=150, bbox_inches='tight')
-            plt.close()
-            
-            return filepath
-            
-        except Exception as e:
-            self.logger.error(f"가격 변동 이미지 생성 실패: {e}")
-            return await self._create_simple_fallback_image(symbol, "가격 변동", timestamp)
+        raw_data = (data_analysis or {}).get('raw_data', {})
+        technical = (data_analysis or {}).get('technical_indicators', {})
+        spec = ChartSpec('price_change', symbol, {
+            'change_percent': event_data.get('change_percent', 0),
+            'current_price': raw_data.get('current_price'),
+            'rsi': technical.get('rsi'),
+            'sma_20': technical.get('sma_20'),
+            'display_time': self._display_time(event_data, data_analysis),
+        })
+        return await self._render_image(spec, symbol, "가격 변동", "가격 변동 이미지")
     
     async def _create_volatility_image(self, symbol: str, event_data: Dict[str, Any], data_analysis: Optional[Dict[str, Any]]) -> str:
         """변동성 이미지 생성"""
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{symbol}_volatility_{timestamp}.png"
-        filepath = os.path.join(self.images_dir, filename)
+        # 변동성 게이지 값 (연율 %)
+        statistics = (data_analysis or {}).get('statistics', {})
+        if statistics.get('volatility_annualized'):
+            volatility = statistics['volatility_annualized'] * 100
+        else:
+            volatility = 25.0  # 기본값
         
-        try:
-            fig, ax = plt.subplots(1, 1, figsize=(10, 8))
-            
-            # 변동성 게이지 생성
-            if data_analysis and data_analysis.get('statistics', {}).get('volatility_annualized'):
-                volatility = data_analysis['statistics']['volatility_annualized'] * 100
-            else:
-                volatility = 25.0  # 기본값
-            
-            # 게이지 차트 생성
-            theta = np.linspace(0, np.pi, 100)
-            
-            # 배경 호
-            ax.plot(np.cos(theta), np.sin(theta), 'k-', linewidth=8, alpha=0.3)
-            
-            # 변동성 수준에 따른 색상 구간
-            low_theta = theta[theta <= np.pi/3]
-            med_theta = theta[(theta > np.pi/3) & (theta <= 2*np.pi/3)]
-            high_theta = theta[theta > 2*np.pi/3]
-            
-            ax.plot(np.cos(low_theta), np.sin(low_theta), 'g-', linewidth=8, label='낮음 (0-20%)')
-            ax.plot(np.cos(med_theta), np.sin(med_theta), 'y-', linewidth=8, label='보통 (20-40%)')
-            ax.plot(np.cos(high_theta), np.sin(high_theta), 'r-', linewidth=8, label='높음 (40%+)')
-            
-            # 현재 변동성 위치 표시
-            vol_angle = np.pi * (1 - min(volatility / 60, 1))  # 60%를 최대로 정규화
-            needle_x = np.cos(vol_angle)
-            needle_y = np.sin(vol_angle)
-            
-            ax.arrow(0, 0, needle_x*0.8, needle_y*0.8, head_width=0.05, head_length=0.05,
-                    fc='black', ec='black', linewidth=3)
-            
-            # 중앙에 변동성 값 표시
-            ax.text(0, -0.3, f'{volatility:.1f}%', ha='center', va='center',
-                   fontsize=24, fontweight='bold')
-            ax.text(0, -0.45, '연율 변동성', ha='center', va='center',
-                   fontsize=14)
-            
-            ax.set_xlim(-1.2, 1.2)
-            ax.set_ylim(-0.6, 1.2)
-            ax.set_aspect('equal')
-            ax.axis('off')
-            ax.set_title(f'{symbol} 변동성 분석', fontsize=18, fontweight='bold', pad=20)
-            ax.legend(loc='upper right')
-            
-            # 추가 정보 텍스트
-            info_text = f"""
-변동성 수준: {'높음' if volatility > 40 else '보통' if volatility > 20 else '낮음'}
-위험도: {'고위험' if volatility > 40 else '중위험' if volatility > 20 else '저위험'}
-분석 시간: {datetime.now().strftime('%Y-%m-%d %H:%M')}
-            """.strip()
-            
-            ax.text(-1.1, -0.5, info_text, fontsize=10, verticalalignment='top',
-                   bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.7))
-            
-            plt.tight_layout()
-            plt.savefig(filepath, dpi=150, bbox_inches='tight')
-            plt.close()
-            
-            return filepath
-            
-        except Exception as e:
-            self.logger.error(f"변동성 이미지 생성 실패: {e}")
-            return await self._create_simple_fallback_image(symbol, "변동성 분석", timestamp)
+        spec = ChartSpec('volatility', symbol, {
+            'volatility': volatility,
+            'display_time': self._display_time(event_data, data_analysis),
+        })
+        return await self._render_image(spec, symbol, "변동성 분석", "변동성 이미지")
     
     async def _create_default_image(self, symbol: str, event_data: Dict[str, Any], article: Dict[str, Any]) -> str:
         """기본 이미지 생성"""
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{symbol}_default_{timestamp}.png"
-        filepath = os.path.join(self.images_dir, filename)
-        
-        try:
-            fig, ax = plt.subplots(1, 1, figsize=(10, 6))
-            
-            # 심플한 정보 표시 이미지
-            ax.text(0.5, 0.7, symbol, ha='center', va='center',
-                   fontsize=36, fontweight='bold', transform=ax.transAxes)
-            
-            ax.text(0.5, 0.5, article.get('title', '경제 뉴스'), ha='center', va='center',
-                   fontsize=16, transform=ax.transAxes, wrap=True)
-            
-            ax.text(0.5, 0.3, f"이벤트: {event_data.get('event_type', 'Unknown')}", 
-                   ha='center', va='center', fontsize=14, transform=ax.transAxes)
-            
-            ax.text(0.5, 0.1, f"생성 시간: {datetime.now().strftime('%Y-%m-%d %H:%M')}", 
-                   ha='center', va='center', fontsize=12, transform=ax.transAxes)
-            
-            ax.set_xlim(0, 1)
-            ax.set_ylim(0, 1)
-            ax.axis('off')
-            
-            # 배경 색상
-            ax.add_patch(patches.Rectangle((0, 0), 1, 1, facecolor='lightblue', alpha=0.3))
-            
-            plt.tight_layout()
-            plt.savefig(filepath, dpi=150, bbox_inches='tight')
-            plt.close()
-            
-            return filepath
-            
-        except Exception as e:
-            self.logger.error(f"기본 이미지 생성 실패: {e}")
-            return await self._create_simple_fallback_image(symbol, "경제 뉴스", timestamp)
+        spec = ChartSpec('default', symbol, {
+            'title': article.get('title', '경제 뉴스'),
+            'event_type': event_data.get('event_type', 'Unknown'),
+            'display_time': self._display_time(event_data),
+        })
+        return await self._render_image(spec, symbol, "경제 뉴스", "기본 이미지")
     
     async def _create_wordcloud(self, article: Dict[str, Any], symbol: str) -> Optional[str]:
         """워드클라우드 생성"""
@@ -453,63 +255,27 @@ class ImageGeneratorStrand(BaseStrandAgent):
                 return None
             
             # 워드클라우드 생성
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{symbol}_wordcloud_{timestamp}.png"
-            filepath = os.path.join(self.images_dir, filename)
-            
-            wordcloud = WordCloud(
-                width=800, height=400,
-                background_color='white',
-                max_words=50,
-                font_path=None,  # 시스템 기본 폰트 사용
-                colormap='viridis'
-            ).generate(' '.join(filtered_words))
-            
-            plt.figure(figsize=(10, 5))
-            plt.imshow(wordcloud, interpolation='bilinear')
-            plt.axis('off')
-            plt.title(f'{symbol} 기사 키워드', fontsize=16, fontweight='bold', pad=20)
-            plt.tight_layout()
-            plt.savefig(filepath, dpi=150, bbox_inches='tight')
-            plt.close()
-            
-            return filepath
+            return await self.chart_renderer.render(
+                ChartSpec('wordcloud', symbol, {'words': filtered_words}), self.images_dir)
             
         except Exception as e:
             self.logger.error(f"워드클라우드 생성 실패: {e}")
             return None
     
-    async def _create_simple_fallback_image(self, symbol: str, title: str, timestamp: str) -> str:
-        """간단한 폴백 이미지 생성"""
-        
-        filename = f"{symbol}_fallback_{timestamp}.png"
-        filepath = os.path.join(self.images_dir, filename)
+    async def _create_simple_fallback_image(self, symbol: str, title: str, display_time: Optional[str] = None) -> str:
+        """간단한 폴백 이미지 생성 (display_time은 실패한 이미지에 표시하려던 시각)"""
         
         try:
-            fig, ax = plt.subplots(1, 1, figsize=(8, 6))
-            
-            ax.text(0.5, 0.6, symbol, ha='center', va='center',
-                   fontsize=32, fontweight='bold', transform=ax.transAxes)
-            
-            ax.text(0.5, 0.4, title, ha='center', va='center',
-                   fontsize=18, transform=ax.transAxes)
-            
-            ax.text(0.5, 0.2, f"생성 시간: {datetime.now().strftime('%Y-%m-%d %H:%M')}", 
-                   ha='center', va='center', fontsize=12, transform=ax.transAxes)
-            
-            ax.set_xlim(0, 1)
-            ax.set_ylim(0, 1)
-            ax.axis('off')
-            
-            plt.tight_layout()
-            plt.savefig(filepath, dpi=150, bbox_inches='tight')
-            plt.close()
-            
-            return filepath
-            
+            spec = ChartSpec('fallback', symbol, {'title': title, 'display_time': display_time})
+            path = await self.chart_renderer.render(spec, self.images_dir)
+            if path:
+                return path
         except Exception as e:
             self.logger.error(f"폴백 이미지 생성 실패: {e}")
-            # 최후의 수단: 빈 파일 생성
-            with open(filepath, 'w') as f:
-                f.write("Image generation failed")
-            return filepath
+        
+        # 최후의 수단: 빈 파일 생성
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filepath = os.path.join(self.images_dir, f"{symbol}_fallback_{timestamp}.png")
+        with open(filepath, 'w') as f:
+            f.write("Image generation failed")
+        return filepath
@@ -0,0 +1,183 @@
+"""
+LLM 응답 캐시 (SQLite)
+hash(model_id, 시스템 프롬프트, 사용자 프롬프트, 샘플링 파라미터)를 키로 응답을 저장해서
+같은 입력으로 기사를 다시 생성할 때 Bedrock 호출을 생략
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+DEFAULT_CACHE_PATH = 'output/llm_cache.sqlite'
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024  # 전체 응답 크기 상한 (초과 시 오래 안 쓴 항목부터 삭제)
+
+
+def make_cache_key(model_id: str, system_prompt: str, user_prompt: str,
+                   params: Optional[Dict[str, Any]] = None) -> str:
+    """요청 내용 기반 캐시 키 (SHA-256)"""
+    payload = json.dumps({
+        'model_id': model_id,
+        'system': system_prompt,
+        'user': user_prompt,
+        'params': params or {},
+    }, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class LLMResponseCache:
+    """크기 제한이 있는 SQLite LLM 응답 캐시"""
+
+    def __init__(self, db_path: str = DEFAULT_CACHE_PATH, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._initialized = False
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'writes': 0,
+            'evictions': 0,
+            'errors': 0,
+        }
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_responses (
+                    key TEXT PRIMARY KEY,
+                    model_id TEXT,
+                    response TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL,
+                    hits INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_responses_access ON llm_responses(last_access)")
+            conn.commit()
+            self._initialized = True
+        return conn
+
+    def get(self, key: str) -> Optional[str]:
+        """캐시된 응답 조회 (없으면 None)"""
+        try:
+            with self._lock:
+                conn = self._connect()
+                try:
+                    row = conn.execute("SELECT response FROM llm_responses WHERE key = ?", (key,)).fetchone()
+                    if row is not None:
+                        conn.execute(
+                            "UPDATE llm_responses SET last_access = ?, hits = hits + 1 WHERE key = ?",
+                            (time.time(), key)
+                        )
+                        conn.commit()
+                finally:
+                    conn.close()
+        except sqlite3.Error as e:
+            self.stats['errors'] += 1
+            self.logger.warning(f"⚠️ LLM 캐시 조회 실패: {e}")
+            return None
+
+        if row is None:
+            self.stats['misses'] += 1
+            return None
+        self.stats['hits'] += 1
+        return row[0]
+
+    def put(self, key: str, response: str, model_id: str = ""):
+        """응답 저장 후 크기 상한을 넘으면 오래 안 쓴 항목부터 삭제"""
+        size = len(response.encode('utf-8'))
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connect()
+                try:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO llm_responses (key, model_id, response, size, created_at, last_access) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (key, model_id, response, size, now, now)
+                    )
+                    self.stats['writes'] += 1
+                    self._evict(conn)
+                    conn.commit()
+                finally:
+                    conn.close()
+        except sqlite3.Error as e:
+            self.stats['errors'] += 1
+            self.logger.warning(f"⚠️ LLM 캐시 저장 실패: {e}")
+
+    def _evict(self, conn: sqlite3.Connection):
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM llm_responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in conn.execute("SELECT key, size FROM llm_responses ORDER BY last_access ASC").fetchall():
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+            total -= size
+            self.stats['evictions'] += 1
+
+    def clear(self):
+        """캐시 비우기"""
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute("DELETE FROM llm_responses")
+                conn.commit()
+            finally:
+                conn.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """적중률과 저장 현황"""
+        lookups = self.stats['hits'] + self.stats['misses']
+        entries, total_bytes = 0, 0
+        try:
+            with self._lock:
+                conn = self._connect()
+                try:
+                    entries, total_bytes = conn.execute(
+                        "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_responses"
+                    ).fetchone()
+                finally:
+                    conn.close()
+        except sqlite3.Error:
+            pass
+        return {
+            **self.stats,
+            'hit_rate': self.stats['hits'] / lookups if lookups else 0.0,
+            'entries': entries,
+            'total_bytes': total_bytes,
+            'max_bytes': self.max_bytes,
+        }
+
+
+_llm_cache: Optional[LLMResponseCache] = None
+_llm_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """프로세스 전역 LLM 응답 캐시"""
+    global _llm_cache
+    with _llm_cache_lock:
+        if _llm_cache is None:
+            _llm_cache = LLMResponseCache()
+        return _llm_cache
+
+
+def set_llm_cache(cache: Optional[LLMResponseCache]):
+    """전역 LLM 응답 캐시 교체 (None이면 다음 조회 시 기본값으로 생성)"""
+    global _llm_cache
+    with _llm_cache_lock:
+        _llm_cache = cache
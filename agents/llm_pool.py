@@ -0,0 +1,354 @@
+"""
+공유 Bedrock 클라이언트 풀
+모든 Strand Agent가 하나의 boto3 클라이언트/ChatBedrock 인스턴스를 지연 생성해서 함께 사용
+- 연결 재사용 (boto3 클라이언트 1개, 커넥션 풀 공유)
+- 스로틀링 시 동시 호출 한도를 줄이고 지수 백오프로 재시도 (AIMD 방식)
+- 동일한 프롬프트가 동시에 들어오면 한 번만 호출하고 결과를 공유
+- 같은 요청의 응답은 영구 캐시(SQLite)에서 바로 반환
+"""
+
+import asyncio
+import logging
+import random
+import threading
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from .batch_scheduler import get_resource_limiter, RESOURCE_LLM
+from .llm_cache import LLMResponseCache, get_llm_cache, make_cache_key
+
+DEFAULT_REGION = 'us-east-1'
+DEFAULT_MODEL_KWARGS = {
+    "temperature": 0.7,
+    "max_tokens": 4000
+}
+
+# 스로틀링으로 판단하는 오류 문자열
+THROTTLING_MARKERS = (
+    'ThrottlingException',
+    'TooManyRequestsException',
+    'ServiceQuotaExceededException',
+    'Too many requests',
+    'Rate exceeded',
+)
+
+
+def is_throttling_error(error: Exception) -> bool:
+    """스로틀링 오류 여부 (botocore ClientError 코드 또는 메시지로 판단)"""
+    response = getattr(error, 'response', None)
+    if isinstance(response, dict):
+        code = response.get('Error', {}).get('Code', '')
+        if code in THROTTLING_MARKERS:
+            return True
+    message = str(error)
+    return any(marker in message for marker in THROTTLING_MARKERS)
+
+
+def _chunk_text(chunk: Any) -> str:
+    """스트리밍 조각(AIMessageChunk)에서 텍스트만 추출"""
+    content = getattr(chunk, 'content', chunk)
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return "".join(
+            part.get('text', '') if isinstance(part, dict) else str(part)
+            for part in content
+        )
+    return ""
+
+
+class AdaptiveConcurrencyLimiter:
+    """스로틀링에 따라 동시 호출 한도를 조절하는 제한기
+
+    성공이 increase_after번 이어지면 한도를 1 늘리고, 스로틀링이 나면 절반으로 줄임
+    """
+
+    def __init__(self, initial: int = 4, minimum: int = 1, maximum: int = 16, increase_after: int = 10):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = min(max(initial, self.minimum), self.maximum)
+        self.increase_after = increase_after
+        self.active = 0
+        self._successes = 0
+        self._conditions: Dict[Any, asyncio.Condition] = {}
+
+    def _condition(self) -> asyncio.Condition:
+        loop = asyncio.get_running_loop()
+        if loop not in self._conditions:
+            for stale in [key for key in self._conditions if key is not loop and key.is_closed()]:
+                del self._conditions[stale]
+            self._conditions[loop] = asyncio.Condition()
+        return self._conditions[loop]
+
+    @asynccontextmanager
+    async def slot(self):
+        """호출 슬롯 확보 (현재 한도를 넘으면 대기)"""
+        condition = self._condition()
+        async with condition:
+            await condition.wait_for(lambda: self.active < self.limit)
+            self.active += 1
+        try:
+            yield
+        finally:
+            async with condition:
+                self.active -= 1
+                condition.notify_all()
+
+    def on_success(self):
+        self._successes += 1
+        if self._successes >= self.increase_after and self.limit < self.maximum:
+            self.limit += 1
+            self._successes = 0
+
+    def on_throttle(self):
+        self.limit = max(self.minimum, self.limit // 2)
+        self._successes = 0
+
+
+class BedrockClientPool:
+    """프로세스 전역 Bedrock 클라이언트/LLM 호출 계층"""
+
+    def __init__(self, region_name: str = DEFAULT_REGION, max_pool_connections: int = 16,
+                 max_retries: int = 4, base_backoff: float = 1.0, max_backoff: float = 20.0,
+                 limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+                 cache: Optional[LLMResponseCache] = None, cache_enabled: bool = True):
+        self.region_name = region_name
+        self.max_pool_connections = max_pool_connections
+        self.max_retries = max_retries
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.limiter = limiter or AdaptiveConcurrencyLimiter()
+        self._cache = cache
+        self.cache_enabled = cache_enabled
+        self.logger = logging.getLogger(__name__)
+
+        self._lock = threading.Lock()
+        self._client = None
+        self._client_error: Optional[Exception] = None
+        self._llms: Dict[Tuple, Any] = {}
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
+        self.stats = {
+            'clients_created': 0,
+            'llms_created': 0,
+            'calls': 0,
+            'coalesced': 0,
+            'cache_hits': 0,
+            'throttled': 0,
+            'retries': 0,
+            'errors': 0,
+        }
+
+    def get_client(self):
+        """공유 bedrock-runtime 클라이언트 (최초 호출 시 생성, 실패 시 None)"""
+        with self._lock:
+            if self._client is None and self._client_error is None:
+                try:
+                    import boto3
+                    from botocore.config import Config
+
+                    self._client = boto3.client(
+                        'bedrock-runtime',
+                        region_name=self.region_name,
+                        config=Config(
+                            max_pool_connections=self.max_pool_connections,
+                            retries={'max_attempts': 2, 'mode': 'standard'}
+                        )
+                    )
+                    self.stats['clients_created'] += 1
+                    self.logger.info(f"✅ Bedrock 클라이언트 생성 ({self.region_name})")
+                except Exception as e:
+                    self._client_error = e
+                    self.logger.error(f"❌ Bedrock 클라이언트 생성 실패: {e}")
+            return self._client
+
+    def get_llm(self, model_id: str, model_kwargs: Optional[Dict[str, Any]] = None):
+        """모델/파라미터별 공유 ChatBedrock 인스턴스 (생성 실패 시 None)"""
+        params = {**DEFAULT_MODEL_KWARGS, **(model_kwargs or {})}
+        key = (model_id, tuple(sorted(params.items())))
+        if key in self._llms:
+            return self._llms[key]
+
+        client = self.get_client()
+        with self._lock:
+            if key not in self._llms:
+                llm = None
+                if client is not None:
+                    try:
+                        from langchain_aws import ChatBedrock
+
+                        llm = ChatBedrock(client=client, model_id=model_id, model_kwargs=params)
+                        self.stats['llms_created'] += 1
+                    except Exception as e:
+                        self.logger.error(f"❌ ChatBedrock 초기화 실패 ({model_id}): {e}")
+                self._llms[key] = llm
+            return self._llms[key]
+
+    @property
+    def cache(self) -> Optional[LLMResponseCache]:
+        """응답 캐시 (비활성화 시 None)"""
+        if not self.cache_enabled:
+            return None
+        return self._cache if self._cache is not None else get_llm_cache()
+
+    async def invoke(self, model_id: str, system_prompt: str, user_prompt: str,
+                     model_kwargs: Optional[Dict[str, Any]] = None, use_cache: bool = True) -> str:
+        """LLM 호출 (캐시 조회 후, 같은 프롬프트의 동시 요청은 하나로 합침)
+
+        use_cache=False이면 캐시를 읽지 않고 새로 생성한 응답으로 캐시를 갱신
+        """
+        params = {**DEFAULT_MODEL_KWARGS, **(model_kwargs or {})}
+        cache = self.cache
+        cache_key = make_cache_key(model_id, system_prompt, user_prompt, params) if cache is not None else None
+        if cache is not None and use_cache:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                self.stats['cache_hits'] += 1
+                return cached
+
+        loop = asyncio.get_running_loop()
+        key = (id(loop), model_id, system_prompt, user_prompt, tuple(sorted(params.items())))
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.stats['coalesced'] += 1
+            return await asyncio.shield(inflight)
+
+        future = loop.create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._invoke_with_retry(model_id, system_prompt, user_prompt, params)
+            if cache is not None:
+                cache.put(cache_key, result, model_id)
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # 대기자가 없을 때 경고 방지
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def stream(self, model_id: str, system_prompt: str, user_prompt: str,
+                     model_kwargs: Optional[Dict[str, Any]] = None, use_cache: bool = True) -> AsyncIterator[str]:
+        """LLM 응답을 생성되는 대로 텍스트 조각 단위로 반환
+
+        캐시에 있으면 전체 응답을 한 번에 돌려주고, 완료된 응답은 캐시에 저장.
+        스로틀링 재시도는 첫 조각을 받기 전까지만 수행
+        """
+        params = {**DEFAULT_MODEL_KWARGS, **(model_kwargs or {})}
+        cache = self.cache
+        cache_key = make_cache_key(model_id, system_prompt, user_prompt, params) if cache is not None else None
+        if cache is not None and use_cache:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                self.stats['cache_hits'] += 1
+                yield cached
+                return
+
+        llm = self._require_llm(model_id, params)
+        messages = self._build_messages(system_prompt, user_prompt)
+        chunks = []
+
+        attempt = 0
+        while True:
+            async with get_resource_limiter().limit(RESOURCE_LLM):
+                async with self.limiter.slot():
+                    try:
+                        self.stats['calls'] += 1
+                        async for chunk in llm.astream(messages):
+                            text = _chunk_text(chunk)
+                            if text:
+                                chunks.append(text)
+                                yield text
+                        self.limiter.on_success()
+                        break
+                    except Exception as e:
+                        if chunks or not is_throttling_error(e) or attempt >= self.max_retries:
+                            self.stats['errors'] += 1
+                            raise
+                        self.stats['throttled'] += 1
+                        self.limiter.on_throttle()
+
+            attempt += 1
+            await self._backoff(attempt)
+
+        if cache is not None:
+            cache.put(cache_key, "".join(chunks), model_id)
+
+    def _require_llm(self, model_id: str, params: Dict[str, Any]):
+        llm = self.get_llm(model_id, params)
+        if llm is None:
+            raise Exception("LLM이 초기화되지 않았습니다")
+        return llm
+
+    @staticmethod
+    def _build_messages(system_prompt: str, user_prompt: str) -> List[Tuple[str, str]]:
+        # (역할, 내용) 튜플은 LangChain 채팅 모델이 SystemMessage/HumanMessage로 변환
+        return [
+            ("system", system_prompt),
+            ("human", user_prompt)
+        ]
+
+    async def _backoff(self, attempt: int):
+        """슬롯을 반납한 뒤 지수 백오프 (지터 포함)"""
+        delay = min(self.max_backoff, self.base_backoff * (2 ** (attempt - 1))) * random.uniform(0.5, 1.0)
+        self.stats['retries'] += 1
+        self.logger.warning(f"⏳ Bedrock 스로틀링 - {delay:.1f}초 후 재시도 ({attempt}/{self.max_retries}), "
+                            f"동시 호출 한도 {self.limiter.limit}")
+        await asyncio.sleep(delay)
+
+    async def _invoke_with_retry(self, model_id: str, system_prompt: str, user_prompt: str,
+                                 params: Dict[str, Any]) -> str:
+        llm = self._require_llm(model_id, params)
+        messages = self._build_messages(system_prompt, user_prompt)
+
+        attempt = 0
+        while True:
+            async with get_resource_limiter().limit(RESOURCE_LLM):
+                async with self.limiter.slot():
+                    try:
+                        self.stats['calls'] += 1
+                        response = await llm.ainvoke(messages)
+                        self.limiter.on_success()
+                        return response.content
+                    except Exception as e:
+                        if not is_throttling_error(e) or attempt >= self.max_retries:
+                            self.stats['errors'] += 1
+                            raise
+                        self.stats['throttled'] += 1
+                        self.limiter.on_throttle()
+
+            attempt += 1
+            await self._backoff(attempt)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """호출 통계"""
+        return {
+            **self.stats,
+            'concurrency_limit': self.limiter.limit,
+            'active_calls': self.limiter.active,
+            'inflight': len(self._inflight),
+        }
+
+
+_llm_pool: Optional[BedrockClientPool] = None
+_llm_pool_lock = threading.Lock()
+
+
+def get_llm_pool() -> BedrockClientPool:
+    """프로세스 전역 Bedrock 클라이언트 풀"""
+    global _llm_pool
+    with _llm_pool_lock:
+        if _llm_pool is None:
+            _llm_pool = BedrockClientPool()
+        return _llm_pool
+
+
+def set_llm_pool(pool: BedrockClientPool):
+    """전역 클라이언트 풀 교체 (설정 변경/테스트용)"""
+    global _llm_pool
+    with _llm_pool_lock:
+        _llm_pool = pool
@@ -7,7 +7,7 @@ import os
 import json
 import logging
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, AsyncIterator, Callable
 import asyncio
 
 from .strands_framework import BaseStrandAgent, StrandContext, StrandMessage, MessageType, StrandOrchestrator, orchestrator
@@ -16,6 +16,7 @@ from .article_writer_strand import ArticleWriterStrand
 from .review_strand import ReviewStrand
 from .image_generator_strand import ImageGeneratorStrand
 from .ad_recommendation_strand import AdRecommendationStrand
+from .batch_scheduler import EventBatchScheduler, EventResult, get_resource_limiter, DEFAULT_MAX_CONCURRENT_EVENTS
 
 class OrchestratorStrand(BaseStrandAgent):
     """오케스트레이터 Strand Agent"""
@@ -47,6 +48,10 @@ class OrchestratorStrand(BaseStrandAgent):
         
         for dir_path in self.output_dirs.values():
             os.makedirs(dir_path, exist_ok=True)
+        
+        # 다중 이벤트 배치 처리 설정
+        self.max_concurrent_events = DEFAULT_MAX_CONCURRENT_EVENTS
+        self.last_batch_report: List[Dict[str, Any]] = []
     
     def _initialize_agents(self):
         """하위 에이전트들 초기화 및 등록"""
@@ -108,200 +113,42 @@ class OrchestratorStrand(BaseStrandAgent):
             self.logger.error(f"❌ {symbol} 워크플로우 실패: {str(e)}")
             raise
     
-    def execute_data_analysis(self, context: StrandContext) -> Dict[str, Any]:
-        """데이터 분석 실행"""
-        try:
-            self.logger.info("📊 데이터 분석 시작")
-            
-            # 데이터 분석 에이전트 실행
-            analysis_message = StrandMessage(
-                message_type=MessageType.REQUEST,
-                content="데이터 분석 요청",
-                data=context.input_data
-            )
-            
-            # 동기적으로 실행 (Streamlit 호환)
-            import asyncio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            try:
-                result = loop.run_until_complete(
-                    self.data_analyst.process(context, analysis_message)
-                )
-                self.logger.info("✅ 데이터 분석 완료")
-                return result
-            finally:
-                loop.close()
-                
-        except Exception as e:
-            self.logger.error(f"❌ 데이터 분석 실패: {str(e)}")
-            return {}
-    
-    def execute_article_writing(self, context: StrandContext) -> Dict[str, Any]:
-        """기사 작성 실행"""
-        try:
-            self.logger.info("✍️ 기사 작성 시작")
-            
-            writing_message = StrandMessage(
-                message_type=MessageType.REQUEST,
-                content="기사 작성 요청",
-                data=context.input_data
-            )
-            
-            import asyncio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            try:
-                result = loop.run_until_complete(
-                    self.article_writer.process(context, writing_message)
-                )
-                self.logger.info("✅ 기사 작성 완료")
-                return result
-            finally:
-                loop.close()
-                
-        except Exception as e:
-            self.logger.error(f"❌ 기사 작성 실패: {str(e)}")
-            return {}
-    
-    def execute_image_generation(self, context: StrandContext) -> Dict[str, Any]:
-        """이미지 생성 실행"""
-        try:
-            self.logger.info("🎨 이미지 생성 시작")
-            
-            image_message = StrandMessage(
-                message_type=MessageType.REQUEST,
-                content="이미지 생성 요청",
-                data=context.input_data
-            )
-            
-            import asyncio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            try:
-                result = loop.run_until_complete(
-                    self.image_generator.process(context, image_message)
-                )
-                self.logger.info("✅ 이미지 생성 완료")
-                return result
-            finally:
-                loop.close()
-                
-        except Exception as e:
-            self.logger.error(f"❌ 이미지 생성 실패: {str(e)}")
-            return {}
-    
-    def execute_review(self, context: StrandContext) -> Dict[str, Any]:
-        """기사 검수 실행"""
+    def _run_agent_sync(self, agent: BaseStrandAgent, context: StrandContext, request: str) -> Dict[str, Any]:
+        """하위 에이전트를 새 이벤트 루프에서 동기 실행 (Streamlit 호환)"""
+        message = StrandMessage(
+            sender=self.agent_id,
+            receiver=agent.agent_id,
+            message_type=MessageType.TASK_ASSIGNMENT,
+            content={'request': request}
+        )
+        
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
         try:
-            self.logger.info("🔍 기사 검수 시작")
-            
-            review_message = StrandMessage(
-                message_type=MessageType.REQUEST,
-                content="기사 검수 요청",
-                data=context.input_data
-            )
-            
-            import asyncio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            try:
-                result = loop.run_until_complete(
-                    self.reviewer.process(context, review_message)
-                )
-                self.logger.info("✅ 기사 검수 완료")
-                return result
-            finally:
-                loop.close()
-                
-        except Exception as e:
-            self.logger.error(f"❌ 기사 검수 실패: {str(e)}")
-            return {}
+            result = loop.run_until_complete(agent.process(context, message))
+            context.results[agent.agent_id] = result
+            return result
+        finally:
+            loop.close()
     
-    def execute_ad_recommendation(self, context: StrandContext) -> Dict[str, Any]:
-        """광고 추천 실행"""
-        try:
-            self.logger.info("📢 광고 추천 시작")
-            
-            ad_message = StrandMessage(
-                message_type=MessageType.REQUEST,
-                content="광고 추천 요청",
-                data=context.input_data
-            )
-            
-            import asyncio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            try:
-                result = loop.run_until_complete(
-                    self.ad_recommender.process(context, ad_message)
-                )
-                self.logger.info("✅ 광고 추천 완료")
-                return result
-            finally:
-                loop.close()
-                
-        except Exception as e:
-            self.logger.error(f"❌ 광고 추천 실패: {str(e)}")
-            return {}
+    def execute_data_analysis(self, context: StrandContext) -> Dict[str, Any]:
         """데이터 분석 실행"""
         try:
             self.logger.info("📊 데이터 분석 시작")
-            
-            # 데이터 분석 에이전트 실행
-            analysis_message = StrandMessage(
-                message_type=MessageType.REQUEST,
-                content="데이터 분석 요청",
-                data=context.input_data
-            )
-            
-            # 동기적으로 실행 (Streamlit 호환)
-            import asyncio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            try:
-                result = loop.run_until_complete(
-                    self.data_analyst.process(context, analysis_message)
-                )
-                self.logger.info("✅ 데이터 분석 완료")
-                return result
-            finally:
-                loop.close()
-                
+            result = self._run_agent_sync(self.data_analyst, context, "데이터 분석 요청")
+            self.logger.info("✅ 데이터 분석 완료")
+            return result
         except Exception as e:
             self.logger.error(f"❌ 데이터 분석 실패: {str(e)}")
             return {}
     
     def execute_article_writing(self, context: StrandContext) -> Dict[str, Any]:
-        """기사 작성 실행"""
+        """기사 작성 실행 (input_data의 article_stream_callback으로 작성 중인 섹션 전달)"""
         try:
             self.logger.info("✍️ 기사 작성 시작")
-            
-            writing_message = StrandMessage(
-                message_type=MessageType.REQUEST,
-                content="기사 작성 요청",
-                data=context.input_data
-            )
-            
-            import asyncio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            try:
-                result = loop.run_until_complete(
-                    self.article_writer.process(context, writing_message)
-                )
-                self.logger.info("✅ 기사 작성 완료")
-                return result
-            finally:
-                loop.close()
-                
+            result = self._run_agent_sync(self.article_writer, context, "기사 작성 요청")
+            self.logger.info("✅ 기사 작성 완료")
+            return result
         except Exception as e:
             self.logger.error(f"❌ 기사 작성 실패: {str(e)}")
             return {}
@@ -310,26 +157,9 @@ class OrchestratorStrand(BaseStrandAgent):
         """이미지 생성 실행"""
         try:
             self.logger.info("🎨 이미지 생성 시작")
-            
-            image_message = StrandMessage(
-                message_type=MessageType.REQUEST,
-                content="이미지 생성 요청",
-                data=context.input_data
-            )
-            
-            import asyncio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            try:
-                result = loop.run_until_complete(
-                    self.image_generator.process(context, image_message)
-                )
-                self.logger.info("✅ 이미지 생성 완료")
-                return result
-            finally:
-                loop.close()
-                
+            result = self._run_agent_sync(self.image_generator, context, "이미지 생성 요청")
+            self.logger.info("✅ 이미지 생성 완료")
+            return result
         except Exception as e:
             self.logger.error(f"❌ 이미지 생성 실패: {str(e)}")
             return {}
@@ -338,26 +168,9 @@ class OrchestratorStrand(BaseStrandAgent):
         """기사 검수 실행"""
         try:
             self.logger.info("🔍 기사 검수 시작")
-            
-            review_message = StrandMessage(
-                message_type=MessageType.REQUEST,
-                content="기사 검수 요청",
-                data=context.input_data
-            )
-            
-            import asyncio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            try:
-                result = loop.run_until_complete(
-                    self.reviewer.process(context, review_message)
-                )
-                self.logger.info("✅ 기사 검수 완료")
-                return result
-            finally:
-                loop.close()
-                
+            result = self._run_agent_sync(self.reviewer, context, "기사 검수 요청")
+            self.logger.info("✅ 기사 검수 완료")
+            return result
         except Exception as e:
             self.logger.error(f"❌ 기사 검수 실패: {str(e)}")
             return {}
@@ -366,26 +179,9 @@ class OrchestratorStrand(BaseStrandAgent):
         """광고 추천 실행"""
         try:
             self.logger.info("📢 광고 추천 시작")
-            
-            ad_message = StrandMessage(
-                message_type=MessageType.REQUEST,
-                content="광고 추천 요청",
-                data=context.input_data
-            )
-            
-            import asyncio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            try:
-                result = loop.run_until_complete(
-                    self.ad_recommender.process(context, ad_message)
-                )
-                self.logger.info("✅ 광고 추천 완료")
-                return result
-            finally:
-                loop.close()
-                
+            result = self._run_agent_sync(self.ad_recommender, context, "광고 추천 요청")
+            self.logger.info("✅ 광고 추천 완료")
+            return result
         except Exception as e:
             self.logger.error(f"❌ 광고 추천 실패: {str(e)}")
             return {}
@@ -410,9 +206,15 @@ class OrchestratorStrand(BaseStrandAgent):
                 'ad_recommender'     # 5. 광고 추천
             ]
             
+            # 호출자가 스트리밍 콜백을 주면 기사 작성 중간 결과를 실시간 HTML로도 기록
+            input_data = dict(context.input_data)
+            stream_callback = context.input_data.get('article_stream_callback')
+            if stream_callback:
+                input_data['article_stream_callback'] = self._make_live_html_writer(event_data, stream_callback)
+            
             # Strand 실행
             strand_id = f"news_generation_{symbol}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            result_context = await orchestrator.execute_strand(strand_id, context.input_data, workflow)
+            result_context = await orchestrator.execute_strand(strand_id, input_data, workflow)
             
             if result_context.status.value == 'completed':
                 # 최종 패키지 생성
@@ -424,6 +226,9 @@ class OrchestratorStrand(BaseStrandAgent):
                 # Streamlit 페이지 생성
                 streamlit_page = await self._generate_streamlit_page(final_package)
                 
+                # 최종 기사가 저장되었으므로 실시간 미리보기 파일 정리
+                self._remove_live_html(symbol)
+                
                 result = {
                     'status': 'success',
                     'package': final_package,
@@ -439,6 +244,7 @@ class OrchestratorStrand(BaseStrandAgent):
                 raise Exception(f"워크플로우 실행 실패: {result_context.error}")
                 
         except Exception as e:
+            self._remove_live_html(symbol)
             self.logger.error(f"❌ 워크플로우 실행 실패: {e}")
             raise
     
@@ -515,6 +321,39 @@ class OrchestratorStrand(BaseStrandAgent):
             self.logger.error(f"❌ 출력 파일 생성 실패: {e}")
             return output_files
     
+    def _live_html_path(self, symbol: str) -> str:
+        return os.path.join(self.output_dirs['articles'], f"{symbol}_live.html")
+    
+    def _remove_live_html(self, symbol: str):
+        """실시간 미리보기 파일 삭제 (없으면 무시)"""
+        try:
+            os.remove(self._live_html_path(symbol))
+        except OSError:
+            pass
+    
+    def _make_live_html_writer(self, event: Dict[str, Any], downstream: Optional[Callable] = None) -> Callable:
+        """스트리밍 중인 기사 섹션을 {symbol}_live.html로 갱신하는 콜백 생성"""
+        
+        live_path = self._live_html_path(event.get('symbol', 'Unknown'))
+        
+        async def write_partial(sections: Dict[str, str], done: bool):
+            html_content = await self._generate_html_article({'article': sections, 'event': event})
+            if not done:
+                # 생성 중에는 브라우저가 주기적으로 새로고침
+                html_content = html_content.replace('<head>', '<head>\n    <meta http-equiv="refresh" content="2">', 1)
+            
+            temp_path = f"{live_path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.write(html_content)
+            os.replace(temp_path, live_path)
+            
+            if downstream:
+                result = downstream(sections, done)
+                if asyncio.iscoroutine(result):
+                    await result
+        
+        return write_partial
+    
     async def _generate_html_article(self, package: Dict[str, Any]) -> str:
         """HTML 기사 생성"""
         
@@ -840,31 +679,24 @@ if __name__ == "__main__":
             self.logger.error(f"❌ Streamlit 페이지 생성 실패: {e}")
             return ""
     
-    async def process_multiple_events(self, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """여러 이벤트 동시 처리"""
+    async def process_multiple_events(self, events: List[Dict[str, Any]],
+                                      max_concurrent_events: Optional[int] = None,
+                                      event_timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """여러 이벤트 동시 처리 (심각도 순, 동시 실행 수 제한)
+
+        성공한 결과를 입력 순서대로 반환하고, 이벤트별 소요 시간은 self.last_batch_report에 기록
+        """
         
         self.logger.info(f"🔄 {len(events)}개 이벤트 동시 처리 시작")
         
-        tasks = []
-        for i, event in enumerate(events):
-            context = StrandContext(
-                strand_id=f"multi_event_{i}_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-                input_data={'event': event}
-            )
-            tasks.append(self.process(context))
-        
         try:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            outcomes = []
+            async for outcome in self.iter_event_results(events, max_concurrent_events, event_timeout):
+                outcomes.append(outcome)
+            outcomes.sort(key=lambda outcome: outcome.index)
             
-            successful_results = []
-            failed_count = 0
-            
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    self.logger.error(f"❌ 이벤트 {i+1} 처리 실패: {result}")
-                    failed_count += 1
-                else:
-                    successful_results.append(result)
+            successful_results = [outcome.result for outcome in outcomes if outcome.success]
+            failed_count = len(outcomes) - len(successful_results)
             
             self.logger.info(f"✅ 다중 이벤트 처리 완료: {len(successful_results)}개 성공, {failed_count}개 실패")
             return successful_results
@@ -873,6 +705,37 @@ if __name__ == "__main__":
             self.logger.error(f"❌ 다중 이벤트 처리 실패: {e}")
             return []
     
+    async def iter_event_results(self, events: List[Dict[str, Any]],
+                                 max_concurrent_events: Optional[int] = None,
+                                 event_timeout: Optional[float] = None) -> AsyncIterator[EventResult]:
+        """이벤트를 심각도 순으로 처리하면서 완료되는 순서대로 결과(EventResult) 반환"""
+        
+        batch_id = datetime.now().strftime('%Y%m%d_%H%M%S')
+        
+        async def handle(index: int, event: Dict[str, Any]) -> Dict[str, Any]:
+            context = StrandContext(
+                strand_id=f"multi_event_{index}_{batch_id}",
+                input_data={'event': event}
+            )
+            return await self.process(context)
+        
+        scheduler = EventBatchScheduler(
+            handle,
+            max_concurrent_events=max_concurrent_events or self.max_concurrent_events,
+            event_timeout=event_timeout
+        )
+        
+        self.last_batch_report = []
+        async for outcome in scheduler.iter_results(events):
+            report = outcome.to_dict()
+            self.last_batch_report.append(report)
+            if outcome.success:
+                self.logger.info(f"⏱️ 이벤트 {outcome.index + 1} ({report['symbol']}) 완료: "
+                                 f"{report['duration_seconds']}초 (대기 {report['queued_seconds']}초)")
+            else:
+                self.logger.error(f"❌ 이벤트 {outcome.index + 1} 처리 실패: {outcome.error}")
+            yield outcome
+    
     def get_system_status(self) -> Dict[str, Any]:
         """시스템 상태 조회"""
         
@@ -881,6 +744,7 @@ if __name__ == "__main__":
             'registered_agents': list(orchestrator.agents.keys()),
             'agent_capabilities': orchestrator.list_agents(),
             'output_directories': self.output_dirs,
+            'resource_usage': get_resource_limiter().get_stats(),
             'last_check': datetime.now().isoformat()
         }
 
@@ -18,6 +18,9 @@ class ReviewStrand(BaseStrandAgent):
             name="기사 검수 에이전트"
         )
         
+        # 공유 메모리에서 읽는 데이터를 만드는 선행 에이전트
+        self.dependencies = ['data_analyst', 'article_writer']
+        
         self.capabilities = [
             "content_quality_review",
             "fact_checking",
@@ -5,15 +5,15 @@ Strands Agent 프레임워크 - 경제 뉴스 시스템용
 
 import asyncio
 import logging
-import boto3
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional, Callable, AsyncIterator
 from dataclasses import dataclass, field
 from enum import Enum
 import json
+import time
 from datetime import datetime
-from langchain_aws import ChatBedrock
-from langchain.schema import HumanMessage, SystemMessage
+
+from .llm_pool import get_llm_pool, DEFAULT_MODEL_KWARGS
 
 class StrandStatus(Enum):
     """Strand 실행 상태"""
@@ -53,6 +53,8 @@ class StrandContext:
     results: Dict[str, Any] = field(default_factory=dict)
     error: Optional[str] = None
     created_at: datetime = field(default_factory=datetime.now)
+    agent_status: Dict[str, StrandStatus] = field(default_factory=dict)
+    agent_timings: Dict[str, float] = field(default_factory=dict)
 
 class BaseStrandAgent(ABC):
     """Strand Agent 기본 클래스"""
@@ -64,28 +66,22 @@ class BaseStrandAgent(ABC):
         self.logger = logging.getLogger(f"strand_agent.{agent_id}")
         self.dependencies: List[str] = []
         self.capabilities: List[str] = []
+        self.timeout: Optional[float] = None  # 에이전트별 실행 제한 시간 (초)
         
-        # AWS Bedrock 클라이언트 초기화
-        try:
-            self.bedrock_client = boto3.client(
-                'bedrock-runtime',
-                region_name='us-east-1'
-            )
-            
-            # LangChain ChatBedrock 초기화
-            self.llm = ChatBedrock(
-                client=self.bedrock_client,
-                model_id=model_id,
-                model_kwargs={
-                    "temperature": 0.7,
-                    "max_tokens": 4000
-                }
-            )
-            self.logger.info(f"✅ {name} Agent 초기화 완료")
-        except Exception as e:
-            self.logger.error(f"❌ {name} Agent 초기화 실패: {e}")
-            self.bedrock_client = None
-            self.llm = None
+        self.model_kwargs: Dict[str, Any] = dict(DEFAULT_MODEL_KWARGS)
+        
+        # Bedrock 클라이언트/LLM은 공유 풀에서 처음 사용할 때 생성
+        self.logger.info(f"✅ {name} Agent 초기화 완료")
+    
+    @property
+    def bedrock_client(self):
+        """공유 bedrock-runtime 클라이언트 (생성 실패 시 None)"""
+        return get_llm_pool().get_client()
+    
+    @property
+    def llm(self):
+        """공유 ChatBedrock 인스턴스 (생성 실패 시 None)"""
+        return get_llm_pool().get_llm(self.model_id, self.model_kwargs)
     
     @abstractmethod
     async def process(self, context: StrandContext, message: Optional[StrandMessage] = None) -> Dict[str, Any]:
@@ -118,21 +114,27 @@ class BaseStrandAgent(ABC):
         context.shared_memory[key] = value
         self.logger.debug(f"💾 공유 데이터 저장: {key}")
     
-    async def call_llm(self, system_prompt: str, user_prompt: str) -> str:
-        """LLM 호출"""
-        if not self.llm:
-            raise Exception("LLM이 초기화되지 않았습니다")
-        
+    async def call_llm(self, system_prompt: str, user_prompt: str, use_cache: bool = True) -> str:
+        """LLM 호출 (공유 풀 사용: 응답 캐시, 스로틀링 백오프, 동일 프롬프트 호출 병합)
+
+        use_cache=False이면 캐시된 응답을 쓰지 않고 새로 생성
+        """
         try:
-            messages = [
-                SystemMessage(content=system_prompt),
-                HumanMessage(content=user_prompt)
-            ]
-            response = await self.llm.ainvoke(messages)
-            return response.content
+            return await get_llm_pool().invoke(self.model_id, system_prompt, user_prompt,
+                                               self.model_kwargs, use_cache=use_cache)
         except Exception as e:
             self.logger.error(f"❌ LLM 호출 실패: {e}")
             raise
+    
+    async def call_llm_stream(self, system_prompt: str, user_prompt: str, use_cache: bool = True) -> AsyncIterator[str]:
+        """LLM 스트리밍 호출 (텍스트 조각을 생성되는 대로 반환)"""
+        try:
+            async for chunk in get_llm_pool().stream(self.model_id, system_prompt, user_prompt,
+                                                     self.model_kwargs, use_cache=use_cache):
+                yield chunk
+        except Exception as e:
+            self.logger.error(f"❌ LLM 스트리밍 호출 실패: {e}")
+            raise
 
 class StrandOrchestrator:
     """Strand 오케스트레이터 - 에이전트들의 협력을 조율"""
@@ -147,8 +149,14 @@ class StrandOrchestrator:
         self.agents[agent.agent_id] = agent
         self.logger.info(f"🤖 에이전트 등록: {agent.name} ({agent.agent_id})")
     
-    async def execute_strand(self, strand_id: str, input_data: Dict[str, Any], workflow: List[str]) -> StrandContext:
-        """Strand 실행"""
+    async def execute_strand(self, strand_id: str, input_data: Dict[str, Any], workflow: List[str],
+                             parallel: bool = True, agent_timeout: Optional[float] = None) -> StrandContext:
+        """Strand 실행
+
+        에이전트가 선언한 dependencies로 의존성 그래프를 만들고, 선행 에이전트가 끝난
+        에이전트들은 동시에 실행. 한 에이전트가 실패하면 그 하위 에이전트들은 실행하지 않고
+        취소 처리. parallel=False이면 workflow 순서대로 하나씩 실행
+        """
         context = StrandContext(
             strand_id=strand_id,
             input_data=input_data,
@@ -159,20 +167,36 @@ class StrandOrchestrator:
         self.logger.info(f"🚀 Strand 실행 시작: {strand_id}")
         
         try:
-            # 워크플로우에 따라 에이전트들을 순차적으로 실행
+            graph = self._build_dependency_graph(workflow, parallel)
             for agent_id in workflow:
-                if agent_id not in self.agents:
-                    raise Exception(f"에이전트를 찾을 수 없습니다: {agent_id}")
-                
-                agent = self.agents[agent_id]
-                self.logger.info(f"🔄 에이전트 실행: {agent.name}")
-                
-                # 에이전트 실행
-                result = await agent.process(context)
-                context.results[agent_id] = result
-                
-                # 상태 업데이트
-                await agent.set_shared_data(context, f"{agent_id}_result", result)
+                context.agent_status[agent_id] = StrandStatus.PENDING
+            
+            tasks: Dict[str, asyncio.Task] = {}
+            
+            async def run_agent(agent_id: str) -> bool:
+                # 선행 에이전트 완료 대기
+                upstream = graph[agent_id]
+                if upstream:
+                    upstream_ok = await asyncio.gather(*(tasks[dep] for dep in upstream))
+                    if not all(upstream_ok):
+                        context.agent_status[agent_id] = StrandStatus.CANCELLED
+                        self.logger.warning(f"⏭️ 선행 에이전트 실패로 취소: {agent_id}")
+                        return False
+                return await self._run_agent(context, agent_id, agent_timeout)
+            
+            for agent_id in workflow:
+                tasks[agent_id] = asyncio.create_task(run_agent(agent_id))
+            
+            try:
+                await asyncio.gather(*tasks.values())
+            except asyncio.CancelledError:
+                for task in tasks.values():
+                    task.cancel()
+                raise
+            
+            failed = [agent_id for agent_id in workflow if context.agent_status[agent_id] == StrandStatus.FAILED]
+            if failed:
+                raise Exception(context.error or f"에이전트 실행 실패: {', '.join(failed)}")
             
             context.status = StrandStatus.COMPLETED
             self.logger.info(f"✅ Strand 실행 완료: {strand_id}")
@@ -184,6 +208,77 @@ class StrandOrchestrator:
         
         return context
     
+    def _build_dependency_graph(self, workflow: List[str], parallel: bool = True) -> Dict[str, List[str]]:
+        """워크플로우의 의존성 그래프 생성 (에이전트 ID -> 선행 에이전트 목록)
+
+        workflow에 포함되지 않은 의존성은 무시하며, 순환 의존성이 있으면 예외 발생
+        """
+        for agent_id in workflow:
+            if agent_id not in self.agents:
+                raise Exception(f"에이전트를 찾을 수 없습니다: {agent_id}")
+        
+        if not parallel:
+            return {agent_id: workflow[:i][-1:] for i, agent_id in enumerate(workflow)}
+        
+        members = set(workflow)
+        graph = {
+            agent_id: [dep for dep in self.agents[agent_id].dependencies if dep in members and dep != agent_id]
+            for agent_id in workflow
+        }
+        
+        # 위상 정렬로 순환 의존성 확인
+        remaining = {agent_id: len(deps) for agent_id, deps in graph.items()}
+        ready = [agent_id for agent_id, count in remaining.items() if count == 0]
+        visited = 0
+        while ready:
+            current = ready.pop()
+            visited += 1
+            for agent_id, deps in graph.items():
+                if current in deps:
+                    remaining[agent_id] -= 1
+                    if remaining[agent_id] == 0:
+                        ready.append(agent_id)
+        if visited != len(graph):
+            cycle = [agent_id for agent_id, count in remaining.items() if count > 0]
+            raise Exception(f"순환 의존성이 있습니다: {', '.join(cycle)}")
+        
+        return graph
+    
+    async def _run_agent(self, context: StrandContext, agent_id: str, default_timeout: Optional[float] = None) -> bool:
+        """단일 에이전트 실행 (제한 시간 적용, 실패 시 False)"""
+        agent = self.agents[agent_id]
+        timeout = agent.timeout if agent.timeout is not None else default_timeout
+        context.agent_status[agent_id] = StrandStatus.RUNNING
+        self.logger.info(f"🔄 에이전트 실행: {agent.name}")
+        started = time.perf_counter()
+        
+        try:
+            if timeout is not None:
+                result = await asyncio.wait_for(agent.process(context), timeout=timeout)
+            else:
+                result = await agent.process(context)
+        except asyncio.TimeoutError:
+            return self._mark_agent_failed(context, agent_id, started, f"{agent.name} 실행 시간 초과 ({timeout}초)")
+        except Exception as e:
+            return self._mark_agent_failed(context, agent_id, started, f"{agent.name} 실행 실패: {e}")
+        
+        context.results[agent_id] = result
+        context.agent_timings[agent_id] = time.perf_counter() - started
+        context.agent_status[agent_id] = StrandStatus.COMPLETED
+        
+        # 상태 업데이트
+        await agent.set_shared_data(context, f"{agent_id}_result", result)
+        return True
+    
+    def _mark_agent_failed(self, context: StrandContext, agent_id: str, started: float, error: str) -> bool:
+        """에이전트 실패 기록 (첫 번째 오류를 Strand 오류로 유지)"""
+        context.agent_timings[agent_id] = time.perf_counter() - started
+        context.agent_status[agent_id] = StrandStatus.FAILED
+        if context.error is None:
+            context.error = error
+        self.logger.error(f"❌ {error}")
+        return False
+    
     async def get_strand_status(self, strand_id: str) -> Optional[StrandContext]:
         """Strand 상태 조회"""
         return self.active_strands.get(strand_id)
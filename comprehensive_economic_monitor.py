@@ -156,13 +156,13 @@ class ComprehensiveEconomicMonitor:
             self.logger.info("📈 경제 지표 수집 시작...")
             
             indicators = {}
+            # 모든 시리즈를 동시에 최신화 (로컬 저장소에 있는 구간은 다시 받지 않음)
+            series_data = await self.fred_collector.get_many_series_data_async(
+                self.monitoring_config['fred_indicators'], limit=10
+            )
             for indicator in self.monitoring_config['fred_indicators']:
                 try:
-                    data = await asyncio.to_thread(
-                        self.fred_collector.get_series_data, 
-                        indicator, 
-                        limit=10
-                    )
+                    data = series_data.get(indicator)
                     if data:
                         indicators[indicator] = data
                         self.logger.info(f"✅ {indicator} 데이터 수집 완료")
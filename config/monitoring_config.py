@@ -74,6 +74,34 @@ MONITORING_CONFIG = {
     'data_retention_days': 30,  # 30일간 데이터 보관
     'alert_cooldown': 300,  # 5분간 동일 알림 방지
     'batch_size': 10,  # 한 번에 처리할 지표 수
+    'history_cache_max_entries': 256,  # 메모리 히스토리 캐시 최대 심볼/인터벌 수
+    'bar_store_enabled': True,  # 로컬 봉 데이터 저장소 사용 여부
+    'bar_store_dir': 'output/bars',  # 봉 데이터 저장 경로
+    'bar_store_min_refresh': 60,  # 이 시간(초) 안에 갱신된 심볼은 다운로드 생략
+    'info_cache_ttl': 86400,  # 종목명/시가총액 등 info 필드 캐시 유지 시간(초)
+    'streaming_interval': '5m',  # 스트리밍 지표에 사용할 인트라데이 봉 간격
+    'streaming_checkpoint': 'output/streaming_indicators.json',  # 스트리밍 지표 상태 저장 경로
+    'event_journal_dir': 'logs/events',  # 일별 이벤트 저널(JSON Lines) 저장 경로
+    'event_store_enabled': True,  # 탐지 이벤트를 조회용 이벤트 저장소에도 기록
+    'event_store_path': 'output/events.sqlite',  # 이벤트 저장소(SQLite) 경로
+    'detection_max_workers': 8,  # 이벤트 탐지 시 동시에 분석할 최대 심볼 수
+    'news_refresh_interval': 300,  # 공유 뉴스 풀에서 같은 RSS 피드를 다시 받기까지의 최소 간격(초)
+    'network_metrics_mode': 'auto',  # 네트워크 중심성 계산 방식 (auto / exact / approximate)
+    'network_exact_node_limit': 500,  # auto 모드에서 정확 계산을 사용할 최대 노드 수
+    'network_pivot_samples': 64,  # 근사 계산 시 표본으로 쓸 피벗 노드 수
+    'alphavantage_calls_per_minute': 5,  # Alpha Vantage API 키당 분당 호출 한도 (무료 티어)
+    'alphavantage_calls_per_day': 25,  # Alpha Vantage API 키당 일일 호출 한도 (무료 티어)
+    'alphavantage_burst': 1,  # 연속으로 보낼 수 있는 최대 호출 수 (1이면 12초 간격 유지)
+    'alphavantage_quota_dir': None,  # 지정하면 이 경로의 잠금 파일로 여러 프로세스가 한도 공유
+    'alphavantage_collection_window': 60,  # 우선순위 수집 1회에 토큰을 기다릴 최대 시간(초)
+    'alphavantage_cache_enabled': True,  # Alpha Vantage 응답 캐시 사용 여부
+    'alphavantage_cache_path': 'output/alphavantage_cache.sqlite',  # 응답 캐시(SQLite) 경로
+    'alphavantage_cache_stale_factor': 4,  # TTL의 이 배수만큼 더 지난 응답까지는 즉시 반환하고 백그라운드 갱신
+    'alphavantage_cache_offline': False,  # True면 API를 호출하지 않고 캐시된 응답만 사용
+    'fred_store_dir': 'output/fred',  # FRED 시리즈 관측값 로컬 저장 경로
+    'fred_max_concurrency': 8,  # FRED 동시 요청 수
+    'fred_requests_per_minute': 120,  # FRED API 분당 요청 한도
+    'fred_revision_lookback': 3,  # 추가 조회 시 개정 확인을 위해 다시 받을 최근 관측값 수
 }
 
 # 이벤트 심각도 계산 가중치
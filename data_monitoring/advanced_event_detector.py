@@ -4,6 +4,7 @@
 """
 
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
@@ -17,9 +18,11 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from data_monitoring.technical_analysis import TechnicalAnalyzer, TechnicalIndicators, TechnicalSignal
-from data_monitoring.sentiment_analysis import SentimentAnalyzer, MarketSentiment, SentimentScore
+from data_monitoring.sentiment_analysis import SentimentAnalyzer, MarketSentiment, SentimentScore, NewsSnapshot
 from data_monitoring.correlation_analysis import CorrelationAnalyzer, MarketCorrelationBreak
 from data_monitoring.data_collector import MarketData, EconomicDataCollector
+from data_monitoring.event_store import EventStore, get_event_store
+from config.monitoring_config import MONITORING_CONFIG
 
 class AdvancedEventType(Enum):
     # 기존 이벤트 타입
@@ -80,8 +83,11 @@ class AdvancedEconomicEvent:
 class AdvancedEventDetector:
     """고도화된 경제 이벤트 탐지 클래스"""
     
-    def __init__(self):
+    def __init__(self, event_store: Optional[EventStore] = None, max_workers: Optional[int] = None):
         self.logger = logging.getLogger(__name__)
+        self._event_store = event_store
+        # 블로킹 I/O(시세/히스토리 다운로드)를 처리할 워커 수 (1이면 순차 실행)
+        self.max_workers = max_workers or MONITORING_CONFIG.get('detection_max_workers', 8)
         
         # 분석 모듈들 초기화
         self.technical_analyzer = TechnicalAnalyzer()
@@ -108,17 +114,25 @@ class AdvancedEventDetector:
     async def detect_advanced_events(self, symbols: List[str]) -> List[AdvancedEconomicEvent]:
         """고도화된 이벤트 탐지 메인 함수"""
         all_events = []
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
         
         try:
-            # 1. 기본 시장 데이터 수집
-            market_data = await self._collect_market_data(symbols)
+            # 1. 기본 시장 데이터 수집 (뉴스/공포탐욕 지수는 주기당 한 번만 수집)
+            news_task = asyncio.ensure_future(self._fetch_news_snapshot())
+            market_data = await self._collect_market_data(symbols, executor)
+            news_snapshot = await news_task
             
-            # 2. 각 심볼별 개별 분석
-            for symbol in symbols:
-                if symbol not in market_data:
+            # 2. 각 심볼별 개별 분석 (동시 실행, 한 심볼의 실패는 해당 심볼만 제외)
+            analyzed = [symbol for symbol in dict.fromkeys(symbols) if symbol in market_data]
+            results = await asyncio.gather(
+                *(self._analyze_symbol_events(symbol, market_data[symbol], executor, news_snapshot)
+                  for symbol in analyzed),
+                return_exceptions=True
+            )
+            for symbol, symbol_events in zip(analyzed, results):
+                if isinstance(symbol_events, Exception):
+                    self.logger.error(f"Error analyzing events for {symbol}: {str(symbol_events)}")
                     continue
-                
-                symbol_events = await self._analyze_symbol_events(symbol, market_data[symbol])
                 all_events.extend(symbol_events)
             
             # 3. 시장 전체 분석 (상관관계, 섹터 로테이션 등)
@@ -131,37 +145,79 @@ class AdvancedEventDetector:
             # 5. 이벤트 히스토리 업데이트
             self._update_event_history(filtered_events)
             
+            # 6. 조회용 이벤트 저장소에 기록
+            self._store_events(filtered_events)
+            
             return filtered_events
             
         except Exception as e:
             self.logger.error(f"Error in advanced event detection: {str(e)}")
             return []
+        finally:
+            executor.shutdown(wait=False)
+    
+    async def _fetch_news_snapshot(self) -> Optional[NewsSnapshot]:
+        """주기 공유 뉴스 스냅샷 수집 (실패 시 심볼별 개별 수집으로 대체)"""
+        try:
+            return await self.sentiment_analyzer.fetch_news_snapshot()
+        except Exception as e:
+            self.logger.error(f"Error fetching shared news snapshot: {str(e)}")
+            return None
     
-    async def _collect_market_data(self, symbols: List[str]) -> Dict[str, MarketData]:
-        """시장 데이터 수집"""
+    @property
+    def event_store(self) -> Optional[EventStore]:
+        """탐지 이벤트를 기록할 저장소 (설정에서 끈 경우 None)"""
+        if self._event_store is None and MONITORING_CONFIG.get('event_store_enabled', True):
+            self._event_store = get_event_store()
+        return self._event_store
+    
+    def _store_events(self, events: List[AdvancedEconomicEvent]):
+        """이벤트 저장소 기록 (저장 실패가 탐지를 막지 않도록 경고만 남김)"""
+        if not events:
+            return
+        try:
+            store = self.event_store
+            if store is not None:
+                store.add_events(events, source='advanced_event_detector')
+        except Exception as e:
+            self.logger.warning(f"Failed to store events: {e}")
+    
+    async def _collect_market_data(self, symbols: List[str],
+                                   executor: Optional[ThreadPoolExecutor] = None) -> Dict[str, MarketData]:
+        """시장 데이터 수집 (워커 풀에서 심볼별 동시 다운로드)"""
         market_data = {}
+        loop = asyncio.get_running_loop()
+        unique_symbols = list(dict.fromkeys(symbols))
         
-        for symbol in symbols:
-            try:
-                data = self.data_collector.collect_yahoo_finance_data(symbol)
-                if data:
-                    market_data[symbol] = data
-            except Exception as e:
-                self.logger.error(f"Error collecting data for {symbol}: {str(e)}")
+        results = await asyncio.gather(
+            *(loop.run_in_executor(executor, self.data_collector.collect_yahoo_finance_data, symbol)
+              for symbol in unique_symbols),
+            return_exceptions=True
+        )
+        for symbol, data in zip(unique_symbols, results):
+            if isinstance(data, Exception):
+                self.logger.error(f"Error collecting data for {symbol}: {str(data)}")
                 continue
+            if data:
+                market_data[symbol] = data
         
         return market_data
     
-    async def _analyze_symbol_events(self, symbol: str, market_data: MarketData) -> List[AdvancedEconomicEvent]:
+    async def _analyze_symbol_events(self, symbol: str, market_data: MarketData,
+                                     executor: Optional[ThreadPoolExecutor] = None,
+                                     news_snapshot: Optional[NewsSnapshot] = None) -> List[AdvancedEconomicEvent]:
         """개별 심볼 이벤트 분석"""
         events = []
         
         try:
-            # 기술적 분석 수행
-            technical_indicators = self.technical_analyzer.analyze_symbol(symbol)
+            # 기술적 분석 수행 (블로킹 다운로드는 워커 풀에서)
+            loop = asyncio.get_running_loop()
+            technical_indicators = await loop.run_in_executor(
+                executor, self.technical_analyzer.analyze_symbol, symbol
+            )
             
-            # 감정 분석 수행
-            market_sentiment = await self.sentiment_analyzer.analyze_market_sentiment(symbol)
+            # 감정 분석 수행 (공유 스냅샷이 있으면 메모리에서 관련 뉴스만 필터링)
+            market_sentiment = await self.sentiment_analyzer.analyze_market_sentiment(symbol, news_snapshot)
             
             # 1. 기술적 돌파 이벤트 감지
             technical_events = self._detect_technical_events(
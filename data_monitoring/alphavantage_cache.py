@@ -0,0 +1,329 @@
+"""
+Alpha Vantage 응답 캐시 모듈
+(function, 파라미터)를 키로 API 응답을 로컬 SQLite에 저장하고 함수별 TTL로 재사용
+TTL이 지난 응답은 바로 반환하면서 백그라운드에서 갱신(stale-while-revalidate)하고,
+오프라인 모드에서는 API를 호출하지 않고 캐시만 사용
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+import sqlite3
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import requests
+
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.monitoring_config import MONITORING_CONFIG
+from data_monitoring.alphavantage_scheduler import get_alphavantage_scheduler, function_priority, PRIORITY_LOW
+
+ALPHAVANTAGE_URL = "https://www.alphavantage.co/query"
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+# 함수별 응답 유지 시간(초) - 데이터가 실제로 바뀌는 주기에 맞춤
+FUNCTION_TTLS = {
+    # 장중 시세
+    'TIME_SERIES_INTRADAY': 5 * MINUTE,
+    'FX_INTRADAY': 5 * MINUTE,
+    'CRYPTO_INTRADAY': 5 * MINUTE,
+    'GLOBAL_QUOTE': 5 * MINUTE,
+    'CURRENCY_EXCHANGE_RATE': 5 * MINUTE,
+    # 장중 집계/뉴스
+    'MARKET_STATUS': 15 * MINUTE,
+    'TOP_GAINERS_LOSERS': 15 * MINUTE,
+    'NEWS_SENTIMENT': 15 * MINUTE,
+    # 일봉 기준 지표
+    'RSI': 6 * HOUR,
+    'MACD': 6 * HOUR,
+    'SMA': 6 * HOUR,
+    'EMA': 6 * HOUR,
+    'ANALYTICS_SLIDING_WINDOW': 6 * HOUR,
+    # 하루 한 번 이하로 바뀌는 데이터
+    'OVERVIEW': DAY,
+    'INSIDER_TRANSACTIONS': DAY,
+    'EARNINGS_CALL_TRANSCRIPT': 7 * DAY,
+    # 경제 지표 (일/월/분기 발표)
+    'FEDERAL_FUNDS_RATE': DAY,
+    'TREASURY_YIELD': DAY,
+    'CPI': 7 * DAY,
+    'INFLATION': 7 * DAY,
+    'UNEMPLOYMENT': 7 * DAY,
+    'RETAIL_SALES': 7 * DAY,
+    'NONFARM_PAYROLL': 7 * DAY,
+    'REAL_GDP': 7 * DAY,
+}
+DEFAULT_TTL = 15 * MINUTE
+
+# 이 키가 있는 응답은 호출 한도/파라미터 오류 안내이므로 캐시하지 않음
+ERROR_RESPONSE_KEYS = ('Error Message', 'Note', 'Information')
+
+
+def make_request_key(params: Dict[str, Any]) -> str:
+    """요청 파라미터 기반 캐시 키 (API 키는 응답 내용과 무관하므로 제외)"""
+    payload = json.dumps({k: v for k, v in params.items() if k.lower() != 'apikey'},
+                         sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def is_error_response(data: Any) -> bool:
+    """Alpha Vantage 오류/한도 안내 응답 여부"""
+    return not isinstance(data, dict) or any(key in data for key in ERROR_RESPONSE_KEYS)
+
+
+class AlphaVantageResponseCache:
+    """함수별 TTL과 stale-while-revalidate를 지원하는 SQLite 응답 캐시
+
+    - 신선한 응답(나이 < TTL): 그대로 반환
+    - 오래된 응답(나이 < TTL × (1 + stale_factor)): 그대로 반환하고 백그라운드에서 한 번만 갱신
+    - 그보다 오래됐거나 없는 응답: 바로 가져오고, 실패하면 남아 있는 캐시로 대체
+    - 오프라인 모드: 나이와 관계없이 캐시만 사용 (없으면 None)
+    """
+
+    def __init__(self, db_path: Optional[str] = None, ttls: Optional[Dict[str, float]] = None,
+                 stale_factor: Optional[float] = None, offline: Optional[bool] = None,
+                 clock: Callable[[], float] = time.time):
+        self.logger = logging.getLogger(__name__)
+        self.db_path = db_path or MONITORING_CONFIG.get('alphavantage_cache_path', 'output/alphavantage_cache.sqlite')
+        self.ttls = {**FUNCTION_TTLS, **(ttls or {})}
+        self.stale_factor = (stale_factor if stale_factor is not None
+                             else MONITORING_CONFIG.get('alphavantage_cache_stale_factor', 4))
+        self.offline = offline if offline is not None else MONITORING_CONFIG.get('alphavantage_cache_offline', False)
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        self._initialized = False
+        self._refreshing: Dict[str, threading.Thread] = {}
+        self.stats = {
+            'hits': 0,
+            'stale_hits': 0,
+            'misses': 0,
+            'fetches': 0,
+            'revalidations': 0,
+            'fallbacks': 0,
+            'errors': 0,
+        }
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS av_responses (
+                    key TEXT PRIMARY KEY,
+                    function TEXT NOT NULL,
+                    params TEXT NOT NULL,
+                    response TEXT NOT NULL,
+                    fetched_at REAL NOT NULL
+                )
+            """)
+            conn.commit()
+            self._initialized = True
+        return conn
+
+    def ttl_for(self, function: str) -> float:
+        return self.ttls.get(function, DEFAULT_TTL)
+
+    def get_entry(self, params: Dict[str, Any]) -> Optional[Tuple[Dict[str, Any], float]]:
+        """캐시된 (응답, 저장 시각) 조회 (나이와 관계없이)"""
+        try:
+            with self._lock:
+                conn = self._connect()
+                try:
+                    row = conn.execute("SELECT response, fetched_at FROM av_responses WHERE key = ?",
+                                       (make_request_key(params),)).fetchone()
+                finally:
+                    conn.close()
+        except sqlite3.Error as e:
+            self.stats['errors'] += 1
+            self.logger.warning(f"⚠️ Alpha Vantage 캐시 조회 실패: {e}")
+            return None
+        if row is None:
+            return None
+        return json.loads(row[0]), row[1]
+
+    def put(self, params: Dict[str, Any], data: Dict[str, Any], fetched_at: Optional[float] = None):
+        """응답 저장 (오류/한도 안내 응답은 저장하지 않음)"""
+        if is_error_response(data):
+            return
+        safe_params = {k: v for k, v in params.items() if k.lower() != 'apikey'}
+        try:
+            with self._lock:
+                conn = self._connect()
+                try:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO av_responses (key, function, params, response, fetched_at) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        (make_request_key(params), params.get('function', ''),
+                         json.dumps(safe_params, sort_keys=True, default=str),
+                         json.dumps(data, ensure_ascii=False),
+                         fetched_at if fetched_at is not None else self.clock())
+                    )
+                    conn.commit()
+                finally:
+                    conn.close()
+        except sqlite3.Error as e:
+            self.stats['errors'] += 1
+            self.logger.warning(f"⚠️ Alpha Vantage 캐시 저장 실패: {e}")
+
+    def fetch(self, params: Dict[str, Any],
+              fetcher: Callable[[bool], Optional[Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+        """캐시 우선 조회, 필요할 때만 fetcher(revalidate) 호출
+
+        fetcher는 API 응답 dict를 반환하고, 호출 한도 때문에 보내지 못하면 None을 반환
+        revalidate=True는 백그라운드 갱신 호출 (낮은 우선순위로 보내면 됨)
+        """
+        entry = self.get_entry(params)
+        if self.offline:
+            if entry is None:
+                self.stats['misses'] += 1
+                return None
+            self.stats['hits'] += 1
+            return entry[0]
+
+        ttl = self.ttl_for(params.get('function', ''))
+        if entry is not None:
+            data, fetched_at = entry
+            age = self.clock() - fetched_at
+            if age < ttl:
+                self.stats['hits'] += 1
+                return data
+            if age < ttl * (1 + self.stale_factor):
+                self.stats['stale_hits'] += 1
+                self._revalidate(params, fetcher)
+                return data
+
+        self.stats['misses'] += 1
+        return self._fetch_now(params, fetcher, entry)
+
+    def _fetch_now(self, params, fetcher, entry) -> Optional[Dict[str, Any]]:
+        try:
+            data = fetcher(False)
+        except Exception:
+            if entry is None:
+                raise
+            self.stats['fallbacks'] += 1
+            self.logger.warning(f"Alpha Vantage 요청 실패, 캐시된 응답 사용: {params.get('function')}")
+            return entry[0]
+
+        if data is not None:
+            self.stats['fetches'] += 1
+        if data is None or is_error_response(data):
+            if entry is not None:
+                self.stats['fallbacks'] += 1
+                return entry[0]
+            return data
+        self.put(params, data)
+        return data
+
+    def _revalidate(self, params, fetcher):
+        """같은 요청의 백그라운드 갱신은 한 번만 실행"""
+        key = make_request_key(params)
+        with self._lock:
+            if key in self._refreshing:
+                return
+            thread = threading.Thread(target=self._run_revalidation, args=(key, params, fetcher),
+                                      name=f"av-revalidate-{params.get('function', '')}", daemon=True)
+            self._refreshing[key] = thread
+        thread.start()
+
+    def _run_revalidation(self, key, params, fetcher):
+        try:
+            data = fetcher(True)
+            if data is not None and not is_error_response(data):
+                self.put(params, data)
+                self.stats['revalidations'] += 1
+        except Exception as e:
+            self.logger.debug(f"Alpha Vantage 백그라운드 갱신 실패 ({params.get('function')}): {e}")
+        finally:
+            with self._lock:
+                self._refreshing.pop(key, None)
+
+    def wait_for_revalidations(self, timeout: Optional[float] = None):
+        """진행 중인 백그라운드 갱신이 끝날 때까지 대기"""
+        with self._lock:
+            threads = list(self._refreshing.values())
+        for thread in threads:
+            thread.join(timeout)
+
+    def clear(self):
+        """캐시 비우기"""
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute("DELETE FROM av_responses")
+                conn.commit()
+            finally:
+                conn.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """적중률과 저장 현황"""
+        lookups = self.stats['hits'] + self.stats['stale_hits'] + self.stats['misses']
+        entries = 0
+        try:
+            with self._lock:
+                conn = self._connect()
+                try:
+                    entries = conn.execute("SELECT COUNT(*) FROM av_responses").fetchone()[0]
+                finally:
+                    conn.close()
+        except sqlite3.Error:
+            pass
+        return {
+            **self.stats,
+            'hit_rate': (self.stats['hits'] + self.stats['stale_hits']) / lookups if lookups else 0.0,
+            'entries': entries,
+            'offline': self.offline,
+        }
+
+
+_av_cache: Optional[AlphaVantageResponseCache] = None
+_av_cache_lock = threading.Lock()
+
+
+def get_alphavantage_cache() -> AlphaVantageResponseCache:
+    """프로세스 전역 Alpha Vantage 응답 캐시"""
+    global _av_cache
+    with _av_cache_lock:
+        if _av_cache is None:
+            _av_cache = AlphaVantageResponseCache()
+        return _av_cache
+
+
+def set_alphavantage_cache(cache: Optional[AlphaVantageResponseCache]):
+    """전역 Alpha Vantage 응답 캐시 교체 (None이면 다음 조회 시 기본값으로 생성)"""
+    global _av_cache
+    with _av_cache_lock:
+        _av_cache = cache
+
+
+def query_alphavantage(params: Dict[str, Any], base_url: str = ALPHAVANTAGE_URL,
+                       timeout: float = 30) -> Optional[Dict[str, Any]]:
+    """Alpha Vantage 조회 (응답 캐시 → 캐시가 없거나 만료되면 공유 스케줄러 토큰을 받아 HTTP 요청)
+
+    호출 한도 때문에 요청하지 못했고 캐시도 없으면 None 반환, HTTP 오류는 예외로 전달
+    """
+    function = params.get('function', '')
+
+    def fetch(revalidate: bool) -> Optional[Dict[str, Any]]:
+        scheduler = get_alphavantage_scheduler(params.get('apikey', ''))
+        priority = PRIORITY_LOW if revalidate else function_priority(function)
+        if not scheduler.acquire(priority, function=function):
+            return None
+        response = requests.get(base_url, params=params, timeout=timeout)
+        response.raise_for_status()
+        return response.json()
+
+    if not MONITORING_CONFIG.get('alphavantage_cache_enabled', True):
+        return fetch(False)
+    return get_alphavantage_cache().fetch(params, fetch)
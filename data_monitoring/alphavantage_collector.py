@@ -15,6 +15,10 @@ from dataclasses import dataclass
 from pathlib import Path
 import asyncio
 import aiohttp
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_monitoring.alphavantage_cache import query_alphavantage
 
 @dataclass
 class IntradayData:
@@ -50,10 +54,6 @@ class AlphaVantageCollector:
         self.base_url = "https://www.alphavantage.co/query"
         self.session = None
         
-        # API 호출 제한 (5 calls per minute for free tier)
-        self.call_interval = 12  # seconds between calls
-        self.last_call_time = 0
-        
         # 주요 모니터링 심볼
         self.us_stocks = [
             "AAPL", "MSFT", "GOOGL", "AMZN", "TSLA", 
@@ -101,23 +101,9 @@ class AlphaVantageCollector:
         if self.session:
             await self.session.close()
     
-    def _wait_for_rate_limit(self):
-        """API 호출 제한 준수"""
-        current_time = time.time()
-        time_since_last_call = current_time - self.last_call_time
-        
-        if time_since_last_call < self.call_interval:
-            wait_time = self.call_interval - time_since_last_call
-            self.logger.debug(f"Rate limit wait: {wait_time:.1f}s")
-            time.sleep(wait_time)
-        
-        self.last_call_time = time.time()
-    
     def get_intraday_data(self, symbol: str, interval: str = "5min", 
                          outputsize: str = "compact") -> List[IntradayData]:
         """실시간 인트라데이 데이터 수집"""
-        self._wait_for_rate_limit()
-        
         try:
             params = {
                 "function": "TIME_SERIES_INTRADAY",
@@ -128,9 +114,9 @@ class AlphaVantageCollector:
                 "datatype": "json"
             }
             
-            response = requests.get(self.base_url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            data = query_alphavantage(params, self.base_url)
+            if data is None:
+                return []
             
             # 오류 체크
             if "Error Message" in data:
@@ -184,8 +170,6 @@ class AlphaVantageCollector:
     def get_technical_indicator(self, symbol: str, indicator: str, 
                               interval: str = "daily", **kwargs) -> List[TechnicalIndicator]:
         """기술적 지표 데이터 수집"""
-        self._wait_for_rate_limit()
-        
         try:
             params = {
                 "function": indicator,
@@ -198,9 +182,9 @@ class AlphaVantageCollector:
             # 추가 파라미터 병합
             params.update(kwargs)
             
-            response = requests.get(self.base_url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            data = query_alphavantage(params, self.base_url)
+            if data is None:
+                return []
             
             # 오류 체크
             if "Error Message" in data:
@@ -290,8 +274,6 @@ class AlphaVantageCollector:
     
     def get_forex_data(self, from_currency: str, to_currency: str) -> Optional[Dict[str, Any]]:
         """외환 데이터 수집"""
-        self._wait_for_rate_limit()
-        
         try:
             params = {
                 "function": "FX_INTRADAY",
@@ -302,9 +284,9 @@ class AlphaVantageCollector:
                 "datatype": "json"
             }
             
-            response = requests.get(self.base_url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            data = query_alphavantage(params, self.base_url)
+            if data is None:
+                return None
             
             if "Error Message" in data:
                 self.logger.error(f"Forex API Error: {data['Error Message']}")
@@ -337,8 +319,6 @@ class AlphaVantageCollector:
     
     def get_crypto_data(self, symbol: str, market: str = "USD") -> Optional[Dict[str, Any]]:
         """암호화폐 데이터 수집"""
-        self._wait_for_rate_limit()
-        
         try:
             params = {
                 "function": "CRYPTO_INTRADAY",
@@ -349,9 +329,9 @@ class AlphaVantageCollector:
                 "datatype": "json"
             }
             
-            response = requests.get(self.base_url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            data = query_alphavantage(params, self.base_url)
+            if data is None:
+                return None
             
             if "Error Message" in data:
                 self.logger.error(f"Crypto API Error: {data['Error Message']}")
@@ -406,8 +386,6 @@ class AlphaVantageCollector:
     
     def _get_economic_indicator(self, indicator: str, interval: str) -> Optional[EconomicIndicatorData]:
         """개별 경제 지표 수집"""
-        self._wait_for_rate_limit()
-        
         try:
             params = {
                 "function": indicator,
@@ -416,9 +394,9 @@ class AlphaVantageCollector:
                 "datatype": "json"
             }
             
-            response = requests.get(self.base_url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            data = query_alphavantage(params, self.base_url)
+            if data is None:
+                return None
             
             if "Error Message" in data:
                 return None
@@ -448,7 +426,7 @@ class AlphaVantageCollector:
             return None
     
     async def collect_comprehensive_data(self) -> Dict[str, Any]:
-        """종합 데이터 수집"""
+        """종합 데이터 수집 (호출 제한 대기와 요청은 작업 스레드에서 실행해 이벤트 루프를 막지 않음)"""
         self.logger.info("🚀 Alpha Vantage 종합 데이터 수집 시작")
         
         results = {
@@ -463,7 +441,7 @@ class AlphaVantageCollector:
         # 1. 주요 주식 인트라데이 데이터
         self.logger.info("📈 주식 인트라데이 데이터 수집 중...")
         for symbol in self.us_stocks[:3]:  # API 제한으로 3개만
-            intraday_data = self.get_intraday_data(symbol, "5min", "compact")
+            intraday_data = await asyncio.to_thread(self.get_intraday_data, symbol, "5min", "compact")
             if intraday_data:
                 results["intraday_data"][symbol] = {
                     "latest_price": intraday_data[0].close_price,
@@ -475,7 +453,7 @@ class AlphaVantageCollector:
         # 2. 기술적 지표
         self.logger.info("📊 기술적 지표 수집 중...")
         for symbol in ["AAPL", "MSFT"]:  # 2개 종목만
-            rsi_data = self.get_technical_indicator(symbol, "RSI", "daily", time_period=14)
+            rsi_data = await asyncio.to_thread(self.get_technical_indicator, symbol, "RSI", "daily", time_period=14)
             if rsi_data:
                 results["technical_indicators"][f"{symbol}_RSI"] = {
                     "latest_value": rsi_data[0].value,
@@ -485,19 +463,19 @@ class AlphaVantageCollector:
         
         # 3. 외환 데이터
         self.logger.info("💱 외환 데이터 수집 중...")
-        forex_data = self.get_forex_data("USD", "KRW")
+        forex_data = await asyncio.to_thread(self.get_forex_data, "USD", "KRW")
         if forex_data:
             results["forex_data"]["USDKRW"] = forex_data
         
         # 4. 암호화폐 데이터
         self.logger.info("₿ 암호화폐 데이터 수집 중...")
-        crypto_data = self.get_crypto_data("BTC", "USD")
+        crypto_data = await asyncio.to_thread(self.get_crypto_data, "BTC", "USD")
         if crypto_data:
             results["crypto_data"]["BTCUSD"] = crypto_data
         
         # 5. 경제 지표
         self.logger.info("🏛️ 경제 지표 수집 중...")
-        economic_indicators = self.get_economic_indicators()
+        economic_indicators = await asyncio.to_thread(self.get_economic_indicators)
         results["economic_indicators"] = [
             {
                 "name": indicator.name,
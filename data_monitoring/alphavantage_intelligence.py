@@ -14,6 +14,10 @@ from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 from pathlib import Path
 import json
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_monitoring.alphavantage_cache import query_alphavantage
 
 @dataclass
 class MarketStatus:
@@ -71,10 +75,6 @@ class AlphaVantageIntelligence:
         self.api_key = self._load_api_key()
         self.base_url = "https://www.alphavantage.co/query"
         
-        # API 호출 제한
-        self.call_interval = 12  # seconds between calls
-        self.last_call_time = 0
-        
     def _load_api_key(self) -> str:
         """configure 파일에서 Alpha Vantage API 키 로드"""
         try:
@@ -99,31 +99,17 @@ class AlphaVantageIntelligence:
             self.logger.error(f"API 키 로드 실패: {e}")
             raise
     
-    def _wait_for_rate_limit(self):
-        """API 호출 제한 준수"""
-        current_time = time.time()
-        time_since_last_call = current_time - self.last_call_time
-        
-        if time_since_last_call < self.call_interval:
-            wait_time = self.call_interval - time_since_last_call
-            self.logger.debug(f"Rate limit wait: {wait_time:.1f}s")
-            time.sleep(wait_time)
-        
-        self.last_call_time = time.time()
-    
     def get_market_status(self) -> List[MarketStatus]:
         """글로벌 시장 개장/폐장 상태 조회"""
-        self._wait_for_rate_limit()
-        
         try:
             params = {
                 "function": "MARKET_STATUS",
                 "apikey": self.api_key
             }
             
-            response = requests.get(self.base_url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            data = query_alphavantage(params, self.base_url)
+            if data is None:
+                return []
             
             if "Error Message" in data or "Note" in data:
                 self.logger.warning(f"Market status API issue: {data}")
@@ -163,8 +149,6 @@ class AlphaVantageIntelligence:
                                  time_from: str = None, time_to: str = None,
                                  sort: str = "LATEST", limit: int = 50) -> List[MarketNews]:
         """시장 뉴스 및 감정 분석 데이터 수집"""
-        self._wait_for_rate_limit()
-        
         try:
             params = {
                 "function": "NEWS_SENTIMENT",
@@ -182,9 +166,9 @@ class AlphaVantageIntelligence:
             if time_to:
                 params["time_to"] = time_to
             
-            response = requests.get(self.base_url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            data = query_alphavantage(params, self.base_url)
+            if data is None:
+                return []
             
             if "Error Message" in data or "Note" in data:
                 self.logger.warning(f"News sentiment API issue: {data}")
@@ -239,17 +223,15 @@ class AlphaVantageIntelligence:
     
     def get_top_gainers_losers(self) -> Dict[str, List[TopMover]]:
         """상승/하락/거래량 상위 종목 조회"""
-        self._wait_for_rate_limit()
-        
         try:
             params = {
                 "function": "TOP_GAINERS_LOSERS",
                 "apikey": self.api_key
             }
             
-            response = requests.get(self.base_url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            data = query_alphavantage(params, self.base_url)
+            if data is None:
+                return {}
             
             if "Error Message" in data or "Note" in data:
                 self.logger.warning(f"Top movers API issue: {data}")
@@ -363,8 +345,6 @@ class AlphaVantageIntelligence:
     
     def get_insider_transactions(self, symbol: str = None) -> List[InsiderTransaction]:
         """내부자 거래 정보 조회"""
-        self._wait_for_rate_limit()
-        
         try:
             params = {
                 "function": "INSIDER_TRANSACTIONS",
@@ -374,9 +354,9 @@ class AlphaVantageIntelligence:
             if symbol:
                 params["symbol"] = symbol
             
-            response = requests.get(self.base_url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            data = query_alphavantage(params, self.base_url)
+            if data is None:
+                return []
             
             if "Error Message" in data or "Note" in data:
                 self.logger.warning(f"Insider transactions API issue: {data}")
@@ -415,8 +395,6 @@ class AlphaVantageIntelligence:
         results = {}
         
         for symbol in symbols:
-            self._wait_for_rate_limit()
-            
             try:
                 params = {
                     "function": "ANALYTICS_SLIDING_WINDOW",
@@ -429,9 +407,9 @@ class AlphaVantageIntelligence:
                     "apikey": self.api_key
                 }
                 
-                response = requests.get(self.base_url, params=params, timeout=30)
-                response.raise_for_status()
-                data = response.json()
+                data = query_alphavantage(params, self.base_url)
+                if data is None:
+                    break
                 
                 if "Error Message" in data or "Note" in data:
                     self.logger.warning(f"Analytics API issue for {symbol}: {data}")
@@ -13,6 +13,9 @@ from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 import json
 from pathlib import Path
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_monitoring.alphavantage_cache import query_alphavantage
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -61,8 +64,6 @@ class AlphaVantageIntelligenceComplete:
         """초기화 및 지능적 API 키 관리"""
         self.logger = logging.getLogger(__name__)
         self.base_url = "https://www.alphavantage.co/query"
-        self.last_call_time = 0
-        self.rate_limit_delay = 12  # 초
         
         # API 키 지능적 선택
         self.api_key = self._select_best_api_key()
@@ -154,8 +155,9 @@ class AlphaVantageIntelligenceComplete:
                 "apikey": self.api_key
             }
             
-            response = requests.get(self.base_url, params=params, timeout=10)
-            data = response.json()
+            data = query_alphavantage(params, self.base_url, timeout=10)
+            if data is None:
+                return False
             
             # 에러나 정보 메시지만 있으면 실패
             if "Error Message" in data or ("Information" in data and "rate limit" in data["Information"]):
@@ -168,35 +170,21 @@ class AlphaVantageIntelligenceComplete:
         except Exception:
             return False
     
-    def _wait_for_rate_limit(self):
-        """Rate limit 대기"""
-        current_time = time.time()
-        time_since_last_call = current_time - self.last_call_time
-        
-        if time_since_last_call < self.rate_limit_delay:
-            wait_time = self.rate_limit_delay - time_since_last_call
-            self.logger.debug(f"Rate limit 대기: {wait_time:.1f}초")
-            time.sleep(wait_time)
-        
-        self.last_call_time = time.time()
-    
     def get_market_status(self) -> List[MarketStatus]:
         """글로벌 시장 상태 조회"""
         if not self.available_functions.get("MARKET_STATUS", False):
             self.logger.warning("Market Status 기능을 사용할 수 없습니다")
             return []
         
-        self._wait_for_rate_limit()
-        
         try:
             params = {
                 "function": "MARKET_STATUS",
                 "apikey": self.api_key
             }
             
-            response = requests.get(self.base_url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            data = query_alphavantage(params, self.base_url)
+            if data is None:
+                return []
             
             if "markets" not in data:
                 self.logger.warning(f"Market status 데이터 없음: {list(data.keys())}")
@@ -234,17 +222,15 @@ class AlphaVantageIntelligenceComplete:
             self.logger.warning("Top Gainers/Losers 기능을 사용할 수 없습니다")
             return {"top_gainers": [], "top_losers": [], "most_actively_traded": []}
         
-        self._wait_for_rate_limit()
-        
         try:
             params = {
                 "function": "TOP_GAINERS_LOSERS",
                 "apikey": self.api_key
             }
             
-            response = requests.get(self.base_url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            data = query_alphavantage(params, self.base_url)
+            if data is None:
+                return {"top_gainers": [], "top_losers": [], "most_actively_traded": []}
             
             result = {
                 "top_gainers": [],
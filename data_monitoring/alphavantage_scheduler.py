@@ -0,0 +1,275 @@
+"""
+Alpha Vantage 요청 스케줄러 모듈
+API 키별 토큰 버킷(분당 한도)과 일일 한도를 프로세스 전체(선택적으로 잠금 파일로 프로세스 간)에서 공유하고,
+우선순위가 높은 호출(시장 상태, 상위 변동 종목)부터 토큰을 배분
+"""
+
+import os
+import json
+import math
+import time
+import heapq
+import asyncio
+import hashlib
+import logging
+import itertools
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import Callable, Dict, Optional
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    # Windows 등 fcntl이 없는 환경에서는 프로세스 내부에서만 한도 공유
+    fcntl = None
+    FCNTL_AVAILABLE = False
+
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.monitoring_config import MONITORING_CONFIG
+
+# 우선순위 (작을수록 먼저)
+PRIORITY_CRITICAL = 0
+PRIORITY_HIGH = 1
+PRIORITY_NORMAL = 2
+PRIORITY_LOW = 3
+
+# API 함수별 기본 우선순위
+FUNCTION_PRIORITIES = {
+    'MARKET_STATUS': PRIORITY_CRITICAL,
+    'TOP_GAINERS_LOSERS': PRIORITY_CRITICAL,
+    'NEWS_SENTIMENT': PRIORITY_HIGH,
+    'GLOBAL_QUOTE': PRIORITY_HIGH,
+    'TIME_SERIES_INTRADAY': PRIORITY_NORMAL,
+    'CURRENCY_EXCHANGE_RATE': PRIORITY_NORMAL,
+    'INSIDER_TRANSACTIONS': PRIORITY_LOW,
+    'ANALYTICS_SLIDING_WINDOW': PRIORITY_LOW,
+}
+
+# 비동기 대기 시 상태를 다시 확인하는 최대 간격(초)
+_ASYNC_POLL_INTERVAL = 0.25
+
+
+def function_priority(function: str) -> int:
+    """API 함수 이름의 기본 우선순위"""
+    return FUNCTION_PRIORITIES.get(function, PRIORITY_NORMAL)
+
+
+@dataclass
+class QuotaStatus:
+    """API 키 한도 사용 현황"""
+    calls_per_minute: int
+    calls_per_day: int
+    tokens: float            # 지금 바로 쓸 수 있는 토큰 (분당 한도 기준)
+    used_today: int
+    remaining_today: int
+    waiting: int             # 토큰을 기다리는 요청 수
+    total_granted: int
+    total_rejected: int
+
+    def to_dict(self) -> Dict[str, float]:
+        return asdict(self)
+
+
+class AlphaVantageScheduler:
+    """API 키 1개의 토큰 버킷 요청 스케줄러
+
+    - 분당 한도: 용량 burst, 초당 calls_per_minute / 60개씩 채워지는 토큰 버킷
+    - 일일 한도: 날짜별 사용 횟수 (초과하면 대기하지 않고 거절)
+    - 우선순위 큐: 대기 중인 요청 중 우선순위(같으면 도착 순서)가 가장 앞선 요청만 토큰을 가져감
+    - state_path를 지정하면 잠금 파일로 보호되는 JSON 상태를 여러 프로세스가 공유
+    """
+
+    def __init__(self, calls_per_minute: Optional[int] = None, calls_per_day: Optional[int] = None,
+                 burst: Optional[int] = None, state_path: Optional[str] = None,
+                 clock: Callable[[], float] = time.time):
+        self.logger = logging.getLogger(__name__)
+        self.calls_per_minute = calls_per_minute or MONITORING_CONFIG.get('alphavantage_calls_per_minute', 5)
+        self.calls_per_day = calls_per_day or MONITORING_CONFIG.get('alphavantage_calls_per_day', 25)
+        self.capacity = float(burst or MONITORING_CONFIG.get('alphavantage_burst', 1))
+        self.refill_rate = self.calls_per_minute / 60.0
+        self.clock = clock
+
+        if state_path and not FCNTL_AVAILABLE:
+            self.logger.warning("fcntl을 사용할 수 없어 Alpha Vantage 한도를 프로세스 내부에서만 공유합니다")
+            state_path = None
+        self.state_path = state_path
+
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        self._waiters = []
+        self._sequence = itertools.count()
+        self._state = {'tokens': self.capacity, 'updated': self.clock(), 'day': self._today(), 'used_today': 0}
+        self.stats = {'granted': 0, 'rejected': 0, 'wait_seconds': 0.0}
+
+    def _today(self) -> str:
+        return datetime.fromtimestamp(self.clock()).strftime('%Y-%m-%d')
+
+    @contextmanager
+    def _shared_state(self):
+        """토큰/일일 사용량 상태 (프로세스 간 공유 시 잠금 파일에서 읽고 다시 기록)"""
+        if not self.state_path:
+            yield self._state
+            return
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.state_path)), exist_ok=True)
+        with open(self.state_path + '.lock', 'a+') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                state = dict(self._state)
+                if os.path.exists(self.state_path):
+                    try:
+                        with open(self.state_path, 'r', encoding='utf-8') as f:
+                            state.update(json.load(f))
+                    except (OSError, ValueError) as e:
+                        self.logger.warning(f"Alpha Vantage 한도 상태 파일 읽기 실패, 현재 상태로 덮어씁니다: {e}")
+                yield state
+                tmp_path = f"{self.state_path}.{os.getpid()}.tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(state, f)
+                os.replace(tmp_path, self.state_path)
+                self._state = state
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _refill(self, state: Dict):
+        now = self.clock()
+        today = self._today()
+        if state['day'] != today:
+            state['day'] = today
+            state['used_today'] = 0
+        elapsed = max(0.0, now - state['updated'])
+        state['tokens'] = min(self.capacity, state['tokens'] + elapsed * self.refill_rate)
+        state['updated'] = now
+
+    def _try_take(self, ticket) -> Optional[float]:
+        """(잠금 보유 상태에서) 토큰을 가져오면 0, 기다려야 하면 대기 시간, 일일 한도 초과면 None"""
+        with self._shared_state() as state:
+            self._refill(state)
+            if state['used_today'] >= self.calls_per_day:
+                return None
+            if self._waiters[0] is not ticket:
+                return max(1.0 - state['tokens'], 0.0) / self.refill_rate or _ASYNC_POLL_INTERVAL
+            if state['tokens'] >= 1.0:
+                state['tokens'] -= 1.0
+                state['used_today'] += 1
+                return 0.0
+            return (1.0 - state['tokens']) / self.refill_rate
+
+    def _enqueue(self, priority: int):
+        ticket = (priority, next(self._sequence))
+        heapq.heappush(self._waiters, ticket)
+        return ticket
+
+    def _dequeue(self, ticket):
+        self._waiters.remove(ticket)
+        heapq.heapify(self._waiters)
+        self._condition.notify_all()
+
+    def _finish(self, ticket, granted: bool, started: float, function: str) -> bool:
+        self._dequeue(ticket)
+        self.stats['wait_seconds'] += time.monotonic() - started
+        if granted:
+            self.stats['granted'] += 1
+        else:
+            self.stats['rejected'] += 1
+            self.logger.warning(f"Alpha Vantage 호출 생략 ({function or '요청'}): 일일 한도 또는 대기 시간 초과")
+        return granted
+
+    def acquire(self, priority: int = PRIORITY_NORMAL, timeout: Optional[float] = None,
+                function: str = '') -> bool:
+        """토큰 1개 획득 (동기, 필요하면 대기). 일일 한도 초과나 timeout이면 False"""
+        started = time.monotonic()
+        deadline = None if timeout is None else started + timeout
+        with self._condition:
+            ticket = self._enqueue(priority)
+            while True:
+                wait = self._try_take(ticket)
+                if wait is None:
+                    return self._finish(ticket, False, started, function)
+                if wait == 0.0:
+                    return self._finish(ticket, True, started, function)
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return self._finish(ticket, False, started, function)
+                    wait = min(wait, remaining)
+                if wait > 1.0:
+                    self.logger.debug(f"Alpha Vantage rate limit wait: {wait:.1f}s")
+                self._condition.wait(wait)
+
+    async def acquire_async(self, priority: int = PRIORITY_NORMAL, timeout: Optional[float] = None,
+                            function: str = '') -> bool:
+        """토큰 1개 획득 (비동기, 이벤트 루프를 막지 않고 대기)"""
+        started = time.monotonic()
+        deadline = None if timeout is None else started + timeout
+        with self._lock:
+            ticket = self._enqueue(priority)
+        while True:
+            with self._lock:
+                wait = self._try_take(ticket)
+                if wait is None:
+                    return self._finish(ticket, False, started, function)
+                if wait == 0.0:
+                    return self._finish(ticket, True, started, function)
+                if deadline is not None and time.monotonic() >= deadline:
+                    return self._finish(ticket, False, started, function)
+            await asyncio.sleep(min(wait, _ASYNC_POLL_INTERVAL))
+
+    def calls_available(self, within_seconds: float = 0.0) -> int:
+        """지금부터 within_seconds 안에 보낼 수 있는 호출 수 (분당/일일 한도와 대기 요청 반영)"""
+        with self._lock:
+            with self._shared_state() as state:
+                self._refill(state)
+                by_rate = math.floor(state['tokens'] + within_seconds * self.refill_rate)
+                remaining_today = self.calls_per_day - state['used_today']
+        return max(0, min(by_rate, remaining_today) - len(self._waiters))
+
+    def status(self) -> QuotaStatus:
+        """한도 사용 현황"""
+        with self._lock:
+            with self._shared_state() as state:
+                self._refill(state)
+                return QuotaStatus(
+                    calls_per_minute=self.calls_per_minute,
+                    calls_per_day=self.calls_per_day,
+                    tokens=round(state['tokens'], 3),
+                    used_today=state['used_today'],
+                    remaining_today=max(0, self.calls_per_day - state['used_today']),
+                    waiting=len(self._waiters),
+                    total_granted=self.stats['granted'],
+                    total_rejected=self.stats['rejected']
+                )
+
+
+_schedulers: Dict[str, AlphaVantageScheduler] = {}
+_schedulers_lock = threading.Lock()
+
+
+def _quota_state_path(api_key: str) -> Optional[str]:
+    quota_dir = MONITORING_CONFIG.get('alphavantage_quota_dir')
+    if not quota_dir:
+        return None
+    # API 키는 파일 이름에 그대로 쓰지 않음
+    return os.path.join(quota_dir, hashlib.sha1(api_key.encode('utf-8')).hexdigest()[:16] + '.json')
+
+
+def get_alphavantage_scheduler(api_key: str) -> AlphaVantageScheduler:
+    """API 키별 프로세스 전역 스케줄러 (같은 키를 쓰는 수집기끼리 한도 공유)"""
+    with _schedulers_lock:
+        scheduler = _schedulers.get(api_key)
+        if scheduler is None:
+            scheduler = _schedulers[api_key] = AlphaVantageScheduler(state_path=_quota_state_path(api_key))
+        return scheduler
+
+
+def set_alphavantage_scheduler(api_key: str, scheduler: Optional[AlphaVantageScheduler]):
+    """API 키의 스케줄러 교체 (테스트용)"""
+    with _schedulers_lock:
+        if scheduler is None:
+            _schedulers.pop(api_key, None)
+        else:
+            _schedulers[api_key] = scheduler
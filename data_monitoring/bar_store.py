@@ -0,0 +1,212 @@
+"""
+로컬 OHLCV 봉 데이터 저장소 모듈
+심볼/인터벌별 컬럼형 파일(Feather)에 과거 데이터를 보관하고, 마지막 저장 시점 이후의 봉만 추가로 다운로드
+"""
+
+import os
+import json
+import time
+import threading
+import logging
+from typing import Dict, Optional
+
+import pandas as pd
+import yfinance as yf
+
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.monitoring_config import MONITORING_CONFIG
+from data_monitoring.history_cache import period_to_days, slice_to_period
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    PYARROW_AVAILABLE = True
+except ImportError:
+    # pyarrow가 없으면 pickle 파일로 대체 (메모리 매핑 미지원)
+    PYARROW_AVAILABLE = False
+
+INDEX_COLUMN = "Datetime"
+
+
+class BarStore:
+    """심볼/인터벌별 OHLCV 로컬 저장소
+
+    - 최초 요청 시 period 전체를 다운로드해 파일로 저장
+    - 이후에는 마지막 저장 봉부터의 꼬리 구간만 다운로드해 병합
+    - 더 넓은 period 요청이 오면 한 번 전체를 다시 받아 구간을 넓힘
+    - 파일은 비압축 Feather(Arrow IPC)로 저장해 대시보드에서 메모리 매핑으로 읽을 수 있음
+    """
+
+    def __init__(self, base_dir: Optional[str] = None, min_refresh_seconds: Optional[float] = None):
+        self.logger = logging.getLogger(__name__)
+        self.base_dir = base_dir or MONITORING_CONFIG.get('bar_store_dir', 'output/bars')
+        self.min_refresh_seconds = (
+            min_refresh_seconds if min_refresh_seconds is not None
+            else MONITORING_CONFIG.get('bar_store_min_refresh', 60)
+        )
+        os.makedirs(self.base_dir, exist_ok=True)
+
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self.stats = {'full_downloads': 0, 'tail_downloads': 0, 'local_reads': 0}
+
+    def get_history(self, symbol: str, period: str = "1mo", interval: str = "1d") -> pd.DataFrame:
+        """period 구간의 OHLCV 데이터 조회 (로컬 우선, 부족한 꼬리만 다운로드)"""
+        path = self._data_path(symbol, interval)
+
+        with self._get_lock(path):
+            meta = self._read_meta(symbol, interval)
+            stored = self.load(symbol, interval) if meta else pd.DataFrame()
+
+            if stored.empty or period_to_days(meta.get('period', '1d')) < period_to_days(period):
+                data = self._download(symbol, interval, period=period)
+                if data.empty:
+                    return slice_to_period(stored, period, interval)
+                self.stats['full_downloads'] += 1
+                merged = self._merge(stored, data)
+                self._write(symbol, interval, merged, period)
+                return slice_to_period(merged, period, interval)
+
+            if time.time() - meta.get('updated_at', 0) < self.min_refresh_seconds:
+                self.stats['local_reads'] += 1
+                return slice_to_period(stored, period, interval)
+
+            # 마지막 저장 봉(진행 중이던 봉일 수 있음)부터 다시 받아 덮어씀
+            tail = self._download(symbol, interval, start=stored.index[-1])
+            self.stats['tail_downloads'] += 1
+            merged = self._merge(stored, tail) if not tail.empty else stored
+            self._write(symbol, interval, merged, meta['period'])
+            return slice_to_period(merged, period, interval)
+
+    def fetch(self, symbol: str, period: str, interval: str) -> pd.DataFrame:
+        """HistoryCache fetcher 시그니처 호환 메서드"""
+        return self.get_history(symbol, period=period, interval=interval)
+
+    def load(self, symbol: str, interval: str = "1d", memory_map: bool = True) -> pd.DataFrame:
+        """저장된 전체 데이터를 네트워크 없이 읽기 (대시보드용)"""
+        path = self._data_path(symbol, interval)
+        if not os.path.exists(path):
+            return pd.DataFrame()
+
+        try:
+            if PYARROW_AVAILABLE:
+                table = feather.read_table(path, memory_map=memory_map)
+                data = table.to_pandas()
+            else:
+                data = pd.read_pickle(path)
+            return data.set_index(INDEX_COLUMN)
+        except Exception as e:
+            self.logger.error(f"Error reading bar store for {symbol}: {str(e)}")
+            return pd.DataFrame()
+
+    def list_symbols(self, interval: str = "1d") -> list:
+        """저장된 심볼 목록"""
+        symbols = []
+        suffix = f"_{interval}.json"
+        for filename in os.listdir(self.base_dir):
+            if filename.endswith(suffix):
+                with open(os.path.join(self.base_dir, filename), 'r') as f:
+                    symbols.append(json.load(f).get('symbol'))
+        return sorted(s for s in symbols if s)
+
+    def _download(self, symbol: str, interval: str, period: Optional[str] = None,
+                  start: Optional[pd.Timestamp] = None) -> pd.DataFrame:
+        """Yahoo Finance에서 전체 구간 또는 start 이후 구간 다운로드"""
+        try:
+            ticker = yf.Ticker(symbol)
+            if start is not None:
+                return ticker.history(start=start.strftime('%Y-%m-%d'), interval=interval)
+            return ticker.history(period=period, interval=interval)
+        except Exception as e:
+            self.logger.error(f"Error downloading bars for {symbol}: {str(e)}")
+            return pd.DataFrame()
+
+    @staticmethod
+    def _merge(stored: pd.DataFrame, new: pd.DataFrame) -> pd.DataFrame:
+        """새 봉으로 겹치는 구간을 덮어쓰며 병합"""
+        if stored.empty:
+            return new.sort_index()
+        if new.empty:
+            return stored
+
+        merged = pd.concat([stored[stored.index < new.index.min()], new])
+        merged = merged[~merged.index.duplicated(keep='last')]
+        return merged.sort_index()
+
+    def _write(self, symbol: str, interval: str, data: pd.DataFrame, period: str):
+        """임시 파일에 쓴 뒤 교체 (다른 프로세스가 읽는 중에도 안전)"""
+        path = self._data_path(symbol, interval)
+        tmp_path = f"{path}.tmp.{os.getpid()}"
+
+        frame = data.copy()
+        frame.index.name = INDEX_COLUMN
+        frame = frame.reset_index()
+
+        try:
+            if PYARROW_AVAILABLE:
+                feather.write_feather(frame, tmp_path, compression='uncompressed')
+            else:
+                frame.to_pickle(tmp_path)
+            os.replace(tmp_path, path)
+
+            meta = {
+                'symbol': symbol,
+                'interval': interval,
+                'period': period,
+                'updated_at': time.time(),
+                'rows': len(frame),
+                'last_bar': str(frame[INDEX_COLUMN].iloc[-1]) if len(frame) else None
+            }
+            meta_tmp = f"{self._meta_path(symbol, interval)}.tmp.{os.getpid()}"
+            with open(meta_tmp, 'w') as f:
+                json.dump(meta, f, ensure_ascii=False)
+            os.replace(meta_tmp, self._meta_path(symbol, interval))
+
+        except Exception as e:
+            self.logger.error(f"Error writing bar store for {symbol}: {str(e)}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _read_meta(self, symbol: str, interval: str) -> Dict:
+        meta_path = self._meta_path(symbol, interval)
+        if not os.path.exists(meta_path) or not os.path.exists(self._data_path(symbol, interval)):
+            return {}
+        try:
+            with open(meta_path, 'r') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def _file_stem(self, symbol: str, interval: str) -> str:
+        # ^GSPC, USDKRW=X 같은 심볼을 파일명으로 안전하게 변환
+        safe_symbol = "".join(c if c.isalnum() or c in "-_." else "_" for c in symbol)
+        return os.path.join(self.base_dir, f"{safe_symbol}_{interval}")
+
+    def _data_path(self, symbol: str, interval: str) -> str:
+        extension = "feather" if PYARROW_AVAILABLE else "pkl"
+        return f"{self._file_stem(symbol, interval)}.{extension}"
+
+    def _meta_path(self, symbol: str, interval: str) -> str:
+        return f"{self._file_stem(symbol, interval)}.json"
+
+    def _get_lock(self, path: str) -> threading.Lock:
+        with self._locks_guard:
+            if path not in self._locks:
+                self._locks[path] = threading.Lock()
+            return self._locks[path]
+
+
+# 프로세스 전역 저장소 인스턴스
+_bar_store: Optional[BarStore] = None
+_bar_store_lock = threading.Lock()
+
+
+def get_bar_store() -> BarStore:
+    """프로세스 전역 봉 데이터 저장소 반환 (최초 호출 시 생성)"""
+    global _bar_store
+    if _bar_store is None:
+        with _bar_store_lock:
+            if _bar_store is None:
+                _bar_store = BarStore()
+    return _bar_store
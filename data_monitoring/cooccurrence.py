@@ -0,0 +1,111 @@
+"""
+개념 동시 출현 행렬 모듈
+문서 × 개념 희소 행렬을 쌓아 가중 동시 출현 행렬을 한 번의 희소 행렬 곱으로 계산
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+import networkx as nx
+from scipy import sparse
+
+
+class CooccurrenceMatrix:
+    """문서 × 개념 희소 행렬 기반 동시 출현 누적기
+
+    - add_document(s)로 문서별 개념 점수를 행 단위로 쌓고 (문서 가중치 지원)
+    - 동시 출현 행렬 C = Xᵀ · diag(w) · X 를 희소 곱 한 번으로 계산해 누적 (대각 성분 제외)
+    - 새 문서가 들어오면 쌓인 행만 다시 곱해 기존 행렬에 더하므로 증분 갱신 가능
+    - transform='sqrt'이면 점수에 제곱근을 취해, 문서당 쌍 가중치가 sqrt(s1 * s2)가 됨
+    """
+
+    def __init__(self, concepts: Optional[Iterable[str]] = None, transform: Optional[str] = None):
+        if transform not in (None, 'sqrt'):
+            raise ValueError(f"지원하지 않는 변환: {transform}")
+        self.transform = transform
+        self.concepts: List[str] = []
+        self._index: Dict[str, int] = {}
+        for concept in concepts or []:
+            self._concept_id(concept)
+
+        self.document_count = 0
+        self._matrix = sparse.csr_matrix((0, 0), dtype=np.float64)
+        # 아직 곱하지 않은 문서 행 (COO 형식 버퍼)
+        self._rows: List[int] = []
+        self._cols: List[int] = []
+        self._values: List[float] = []
+        self._doc_weights: List[float] = []
+
+    def _concept_id(self, concept: str) -> int:
+        index = self._index.get(concept)
+        if index is None:
+            index = self._index[concept] = len(self.concepts)
+            self.concepts.append(concept)
+        return index
+
+    def add_document(self, scores: Dict[str, float], weight: float = 1.0):
+        """문서 1건의 개념 점수 추가 (점수가 0 이하인 개념은 무시)"""
+        row = len(self._doc_weights)
+        for concept, score in scores.items():
+            if score > 0:
+                self._rows.append(row)
+                self._cols.append(self._concept_id(concept))
+                self._values.append(float(score))
+        self._doc_weights.append(float(weight))
+        self.document_count += 1
+
+    def add_documents(self, documents: Iterable[Dict[str, float]], weights: Optional[Iterable[float]] = None):
+        """여러 문서의 개념 점수 추가"""
+        if weights is None:
+            for scores in documents:
+                self.add_document(scores)
+        else:
+            for scores, weight in zip(documents, weights):
+                self.add_document(scores, weight)
+
+    def _flush(self):
+        """쌓인 문서 행을 곱해 동시 출현 행렬에 누적"""
+        size = len(self.concepts)
+        if self._matrix.shape[0] < size:
+            # 새 개념이 생기면 기존 값은 그대로 두고 행/열만 확장
+            self._matrix.resize((size, size))
+        if not self._doc_weights:
+            return
+
+        values = np.asarray(self._values, dtype=np.float64)
+        if self.transform == 'sqrt':
+            values = np.sqrt(values)
+        docs = sparse.csr_matrix((values, (self._rows, self._cols)),
+                                 shape=(len(self._doc_weights), size))
+        weighted = sparse.diags(np.asarray(self._doc_weights, dtype=np.float64)) @ docs
+        product = (docs.T @ weighted).tocsr()
+        product.setdiag(0)
+        product.eliminate_zeros()
+        self._matrix = (self._matrix + product).tocsr()
+
+        self._rows, self._cols, self._values, self._doc_weights = [], [], [], []
+
+    def matrix(self) -> sparse.csr_matrix:
+        """개념 × 개념 가중 동시 출현 행렬 (대칭, 행/열 순서는 self.concepts)"""
+        self._flush()
+        return self._matrix
+
+    def weight(self, concept1: str, concept2: str) -> float:
+        """두 개념의 누적 동시 출현 가중치"""
+        if concept1 not in self._index or concept2 not in self._index:
+            return 0.0
+        return float(self.matrix()[self._index[concept1], self._index[concept2]])
+
+    def edges(self, min_weight: float = 0.0) -> Iterator[Tuple[str, str, float]]:
+        """가중치가 min_weight를 넘는 개념 쌍 (각 쌍은 한 번만, 상삼각 기준)"""
+        upper = sparse.triu(self.matrix(), k=1).tocoo()
+        mask = upper.data > min_weight
+        concepts = self.concepts
+        for i, j, value in zip(upper.row[mask], upper.col[mask], upper.data[mask]):
+            yield concepts[i], concepts[j], float(value)
+
+    def to_graph(self, min_weight: float = 0.0, graph: Optional[nx.Graph] = None) -> nx.Graph:
+        """동시 출현 관계를 weight 속성 엣지로 가진 그래프로 변환"""
+        graph = graph if graph is not None else nx.Graph()
+        graph.add_weighted_edges_from(self.edges(min_weight))
+        return graph
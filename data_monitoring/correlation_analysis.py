@@ -13,6 +13,15 @@ import logging
 from scipy.stats import pearsonr
 from sklearn.preprocessing import StandardScaler
 from sklearn.decomposition import PCA
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_monitoring.history_cache import HistoryCache, get_history_cache
+from data_monitoring.correlation_engine import RollingCorrelationEngine
+
+# 기간별 상관관계 윈도우 (수익률 개수 기준)
+WINDOW_1W = 5
+WINDOW_1M = 20
 
 class CorrelationStrength(Enum):
     VERY_STRONG = "very_strong"      # |r| >= 0.8
@@ -70,8 +79,9 @@ class SectorCorrelation:
 class CorrelationAnalyzer:
     """시장 상관관계 분석 클래스"""
     
-    def __init__(self):
+    def __init__(self, history_cache: Optional[HistoryCache] = None):
         self.logger = logging.getLogger(__name__)
+        self.history_cache = history_cache or get_history_cache()
         
         # 주요 시장 지수 및 섹터 정의
         self.market_indices = {
@@ -97,82 +107,124 @@ class CorrelationAnalyzer:
             ("^GSPC", "^VIX"): -0.75,  # S&P 500과 VIX
             ("XLK", "QQQ"): 0.95,      # 기술 섹터 ETF와 NASDAQ
         }
+        
+        # (심볼 구성, 기간)별 롤링 상관관계 엔진 - 새 봉만 증분 반영
+        self._engines: Dict[Tuple[Tuple[str, ...], str], RollingCorrelationEngine] = {}
     
     def analyze_market_correlations(self, symbols: List[str], period: str = "3mo") -> Dict[str, CorrelationPair]:
         """시장 상관관계 분석"""
         try:
-            # 데이터 수집
-            price_data = self._collect_price_data(symbols, period)
+            engine = self._get_engine(symbols, period)
             
-            if price_data.empty:
+            if engine is None:
                 self.logger.error("No price data available")
                 return {}
             
-            # 수익률 계산
-            returns = price_data.pct_change().dropna()
-            
-            # 모든 쌍에 대한 상관관계 계산
-            correlations = {}
-            
-            for i, symbol1 in enumerate(symbols):
-                for j, symbol2 in enumerate(symbols[i+1:], i+1):
-                    if symbol1 in returns.columns and symbol2 in returns.columns:
-                        corr_pair = self._calculate_correlation_pair(
-                            returns[symbol1], returns[symbol2], symbol1, symbol2
-                        )
-                        if corr_pair:
-                            correlations[f"{symbol1}_{symbol2}"] = corr_pair
-            
-            return correlations
+            return self._build_correlation_pairs(engine, symbols)
             
         except Exception as e:
             self.logger.error(f"Error analyzing correlations: {str(e)}")
             return {}
     
     def detect_correlation_breaks(self, symbols: List[str]) -> List[MarketCorrelationBreak]:
-        """상관관계 이탈 감지"""
+        """상관관계 이탈 감지 (최근 1개월 윈도우 상관관계를 기준값과 일괄 비교)"""
         breaks = []
         
         try:
-            # 현재 상관관계 계산
-            current_correlations = self.analyze_market_correlations(symbols, "1mo")
+            engine = self._get_engine(symbols, "3mo")
+            if engine is None:
+                return breaks
             
-            for pair_key, corr_pair in current_correlations.items():
-                symbol1, symbol2 = pair_key.split('_')
-                pair_tuple = (symbol1, symbol2)
-                reverse_tuple = (symbol2, symbol1)
-                
-                # 기준 상관관계 확인
-                expected_corr = None
-                if pair_tuple in self.normal_correlations:
-                    expected_corr = self.normal_correlations[pair_tuple]
-                elif reverse_tuple in self.normal_correlations:
-                    expected_corr = self.normal_correlations[reverse_tuple]
+            # 임계값을 넘는 이탈 감지 (0.2 이상 차이)
+            candidates = engine.find_breaks(self.normal_correlations, threshold=0.2, window=WINDOW_1M)
+            
+            for symbol1, symbol2, expected_corr, actual_corr, deviation in candidates:
+                significance = min(1.0, deviation / 0.5)  # 0.5 차이를 최대로 정규화
                 
-                if expected_corr is not None:
-                    deviation = abs(corr_pair.correlation - expected_corr)
-                    
-                    # 임계값을 넘는 이탈 감지 (0.2 이상 차이)
-                    if deviation > 0.2:
-                        significance = min(1.0, deviation / 0.5)  # 0.5 차이를 최대로 정규화
-                        
-                        break_event = MarketCorrelationBreak(
-                            timestamp=datetime.now(),
-                            symbol1=symbol1,
-                            symbol2=symbol2,
-                            expected_correlation=expected_corr,
-                            actual_correlation=corr_pair.correlation,
-                            deviation_magnitude=deviation,
-                            significance=significance,
-                            description=f"{symbol1}과 {symbol2}의 상관관계가 예상({expected_corr:.2f})에서 {deviation:.2f} 이탈"
-                        )
-                        breaks.append(break_event)
+                break_event = MarketCorrelationBreak(
+                    timestamp=datetime.now(),
+                    symbol1=symbol1,
+                    symbol2=symbol2,
+                    expected_correlation=expected_corr,
+                    actual_correlation=actual_corr,
+                    deviation_magnitude=deviation,
+                    significance=significance,
+                    description=f"{symbol1}과 {symbol2}의 상관관계가 예상({expected_corr:.2f})에서 {deviation:.2f} 이탈"
+                )
+                breaks.append(break_event)
             
         except Exception as e:
             self.logger.error(f"Error detecting correlation breaks: {str(e)}")
         
         return breaks
     
+    def _get_engine(self, symbols: List[str], period: str) -> Optional[RollingCorrelationEngine]:
+        """심볼 구성/기간별 상관관계 엔진 (이전 계산 이후 새로 들어온 봉만 추가)"""
+        price_data = self._collect_price_data(list(dict.fromkeys(symbols)), period)
+        if price_data.empty or len(price_data.columns) < 2:
+            return None
+        
+        key = (tuple(price_data.columns), period)
+        engine = self._engines.get(key)
+        if engine is not None and engine.matches(price_data):
+            engine.extend(price_data)
+        else:
+            engine = RollingCorrelationEngine.from_prices(price_data, windows=(WINDOW_1W, WINDOW_1M))
+            self._engines[key] = engine
+        return engine
+    
+    def _build_correlation_pairs(self, engine: RollingCorrelationEngine,
+                                 symbols: List[str]) -> Dict[str, CorrelationPair]:
+        """상관관계/기간별 상관관계/p-value/안정성을 행렬 단위로 계산한 뒤 쌍별 결과로 변환"""
+        correlation = engine.correlation_array()
+        p_values = engine.p_values()
+        
+        # 기간별 상관관계 (데이터가 부족하거나 1일처럼 정의되지 않으면 전체 기간 값 사용)
+        correlation_1d = correlation
+        correlation_1w = engine.correlation_array(WINDOW_1W) if len(engine) >= WINDOW_1W else correlation
+        correlation_1m = engine.correlation_array(WINDOW_1M) if len(engine) >= WINDOW_1M else correlation
+        correlation_1w = np.where(np.isnan(correlation_1w), correlation, correlation_1w)
+        correlation_1m = np.where(np.isnan(correlation_1m), correlation, correlation_1m)
+        
+        # 안정성 점수 (표준편차가 낮을수록 안정성이 높음)
+        stability = np.clip(1.0 - np.std([correlation_1d, correlation_1w, correlation_1m, correlation], axis=0) * 2,
+                            0.0, 1.0)
+        
+        columns = {symbol: i for i, symbol in enumerate(engine.symbols)}
+        present = [symbol for symbol in dict.fromkeys(symbols) if symbol in columns]
+        
+        correlations = {}
+        for i, symbol1 in enumerate(present):
+            for symbol2 in present[i+1:]:
+                a, b = columns[symbol1], columns[symbol2]
+                value = float(correlation[a, b])
+                if np.isnan(value):
+                    continue
+                
+                # 방향 분류
+                if value > 0.1:
+                    direction = CorrelationDirection.POSITIVE
+                elif value < -0.1:
+                    direction = CorrelationDirection.NEGATIVE
+                else:
+                    direction = CorrelationDirection.NEUTRAL
+                
+                correlations[f"{symbol1}_{symbol2}"] = CorrelationPair(
+                    symbol1=symbol1,
+                    symbol2=symbol2,
+                    correlation=value,
+                    strength=self._classify_correlation_strength(abs(value)),
+                    direction=direction,
+                    p_value=float(p_values[a, b]),
+                    is_significant=bool(p_values[a, b] < 0.05),
+                    correlation_1d=float(correlation_1d[a, b]),
+                    correlation_1w=float(correlation_1w[a, b]),
+                    correlation_1m=float(correlation_1m[a, b]),
+                    stability_score=float(stability[a, b])
+                )
+        
+        return correlations
+    
     def analyze_sector_correlations(self) -> Dict[str, SectorCorrelation]:
         """섹터별 상관관계 분석"""
         sector_analyses = {}
@@ -191,66 +243,23 @@ class CorrelationAnalyzer:
         return sector_analyses
     
     def _collect_price_data(self, symbols: List[str], period: str) -> pd.DataFrame:
-        """가격 데이터 수집"""
-        price_data = pd.DataFrame()
+        """가격 데이터 수집 (종가 열을 모아 한 번에 결합)"""
+        closes = {}
         
         for symbol in symbols:
             try:
-                ticker = yf.Ticker(symbol)
-                hist = ticker.history(period=period)
+                hist = self.history_cache.get_history(symbol, period=period)
                 
                 if not hist.empty:
-                    price_data[symbol] = hist['Close']
+                    closes[symbol] = hist['Close']
                     
             except Exception as e:
                 self.logger.error(f"Error collecting data for {symbol}: {str(e)}")
                 continue
         
-        return price_data.dropna()
-    
-    def _calculate_correlation_pair(self, series1: pd.Series, series2: pd.Series, 
-                                  symbol1: str, symbol2: str) -> Optional[CorrelationPair]:
-        """두 시계열 간 상관관계 계산"""
-        try:
-            # 전체 기간 상관관계
-            correlation, p_value = pearsonr(series1, series2)
-            
-            # 기간별 상관관계
-            correlation_1d = pearsonr(series1.tail(1), series2.tail(1))[0] if len(series1) >= 1 else correlation
-            correlation_1w = pearsonr(series1.tail(5), series2.tail(5))[0] if len(series1) >= 5 else correlation
-            correlation_1m = pearsonr(series1.tail(20), series2.tail(20))[0] if len(series1) >= 20 else correlation
-            
-            # 상관관계 강도 분류
-            strength = self._classify_correlation_strength(abs(correlation))
-            
-            # 방향 분류
-            if correlation > 0.1:
-                direction = CorrelationDirection.POSITIVE
-            elif correlation < -0.1:
-                direction = CorrelationDirection.NEGATIVE
-            else:
-                direction = CorrelationDirection.NEUTRAL
-            
-            # 안정성 점수 계산
-            stability_score = self._calculate_stability_score([correlation_1d, correlation_1w, correlation_1m, correlation])
-            
-            return CorrelationPair(
-                symbol1=symbol1,
-                symbol2=symbol2,
-                correlation=correlation,
-                strength=strength,
-                direction=direction,
-                p_value=p_value,
-                is_significant=p_value < 0.05,
-                correlation_1d=correlation_1d,
-                correlation_1w=correlation_1w,
-                correlation_1m=correlation_1m,
-                stability_score=stability_score
-            )
-            
-        except Exception as e:
-            self.logger.error(f"Error calculating correlation for {symbol1}-{symbol2}: {str(e)}")
-            return None
+        if not closes:
+            return pd.DataFrame()
+        return pd.concat(closes, axis=1).dropna()
     
     def _classify_correlation_strength(self, abs_correlation: float) -> CorrelationStrength:
         """상관관계 강도 분류"""
@@ -265,17 +274,6 @@ class CorrelationAnalyzer:
         else:
             return CorrelationStrength.VERY_WEAK
     
-    def _calculate_stability_score(self, correlations: List[float]) -> float:
-        """상관관계 안정성 점수 계산"""
-        if len(correlations) < 2:
-            return 0.5
-        
-        # 표준편차가 낮을수록 안정성이 높음
-        std_dev = np.std(correlations)
-        stability = max(0.0, 1.0 - std_dev * 2)  # 표준편차 0.5를 기준으로 정규화
-        
-        return min(1.0, stability)
-    
     def _analyze_single_sector(self, sector_name: str, symbols: List[str]) -> Optional[SectorCorrelation]:
         """단일 섹터 분석"""
         try:
@@ -0,0 +1,242 @@
+"""
+롤링 상관관계 엔진 모듈
+수익률 패널 전체에 대해 상관관계 행렬과 롤링 윈도우 상관관계를 행렬 연산으로 한 번에 계산
+새 봉이 들어오면 윈도우별 누적합(Σx, Σxxᵀ)만 O(N²)로 갱신
+"""
+
+import logging
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+
+def _correlation_from_sums(count: int, sums: np.ndarray, products: np.ndarray) -> np.ndarray:
+    """관측 수, Σx, Σxxᵀ로 피어슨 상관계수 행렬 계산 (분산 0인 심볼은 NaN)"""
+    if count < 2:
+        return np.full(products.shape, np.nan)
+    cov = (products - np.outer(sums, sums) / count) / (count - 1)
+    std = np.sqrt(np.clip(np.diag(cov), 0.0, None))
+    denom = np.outer(std, std)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        corr = np.where(denom > 0, cov / denom, np.nan)
+    corr = np.clip(corr, -1.0, 1.0)
+    np.fill_diagonal(corr, np.where(std > 0, 1.0, np.nan))
+    return corr
+
+
+def correlation_p_values(corr: np.ndarray, count: int) -> np.ndarray:
+    """상관계수 행렬의 양측 p-value (scipy.stats.pearsonr와 같은 t 분포 검정)"""
+    if count <= 2:
+        return np.full(corr.shape, np.nan)
+    dof = count - 2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t_stat = corr * np.sqrt(dof / (1.0 - corr ** 2))
+    return 2.0 * stats.t.sf(np.abs(t_stat), dof)
+
+
+class _WindowSums:
+    """최근 window개 수익률의 누적합 (추가/제거 모두 O(N²))"""
+
+    def __init__(self, window: int, size: int):
+        self.window = window
+        self.count = 0
+        self.sums = np.zeros(size)
+        self.products = np.zeros((size, size))
+
+    def reset(self, rows: np.ndarray):
+        rows = rows[-self.window:]
+        self.count = len(rows)
+        self.sums = rows.sum(axis=0)
+        self.products = rows.T @ rows
+
+    def push(self, row: np.ndarray, dropped: Optional[np.ndarray]):
+        self.sums += row
+        self.products += np.outer(row, row)
+        self.count += 1
+        if dropped is not None:
+            self.sums -= dropped
+            self.products -= np.outer(dropped, dropped)
+            self.count -= 1
+
+    def correlation(self) -> np.ndarray:
+        return _correlation_from_sums(self.count, self.sums, self.products)
+
+
+class RollingCorrelationEngine:
+    """수익률 패널 기반 상관관계 엔진
+
+    - from_prices(): 종가 패널(행: 시점, 열: 심볼)로 초기화 (결측 행 제거 후 수익률 계산)
+    - update(): 새 봉 종가 1행 추가, 추적 중인 윈도우 누적합을 증분 갱신 (결측 심볼은 직전 종가 유지)
+    - correlation(window): 전체 보관 구간 또는 최근 window개 수익률의 상관관계 행렬
+    - rolling_correlations(window): 모든 시점의 롤링 상관관계를 누적합 차분으로 한 번에 계산
+    - find_breaks(): 기준 상관관계 사전과 일괄 비교해 이탈 후보 반환
+    """
+
+    def __init__(self, symbols: List[str], windows: Iterable[int] = (5, 20), max_history: int = 252):
+        self.logger = logging.getLogger(__name__)
+        self.symbols = list(symbols)
+        self._column = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self.windows = sorted(set(int(w) for w in windows))
+        self.max_history = max(max_history, *self.windows) if self.windows else max_history
+
+        size = len(self.symbols)
+        self._returns: deque = deque()
+        self._timestamps: deque = deque()
+        self._window_sums = {window: _WindowSums(window, size) for window in self.windows}
+        self._last_close: Optional[np.ndarray] = None
+        self.last_timestamp = None
+        self._updates_since_rebuild = 0
+
+    @classmethod
+    def from_prices(cls, prices: pd.DataFrame, windows: Iterable[int] = (5, 20),
+                    max_history: Optional[int] = None) -> "RollingCorrelationEngine":
+        """종가 패널로 엔진 생성 (max_history를 생략하면 처음 적재한 수익률 개수를 보관 길이로 사용)"""
+        prices = prices.dropna()
+        returns = prices.pct_change().dropna()
+        engine = cls(list(prices.columns), windows=windows,
+                     max_history=max_history if max_history is not None else max(len(returns), 1))
+        engine._load(prices, returns)
+        return engine
+
+    def _load(self, prices: pd.DataFrame, returns: pd.DataFrame):
+        rows = returns.to_numpy(dtype=np.float64)[-self.max_history:]
+        self._returns = deque(rows, maxlen=None)
+        self._timestamps = deque(returns.index[-self.max_history:])
+        if len(prices):
+            self._last_close = prices.iloc[-1].to_numpy(dtype=np.float64)
+            self.last_timestamp = prices.index[-1]
+        self._rebuild()
+
+    def _rebuild(self):
+        """보관 중인 수익률로 윈도우 누적합을 다시 계산 (증분 갱신의 부동소수 오차 제거)"""
+        rows = self._matrix()
+        for sums in self._window_sums.values():
+            sums.reset(rows)
+        self._updates_since_rebuild = 0
+
+    def _matrix(self) -> np.ndarray:
+        if not self._returns:
+            return np.zeros((0, len(self.symbols)))
+        return np.vstack(self._returns)
+
+    def __len__(self) -> int:
+        """보관 중인 수익률 개수"""
+        return len(self._returns)
+
+    def update(self, closes, timestamp=None) -> bool:
+        """새 봉 종가 추가 (timestamp가 마지막 시점 이전이면 무시하고 False 반환)"""
+        if timestamp is not None and self.last_timestamp is not None and timestamp <= self.last_timestamp:
+            return False
+
+        if isinstance(closes, dict):
+            closes = pd.Series(closes)
+        if isinstance(closes, pd.Series):
+            closes = closes.reindex(self.symbols)
+        close = np.asarray(closes, dtype=np.float64)
+
+        if self._last_close is None:
+            self._last_close = close
+            self.last_timestamp = timestamp
+            return True
+
+        close = np.where(np.isnan(close), self._last_close, close)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            row = np.where(self._last_close != 0, close / self._last_close - 1.0, 0.0)
+        row = np.nan_to_num(row)
+
+        self._returns.append(row)
+        self._timestamps.append(timestamp)
+        for window, sums in self._window_sums.items():
+            dropped = self._returns[-window - 1] if len(self._returns) > window else None
+            sums.push(row, dropped)
+        if len(self._returns) > self.max_history:
+            self._returns.popleft()
+            self._timestamps.popleft()
+
+        self._last_close = close
+        self.last_timestamp = timestamp
+        self._updates_since_rebuild += 1
+        if self._updates_since_rebuild >= self.max_history:
+            self._rebuild()
+        return True
+
+    def extend(self, prices: pd.DataFrame) -> int:
+        """종가 패널에서 마지막 시점 이후의 행만 추가하고 추가한 행 수 반환"""
+        prices = prices.reindex(columns=self.symbols)
+        if self.last_timestamp is not None:
+            prices = prices[prices.index > self.last_timestamp]
+        added = 0
+        for timestamp, row in prices.iterrows():
+            added += self.update(row, timestamp)
+        return added
+
+    def matches(self, prices: pd.DataFrame) -> bool:
+        """패널이 이 엔진의 심볼 구성과 같고 마지막 시점 종가가 일치하면 증분 갱신 가능"""
+        if list(prices.columns) != self.symbols or self.last_timestamp not in prices.index:
+            return False
+        close = prices.loc[self.last_timestamp].to_numpy(dtype=np.float64)
+        return bool(np.allclose(close, self._last_close, equal_nan=True))
+
+    @property
+    def returns(self) -> pd.DataFrame:
+        """보관 중인 수익률 패널"""
+        return pd.DataFrame(self._matrix(), index=list(self._timestamps), columns=self.symbols)
+
+    def correlation_array(self, window: Optional[int] = None) -> np.ndarray:
+        """상관관계 행렬 (window=None이면 보관 구간 전체, 추적 중인 윈도우는 누적합 사용)"""
+        if window in self._window_sums and len(self._returns) >= window:
+            return self._window_sums[window].correlation()
+        rows = self._matrix()
+        if window is not None:
+            rows = rows[-window:]
+        return _correlation_from_sums(len(rows), rows.sum(axis=0), rows.T @ rows)
+
+    def correlation(self, window: Optional[int] = None) -> pd.DataFrame:
+        return pd.DataFrame(self.correlation_array(window), index=self.symbols, columns=self.symbols)
+
+    def p_values(self, window: Optional[int] = None) -> np.ndarray:
+        """상관계수 p-value 행렬"""
+        count = len(self._returns) if window is None else min(window, len(self._returns))
+        return correlation_p_values(self.correlation_array(window), count)
+
+    def rolling_correlations(self, window: int) -> Tuple[List, np.ndarray]:
+        """모든 시점의 window 롤링 상관관계 (시점 목록, 배열 [T - window + 1, N, N])"""
+        rows = self._matrix()
+        count = len(rows)
+        if count < window:
+            return [], np.zeros((0, len(self.symbols), len(self.symbols)))
+
+        zero_sums = np.zeros((1, rows.shape[1]))
+        cum_sums = np.concatenate([zero_sums, np.cumsum(rows, axis=0)])
+        cum_products = np.concatenate([zero_sums[:, :, None] * zero_sums[:, None, :],
+                                       np.cumsum(rows[:, :, None] * rows[:, None, :], axis=0)])
+        sums = cum_sums[window:] - cum_sums[:-window]
+        products = cum_products[window:] - cum_products[:-window]
+
+        cov = (products - sums[:, :, None] * sums[:, None, :] / window) / (window - 1)
+        std = np.sqrt(np.clip(np.diagonal(cov, axis1=1, axis2=2), 0.0, None))
+        denom = std[:, :, None] * std[:, None, :]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr = np.clip(np.where(denom > 0, cov / denom, np.nan), -1.0, 1.0)
+        return list(self._timestamps)[window - 1:], corr
+
+    def find_breaks(self, expected: Dict[Tuple[str, str], float], threshold: float = 0.2,
+                    window: Optional[int] = None) -> List[Tuple[str, str, float, float, float]]:
+        """기준 상관관계에서 threshold 넘게 벗어난 쌍 (symbol1, symbol2, 기준, 현재, 이탈 크기)"""
+        pairs = [(s1, s2, value) for (s1, s2), value in expected.items()
+                 if s1 in self._column and s2 in self._column]
+        if not pairs:
+            return []
+
+        rows = np.array([self._column[s1] for s1, _, _ in pairs])
+        cols = np.array([self._column[s2] for _, s2, _ in pairs])
+        expected_values = np.array([value for _, _, value in pairs], dtype=np.float64)
+        actual = self.correlation_array(window)[rows, cols]
+        deviation = np.abs(actual - expected_values)
+
+        hits = np.flatnonzero(deviation > threshold)
+        return [(pairs[i][0], pairs[i][1], float(expected_values[i]), float(actual[i]), float(deviation[i]))
+                for i in hits]
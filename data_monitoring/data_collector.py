@@ -7,10 +7,19 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 import asyncio
 import aiohttp
 import logging
+import time
+import threading
 from dataclasses import dataclass
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_monitoring.history_cache import HistoryCache, get_history_cache
+from data_monitoring.indicators import latest_values
+from config.monitoring_config import MONITORING_CONFIG
 
 @dataclass
 class MarketData:
@@ -25,10 +34,52 @@ class MarketData:
     low_24h: float
     market_cap: Optional[float] = None
 
+class InfoCache:
+    """자주 바뀌지 않는 ticker.info 필드(longName, marketCap) 캐시"""
+    
+    FIELDS = ('longName', 'marketCap')
+    
+    def __init__(self, ttl_seconds: float = 86400):
+        self.logger = logging.getLogger(__name__)
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[str, Tuple[float, Dict]] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, symbol: str) -> Dict:
+        """캐시된 info 필드 조회 (만료 또는 없으면 다운로드)"""
+        with self._lock:
+            entry = self._entries.get(symbol)
+        if entry and time.time() - entry[0] < self.ttl_seconds:
+            return entry[1]
+        
+        try:
+            info = yf.Ticker(symbol).info or {}
+            fields = {key: info.get(key) for key in self.FIELDS}
+        except Exception as e:
+            self.logger.warning(f"Error fetching info for {symbol}: {str(e)}")
+            # 실패 시 이전 값이라도 사용
+            return entry[1] if entry else {}
+        
+        with self._lock:
+            self._entries[symbol] = (time.time(), fields)
+        return fields
+    
+    def get_cached(self, symbol: str) -> Optional[Dict]:
+        """다운로드 없이 캐시에 있는 값만 조회 (만료 여부 무시)"""
+        with self._lock:
+            entry = self._entries.get(symbol)
+        return entry[1] if entry else None
+
+# 프로세스 전역 info 캐시
+info_cache = InfoCache(ttl_seconds=MONITORING_CONFIG.get('info_cache_ttl', 86400))
+
 class EconomicDataCollector:
-    def __init__(self):
+    def __init__(self, history_cache: Optional[HistoryCache] = None, batched: bool = True):
         self.logger = logging.getLogger(__name__)
         self.session = None
+        self.history_cache = history_cache or get_history_cache()
+        self.info_cache = info_cache
+        self.batched = batched
         
     async def __aenter__(self):
         self.session = aiohttp.ClientSession()
@@ -43,8 +94,8 @@ class EconomicDataCollector:
         try:
             ticker = yf.Ticker(symbol)
             
-            # 현재 정보 가져오기
-            info = ticker.info
+            # 현재 정보 가져오기 (info는 캐시 사용)
+            info = self.info_cache.get(symbol)
             hist = ticker.history(period="2d")  # 최근 2일 데이터
             
             if hist.empty:
@@ -59,7 +110,7 @@ class EconomicDataCollector:
             
             return MarketData(
                 symbol=symbol,
-                name=info.get('longName', symbol),
+                name=info.get('longName') or symbol,
                 timestamp=datetime.now(),
                 current_price=float(current_data['Close']),
                 previous_close=float(previous_data['Close']),
@@ -74,8 +125,22 @@ class EconomicDataCollector:
             self.logger.error(f"Error collecting data for {symbol}: {str(e)}")
             return None
     
-    async def collect_multiple_symbols(self, symbols: List[str]) -> Dict[str, MarketData]:
+    async def collect_multiple_symbols(self, symbols: List[str], batched: Optional[bool] = None) -> Dict[str, MarketData]:
         """여러 심볼의 데이터를 동시에 수집"""
+        if batched if batched is not None else self.batched:
+            results = await asyncio.to_thread(self.collect_batch_data, symbols)
+            
+            # 배치 다운로드에서 빠진 심볼만 개별 수집으로 보완
+            missing = [symbol for symbol in symbols if symbol not in results]
+            if missing:
+                self.logger.info(f"배치 수집 누락 {len(missing)}개 심볼 개별 수집")
+                results.update(await self._collect_symbols_individually(missing))
+            return results
+        
+        return await self._collect_symbols_individually(symbols)
+    
+    async def _collect_symbols_individually(self, symbols: List[str]) -> Dict[str, MarketData]:
+        """심볼별 스레드로 개별 수집"""
         tasks = []
         for symbol in symbols:
             task = asyncio.create_task(
@@ -94,11 +159,71 @@ class EconomicDataCollector:
         
         return results
     
+    def collect_batch_data(self, symbols: List[str]) -> Dict[str, MarketData]:
+        """모든 심볼의 최근 시세를 한 번의 다운로드로 수집"""
+        if not symbols:
+            return {}
+        
+        try:
+            # 거래소별 휴장일이 달라 2일 대신 5일을 받아 심볼별 마지막 2개 유효 봉 사용
+            wide = yf.download(
+                symbols, period="5d", interval="1d",
+                group_by='column', threads=True, progress=False
+            )
+        except Exception as e:
+            self.logger.error(f"Error downloading batch data: {str(e)}")
+            return {}
+        
+        if wide is None or wide.empty:
+            return {}
+        
+        if not isinstance(wide.columns, pd.MultiIndex):
+            wide.columns = pd.MultiIndex.from_product([wide.columns, symbols[:1]])
+        
+        # 아직 info 캐시에 없는 심볼만 병렬로 채움 (이후 사이클은 캐시 적중)
+        uncached = [symbol for symbol in symbols if self.info_cache.get_cached(symbol) is None]
+        if uncached:
+            with ThreadPoolExecutor(max_workers=min(8, len(uncached))) as executor:
+                list(executor.map(self.info_cache.get, uncached))
+        
+        close = wide['Close']
+        results = {}
+        timestamp = datetime.now()
+        
+        for symbol in symbols:
+            if symbol not in close.columns:
+                continue
+            
+            valid = close[symbol].dropna()
+            if valid.empty:
+                continue
+            
+            current_idx = valid.index[-1]
+            current_close = float(valid.iloc[-1])
+            previous_close = float(valid.iloc[-2]) if len(valid) > 1 else current_close
+            change_percent = ((current_close - previous_close) / previous_close) * 100 if previous_close else 0.0
+            volume = wide['Volume'][symbol].get(current_idx, 0)
+            info = self.info_cache.get_cached(symbol) or {}
+            
+            results[symbol] = MarketData(
+                symbol=symbol,
+                name=info.get('longName') or symbol,
+                timestamp=timestamp,
+                current_price=current_close,
+                previous_close=previous_close,
+                change_percent=float(change_percent),
+                volume=int(volume) if not pd.isna(volume) else 0,
+                high_24h=float(wide['High'][symbol].get(current_idx, current_close)),
+                low_24h=float(wide['Low'][symbol].get(current_idx, current_close)),
+                market_cap=info.get('marketCap')
+            )
+        
+        return results
+    
     def calculate_volatility(self, symbol: str, days: int = 30) -> float:
         """변동성 계산 (30일 기준)"""
         try:
-            ticker = yf.Ticker(symbol)
-            hist = ticker.history(period=f"{days}d")
+            hist = self.history_cache.get_history(symbol, period=f"{days}d")
             
             if len(hist) < 2:
                 return 0.0
@@ -118,9 +243,7 @@ class EconomicDataCollector:
     def get_historical_data(self, symbol: str, period: str = "1mo") -> pd.DataFrame:
         """과거 데이터 조회"""
         try:
-            ticker = yf.Ticker(symbol)
-            hist = ticker.history(period=period)
-            return hist
+            return self.history_cache.get_history(symbol, period=period)
         except Exception as e:
             self.logger.error(f"Error getting historical data for {symbol}: {str(e)}")
             return pd.DataFrame()
@@ -133,22 +256,19 @@ class EconomicDataCollector:
         indicators = {}
         
         try:
+            # 공유 지표 엔진에서 최신 값만 계산
+            values = latest_values(data)
+            
             # 이동평균
-            indicators['sma_20'] = data['Close'].rolling(window=20).mean().iloc[-1]
-            indicators['sma_50'] = data['Close'].rolling(window=50).mean().iloc[-1] if len(data) >= 50 else None
+            indicators['sma_20'] = values['sma_20']
+            indicators['sma_50'] = values['sma_50'] if len(data) >= 50 else None
             
             # RSI (Relative Strength Index)
-            delta = data['Close'].diff()
-            gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-            rs = gain / loss
-            indicators['rsi'] = (100 - (100 / (1 + rs))).iloc[-1]
+            indicators['rsi'] = values['rsi']
             
             # 볼린저 밴드
-            sma_20 = data['Close'].rolling(window=20).mean()
-            std_20 = data['Close'].rolling(window=20).std()
-            indicators['bollinger_upper'] = (sma_20 + (std_20 * 2)).iloc[-1]
-            indicators['bollinger_lower'] = (sma_20 - (std_20 * 2)).iloc[-1]
+            indicators['bollinger_upper'] = values['bollinger_upper']
+            indicators['bollinger_lower'] = values['bollinger_lower']
             
             # 현재 가격이 볼린저 밴드 어디에 위치하는지
             current_price = data['Close'].iloc[-1]
@@ -24,6 +24,7 @@ from data_monitoring.integrated_alphavantage_collector import IntegratedAlphaVan
 from data_monitoring.alphavantage_intelligence_complete import AlphaVantageIntelligenceComplete
 from data_monitoring.fred_data_collector import FREDDataCollector
 from data_monitoring.news_social_collector import EnhancedNewsCollector
+from data_monitoring.news_pool import get_news_pool
 import json
 
 @dataclass
@@ -267,31 +268,32 @@ class EnhancedGlobalDataCollector:
         """뉴스 데이터 수집"""
         all_news = []
         
+        # 모든 피드를 공유 뉴스 풀에서 한 번에 갱신 (다른 수집기가 받은 피드는 재사용)
+        news_pool = get_news_pool()
+        feeds = news_pool.refresh(url for sources in self.news_sources.values() for url in sources)
+        
         for category, sources in self.news_sources.items():
             self.logger.info(f"Collecting {category} news...")
             
             for source_url in sources:
                 try:
-                    feed = feedparser.parse(source_url)
+                    feed = feeds[source_url]
                     
-                    for entry in feed.entries[:10]:  # 각 소스에서 최대 10개
+                    # 중복 제거된 기사 기준 (여러 피드에 실린 기사는 처음 본 피드에서 한 번만 처리)
+                    for article in news_pool.articles(feed_urls=[source_url], limit=10):  # 각 소스에서 최대 10개
                         try:
-                            published = datetime.now()
-                            if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                                published = datetime(*entry.published_parsed[:6])
-                            
                             # 간단한 감정 분석 (키워드 기반)
-                            sentiment_score = self._analyze_sentiment(entry.title + " " + entry.get('summary', ''))
+                            sentiment_score = self._analyze_sentiment(article.text)
                             
                             # 키워드 추출
-                            keywords = self._extract_keywords(entry.title + " " + entry.get('summary', ''))
+                            keywords = self._extract_keywords(article.text)
                             
                             news_item = NewsData(
-                                title=entry.title,
-                                summary=entry.get('summary', '')[:500],  # 500자 제한
-                                url=entry.link,
-                                published=published,
-                                source=feed.feed.get('title', 'Unknown'),
+                                title=article.title,
+                                summary=article.summary[:500],  # 500자 제한
+                                url=article.link,
+                                published=article.published,
+                                source=feed.title,
                                 sentiment_score=sentiment_score,
                                 keywords=keywords
                             )
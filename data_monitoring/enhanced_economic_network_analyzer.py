@@ -12,9 +12,16 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple
 from collections import Counter, defaultdict
 import re
-from textblob import TextBlob
 import json
 
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_monitoring.keyword_matcher import KeywordMatcher
+from data_monitoring.sentiment_service import get_sentiment_service
+from data_monitoring.cooccurrence import CooccurrenceMatrix
+from data_monitoring.network_metrics import get_network_metrics_calculator
+
 class EnhancedEconomicNetworkAnalyzer:
     """개선된 경제 개념 네트워크 분석기"""
     
@@ -212,6 +219,14 @@ class EnhancedEconomicNetworkAnalyzer:
             'mentioned_together': 0.3       # 단순 동시 언급
         }
         
+        # 16개 카테고리의 주요 개념/관련 용어를 한 오토마톤으로 컴파일
+        self.concept_matcher = KeywordMatcher({
+            term_group: terms
+            for category, concept_data in self.economic_concepts.items()
+            for term_group, terms in ((f"{category}:main", concept_data['main_concepts']),
+                                      (f"{category}:related", concept_data['related_terms']))
+        })
+        
         self.logger.info("✅ 개선된 경제 네트워크 분석기 초기화 완료")
     
     def extract_economic_concepts(self, text: str) -> Dict[str, Any]:
@@ -225,21 +240,22 @@ class EnhancedEconomicNetworkAnalyzer:
         found_concepts = {}
         concept_scores = {}
         
+        # 모든 카테고리의 용어를 한 번의 스캔으로 확인
+        hits = self.concept_matcher.find(text_clean_lower)
+        
         for category, concept_data in self.economic_concepts.items():
             category_score = 0
             found_terms = []
             
             # 주요 개념 검색 (높은 가중치)
-            for main_concept in concept_data['main_concepts']:
-                if main_concept.lower() in text_clean_lower:
-                    category_score += 2.0 * concept_data['weight']
-                    found_terms.append(main_concept)
+            for main_concept in hits[f"{category}:main"]:
+                category_score += 2.0 * concept_data['weight']
+                found_terms.append(main_concept)
             
             # 관련 용어 검색 (낮은 가중치)
-            for related_term in concept_data['related_terms']:
-                if related_term.lower() in text_clean_lower:
-                    category_score += 1.0 * concept_data['weight']
-                    found_terms.append(related_term)
+            for related_term in hits[f"{category}:related"]:
+                category_score += 1.0 * concept_data['weight']
+                found_terms.append(related_term)
             
             if category_score > 0:
                 found_concepts[category] = {
@@ -257,18 +273,16 @@ class EnhancedEconomicNetworkAnalyzer:
         
         # 모든 텍스트에서 개념 추출
         all_concepts = {}
-        concept_cooccurrence = defaultdict(lambda: defaultdict(int))
+        # 개념 쌍 가중치 sqrt(s1 * s2)를 문서 × 개념 희소 행렬 곱으로 누적
+        cooccurrence = CooccurrenceMatrix(transform='sqrt')
         concept_sentiments = defaultdict(list)
         
-        for text in texts:
+        # 감정 분석 (전체 텍스트를 한 번에 배치 처리)
+        polarities = get_sentiment_service().polarities(texts)
+        
+        for text, sentiment in zip(texts, polarities):
             concepts, scores = self.extract_economic_concepts(text)
             
-            # 감정 분석
-            try:
-                sentiment = TextBlob(text).sentiment.polarity
-            except:
-                sentiment = 0.0
-            
             # 개념별 점수 누적
             for concept, data in concepts.items():
                 if concept not in all_concepts:
@@ -285,13 +299,7 @@ class EnhancedEconomicNetworkAnalyzer:
                 concept_sentiments[concept].append(sentiment)
             
             # 동시 출현 관계 계산
-            concept_list = list(concepts.keys())
-            for i, concept1 in enumerate(concept_list):
-                for concept2 in concept_list[i+1:]:
-                    # 상호 가중치 적용
-                    weight = (concepts[concept1]['score'] * concepts[concept2]['score']) ** 0.5
-                    concept_cooccurrence[concept1][concept2] += weight
-                    concept_cooccurrence[concept2][concept1] += weight
+            cooccurrence.add_document({concept: data['score'] for concept, data in concepts.items()})
         
         # 네트워크 그래프 생성
         G = nx.Graph()
@@ -310,22 +318,20 @@ class EnhancedEconomicNetworkAnalyzer:
         
         # 엣지 추가 (관계들)
         edges_added = 0
-        for concept1, connections in concept_cooccurrence.items():
-            for concept2, weight in connections.items():
-                if weight > 0.5:  # 임계값 이상의 관계만 포함
-                    # 관계 유형 결정
-                    relationship_type = self._determine_relationship_type_advanced(
-                        concept1, concept2, weight
-                    )
-                    
-                    # 정규화된 가중치
-                    normalized_weight = min(weight / 10.0, 1.0)
-                    
-                    G.add_edge(concept1, concept2,
-                              weight=normalized_weight,
-                              relationship_type=relationship_type,
-                              strength=weight)
-                    edges_added += 1
+        for concept1, concept2, weight in cooccurrence.edges(min_weight=0.5):  # 임계값 이상의 관계만 포함
+            # 관계 유형 결정
+            relationship_type = self._determine_relationship_type_advanced(
+                concept1, concept2, weight
+            )
+            
+            # 정규화된 가중치
+            normalized_weight = min(weight / 10.0, 1.0)
+            
+            G.add_edge(concept1, concept2,
+                      weight=normalized_weight,
+                      relationship_type=relationship_type,
+                      strength=weight)
+            edges_added += 1
         
         # 네트워크 메트릭 계산
         metrics = self._calculate_network_metrics(G)
@@ -384,37 +390,34 @@ class EnhancedEconomicNetworkAnalyzer:
         metrics = {}
         
         try:
+            # 그래프 크기에 따라 정확/근사 계산 (같은 구조의 그래프는 캐시 사용)
+            result = get_network_metrics_calculator().compute(G)
+            metrics['metrics_mode'] = result.mode
+            
             # 기본 메트릭
-            metrics['density'] = nx.density(G)
-            metrics['average_clustering'] = nx.average_clustering(G)
+            metrics['density'] = result.density
+            metrics['average_clustering'] = result.average_clustering
             
             # 중심성 지표
-            degree_centrality = nx.degree_centrality(G)
-            betweenness_centrality = nx.betweenness_centrality(G)
-            closeness_centrality = nx.closeness_centrality(G)
-            
             metrics['centrality'] = {
-                'degree': degree_centrality,
-                'betweenness': betweenness_centrality,
-                'closeness': closeness_centrality
+                'degree': result.degree,
+                'betweenness': result.betweenness,
+                'closeness': result.closeness
             }
             
             # 가장 중요한 노드들
             metrics['top_nodes'] = {
-                'by_degree': sorted(degree_centrality.items(), 
-                                  key=lambda x: x[1], reverse=True)[:5],
-                'by_betweenness': sorted(betweenness_centrality.items(), 
-                                       key=lambda x: x[1], reverse=True)[:5]
+                'by_degree': result.top('degree'),
+                'by_betweenness': result.top('betweenness')
             }
             
             # 연결 성분
-            if nx.is_connected(G):
-                metrics['diameter'] = nx.diameter(G)
-                metrics['average_path_length'] = nx.average_shortest_path_length(G)
+            if result.connected:
+                metrics['diameter'] = result.diameter
+                metrics['average_path_length'] = result.average_path_length
             else:
-                components = list(nx.connected_components(G))
-                metrics['connected_components'] = len(components)
-                metrics['largest_component_size'] = len(max(components, key=len))
+                metrics['connected_components'] = result.connected_components
+                metrics['largest_component_size'] = result.largest_component_size
             
         except Exception as e:
             self.logger.warning(f"메트릭 계산 중 오류: {e}")
@@ -15,6 +15,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from data_monitoring.monitor import EconomicMonitor
 from data_monitoring.integrated_event_system import IntegratedEventSystem
 from data_monitoring.advanced_event_detector import AdvancedEconomicEvent
+from data_monitoring.streaming_indicators import StreamingIndicatorBank
+from config.monitoring_config import MONITORING_CONFIG
 
 class EnhancedEconomicMonitor(EconomicMonitor):
     """고도화된 경제 모니터링 시스템"""
@@ -27,6 +29,11 @@ class EnhancedEconomicMonitor(EconomicMonitor):
         # 고도화된 분석 결과 저장
         self.latest_advanced_analysis = None
         self.advanced_events_history = []
+        
+        # 인트라데이 스트리밍 지표 (체크포인트에서 복원해 새 봉만 반영)
+        self.streaming_interval = MONITORING_CONFIG.get('streaming_interval', '5m')
+        self.streaming_checkpoint = MONITORING_CONFIG.get('streaming_checkpoint', 'output/streaming_indicators.json')
+        self.streaming_indicators = StreamingIndicatorBank.load(self.streaming_checkpoint)
     
     async def run_enhanced_monitoring_cycle(self) -> Dict:
         """고도화된 모니터링 사이클 실행"""
@@ -39,10 +46,14 @@ class EnhancedEconomicMonitor(EconomicMonitor):
             # 2. 고도화된 분석 실행
             advanced_analysis = await self.integrated_system.run_comprehensive_analysis()
             
-            # 3. 결과 통합
+            # 3. 인트라데이 스트리밍 지표 갱신
+            streaming_snapshot = await asyncio.to_thread(self._update_streaming_indicators)
+            
+            # 4. 결과 통합
             integrated_result = self._integrate_results(basic_events, advanced_analysis)
+            integrated_result['streaming_indicators'] = streaming_snapshot
             
-            # 4. 결과 저장 및 업데이트
+            # 5. 결과 저장 및 업데이트
             self.latest_advanced_analysis = advanced_analysis
             self._update_history(integrated_result)
             
@@ -79,6 +90,27 @@ class EnhancedEconomicMonitor(EconomicMonitor):
             self.logger.error(f"기본 모니터링 실패: {str(e)}")
             return []
     
+    def _update_streaming_indicators(self) -> Dict:
+        """새로 완성된 인트라데이 봉만 스트리밍 지표에 반영하고 체크포인트 저장"""
+        applied = 0
+        for symbol in self.monitoring_symbols:
+            try:
+                bars = self.data_collector.history_cache.get_history(
+                    symbol, period="5d", interval=self.streaming_interval
+                )
+                applied += self.streaming_indicators.update_from_frame(symbol, bars)
+            except Exception as e:
+                self.logger.error(f"스트리밍 지표 갱신 실패 {symbol}: {str(e)}")
+        
+        if applied:
+            try:
+                self.streaming_indicators.save(self.streaming_checkpoint)
+            except OSError as e:
+                self.logger.error(f"스트리밍 지표 체크포인트 저장 실패: {str(e)}")
+        
+        self.logger.info(f"스트리밍 지표 갱신: 새 봉 {applied}개 반영")
+        return self.streaming_indicators.snapshot(self.monitoring_symbols)
+    
     def _integrate_results(self, basic_events: List, advanced_analysis: Dict) -> Dict:
         """기본 이벤트와 고도화된 분석 결과 통합"""
         
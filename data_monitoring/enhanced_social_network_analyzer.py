@@ -12,7 +12,13 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple
 from collections import Counter, defaultdict
 import re
-from textblob import TextBlob
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_monitoring.cooccurrence import CooccurrenceMatrix
+from data_monitoring.keyword_matcher import KeywordMatcher
+from data_monitoring.network_metrics import get_network_metrics_calculator
 
 class EnhancedSocialNetworkAnalyzer:
     """강화된 소셜 네트워크 분석기 - 경제 개념 중심"""
@@ -151,6 +157,15 @@ class EnhancedSocialNetworkAnalyzer:
             ('regulation', 'financial_services'): 0.8
         }
         
+        # 개념 키워드와 다단어 키워드의 구성 단어를 매처 하나로 컴파일 (문서당 한 번 스캔)
+        concept_terms = {
+            concept: keywords + [word for keyword in keywords for word in keyword.split()]
+            for concept, keywords in self.economic_concepts.items()
+        }
+        self.concept_matcher = KeywordMatcher(concept_terms)
+        self._concept_term_sets = {concept: {term.lower() for term in terms}
+                                   for concept, terms in concept_terms.items()}
+        
         self.logger.info("✅ 강화된 소셜 네트워크 분석기 초기화 완료")
     
     def extract_concepts_from_text(self, text: str) -> Dict[str, float]:
@@ -163,14 +178,20 @@ class EnhancedSocialNetworkAnalyzer:
         text_clean_lower = text_clean.lower()
         
         concept_scores = {}
+        hits = self.concept_matcher.matched(text_clean_lower)
+        word_count = len(text_clean.split())
         
         for concept, keywords in self.economic_concepts.items():
+            # 일치한 단어가 하나도 없는 개념은 건너뜀
+            if hits.isdisjoint(self._concept_term_sets[concept]):
+                continue
+            
             score = 0
             matches = []
             
             for keyword in keywords:
                 # 정확한 매칭
-                if keyword in text_clean_lower:
+                if keyword.lower() in hits:
                     # 키워드 길이에 따른 가중치 (긴 키워드일수록 높은 점수)
                     weight = len(keyword.split()) * 1.5
                     score += weight
@@ -179,13 +200,13 @@ class EnhancedSocialNetworkAnalyzer:
                 # 부분 매칭 (단어 단위)
                 keyword_words = keyword.split()
                 if len(keyword_words) > 1:
-                    if all(word in text_clean_lower for word in keyword_words):
+                    if all(word.lower() in hits for word in keyword_words):
                         score += len(keyword_words) * 1.2
                         matches.append(keyword)
             
             if score > 0:
                 # 텍스트 길이 대비 정규화
-                normalized_score = score / (len(text_clean.split()) + 1) * 100
+                normalized_score = score / (word_count + 1) * 100
                 concept_scores[concept] = {
                     'score': normalized_score,
                     'matches': matches,
@@ -206,8 +227,8 @@ class EnhancedSocialNetworkAnalyzer:
         concept_sentiments = defaultdict(list)
         concept_contexts = defaultdict(list)
         
-        # 개념 간 동시 출현 매트릭스
-        concept_cooccurrence = defaultdict(int)
+        # 개념 간 동시 출현 매트릭스 (문서 × 개념 희소 행렬, 쌍 강도 = 점수 곱 × 문서 가중치)
+        cooccurrence = CooccurrenceMatrix()
         
         # Reddit 데이터 처리
         subreddits = reddit_data.get('subreddits', {})
@@ -242,13 +263,8 @@ class EnhancedSocialNetworkAnalyzer:
                         'url': post.get('permalink', '')
                     })
                 
-                # 개념 간 동시 출현 계산
-                concept_list = list(concepts.keys())
-                for i, concept1 in enumerate(concept_list):
-                    for concept2 in concept_list[i+1:]:
-                        # 두 개념의 점수 곱으로 관계 강도 계산
-                        strength = concepts[concept1]['score'] * concepts[concept2]['score']
-                        concept_cooccurrence[(concept1, concept2)] += strength
+                # 개념 간 동시 출현 (두 개념의 점수 곱으로 관계 강도 계산)
+                cooccurrence.add_document({concept: data['score'] for concept, data in concepts.items()})
             
             # 댓글 분석
             comments = subreddit_data.get('comments', [])
@@ -277,11 +293,7 @@ class EnhancedSocialNetworkAnalyzer:
                     })
                 
                 # 댓글의 개념 간 동시 출현 (가중치 0.5)
-                concept_list = list(concepts.keys())
-                for i, concept1 in enumerate(concept_list):
-                    for concept2 in concept_list[i+1:]:
-                        strength = concepts[concept1]['score'] * concepts[concept2]['score'] * 0.5
-                        concept_cooccurrence[(concept1, concept2)] += strength
+                cooccurrence.add_document({concept: data['score'] for concept, data in concepts.items()}, weight=0.5)
         
         # 네트워크 그래프 구성
         # 노드 추가 (언급 횟수가 2 이상인 개념만)
@@ -296,8 +308,8 @@ class EnhancedSocialNetworkAnalyzer:
                           contexts=concept_contexts[concept][:5])  # 상위 5개 컨텍스트만 저장
         
         # 엣지 추가
-        for (concept1, concept2), strength in concept_cooccurrence.items():
-            if concept1 in G.nodes() and concept2 in G.nodes() and strength > 1:
+        for concept1, concept2, strength in cooccurrence.edges(min_weight=1):
+            if concept1 in G.nodes() and concept2 in G.nodes():
                 # 기본 동시 출현 가중치
                 weight = strength
                 
@@ -339,39 +351,36 @@ class EnhancedSocialNetworkAnalyzer:
         if len(G.nodes()) == 0:
             return {}
         
+        # 그래프 크기에 따라 정확/근사 계산 (같은 구조의 그래프는 캐시 사용)
+        result = get_network_metrics_calculator().compute(G)
+        
         metrics = {
             'nodes_count': len(G.nodes()),
             'edges_count': len(G.edges()),
-            'density': nx.density(G),
-            'average_clustering': nx.average_clustering(G),
+            'density': result.density,
+            'average_clustering': result.average_clustering,
+            'metrics_mode': result.mode,
         }
         
         if len(G.nodes()) > 0:
-            # 중심성 측정
-            degree_centrality = nx.degree_centrality(G)
-            betweenness_centrality = nx.betweenness_centrality(G)
-            closeness_centrality = nx.closeness_centrality(G)
+            # 중심성 측정 (고유벡터 중심성은 반복법이라 그대로 계산)
             eigenvector_centrality = nx.eigenvector_centrality(G, max_iter=1000)
             
             metrics.update({
-                'top_degree_centrality': sorted(degree_centrality.items(), 
-                                               key=lambda x: x[1], reverse=True)[:10],
-                'top_betweenness_centrality': sorted(betweenness_centrality.items(), 
-                                                   key=lambda x: x[1], reverse=True)[:10],
-                'top_closeness_centrality': sorted(closeness_centrality.items(), 
-                                                 key=lambda x: x[1], reverse=True)[:10],
+                'top_degree_centrality': result.top('degree', 10),
+                'top_betweenness_centrality': result.top('betweenness', 10),
+                'top_closeness_centrality': result.top('closeness', 10),
                 'top_eigenvector_centrality': sorted(eigenvector_centrality.items(), 
                                                    key=lambda x: x[1], reverse=True)[:10]
             })
         
         # 연결성 분석
-        if nx.is_connected(G):
-            metrics['diameter'] = nx.diameter(G)
-            metrics['average_path_length'] = nx.average_shortest_path_length(G)
+        if result.connected:
+            metrics['diameter'] = result.diameter
+            metrics['average_path_length'] = result.average_path_length
         else:
-            metrics['connected_components'] = nx.number_connected_components(G)
-            largest_cc = max(nx.connected_components(G), key=len)
-            metrics['largest_component_size'] = len(largest_cc)
+            metrics['connected_components'] = result.connected_components
+            metrics['largest_component_size'] = result.largest_component_size
         
         return metrics
     
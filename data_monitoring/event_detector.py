@@ -9,11 +9,15 @@ from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from .data_collector import MarketData, EconomicDataCollector
+from .history_cache import HistoryCache, slice_to_period
+from .event_store import EventStore, get_event_store
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config.monitoring_config import ECONOMIC_INDICATORS, SEVERITY_WEIGHTS
+from config.monitoring_config import ECONOMIC_INDICATORS, SEVERITY_WEIGHTS, MONITORING_CONFIG
 
 class EventType(Enum):
     SURGE = "surge"  # 급등
@@ -37,34 +41,83 @@ class EconomicEvent:
     technical_indicators: Dict[str, float]
     market_context: Dict[str, any]
 
+class DetectionCycle:
+    """detect_events 1회 동안만 유지되는 심볼별 히스토리/기술적 지표 컨텍스트
+
+    - 히스토리는 심볼마다 가장 넓은 구간(3개월)을 한 번만 받고 좁은 구간은 잘라서 사용
+    - 기술적 지표도 심볼마다 한 번만 계산해 가격/거래량/변동성 탐지가 공유
+    - 실패 결과(빈 데이터)도 기억해 같은 주기 안에서 다시 시도하지 않음
+    """
+    
+    HISTORY_PERIOD = "3mo"
+    
+    def __init__(self, data_collector: EconomicDataCollector):
+        self.data_collector = data_collector
+        self._histories: Dict[str, pd.DataFrame] = {}
+        self._indicators: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+        self._symbol_locks: Dict[str, threading.Lock] = {}
+        self.stats = {'history_fetches': 0, 'indicator_computations': 0}
+    
+    def _symbol_lock(self, symbol: str) -> threading.Lock:
+        with self._lock:
+            return self._symbol_locks.setdefault(symbol, threading.Lock())
+    
+    def history(self, symbol: str, period: str = HISTORY_PERIOD) -> pd.DataFrame:
+        """심볼의 일봉 히스토리 (주기 내 1회 조회, period는 3개월 이하)"""
+        with self._symbol_lock(symbol):
+            if symbol not in self._histories:
+                self._histories[symbol] = self.data_collector.get_historical_data(symbol, self.HISTORY_PERIOD)
+                self.stats['history_fetches'] += 1
+            data = self._histories[symbol]
+        if period == self.HISTORY_PERIOD or data.empty:
+            return data
+        return slice_to_period(data, period)
+    
+    def indicators(self, symbol: str) -> Dict[str, float]:
+        """심볼의 기술적 지표 (주기 내 1회 계산, 이벤트마다 복사본 반환)"""
+        history = self.history(symbol)
+        with self._symbol_lock(symbol):
+            if symbol not in self._indicators:
+                self._indicators[symbol] = self.data_collector.calculate_technical_indicators(history)
+                self.stats['indicator_computations'] += 1
+            return dict(self._indicators[symbol])
+
 class EventDetector:
-    def __init__(self):
+    def __init__(self, history_cache: Optional[HistoryCache] = None,
+                 event_store: Optional[EventStore] = None,
+                 max_workers: Optional[int] = None):
         self.logger = logging.getLogger(__name__)
-        self.data_collector = EconomicDataCollector()
+        self.data_collector = EconomicDataCollector(history_cache)
         self.event_history = []  # 최근 이벤트 기록
         self.alert_cooldown = {}  # 알림 쿨다운 관리
+        self._event_store = event_store
+        self.max_workers = max_workers or MONITORING_CONFIG.get('detection_max_workers', 8)
+        self.last_cycle: Optional[DetectionCycle] = None
+    
+    @property
+    def event_store(self) -> Optional[EventStore]:
+        """탐지 이벤트를 기록할 저장소 (설정에서 끈 경우 None)"""
+        if self._event_store is None and MONITORING_CONFIG.get('event_store_enabled', True):
+            self._event_store = get_event_store()
+        return self._event_store
     
     def detect_events(self, market_data: Dict[str, MarketData]) -> List[EconomicEvent]:
         """시장 데이터에서 이벤트 탐지"""
         events = []
+        cycle = DetectionCycle(self.data_collector)
+        self.last_cycle = cycle
         
-        for symbol, data in market_data.items():
-            # 각 지표별 임계값 확인
-            indicator_config = self._get_indicator_config(symbol)
-            if not indicator_config:
-                continue
-            
-            # 1. 가격 변동 이벤트 탐지
-            price_events = self._detect_price_events(data, indicator_config)
-            events.extend(price_events)
-            
-            # 2. 거래량 이벤트 탐지
-            volume_events = self._detect_volume_events(data, symbol)
-            events.extend(volume_events)
-            
-            # 3. 변동성 이벤트 탐지
-            volatility_events = self._detect_volatility_events(data, indicator_config, symbol)
-            events.extend(volatility_events)
+        # 1~3. 심볼별 가격/거래량/변동성 이벤트를 병렬 탐지 (결과는 입력 순서 유지)
+        targets = [(symbol, data) for symbol, data in market_data.items()
+                   if self._get_indicator_config(symbol)]
+        if len(targets) > 1 and self.max_workers > 1:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(targets))) as executor:
+                results = list(executor.map(lambda item: self._detect_symbol_events(item[0], item[1], cycle), targets))
+        else:
+            results = [self._detect_symbol_events(symbol, data, cycle) for symbol, data in targets]
+        for symbol_events in results:
+            events.extend(symbol_events)
         
         # 4. 시장 간 상관관계 이벤트 탐지
         correlation_events = self._detect_correlation_events(market_data)
@@ -73,8 +126,39 @@ class EventDetector:
         # 5. 이벤트 필터링 및 우선순위 정렬
         filtered_events = self._filter_and_prioritize_events(events)
         
+        # 6. 조회용 이벤트 저장소에 기록
+        self._store_events(filtered_events)
+        
         return filtered_events
     
+    def _store_events(self, events: List[EconomicEvent]):
+        """이벤트 저장소 기록 (저장 실패가 탐지를 막지 않도록 경고만 남김)"""
+        if not events:
+            return
+        try:
+            store = self.event_store
+            if store is not None:
+                store.add_events(events, source='event_detector')
+        except Exception as e:
+            self.logger.warning(f"이벤트 저장소 기록 실패: {e}")
+    
+    def _detect_symbol_events(self, symbol: str, data: MarketData,
+                              cycle: DetectionCycle) -> List[EconomicEvent]:
+        """한 심볼의 가격/거래량/변동성 이벤트 탐지 (주기 컨텍스트 공유)"""
+        indicator_config = self._get_indicator_config(symbol)
+        events = []
+        
+        # 1. 가격 변동 이벤트 탐지
+        events.extend(self._detect_price_events(data, indicator_config, cycle))
+        
+        # 2. 거래량 이벤트 탐지
+        events.extend(self._detect_volume_events(data, symbol, cycle))
+        
+        # 3. 변동성 이벤트 탐지
+        events.extend(self._detect_volatility_events(data, indicator_config, symbol, cycle))
+        
+        return events
+    
     def _get_indicator_config(self, symbol: str) -> Optional[Dict]:
         """심볼에 해당하는 설정 찾기"""
         for category, indicators in ECONOMIC_INDICATORS.items():
@@ -83,7 +167,8 @@ class EventDetector:
                     return config
         return None
     
-    def _detect_price_events(self, data: MarketData, config: Dict) -> List[EconomicEvent]:
+    def _detect_price_events(self, data: MarketData, config: Dict,
+                             cycle: Optional[DetectionCycle] = None) -> List[EconomicEvent]:
         """가격 변동 이벤트 탐지"""
         events = []
         change_percent = data.change_percent
@@ -103,7 +188,7 @@ class EventDetector:
                 change_percent=change_percent,
                 volume=data.volume,
                 description=f"{data.name}이(가) {change_percent:.2f}% 급등했습니다.",
-                technical_indicators=self._get_technical_indicators(data.symbol),
+                technical_indicators=self._get_technical_indicators(data.symbol, cycle),
                 market_context=self._get_market_context(data)
             )
             events.append(event)
@@ -123,20 +208,22 @@ class EventDetector:
                 change_percent=change_percent,
                 volume=data.volume,
                 description=f"{data.name}이(가) {change_percent:.2f}% 급락했습니다.",
-                technical_indicators=self._get_technical_indicators(data.symbol),
+                technical_indicators=self._get_technical_indicators(data.symbol, cycle),
                 market_context=self._get_market_context(data)
             )
             events.append(event)
         
         return events
     
-    def _detect_volume_events(self, data: MarketData, symbol: str) -> List[EconomicEvent]:
+    def _detect_volume_events(self, data: MarketData, symbol: str,
+                              cycle: Optional[DetectionCycle] = None) -> List[EconomicEvent]:
         """거래량 급증 이벤트 탐지"""
         events = []
+        cycle = cycle or DetectionCycle(self.data_collector)
         
         try:
-            # 최근 20일 평균 거래량과 비교
-            historical_data = self.data_collector.get_historical_data(symbol, "1mo")
+            # 최근 20일 평균 거래량과 비교 (주기 내 3개월 히스토리에서 1개월만 잘라 사용)
+            historical_data = cycle.history(symbol, "1mo")
             if historical_data.empty or len(historical_data) < 20:
                 return events
             
@@ -158,7 +245,7 @@ class EventDetector:
                     change_percent=data.change_percent,
                     volume=data.volume,
                     description=f"{data.name}의 거래량이 평균 대비 {volume_ratio:.1f}배 급증했습니다.",
-                    technical_indicators=self._get_technical_indicators(symbol),
+                    technical_indicators=self._get_technical_indicators(symbol, cycle),
                     market_context={'volume_ratio': volume_ratio, 'avg_volume': avg_volume}
                 )
                 events.append(event)
@@ -168,7 +255,8 @@ class EventDetector:
         
         return events
     
-    def _detect_volatility_events(self, data: MarketData, config: Dict, symbol: str) -> List[EconomicEvent]:
+    def _detect_volatility_events(self, data: MarketData, config: Dict, symbol: str,
+                                  cycle: Optional[DetectionCycle] = None) -> List[EconomicEvent]:
         """변동성 이벤트 탐지"""
         events = []
         
@@ -190,7 +278,7 @@ class EventDetector:
                     change_percent=data.change_percent,
                     volume=data.volume,
                     description=f"{data.name}의 변동성이 {intraday_volatility:.2f}%로 높습니다.",
-                    technical_indicators=self._get_technical_indicators(symbol),
+                    technical_indicators=self._get_technical_indicators(symbol, cycle),
                     market_context={'intraday_volatility': intraday_volatility}
                 )
                 events.append(event)
@@ -241,11 +329,12 @@ class EventDetector:
         
         return events
     
-    def _get_technical_indicators(self, symbol: str) -> Dict[str, float]:
-        """기술적 지표 계산"""
+    def _get_technical_indicators(self, symbol: str,
+                                  cycle: Optional[DetectionCycle] = None) -> Dict[str, float]:
+        """기술적 지표 계산 (주기 컨텍스트가 있으면 심볼당 한 번만 계산)"""
         try:
-            historical_data = self.data_collector.get_historical_data(symbol, "3mo")
-            return self.data_collector.calculate_technical_indicators(historical_data)
+            cycle = cycle or DetectionCycle(self.data_collector)
+            return cycle.indicators(symbol)
         except Exception as e:
             self.logger.error(f"Error getting technical indicators for {symbol}: {str(e)}")
             return {}
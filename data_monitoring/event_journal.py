@@ -0,0 +1,320 @@
+"""
+추가 전용(append-only) 이벤트 저널 모듈
+일별 JSON Lines 세그먼트에 이벤트를 한 줄씩 추가하고, 세그먼트별 시간 인덱스로 최근 이벤트를 조회
+"""
+
+import os
+import json
+import bisect
+import logging
+import threading
+from datetime import datetime, timedelta
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    # Windows 등 fcntl이 없는 환경에서는 프로세스 내부 잠금만 사용
+    fcntl = None
+    FCNTL_AVAILABLE = False
+
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.monitoring_config import MONITORING_CONFIG
+
+SEGMENT_PREFIX = "events_"
+SEGMENT_SUFFIX = ".jsonl"
+INDEX_SUFFIX = ".idx"
+LOCK_FILE = ".journal.lock"
+
+
+def _to_epoch(timestamp: str) -> float:
+    """ISO 시각 문자열을 epoch 초로 변환 (시간대 없는 값은 로컬 시간 기준)"""
+    return datetime.fromisoformat(timestamp).timestamp()
+
+
+class EventJournal:
+    """일별 세그먼트 기반 이벤트 저널
+
+    - 저장: 세그먼트 파일 끝에 JSON 한 줄을 단일 write로 추가 (기존 내용을 다시 쓰지 않음)
+    - 인덱스: 세그먼트마다 (시각, 바이트 오프셋) 사이드카 파일을 함께 추가하고 메모리에 정렬 보관
+    - 조회: 기간과 겹치는 세그먼트만 열고, 인덱스에서 찾은 오프셋의 줄만 읽음
+    - 정리: 지난 세그먼트는 시간순 정렬/중복 제거로 압축하고 보관 기간이 지나면 삭제
+    - 동시성: 여러 프로세스가 같은 디렉토리를 쓸 수 있으므로 추가/조회/정리는 저널 잠금 파일(flock) 안에서 수행
+    """
+
+    def __init__(self, base_dir: Optional[str] = None, fsync: bool = False):
+        self.logger = logging.getLogger(__name__)
+        self.base_dir = base_dir or MONITORING_CONFIG.get('event_journal_dir', 'logs/events')
+        self.fsync = fsync
+        os.makedirs(self.base_dir, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._lock_depth = 0
+        # 세그먼트 날짜 -> 시각순 정렬된 [(epoch, offset)]
+        self._indexes: Dict[str, List[Tuple[float, int]]] = {}
+        # 세그먼트 날짜 -> 인덱스 사이드카에서 읽은 바이트 위치
+        self._index_positions: Dict[str, int] = {}
+
+    @contextmanager
+    def _locked(self):
+        """스레드 잠금 + 프로세스 간 파일 잠금 (같은 스레드에서 중첩 호출 가능)
+
+        세그먼트 줄과 인덱스 줄을 한 묶음으로 추가하고, 다른 프로세스가 추가하는 도중에
+        인덱스를 재생성하지 않도록 함
+        """
+        with self._lock:
+            lock_fd = None
+            if self._lock_depth == 0 and FCNTL_AVAILABLE:
+                lock_fd = os.open(os.path.join(self.base_dir, LOCK_FILE), os.O_RDWR | os.O_CREAT, 0o644)
+                fcntl.flock(lock_fd, fcntl.LOCK_EX)
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+                if lock_fd is not None:
+                    fcntl.flock(lock_fd, fcntl.LOCK_UN)
+                    os.close(lock_fd)
+
+    def _segment_path(self, date_str: str) -> str:
+        return os.path.join(self.base_dir, f"{SEGMENT_PREFIX}{date_str}{SEGMENT_SUFFIX}")
+
+    def _index_path(self, date_str: str) -> str:
+        return os.path.join(self.base_dir, f"{SEGMENT_PREFIX}{date_str}{INDEX_SUFFIX}")
+
+    def list_segments(self) -> List[str]:
+        """저장된 세그먼트 날짜 목록 (오름차순)"""
+        dates = [
+            name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)]
+            for name in os.listdir(self.base_dir)
+            if name.startswith(SEGMENT_PREFIX) and name.endswith(SEGMENT_SUFFIX)
+        ]
+        return sorted(dates)
+
+    def append(self, event: Dict) -> None:
+        """이벤트 1건 추가 (event['timestamp']는 ISO 형식 문자열)"""
+        epoch = _to_epoch(event['timestamp'])
+        date_str = event['timestamp'][:10]
+        line = (json.dumps(event, ensure_ascii=False, default=str) + "\n").encode('utf-8')
+
+        with self._locked():
+            self._load_index(date_str)
+            offset = self._append_bytes(self._segment_path(date_str), line)
+            self._append_bytes(self._index_path(date_str), f"{epoch}\t{offset}\n".encode('utf-8'))
+            self._load_index(date_str)
+
+    def _append_bytes(self, path: str, data: bytes) -> int:
+        """파일 끝에 단일 write로 추가하고 기록 시작 오프셋 반환
+
+        잘린 줄 확인, 오프셋 조회, 기록 사이에 다른 프로세스가 끼어들면 오프셋이 어긋나므로
+        호출 측은 _locked()로 저널 잠금을 잡고 있어야 함
+        """
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            offset = os.lseek(fd, 0, os.SEEK_END)
+            if offset > 0:
+                # 비정상 종료로 마지막 줄이 잘렸으면 줄바꿈으로 분리
+                with open(path, 'rb') as f:
+                    f.seek(offset - 1)
+                    if f.read(1) != b"\n":
+                        os.write(fd, b"\n")
+                        offset += 1
+            os.write(fd, data)
+            if self.fsync:
+                os.fsync(fd)
+            return offset
+        finally:
+            os.close(fd)
+
+    def _load_index(self, date_str: str) -> List[Tuple[float, int]]:
+        """세그먼트 인덱스 (처음에는 사이드카에서 읽고, 이후에는 다른 프로세스가 추가한 꼬리만 반영)"""
+        index = self._indexes.get(date_str)
+        index_path = self._index_path(date_str)
+        index_size = os.path.getsize(index_path) if os.path.exists(index_path) else 0
+
+        if index is not None and index_size >= self._index_positions.get(date_str, 0):
+            self._read_index_tail(date_str, index)
+            return index
+
+        index = []
+        self._indexes[date_str] = index
+        self._index_positions[date_str] = 0
+        segment_path = self._segment_path(date_str)
+        if os.path.exists(segment_path):
+            try:
+                self._read_index_tail(date_str, index)
+                valid = self._index_matches(segment_path, index)
+            except ValueError:
+                valid = False
+            if not valid:
+                index[:] = sorted(self._rebuild_index(date_str))
+                self._index_positions[date_str] = os.path.getsize(index_path)
+        return index
+
+    def _read_index_tail(self, date_str: str, index: List[Tuple[float, int]]):
+        """인덱스 사이드카에서 아직 읽지 않은 줄을 읽어 정렬 상태로 추가"""
+        index_path = self._index_path(date_str)
+        position = self._index_positions.get(date_str, 0)
+        if not os.path.exists(index_path) or os.path.getsize(index_path) <= position:
+            return
+        with open(index_path, 'rb') as f:
+            f.seek(position)
+            for row in f:
+                if not row.endswith(b"\n"):
+                    break  # 아직 기록 중인 줄
+                epoch, offset = row.decode('utf-8').rstrip("\n").split("\t")
+                bisect.insort(index, (float(epoch), int(offset)))
+                position += len(row)
+        self._index_positions[date_str] = position
+
+    def _index_matches(self, segment_path: str, index: List[Tuple[float, int]]) -> bool:
+        """인덱스의 마지막 항목이 세그먼트의 마지막 줄을 가리키는지 확인 (추가 도중 중단 감지)"""
+        segment_size = os.path.getsize(segment_path)
+        if not index:
+            return segment_size == 0
+        with open(segment_path, 'rb') as f:
+            f.seek(max(offset for _, offset in index))
+            f.readline()
+            return f.tell() == segment_size
+
+    def _rebuild_index(self, date_str: str) -> List[Tuple[float, int]]:
+        """세그먼트 파일을 한 번 읽어 인덱스 사이드카 재작성"""
+        index = []
+        with open(self._segment_path(date_str), 'rb') as f:
+            offset = 0
+            for raw in f:
+                try:
+                    event = json.loads(raw)
+                    index.append((_to_epoch(event['timestamp']), offset))
+                except (ValueError, KeyError, TypeError):
+                    pass  # 잘린 줄은 건너뜀
+                offset += len(raw)
+
+        self._write_atomic(self._index_path(date_str),
+                           "".join(f"{epoch}\t{offset}\n" for epoch, offset in index).encode('utf-8'))
+        self.logger.info(f"이벤트 인덱스 재생성: {date_str} ({len(index)}건)")
+        return index
+
+    def read_range(self, start: datetime, end: Optional[datetime] = None) -> List[Dict]:
+        """[start, end] 구간 이벤트 (시간 오름차순)"""
+        end = end or datetime.now()
+        start_epoch, end_epoch = start.timestamp(), end.timestamp()
+        events = []
+
+        with self._locked():
+            # 자정 근처 시간대 차이를 고려해 앞뒤 하루씩 여유를 둠
+            first = (start - timedelta(days=1)).strftime('%Y-%m-%d')
+            last = (end + timedelta(days=1)).strftime('%Y-%m-%d')
+            for date_str in self.list_segments():
+                if date_str < first or date_str > last:
+                    continue
+                index = self._load_index(date_str)
+                lo = bisect.bisect_left(index, (start_epoch, -1))
+                hi = bisect.bisect_right(index, (end_epoch, float('inf')))
+                if lo >= hi:
+                    continue
+                with open(self._segment_path(date_str), 'rb') as f:
+                    for _, offset in index[lo:hi]:
+                        f.seek(offset)
+                        try:
+                            events.append(json.loads(f.readline()))
+                        except ValueError:
+                            continue
+
+        events.sort(key=lambda event: _to_epoch(event['timestamp']))
+        return events
+
+    def get_recent_events(self, hours: float = 24, now: Optional[datetime] = None) -> List[Dict]:
+        """최근 hours시간 이벤트 (최신순)"""
+        now = now or datetime.now()
+        events = self.read_range(now - timedelta(hours=hours), now)
+        events.reverse()
+        return events
+
+    def compact(self, date_str: str) -> int:
+        """세그먼트를 시간순 정렬/event_id 중복 제거 후 다시 쓰고 인덱스 재생성 (남은 건수 반환)"""
+        path = self._segment_path(date_str)
+        with self._locked():
+            events, seen = [], set()
+            with open(path, 'rb') as f:
+                for raw in f:
+                    try:
+                        event = json.loads(raw)
+                        epoch = _to_epoch(event['timestamp'])
+                    except (ValueError, KeyError, TypeError):
+                        continue
+                    event_id = event.get('event_id')
+                    if event_id is not None:
+                        if event_id in seen:
+                            continue
+                        seen.add(event_id)
+                    events.append((epoch, event))
+
+            events.sort(key=lambda item: item[0])
+            lines = [json.dumps(event, ensure_ascii=False, default=str) + "\n" for _, event in events]
+            self._write_atomic(path, "".join(lines).encode('utf-8'))
+            self._rebuild_index(date_str)
+            self._indexes.pop(date_str, None)
+            self._index_positions.pop(date_str, None)
+            return len(events)
+
+    def rotate(self, retention_days: Optional[int] = None, today: Optional[datetime] = None) -> Dict[str, List[str]]:
+        """지난 세그먼트 압축 및 보관 기간이 지난 세그먼트 삭제"""
+        today = today or datetime.now()
+        retention_days = retention_days if retention_days is not None else MONITORING_CONFIG.get('data_retention_days', 30)
+        today_str = today.strftime('%Y-%m-%d')
+        expire_before = (today - timedelta(days=retention_days)).strftime('%Y-%m-%d')
+        result = {'compacted': [], 'deleted': []}
+
+        with self._locked():
+            for date_str in self.list_segments():
+                if date_str < expire_before:
+                    for path in (self._segment_path(date_str), self._index_path(date_str),
+                                 self._compacted_marker(date_str)):
+                        if os.path.exists(path):
+                            os.remove(path)
+                    self._indexes.pop(date_str, None)
+                    self._index_positions.pop(date_str, None)
+                    result['deleted'].append(date_str)
+                elif date_str < today_str and not os.path.exists(self._compacted_marker(date_str)):
+                    self.compact(date_str)
+                    open(self._compacted_marker(date_str), 'w').close()
+                    result['compacted'].append(date_str)
+
+        if result['compacted'] or result['deleted']:
+            self.logger.info(f"이벤트 저널 정리: 압축 {len(result['compacted'])}개, 삭제 {len(result['deleted'])}개")
+        return result
+
+    def _compacted_marker(self, date_str: str) -> str:
+        return os.path.join(self.base_dir, f"{SEGMENT_PREFIX}{date_str}.compacted")
+
+    def _write_atomic(self, path: str, data: bytes):
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+
+
+_event_journal: Optional[EventJournal] = None
+_event_journal_lock = threading.Lock()
+
+
+def get_event_journal() -> EventJournal:
+    """프로세스 전역 이벤트 저널"""
+    global _event_journal
+    with _event_journal_lock:
+        if _event_journal is None:
+            _event_journal = EventJournal()
+        return _event_journal
+
+
+def set_event_journal(journal: Optional[EventJournal]):
+    """전역 이벤트 저널 교체 (테스트용)"""
+    global _event_journal
+    with _event_journal_lock:
+        _event_journal = journal
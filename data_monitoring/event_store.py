@@ -0,0 +1,263 @@
+"""
+질의 가능한 이벤트 저장소 모듈
+탐지된 이벤트를 로컬 SQLite에 저장하고 심볼/유형/심각도/시각 인덱스로 조회
+"""
+
+import os
+import json
+import sqlite3
+import logging
+import threading
+from dataclasses import fields, is_dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.monitoring_config import MONITORING_CONFIG
+
+# 문자열 심각도 -> 0-1 점수 (조회 시 min_severity 비교에 사용)
+SEVERITY_LEVEL_SCORES = {
+    'low': 0.25,
+    'medium': 0.5,
+    'high': 0.75,
+    'critical': 1.0,
+}
+
+TimeLike = Union[datetime, str, float, int]
+
+
+def severity_level(score: float) -> str:
+    """0-1 심각도 점수를 단계 문자열로 변환 (대시보드 기준과 동일)"""
+    if score >= 0.9:
+        return 'critical'
+    if score > 0.7:
+        return 'high'
+    if score > 0.5:
+        return 'medium'
+    return 'low'
+
+
+def _to_jsonable(value: Any) -> Any:
+    """데이터클래스/Enum/datetime/numpy 값을 JSON 직렬화 가능한 값으로 변환"""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if is_dataclass(value) and not isinstance(value, type):
+        return {f.name: _to_jsonable(getattr(value, f.name)) for f in fields(value)}
+    if isinstance(value, dict):
+        return {str(k): _to_jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [_to_jsonable(v) for v in value]
+    if hasattr(value, 'item') and callable(value.item):
+        try:
+            return value.item()  # numpy 스칼라
+        except (TypeError, ValueError):
+            pass
+    return value
+
+
+def event_to_dict(event: Any) -> Dict[str, Any]:
+    """탐지기별 이벤트 객체(데이터클래스 또는 dict)를 저장용 dict로 변환"""
+    data = _to_jsonable(event)
+    if not isinstance(data, dict):
+        raise TypeError(f"이벤트로 변환할 수 없는 값: {type(event).__name__}")
+    if 'event_type' not in data and 'type' in data:
+        data['event_type'] = data['type']
+    return data
+
+
+def _to_epoch(value: Optional[TimeLike]) -> Optional[float]:
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, str):
+        return datetime.fromisoformat(value).timestamp()
+    return float(value)
+
+
+class EventStore:
+    """SQLite 기반 이벤트 저장소
+
+    - 저장: 이벤트마다 한 행, 원본은 payload(JSON)로 보관하고 조회용 컬럼만 따로 추출
+    - 인덱스: symbol / event_type / severity / timestamp (+ 심볼·유형별 최신순 복합 인덱스)
+    - 조회: 최신순 정렬 + limit/offset 페이지네이션, 건수는 같은 조건의 COUNT로 계산
+    - event_id가 같은 이벤트는 한 번만 저장 (탐지기를 여러 번 돌려도 중복되지 않음)
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        self.logger = logging.getLogger(__name__)
+        self.db_path = db_path or MONITORING_CONFIG.get('event_store_path', 'output/events.sqlite')
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+    def _create_schema(self):
+        with self._lock, self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS events (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    event_id TEXT NOT NULL UNIQUE,
+                    source TEXT NOT NULL DEFAULT '',
+                    symbol TEXT NOT NULL DEFAULT '',
+                    event_type TEXT NOT NULL DEFAULT '',
+                    severity REAL NOT NULL DEFAULT 0,
+                    severity_level TEXT NOT NULL DEFAULT 'low',
+                    timestamp REAL NOT NULL,
+                    processed INTEGER NOT NULL DEFAULT 0,
+                    payload TEXT NOT NULL
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_events_timestamp ON events(timestamp)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_events_severity ON events(severity, timestamp)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_events_symbol ON events(symbol, timestamp)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_events_type ON events(event_type, timestamp)")
+
+    def add_event(self, event: Any, source: str = '') -> bool:
+        """이벤트 1건 저장 (새로 저장되면 True)"""
+        return self.add_events([event], source) == 1
+
+    def add_events(self, events: Iterable[Any], source: str = '') -> int:
+        """이벤트 여러 건을 한 트랜잭션으로 저장하고 새로 저장된 건수 반환"""
+        rows = [self._to_row(event_to_dict(event), source) for event in events]
+        if not rows:
+            return 0
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany("""
+                INSERT OR IGNORE INTO events
+                    (event_id, source, symbol, event_type, severity, severity_level, timestamp, processed, payload)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+            return self._conn.total_changes - before
+
+    def _to_row(self, data: Dict[str, Any], source: str) -> tuple:
+        timestamp = data.get('timestamp') or datetime.now().isoformat()
+        data['timestamp'] = timestamp
+        symbol = str(data.get('symbol') or '')
+        event_type = str(data.get('event_type') or '')
+
+        raw_severity = data.get('severity', 0)
+        if isinstance(raw_severity, str):
+            level = raw_severity.lower()
+            score = SEVERITY_LEVEL_SCORES.get(level, 0.0)
+        else:
+            score = float(raw_severity or 0)
+            level = data.get('severity_level') or severity_level(score)
+        data.setdefault('severity_level', level)
+
+        event_id = data.get('event_id') or f"{symbol}_{event_type}_{timestamp}"
+        data['event_id'] = event_id
+        return (
+            event_id, source, symbol, event_type, score, level,
+            _to_epoch(timestamp), int(bool(data.get('processed'))),
+            json.dumps(data, ensure_ascii=False, default=str),
+        )
+
+    def _where(self, symbol: Optional[str], event_type: Optional[str], min_severity: Optional[float],
+               start: Optional[TimeLike], end: Optional[TimeLike], source: Optional[str]):
+        clauses, params = [], []
+        if symbol is not None:
+            clauses.append("symbol = ?")
+            params.append(symbol)
+        if event_type is not None:
+            clauses.append("event_type = ?")
+            params.append(event_type)
+        if min_severity is not None:
+            clauses.append("severity >= ?")
+            params.append(float(min_severity))
+        if start is not None:
+            clauses.append("timestamp >= ?")
+            params.append(_to_epoch(start))
+        if end is not None:
+            clauses.append("timestamp <= ?")
+            params.append(_to_epoch(end))
+        if source is not None:
+            clauses.append("source = ?")
+            params.append(source)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+    def query(self, symbol: Optional[str] = None, event_type: Optional[str] = None,
+              min_severity: Optional[float] = None, start: Optional[TimeLike] = None,
+              end: Optional[TimeLike] = None, source: Optional[str] = None,
+              limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
+        """조건에 맞는 이벤트를 최신순으로 조회 (limit/offset 페이지네이션)"""
+        where, params = self._where(symbol, event_type, min_severity, start, end, source)
+        sql = f"SELECT payload, processed FROM events {where} ORDER BY timestamp DESC, id DESC LIMIT ? OFFSET ?"
+        with self._lock:
+            rows = self._conn.execute(sql, params + [int(limit), int(offset)]).fetchall()
+
+        events = []
+        for row in rows:
+            event = json.loads(row['payload'])
+            event['processed'] = bool(row['processed'])
+            events.append(event)
+        return events
+
+    def count(self, symbol: Optional[str] = None, event_type: Optional[str] = None,
+              min_severity: Optional[float] = None, start: Optional[TimeLike] = None,
+              end: Optional[TimeLike] = None, source: Optional[str] = None,
+              processed: Optional[bool] = None) -> int:
+        """조건에 맞는 이벤트 수"""
+        where, params = self._where(symbol, event_type, min_severity, start, end, source)
+        if processed is not None:
+            where = f"{where} AND processed = ?" if where else "WHERE processed = ?"
+            params.append(int(processed))
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM events {where}", params).fetchone()[0]
+
+    def recent(self, n: int = 10) -> List[Dict[str, Any]]:
+        """최근 n개 이벤트 (최신순)"""
+        return self.query(limit=n)
+
+    def by_symbol(self, symbol: str, limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
+        """심볼별 이벤트 (최신순)"""
+        return self.query(symbol=symbol, limit=limit, offset=offset)
+
+    def mark_processed(self, event_id: str, processed: bool = True) -> bool:
+        """기사 생성 등 후속 처리 완료 표시"""
+        with self._lock, self._conn:
+            cursor = self._conn.execute("UPDATE events SET processed = ? WHERE event_id = ?",
+                                        (int(processed), event_id))
+            return cursor.rowcount > 0
+
+    def purge_older_than(self, cutoff: TimeLike) -> int:
+        """cutoff 이전 이벤트 삭제 (보관 기간 정리용)"""
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM events WHERE timestamp < ?", (_to_epoch(cutoff),))
+            return cursor.rowcount
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_event_store: Optional[EventStore] = None
+_event_store_lock = threading.Lock()
+
+
+def get_event_store() -> EventStore:
+    """프로세스 전역 이벤트 저장소"""
+    global _event_store
+    with _event_store_lock:
+        if _event_store is None:
+            _event_store = EventStore()
+        return _event_store
+
+
+def set_event_store(store: Optional[EventStore]):
+    """전역 이벤트 저장소 교체 (테스트용)"""
+    global _event_store
+    with _event_store_lock:
+        _event_store = store
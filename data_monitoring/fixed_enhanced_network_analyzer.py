@@ -18,6 +18,9 @@ import os
 
 # 경로 설정
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_monitoring.cooccurrence import CooccurrenceMatrix
+from data_monitoring.network_metrics import get_network_metrics_calculator
 
 class FixedEnhancedNetworkAnalyzer:
     """수정된 개선된 경제 네트워크 분석기"""
@@ -210,7 +213,8 @@ class FixedEnhancedNetworkAnalyzer:
         
         # 모든 텍스트에서 개념 추출
         all_concepts = {}
-        concept_cooccurrence = defaultdict(lambda: defaultdict(int))
+        # 개념 쌍 가중치 sqrt(s1 * s2)를 문서 × 개념 희소 행렬 곱으로 누적
+        cooccurrence = CooccurrenceMatrix(transform='sqrt')
         concept_sentiments = defaultdict(list)
         
         valid_texts = [text for text in texts if text and isinstance(text, str) and len(text.strip()) > 10]
@@ -241,13 +245,7 @@ class FixedEnhancedNetworkAnalyzer:
                     concept_sentiments[concept].append(sentiment)
                 
                 # 동시 출현 관계 계산
-                concept_list = list(concepts.keys())
-                for i, concept1 in enumerate(concept_list):
-                    for concept2 in concept_list[i+1:]:
-                        # 상호 가중치 적용
-                        weight = (concepts[concept1]['score'] * concepts[concept2]['score']) ** 0.5
-                        concept_cooccurrence[concept1][concept2] += weight
-                        concept_cooccurrence[concept2][concept1] += weight
+                cooccurrence.add_document({concept: data['score'] for concept, data in concepts.items()})
                         
             except Exception as e:
                 self.logger.warning(f"텍스트 처리 오류: {e}")
@@ -278,25 +276,24 @@ class FixedEnhancedNetworkAnalyzer:
         
         # 엣지 추가 (관계들)
         edges_added = 0
-        for concept1, connections in concept_cooccurrence.items():
-            for concept2, weight in connections.items():
-                if weight > 0.5 and concept1 in G.nodes() and concept2 in G.nodes():
-                    try:
-                        # 관계 유형 결정
-                        relationship_type = self._determine_relationship_type_safe(concept1, concept2, weight)
-                        
-                        # 정규화된 가중치
-                        normalized_weight = min(weight / 10.0, 1.0)
-                        
-                        G.add_edge(concept1, concept2,
-                                  weight=float(normalized_weight),
-                                  relationship_type=relationship_type,
-                                  strength=float(weight))
-                        edges_added += 1
-                        
-                    except Exception as e:
-                        self.logger.warning(f"엣지 추가 오류 ({concept1}-{concept2}): {e}")
-                        continue
+        for concept1, concept2, weight in cooccurrence.edges(min_weight=0.5):
+            if concept1 in G.nodes() and concept2 in G.nodes():
+                try:
+                    # 관계 유형 결정
+                    relationship_type = self._determine_relationship_type_safe(concept1, concept2, weight)
+                    
+                    # 정규화된 가중치
+                    normalized_weight = min(weight / 10.0, 1.0)
+                    
+                    G.add_edge(concept1, concept2,
+                              weight=float(normalized_weight),
+                              relationship_type=relationship_type,
+                              strength=float(weight))
+                    edges_added += 1
+                    
+                except Exception as e:
+                    self.logger.warning(f"엣지 추가 오류 ({concept1}-{concept2}): {e}")
+                    continue
         
         # 네트워크 메트릭 계산
         metrics = self._calculate_network_metrics_safe(G)
@@ -393,38 +390,35 @@ class FixedEnhancedNetworkAnalyzer:
         metrics = {}
         
         try:
+            # 그래프 크기에 따라 정확/근사 계산 (같은 구조의 그래프는 캐시 사용)
+            result = get_network_metrics_calculator().compute(G)
+            metrics['metrics_mode'] = result.mode
+            
             # 기본 메트릭
-            metrics['density'] = float(nx.density(G))
-            metrics['average_clustering'] = float(nx.average_clustering(G))
+            metrics['density'] = float(result.density)
+            metrics['average_clustering'] = float(result.average_clustering)
             
             # 중심성 지표 (안전하게 계산)
             if len(G.nodes()) > 1:
-                degree_centrality = nx.degree_centrality(G)
-                betweenness_centrality = nx.betweenness_centrality(G)
-                closeness_centrality = nx.closeness_centrality(G)
-                
                 metrics['centrality'] = {
-                    'degree': {k: float(v) for k, v in degree_centrality.items()},
-                    'betweenness': {k: float(v) for k, v in betweenness_centrality.items()},
-                    'closeness': {k: float(v) for k, v in closeness_centrality.items()}
+                    'degree': {k: float(v) for k, v in result.degree.items()},
+                    'betweenness': {k: float(v) for k, v in result.betweenness.items()},
+                    'closeness': {k: float(v) for k, v in result.closeness.items()}
                 }
                 
                 # 가장 중요한 노드들
                 metrics['top_nodes'] = {
-                    'by_degree': sorted(degree_centrality.items(), 
-                                      key=lambda x: x[1], reverse=True)[:5],
-                    'by_betweenness': sorted(betweenness_centrality.items(), 
-                                           key=lambda x: x[1], reverse=True)[:5]
+                    'by_degree': result.top('degree'),
+                    'by_betweenness': result.top('betweenness')
                 }
             
             # 연결 성분
-            if nx.is_connected(G):
-                metrics['diameter'] = nx.diameter(G)
-                metrics['average_path_length'] = float(nx.average_shortest_path_length(G))
+            if result.connected:
+                metrics['diameter'] = result.diameter
+                metrics['average_path_length'] = float(result.average_path_length)
             else:
-                components = list(nx.connected_components(G))
-                metrics['connected_components'] = len(components)
-                metrics['largest_component_size'] = len(max(components, key=len))
+                metrics['connected_components'] = result.connected_components
+                metrics['largest_component_size'] = result.largest_component_size
             
         except Exception as e:
             self.logger.warning(f"메트릭 계산 중 오류: {e}")
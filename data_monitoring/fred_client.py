@@ -0,0 +1,274 @@
+"""
+비동기 FRED 클라이언트 모듈
+공유 aiohttp 세션으로 여러 시리즈를 동시에 조회하고(FRED 분당 호출 한도 준수),
+시리즈별 전체 관측값을 로컬에 저장해 마지막 저장일 이후(개정 확인 구간 포함)만 추가로 받음
+"""
+
+import os
+import json
+import time
+import asyncio
+import logging
+import threading
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import aiohttp
+
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.monitoring_config import MONITORING_CONFIG
+
+FRED_BASE_URL = "https://api.stlouisfed.org/fred"
+
+HOUR = 3600
+
+# 발표 주기(frequency_short)별 재확인 간격(초) - 이 시간 안에는 네트워크 없이 로컬 데이터 사용
+REFRESH_INTERVALS = {
+    'D': 1 * HOUR,
+    'W': 6 * HOUR,
+    'BW': 6 * HOUR,
+    'M': 12 * HOUR,
+    'Q': 12 * HOUR,
+    'SA': 12 * HOUR,
+    'A': 12 * HOUR,
+}
+DEFAULT_REFRESH_INTERVAL = 6 * HOUR
+
+# 로컬에 보관하는 시리즈 메타데이터 필드
+INFO_FIELDS = ("id", "title", "units", "frequency", "frequency_short", "last_updated", "notes")
+
+
+def parse_observations(raw: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """FRED 관측값을 {date, value} 목록으로 변환 (결측값 '.' 제외)"""
+    observations = []
+    for obs in raw:
+        try:
+            if obs["value"] != ".":
+                observations.append({"date": obs["date"], "value": float(obs["value"])})
+        except (KeyError, ValueError, TypeError):
+            continue
+    return observations
+
+
+def merge_observations(stored: List[Dict[str, Any]], new: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """날짜 기준 병합 (같은 날짜는 새 값으로 덮어써서 개정치 반영), 날짜 오름차순"""
+    merged = {obs["date"]: obs for obs in stored}
+    merged.update((obs["date"], obs) for obs in new)
+    return [merged[date] for date in sorted(merged)]
+
+
+class SlidingWindowRateLimiter:
+    """최근 period초 동안 max_requests개까지만 허용하는 비동기 호출 제한기"""
+
+    def __init__(self, max_requests: int, period: float = 60.0):
+        self.max_requests = max_requests
+        self.period = period
+        self._calls: deque = deque()
+        self._lock = threading.Lock()
+
+    async def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= self.period:
+                    self._calls.popleft()
+                if len(self._calls) < self.max_requests:
+                    self._calls.append(now)
+                    return
+                wait = self.period - (now - self._calls[0])
+            await asyncio.sleep(wait)
+
+
+_rate_limiters: Dict[str, SlidingWindowRateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(key: str, requests_per_minute: Optional[int] = None) -> SlidingWindowRateLimiter:
+    """API 키별 프로세스 전역 호출 제한기
+
+    FRED 한도는 API 키 단위이므로 같은 키를 쓰는 모든 클라이언트(동기 호출마다 새로 만드는 것 포함)가
+    하나의 슬라이딩 윈도우를 공유. requests_per_minute는 처음 만들 때만 적용
+    """
+    with _rate_limiters_lock:
+        limiter = _rate_limiters.get(key)
+        if limiter is None:
+            limiter = SlidingWindowRateLimiter(
+                requests_per_minute or MONITORING_CONFIG.get('fred_requests_per_minute', 120))
+            _rate_limiters[key] = limiter
+        return limiter
+
+
+def set_rate_limiter(key: str, limiter: Optional[SlidingWindowRateLimiter]):
+    """키별 호출 제한기 교체 (None이면 다음 조회 시 기본값으로 생성)"""
+    with _rate_limiters_lock:
+        if limiter is None:
+            _rate_limiters.pop(key, None)
+        else:
+            _rate_limiters[key] = limiter
+
+
+class FredSeriesStore:
+    """시리즈별 전체 관측값/메타데이터 로컬 저장소 (시리즈당 JSON 파일 1개)"""
+
+    def __init__(self, base_dir: Optional[str] = None):
+        self.logger = logging.getLogger(__name__)
+        self.base_dir = base_dir or MONITORING_CONFIG.get('fred_store_dir', 'output/fred')
+        os.makedirs(self.base_dir, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def _path(self, series_id: str) -> str:
+        safe_id = "".join(c if c.isalnum() or c in "-_" else "_" for c in series_id)
+        return os.path.join(self.base_dir, f"{safe_id}.json")
+
+    def load(self, series_id: str) -> Optional[Dict[str, Any]]:
+        path = self._path(series_id)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"⚠️ FRED 로컬 데이터 읽기 실패 ({series_id}), 다시 받습니다: {e}")
+            return None
+
+    def save(self, series_id: str, record: Dict[str, Any]):
+        path = self._path(series_id)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with self._lock:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(record, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+
+
+class AsyncFredClient:
+    """비동기 FRED 클라이언트
+
+    - async with 블록 동안 커넥션 풀을 공유하는 aiohttp 세션 1개 사용
+    - 동시 요청 수(max_concurrency)와 분당 요청 수(requests_per_minute)를 함께 제한
+      (분당 한도는 API 키별 전역 제한기를 공유하므로 클라이언트를 새로 만들어도 초기화되지 않음)
+    - refresh_series(): 재확인 간격 안이면 로컬 데이터만 사용하고,
+      지나면 메타데이터의 last_updated를 비교해 바뀐 시리즈만
+      마지막 저장 관측값 몇 개 전(revision_lookback)부터 observation_start로 추가 조회
+    """
+
+    def __init__(self, api_key: str, base_url: str = FRED_BASE_URL, store: Optional[FredSeriesStore] = None,
+                 max_concurrency: Optional[int] = None, requests_per_minute: Optional[int] = None,
+                 revision_lookback: Optional[int] = None, clock: Callable[[], float] = time.time):
+        self.logger = logging.getLogger(__name__)
+        self.api_key = api_key
+        self.base_url = base_url.rstrip('/')
+        self.store = store or FredSeriesStore()
+        self.max_concurrency = max_concurrency or MONITORING_CONFIG.get('fred_max_concurrency', 8)
+        self.limiter = get_rate_limiter(api_key, requests_per_minute)
+        self.revision_lookback = (revision_lookback if revision_lookback is not None
+                                  else MONITORING_CONFIG.get('fred_revision_lookback', 3))
+        self.clock = clock
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.stats = {'requests': 0, 'local_reads': 0, 'unchanged': 0, 'full_fetches': 0,
+                      'incremental_fetches': 0, 'errors': 0}
+
+    async def __aenter__(self):
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.max_concurrency),
+            timeout=aiohttp.ClientTimeout(total=30)
+        )
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._session:
+            await self._session.close()
+        self._session = None
+
+    async def _get(self, endpoint: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """FRED API GET (실패 시 None)"""
+        query = {**params, "api_key": self.api_key, "file_type": "json"}
+        async with self._semaphore:
+            await self.limiter.acquire()
+            self.stats['requests'] += 1
+            try:
+                async with self._session.get(f"{self.base_url}/{endpoint}", params=query) as response:
+                    if response.status != 200:
+                        self.stats['errors'] += 1
+                        self.logger.error(f"❌ FRED {endpoint} {params.get('series_id')}: HTTP {response.status}")
+                        return None
+                    return await response.json(content_type=None)
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                self.stats['errors'] += 1
+                self.logger.error(f"❌ FRED {endpoint} {params.get('series_id')} 조회 오류: {e}")
+                return None
+
+    async def fetch_series_info(self, series_id: str) -> Optional[Dict[str, Any]]:
+        data = await self._get("series", {"series_id": series_id})
+        if not data or not data.get("seriess"):
+            return None
+        info = data["seriess"][0]
+        return {field: info.get(field, "") for field in INFO_FIELDS}
+
+    async def fetch_observations(self, series_id: str,
+                                 observation_start: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+        params = {"series_id": series_id, "sort_order": "asc"}
+        if observation_start:
+            params["observation_start"] = observation_start
+        data = await self._get("series/observations", params)
+        if data is None or "observations" not in data:
+            return None
+        return parse_observations(data["observations"])
+
+    def _is_fresh(self, record: Dict[str, Any]) -> bool:
+        frequency = record.get("info", {}).get("frequency_short", "")
+        interval = REFRESH_INTERVALS.get(frequency, DEFAULT_REFRESH_INTERVAL)
+        return self.clock() - record.get("checked_at", 0) < interval
+
+    async def refresh_series(self, series_id: str, force: bool = False) -> Optional[Dict[str, Any]]:
+        """시리즈 최신화 후 저장 레코드 반환 ({series_id, info, observations(오름차순), checked_at})"""
+        record = self.store.load(series_id)
+        if record and not force and self._is_fresh(record):
+            self.stats['local_reads'] += 1
+            return record
+
+        info = await self.fetch_series_info(series_id)
+        if info is None:
+            return record  # 조회 실패 시 저장된 데이터라도 사용
+
+        if record and record.get("observations") and info.get("last_updated") == record["info"].get("last_updated"):
+            self.stats['unchanged'] += 1
+            record.update(info=info, checked_at=self.clock())
+            self.store.save(series_id, record)
+            return record
+
+        stored = record.get("observations", []) if record else []
+        start = stored[-min(len(stored), self.revision_lookback + 1)]["date"] if stored else None
+        observations = await self.fetch_observations(series_id, observation_start=start)
+        if observations is None:
+            return record
+
+        self.stats['incremental_fetches' if start else 'full_fetches'] += 1
+        if start:
+            # 개정 확인 구간은 새 응답으로 교체 (그 사이 삭제된 관측값도 반영)
+            stored = [obs for obs in stored if obs["date"] < start]
+        record = {
+            "series_id": series_id,
+            "info": info,
+            "observations": merge_observations(stored, observations),
+            "checked_at": self.clock(),
+        }
+        self.store.save(series_id, record)
+        return record
+
+    async def refresh_many(self, series_ids: Iterable[str], force: bool = False) -> Dict[str, Dict[str, Any]]:
+        """여러 시리즈 동시 최신화 (실패한 시리즈는 결과에서 제외)"""
+        series_ids = list(dict.fromkeys(series_ids))
+        results = await asyncio.gather(*(self.refresh_series(sid, force) for sid in series_ids),
+                                       return_exceptions=True)
+        records = {}
+        for series_id, result in zip(series_ids, results):
+            if isinstance(result, Exception):
+                self.stats['errors'] += 1
+                self.logger.error(f"❌ {series_id} 최신화 오류: {result}")
+            elif result:
+                records[series_id] = result
+        return records
@@ -4,12 +4,16 @@ FRED (Federal Reserve Economic Data) 수집기
 """
 
 import os
-import requests
+import asyncio
 import pandas as pd
 import logging
+import concurrent.futures
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
-import time
+
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_monitoring.fred_client import AsyncFredClient, FredSeriesStore, FRED_BASE_URL
 
 class FREDDataCollector:
     """FRED 경제 데이터 수집기"""
@@ -25,9 +29,11 @@ class FREDDataCollector:
             self.logger.warning("⚠️ FRED API 키가 설정되지 않음. Demo 모드로 실행")
             self.api_key = "demo"
         
-        self.base_url = "https://api.stlouisfed.org/fred"
-        self.last_call_time = 0
-        self.rate_limit_delay = 1  # FRED는 관대한 편
+        self.base_url = FRED_BASE_URL
+        
+        # 시리즈 전체 관측값 로컬 저장소 (마지막 저장일 이후만 추가 조회)
+        self.series_store = FredSeriesStore()
+        self.last_refresh_stats: Dict[str, int] = {}
         
         # Demo 모드 확인
         self.demo_mode = (self.api_key == "demo")
@@ -87,103 +93,70 @@ class FREDDataCollector:
         
         self.logger.info("✅ FRED 데이터 수집기 초기화 완료")
     
-    def _wait_for_rate_limit(self):
-        """Rate limit 대기"""
-        current_time = time.time()
-        time_since_last_call = current_time - self.last_call_time
-        
-        if time_since_last_call < self.rate_limit_delay:
-            wait_time = self.rate_limit_delay - time_since_last_call
-            time.sleep(wait_time)
-        
-        self.last_call_time = time.time()
+    def _run(self, coro):
+        """동기 호출용 코루틴 실행 (이미 이벤트 루프가 돌고 있으면 별도 스레드에서 실행)"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
+    
+    async def refresh_series_async(self, series_ids: List[str], force: bool = False) -> Dict[str, Dict[str, Any]]:
+        """여러 시리즈를 동시에 최신화하고 로컬 레코드 반환"""
+        async with AsyncFredClient(self.api_key, self.base_url, store=self.series_store) as client:
+            records = await client.refresh_many(series_ids, force=force)
+        self.last_refresh_stats = dict(client.stats)
+        self.logger.debug(f"FRED 최신화 통계: {self.last_refresh_stats}")
+        return records
+    
+    def _format_observations(self, record: Optional[Dict[str, Any]], limit: int) -> List[Dict[str, Any]]:
+        """로컬 레코드를 최신순 관측값 목록으로 변환"""
+        if not record:
+            return []
+        series_id = record["series_id"]
+        return [
+            {"date": obs["date"], "value": obs["value"], "series_id": series_id}
+            for obs in reversed(record["observations"][-limit:])
+        ]
+    
+    async def get_many_series_data_async(self, series_ids: List[str], limit: int = 100) -> Dict[str, List[Dict[str, Any]]]:
+        """여러 시리즈 데이터 동시 조회 (시리즈 ID -> 최신순 관측값)"""
+        records = await self.refresh_series_async(series_ids)
+        return {series_id: self._format_observations(records.get(series_id), limit) for series_id in series_ids}
     
     def get_series_data(self, series_id: str, limit: int = 100) -> List[Dict[str, Any]]:
         """특정 시리즈 데이터 조회"""
-        self._wait_for_rate_limit()
-        
         try:
-            params = {
-                "series_id": series_id,
-                "api_key": self.api_key,
-                "file_type": "json",
-                "limit": limit,
-                "sort_order": "desc"  # 최신 데이터부터
-            }
-            
-            response = requests.get(
-                f"{self.base_url}/series/observations",
-                params=params,
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                
-                if "observations" in data:
-                    observations = []
-                    for obs in data["observations"]:
-                        if obs["value"] != ".":  # 결측값 제외
-                            try:
-                                observations.append({
-                                    "date": obs["date"],
-                                    "value": float(obs["value"]),
-                                    "series_id": series_id
-                                })
-                            except (ValueError, TypeError):
-                                continue
-                    
-                    self.logger.debug(f"✅ {series_id}: {len(observations)}개 데이터 수집")
-                    return observations
-                else:
-                    self.logger.warning(f"⚠️ {series_id}: 데이터 없음")
-                    return []
+            records = self._run(self.refresh_series_async([series_id]))
+            observations = self._format_observations(records.get(series_id), limit)
+            if observations:
+                self.logger.debug(f"✅ {series_id}: {len(observations)}개 데이터 수집")
             else:
-                self.logger.error(f"❌ {series_id}: HTTP {response.status_code}")
-                return []
-                
+                self.logger.warning(f"⚠️ {series_id}: 데이터 없음")
+            return observations
         except Exception as e:
             self.logger.error(f"❌ {series_id} 조회 오류: {e}")
             return []
     
     def get_series_info(self, series_id: str) -> Dict[str, Any]:
         """시리즈 정보 조회"""
-        self._wait_for_rate_limit()
-        
         try:
-            params = {
-                "series_id": series_id,
-                "api_key": self.api_key,
-                "file_type": "json"
-            }
-            
-            response = requests.get(
-                f"{self.base_url}/series",
-                params=params,
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                if "seriess" in data and len(data["seriess"]) > 0:
-                    series_info = data["seriess"][0]
-                    return {
-                        "id": series_info.get("id", ""),
-                        "title": series_info.get("title", ""),
-                        "units": series_info.get("units", ""),
-                        "frequency": series_info.get("frequency", ""),
-                        "last_updated": series_info.get("last_updated", ""),
-                        "notes": series_info.get("notes", "")
-                    }
-            
-            return {}
-            
+            record = self._run(self.refresh_series_async([series_id])).get(series_id)
+            if not record:
+                return {}
+            info = record["info"]
+            return {key: info.get(key, "") for key in ("id", "title", "units", "frequency", "last_updated", "notes")}
         except Exception as e:
             self.logger.error(f"❌ {series_id} 정보 조회 오류: {e}")
             return {}
     
     def collect_key_indicators(self) -> Dict[str, Any]:
         """주요 경제 지표 수집"""
+        return self._run(self.collect_key_indicators_async())
+    
+    async def collect_key_indicators_async(self) -> Dict[str, Any]:
+        """주요 경제 지표 수집 (전체 시리즈 동시 최신화)"""
         self.logger.info("📊 FRED 주요 경제 지표 수집 시작")
         
         # Demo 모드일 때는 샘플 데이터 생성
@@ -197,14 +170,15 @@ class FREDDataCollector:
         }
         
         collected_count = 0
+        records = await self.refresh_series_async(list(self.key_series.values()))
         
         for indicator_name, series_id in self.key_series.items():
             try:
-                # 시리즈 정보 조회
-                series_info = self.get_series_info(series_id)
+                record = records.get(series_id)
+                series_info = record["info"] if record else {}
                 
-                # 최근 데이터 조회 (최근 12개월)
-                series_data = self.get_series_data(series_id, limit=12)
+                # 최근 데이터 (최근 12개 관측값)
+                series_data = self._format_observations(record, 12)
                 
                 if series_data:
                     # 최신값과 이전값 비교
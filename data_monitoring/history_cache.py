@@ -0,0 +1,263 @@
+"""
+OHLCV 히스토리 공유 캐시 모듈
+프로세스 전체에서 심볼/인터벌별 과거 데이터를 한 번만 다운로드하고 재사용
+"""
+
+import threading
+import time
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, Optional, Tuple
+
+import pandas as pd
+import yfinance as yf
+
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.monitoring_config import MONITORING_CONFIG
+
+# 인터벌별 기본 신선도(TTL, 초)
+DEFAULT_TTL_BY_INTERVAL = {
+    '1m': 30,
+    '2m': 60,
+    '5m': 120,
+    '15m': 300,
+    '30m': 300,
+    '60m': 600,
+    '90m': 600,
+    '1h': 600,
+    '1d': 900,
+    '5d': 3600,
+    '1wk': 3600,
+    '1mo': 3600,
+    '3mo': 3600,
+}
+
+# 기간 문자열 → 대략적인 일수 (폭 비교용)
+_PERIOD_UNIT_DAYS = {'d': 1, 'wk': 7, 'mo': 31, 'y': 366}
+
+
+def period_to_days(period: str) -> float:
+    """yfinance period 문자열을 비교 가능한 일수로 변환"""
+    period = period.strip().lower()
+    if period == 'max':
+        return float('inf')
+    if period == 'ytd':
+        now = datetime.now()
+        return float((now - datetime(now.year, 1, 1)).days + 1)
+
+    for unit in ('mo', 'wk', 'd', 'y'):
+        if period.endswith(unit):
+            try:
+                return float(period[:-len(unit)]) * _PERIOD_UNIT_DAYS[unit]
+            except ValueError:
+                break
+
+    raise ValueError(f"지원하지 않는 period 형식입니다: {period}")
+
+
+def slice_to_period(data: pd.DataFrame, period: str, interval: str = "1d") -> pd.DataFrame:
+    """더 넓은 구간의 데이터를 요청 period 구간으로 잘라내기"""
+    if data.empty:
+        return data
+
+    period = period.strip().lower()
+    if period == 'max':
+        return data
+
+    # 'Nd'는 yfinance와 동일하게 최근 N개 거래일로 해석
+    if period.endswith('d') and period[:-1].isdigit():
+        days = int(period[:-1])
+        if interval.endswith('m') or interval.endswith('h'):
+            # 분/시간 봉은 최근 N개 거래일에 속한 봉 전체
+            dates = data.index.normalize()
+            return data[dates.isin(dates.unique()[-days:])]
+        return data.tail(days)
+
+    end = data.index[-1]
+    if period == 'ytd':
+        start = pd.Timestamp(year=end.year, month=1, day=1, tz=end.tz)
+    elif period.endswith('wk'):
+        start = end - pd.DateOffset(weeks=int(period[:-2]))
+    elif period.endswith('mo'):
+        start = end - pd.DateOffset(months=int(period[:-2]))
+    elif period.endswith('y'):
+        start = end - pd.DateOffset(years=int(period[:-1]))
+    else:
+        return data
+
+    return data[data.index > start]
+
+
+@dataclass
+class HistoryEntry:
+    """캐시된 히스토리 항목"""
+    data: pd.DataFrame
+    period: str
+    fetched_at: float
+
+    @property
+    def width_days(self) -> float:
+        return period_to_days(self.period)
+
+
+class HistoryCache:
+    """심볼/인터벌별 OHLCV 히스토리 캐시
+
+    - 지금까지 받은 가장 넓은 구간을 보관하고, 더 좁은 period 요청은 잘라서 응답
+    - TTL이 지나면 다시 다운로드
+    - 최대 항목 수를 넘으면 가장 오래 사용되지 않은 항목부터 제거(LRU)
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: Optional[Dict[str, float]] = None,
+                 fetcher: Optional[Callable[[str, str, str], pd.DataFrame]] = None):
+        self.logger = logging.getLogger(__name__)
+        self.max_entries = max_entries
+        self.ttl_seconds = dict(DEFAULT_TTL_BY_INTERVAL)
+        if ttl_seconds:
+            self.ttl_seconds.update(ttl_seconds)
+        self.fetcher = fetcher or self._fetch_from_yahoo
+
+        self._entries: "OrderedDict[Tuple[str, str], HistoryEntry]" = OrderedDict()
+        self._lock = threading.RLock()
+        # 같은 키에 대한 동시 다운로드를 하나로 합치기 위한 키별 잠금
+        self._key_locks: Dict[Tuple[str, str], threading.Lock] = {}
+
+        self.stats = {'hits': 0, 'misses': 0, 'refreshes': 0, 'evictions': 0}
+
+    def get_history(self, symbol: str, period: str = "1mo", interval: str = "1d") -> pd.DataFrame:
+        """period 구간의 OHLCV 데이터 조회 (캐시 우선)"""
+        key = (symbol, interval)
+
+        entry = self._lookup(key, period)
+        if entry is not None:
+            self.stats['hits'] += 1
+            return slice_to_period(entry.data, period, interval).copy()
+
+        with self._get_key_lock(key):
+            # 잠금을 기다리는 동안 다른 스레드가 채웠을 수 있음
+            entry = self._lookup(key, period)
+            if entry is not None:
+                self.stats['hits'] += 1
+                return slice_to_period(entry.data, period, interval).copy()
+
+            self.stats['misses'] += 1
+            fetch_period = self._widest_period(key, period)
+            data = self.fetcher(symbol, fetch_period, interval)
+
+            if data is None or data.empty:
+                return pd.DataFrame()
+
+            self._store(key, HistoryEntry(data=data, period=fetch_period, fetched_at=time.time()))
+            return slice_to_period(data, period, interval).copy()
+
+    def put(self, symbol: str, data: pd.DataFrame, period: str, interval: str = "1d"):
+        """외부에서 받은 데이터를 캐시에 등록 (기존보다 넓거나 신선한 경우)"""
+        if data is None or data.empty:
+            return
+
+        key = (symbol, interval)
+        with self._lock:
+            current = self._entries.get(key)
+            if (current is not None and not self._is_expired(key, current)
+                    and current.width_days > period_to_days(period)):
+                return
+        self._store(key, HistoryEntry(data=data, period=period, fetched_at=time.time()))
+
+    def invalidate(self, symbol: Optional[str] = None, interval: Optional[str] = None):
+        """캐시 무효화 (인자가 없으면 전체)"""
+        with self._lock:
+            if symbol is None and interval is None:
+                self._entries.clear()
+                return
+
+            for key in list(self._entries.keys()):
+                if (symbol is None or key[0] == symbol) and (interval is None or key[1] == interval):
+                    del self._entries[key]
+
+    def get_stats(self) -> Dict[str, int]:
+        """캐시 통계 반환"""
+        with self._lock:
+            return {**self.stats, 'entries': len(self._entries)}
+
+    def _lookup(self, key: Tuple[str, str], period: str) -> Optional[HistoryEntry]:
+        """신선하고 요청 구간을 포함하는 항목 찾기"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or self._is_expired(key, entry):
+                return None
+            if entry.width_days < period_to_days(period):
+                return None
+
+            self._entries.move_to_end(key)
+            return entry
+
+    def _widest_period(self, key: Tuple[str, str], period: str) -> str:
+        """요청 period와 기존 항목 중 더 넓은 구간 선택"""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry.width_days > period_to_days(period):
+            self.stats['refreshes'] += 1
+            return entry.period
+        return period
+
+    def _store(self, key: Tuple[str, str], entry: HistoryEntry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                evicted_key, _ = self._entries.popitem(last=False)
+                self._key_locks.pop(evicted_key, None)
+                self.stats['evictions'] += 1
+
+    def _is_expired(self, key: Tuple[str, str], entry: HistoryEntry) -> bool:
+        ttl = self.ttl_seconds.get(key[1], DEFAULT_TTL_BY_INTERVAL['1d'])
+        return (time.time() - entry.fetched_at) > ttl
+
+    def _get_key_lock(self, key: Tuple[str, str]) -> threading.Lock:
+        with self._lock:
+            if key not in self._key_locks:
+                self._key_locks[key] = threading.Lock()
+            return self._key_locks[key]
+
+    def _fetch_from_yahoo(self, symbol: str, period: str, interval: str) -> pd.DataFrame:
+        """Yahoo Finance에서 히스토리 다운로드"""
+        try:
+            return yf.Ticker(symbol).history(period=period, interval=interval)
+        except Exception as e:
+            self.logger.error(f"Error fetching history for {symbol}: {str(e)}")
+            return pd.DataFrame()
+
+
+# 프로세스 전역 캐시 인스턴스
+_history_cache: Optional[HistoryCache] = None
+_history_cache_lock = threading.Lock()
+
+
+def get_history_cache() -> HistoryCache:
+    """프로세스 전역 히스토리 캐시 반환 (최초 호출 시 생성)"""
+    global _history_cache
+    if _history_cache is None:
+        with _history_cache_lock:
+            if _history_cache is None:
+                fetcher = None
+                if MONITORING_CONFIG.get('bar_store_enabled', False):
+                    # 로컬 봉 저장소를 거쳐 부족한 꼬리 구간만 다운로드
+                    from data_monitoring.bar_store import get_bar_store
+                    fetcher = get_bar_store().fetch
+                _history_cache = HistoryCache(
+                    max_entries=MONITORING_CONFIG.get('history_cache_max_entries', 256),
+                    fetcher=fetcher
+                )
+    return _history_cache
+
+
+def set_history_cache(cache: HistoryCache):
+    """전역 히스토리 캐시 교체 (테스트 또는 커스텀 저장소 주입용)"""
+    global _history_cache
+    with _history_cache_lock:
+        _history_cache = cache
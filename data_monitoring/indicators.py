@@ -0,0 +1,217 @@
+"""
+벡터화 기술적 지표 엔진
+(시간 × 심볼) 2차원 가격 행렬에 대해 SMA/EMA/RSI/MACD/볼린저 밴드를 한 번에 계산
+
+계산식은 기존 pandas 구현과 동일하게 맞춤
+- SMA/볼린저: rolling(window).mean()/std() (윈도우 안에 NaN이 있으면 NaN)
+- EMA: ewm(span).mean() (adjust=True)
+- RSI: 상승/하락폭의 단순 이동평균 비율
+"""
+
+from typing import Dict, Iterable, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+ArrayLike = Union[np.ndarray, pd.Series, pd.DataFrame]
+
+DEFAULT_PARAMS = {
+    'sma_windows': (20, 50),
+    'ema_spans': (12, 26),
+    'rsi_period': 14,
+    'macd_fast': 12,
+    'macd_slow': 26,
+    'macd_signal': 9,
+    'bb_period': 20,
+    'bb_std': 2,
+    'volume_window': 20,
+}
+
+
+def _as_matrix(values: ArrayLike) -> np.ndarray:
+    """입력을 (시간 × 심볼) float 행렬로 변환"""
+    matrix = np.asarray(values, dtype=float)
+    if matrix.ndim == 1:
+        matrix = matrix[:, None]
+    return matrix
+
+
+def rolling_mean(values: ArrayLike, window: int) -> np.ndarray:
+    """전체 구간 이동평균 (앞쪽 window-1개는 NaN)"""
+    matrix = _as_matrix(values)
+    result = np.full(matrix.shape, np.nan)
+    if len(matrix) >= window:
+        windows = np.lib.stride_tricks.sliding_window_view(matrix, window, axis=0)
+        result[window - 1:] = windows.mean(axis=-1)
+    return result
+
+
+def rolling_std(values: ArrayLike, window: int) -> np.ndarray:
+    """전체 구간 이동 표준편차 (표본 표준편차, ddof=1)"""
+    matrix = _as_matrix(values)
+    result = np.full(matrix.shape, np.nan)
+    if len(matrix) >= window:
+        windows = np.lib.stride_tricks.sliding_window_view(matrix, window, axis=0)
+        result[window - 1:] = windows.std(axis=-1, ddof=1)
+    return result
+
+
+def last_mean(values: ArrayLike, window: int) -> np.ndarray:
+    """마지막 시점의 이동평균만 계산"""
+    matrix = _as_matrix(values)
+    if len(matrix) < window:
+        return np.full(matrix.shape[1], np.nan)
+    return matrix[-window:].mean(axis=0)
+
+
+def last_std(values: ArrayLike, window: int) -> np.ndarray:
+    """마지막 시점의 이동 표준편차만 계산"""
+    matrix = _as_matrix(values)
+    if len(matrix) < window:
+        return np.full(matrix.shape[1], np.nan)
+    return matrix[-window:].std(axis=0, ddof=1)
+
+
+def ema(values: ArrayLike, span: int, last_only: bool = False) -> np.ndarray:
+    """지수이동평균 (pandas ewm(span=span, adjust=True).mean()과 동일)
+
+    시간 방향으로 한 번 순회하면서 모든 심볼을 동시에 갱신
+    """
+    matrix = _as_matrix(values)
+    decay = 1.0 - 2.0 / (span + 1.0)
+    numerator = np.zeros(matrix.shape[1])
+    denominator = np.zeros(matrix.shape[1])
+    result = None if last_only else np.full(matrix.shape, np.nan)
+
+    for t in range(len(matrix)):
+        row = matrix[t]
+        valid = ~np.isnan(row)
+        numerator *= decay
+        denominator *= decay
+        numerator[valid] += row[valid]
+        denominator[valid] += 1.0
+        if result is not None:
+            with np.errstate(invalid='ignore', divide='ignore'):
+                result[t] = numerator / denominator
+
+    if result is not None:
+        return result
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return numerator / denominator
+
+
+def rsi(values: ArrayLike, period: int = 14, last_only: bool = False) -> np.ndarray:
+    """RSI (상승/하락폭의 단순 이동평균 기준)"""
+    matrix = _as_matrix(values)
+    delta = np.full(matrix.shape, np.nan)
+    delta[1:] = np.diff(matrix, axis=0)
+    gain = np.where(delta > 0, delta, 0.0)
+    loss = np.where(delta < 0, -delta, 0.0)
+    # pandas where()와 동일하게 첫 행(NaN)은 0으로 처리
+    gain[0] = 0.0
+    loss[0] = 0.0
+
+    if last_only:
+        avg_gain = last_mean(gain, period)
+        avg_loss = last_mean(loss, period)
+    else:
+        avg_gain = rolling_mean(gain, period)
+        avg_loss = rolling_mean(loss, period)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        rs = avg_gain / avg_loss
+        return 100.0 - (100.0 / (1.0 + rs))
+
+
+def macd(values: ArrayLike, fast: int = 12, slow: int = 26, signal: int = 9,
+         last_only: bool = False) -> Dict[str, np.ndarray]:
+    """MACD, 신호선, 히스토그램"""
+    macd_line = ema(values, fast) - ema(values, slow)
+    signal_line = ema(macd_line, signal, last_only=last_only)
+    if last_only:
+        macd_line = macd_line[-1]
+    return {
+        'macd': macd_line,
+        'macd_signal': signal_line,
+        'macd_histogram': macd_line - signal_line,
+    }
+
+
+def bollinger_bands(values: ArrayLike, period: int = 20, std_dev: float = 2,
+                    last_only: bool = False) -> Dict[str, np.ndarray]:
+    """볼린저 밴드 (상단/중간/하단/폭%)"""
+    if last_only:
+        middle = last_mean(values, period)
+        std = last_std(values, period)
+    else:
+        middle = rolling_mean(values, period)
+        std = rolling_std(values, period)
+
+    upper = middle + std * std_dev
+    lower = middle - std * std_dev
+    with np.errstate(invalid='ignore', divide='ignore'):
+        width = (upper - lower) / middle * 100
+    return {
+        'bollinger_upper': upper,
+        'bollinger_middle': middle,
+        'bollinger_lower': lower,
+        'bollinger_width': width,
+    }
+
+
+def compute_indicators(close: ArrayLike, volume: Optional[ArrayLike] = None,
+                       last_only: bool = True, params: Optional[Dict] = None) -> Dict[str, np.ndarray]:
+    """모든 지표를 한 번에 계산
+
+    close/volume은 (시간 × 심볼) 행렬 또는 단일 시계열.
+    last_only=True이면 심볼별 마지막 값 벡터, False이면 전체 시계열 행렬을 반환
+    """
+    p = {**DEFAULT_PARAMS, **(params or {})}
+    close_matrix = _as_matrix(close)
+    indicators: Dict[str, np.ndarray] = {}
+
+    for window in p['sma_windows']:
+        indicators[f'sma_{window}'] = (
+            last_mean(close_matrix, window) if last_only else rolling_mean(close_matrix, window)
+        )
+    for span in p['ema_spans']:
+        indicators[f'ema_{span}'] = ema(close_matrix, span, last_only=last_only)
+
+    indicators['rsi'] = rsi(close_matrix, p['rsi_period'], last_only=last_only)
+    indicators.update(macd(close_matrix, p['macd_fast'], p['macd_slow'], p['macd_signal'], last_only=last_only))
+    indicators.update(bollinger_bands(close_matrix, p['bb_period'], p['bb_std'], last_only=last_only))
+
+    if volume is not None:
+        volume_matrix = _as_matrix(volume)
+        window = p['volume_window']
+        volume_sma = last_mean(volume_matrix, window) if last_only else rolling_mean(volume_matrix, window)
+        current_volume = volume_matrix[-1] if last_only else volume_matrix
+        with np.errstate(invalid='ignore', divide='ignore'):
+            indicators['volume_sma'] = volume_sma
+            indicators['volume_ratio'] = np.where(volume_sma > 0, current_volume / volume_sma, 1.0)
+
+    return indicators
+
+
+def latest_indicator_frame(close: pd.DataFrame, volume: Optional[pd.DataFrame] = None,
+                           params: Optional[Dict] = None) -> pd.DataFrame:
+    """심볼별 최신 지표 표 (행: 심볼, 열: 지표)"""
+    indicators = compute_indicators(close.values, None if volume is None else volume[close.columns].values,
+                                    last_only=True, params=params)
+    return pd.DataFrame(indicators, index=close.columns)
+
+
+def indicator_series(close: pd.Series, names: Iterable[str], params: Optional[Dict] = None) -> Dict[str, pd.Series]:
+    """단일 심볼의 지표 시계열 (차트 그리기용)"""
+    indicators = compute_indicators(close.values, last_only=False, params=params)
+    return {name: pd.Series(indicators[name][:, 0], index=close.index) for name in names}
+
+
+def latest_values(hist: pd.DataFrame, params: Optional[Dict] = None) -> Dict[str, Optional[float]]:
+    """단일 심볼 OHLCV 데이터의 최신 지표 값 (NaN은 None)"""
+    volume = hist['Volume'].values if 'Volume' in hist.columns else None
+    indicators = compute_indicators(hist['Close'].values, volume, last_only=True, params=params)
+    return {
+        name: (None if np.isnan(value[0]) else float(value[0]))
+        for name, value in indicators.items()
+    }
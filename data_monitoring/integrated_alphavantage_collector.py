@@ -14,6 +14,12 @@ from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 from pathlib import Path
 import asyncio
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_monitoring.alphavantage_scheduler import get_alphavantage_scheduler
+from data_monitoring.alphavantage_cache import query_alphavantage
+from config.monitoring_config import MONITORING_CONFIG
 
 @dataclass
 class AlphaVantageMarketData:
@@ -35,9 +41,8 @@ class IntegratedAlphaVantageCollector:
         self.api_key = self._load_api_key()
         self.base_url = "https://www.alphavantage.co/query"
         
-        # API 호출 제한 (5 calls per minute for free tier)
-        self.call_interval = 12  # seconds between calls
-        self.last_call_time = 0
+        # API 호출 제한 (분당/일일 한도를 같은 API 키의 모든 수집기와 공유)
+        self.scheduler = get_alphavantage_scheduler(self.api_key)
         
         # 우선순위 심볼 (API 제한 고려)
         self.priority_symbols = {
@@ -71,22 +76,8 @@ class IntegratedAlphaVantageCollector:
             self.logger.error(f"API 키 로드 실패: {e}")
             raise
     
-    def _wait_for_rate_limit(self):
-        """API 호출 제한 준수"""
-        current_time = time.time()
-        time_since_last_call = current_time - self.last_call_time
-        
-        if time_since_last_call < self.call_interval:
-            wait_time = self.call_interval - time_since_last_call
-            self.logger.debug(f"Rate limit wait: {wait_time:.1f}s")
-            time.sleep(wait_time)
-        
-        self.last_call_time = time.time()
-    
     def get_stock_data(self, symbol: str) -> Optional[AlphaVantageMarketData]:
         """주식 데이터 수집 (Alpha Vantage)"""
-        self._wait_for_rate_limit()
-        
         try:
             params = {
                 "function": "TIME_SERIES_INTRADAY",
@@ -97,9 +88,9 @@ class IntegratedAlphaVantageCollector:
                 "datatype": "json"
             }
             
-            response = requests.get(self.base_url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            data = query_alphavantage(params, self.base_url)
+            if data is None:
+                return None
             
             # 오류 체크
             if "Error Message" in data:
@@ -164,8 +155,6 @@ class IntegratedAlphaVantageCollector:
     
     def get_forex_data(self, from_currency: str, to_currency: str) -> Optional[AlphaVantageMarketData]:
         """외환 데이터 수집"""
-        self._wait_for_rate_limit()
-        
         try:
             params = {
                 "function": "FX_INTRADAY",
@@ -177,9 +166,9 @@ class IntegratedAlphaVantageCollector:
                 "datatype": "json"
             }
             
-            response = requests.get(self.base_url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            data = query_alphavantage(params, self.base_url)
+            if data is None:
+                return None
             
             if "Error Message" in data or "Note" in data:
                 return None
@@ -231,8 +220,6 @@ class IntegratedAlphaVantageCollector:
     
     def get_crypto_data(self, symbol: str, market: str = "USD") -> Optional[AlphaVantageMarketData]:
         """암호화폐 데이터 수집"""
-        self._wait_for_rate_limit()
-        
         try:
             params = {
                 "function": "CRYPTO_INTRADAY",
@@ -244,9 +231,9 @@ class IntegratedAlphaVantageCollector:
                 "datatype": "json"
             }
             
-            response = requests.get(self.base_url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            data = query_alphavantage(params, self.base_url)
+            if data is None:
+                return None
             
             if "Error Message" in data or "Note" in data:
                 return None
@@ -308,8 +295,30 @@ class IntegratedAlphaVantageCollector:
         }
         return company_names.get(symbol, symbol)
     
-    def collect_priority_data(self) -> Dict[str, List[AlphaVantageMarketData]]:
-        """우선순위 데이터 수집 (API 제한 고려)"""
+    def _plan_priority_calls(self, budget: int) -> List[Tuple[str, Any, tuple]]:
+        """호출 예산을 카테고리별로 번갈아 배분 (주식 → 지수 → 외환 → 암호화폐 순서로 한 개씩)"""
+        queues = [
+            ("stocks", self.get_stock_data, [(symbol,) for symbol in self.priority_symbols["US_STOCKS"]]),
+            ("indices", self.get_stock_data, [(symbol,) for symbol in self.priority_symbols["INDICES"]]),
+            ("forex", self.get_forex_data, list(self.priority_symbols["FOREX"])),
+            ("crypto", self.get_crypto_data, [(symbol, "USD") for symbol in self.priority_symbols["CRYPTO"]])
+        ]
+        
+        plan = []
+        depth = 0
+        while len(plan) < budget and any(depth < len(items) for _, _, items in queues):
+            for category, fetch, items in queues:
+                if depth < len(items) and len(plan) < budget:
+                    plan.append((category, fetch, items[depth]))
+            depth += 1
+        return plan
+    
+    def collect_priority_data(self, max_calls: Optional[int] = None) -> Dict[str, List[AlphaVantageMarketData]]:
+        """우선순위 데이터 수집 (남은 API 한도 안에서 가능한 만큼)
+        
+        max_calls를 생략하면 스케줄러가 수집 시간 창(alphavantage_collection_window) 안에
+        허용하는 호출 수를 예산으로 사용
+        """
         self.logger.info("🚀 Alpha Vantage 우선순위 데이터 수집 시작")
         
         results = {
@@ -319,33 +328,15 @@ class IntegratedAlphaVantageCollector:
             "crypto": []
         }
         
-        # 1. 주요 주식 (3개만)
-        self.logger.info("📈 주요 주식 데이터 수집 중...")
-        for symbol in self.priority_symbols["US_STOCKS"][:3]:
-            stock_data = self.get_stock_data(symbol)
-            if stock_data:
-                results["stocks"].append(stock_data)
-        
-        # 2. 지수 ETF (2개만)
-        self.logger.info("📊 지수 ETF 데이터 수집 중...")
-        for symbol in self.priority_symbols["INDICES"][:2]:
-            index_data = self.get_stock_data(symbol)
-            if index_data:
-                results["indices"].append(index_data)
-        
-        # 3. 주요 외환 (1개만)
-        self.logger.info("💱 외환 데이터 수집 중...")
-        for from_curr, to_curr in self.priority_symbols["FOREX"][:1]:
-            forex_data = self.get_forex_data(from_curr, to_curr)
-            if forex_data:
-                results["forex"].append(forex_data)
+        if max_calls is None:
+            max_calls = self.scheduler.calls_available(MONITORING_CONFIG.get('alphavantage_collection_window', 60))
+        plan = self._plan_priority_calls(max_calls)
+        self.logger.info(f"📊 호출 예산 {max_calls}회: {len(plan)}개 항목 수집 예정")
         
-        # 4. 암호화폐 (1개만)
-        self.logger.info("₿ 암호화폐 데이터 수집 중...")
-        for symbol in self.priority_symbols["CRYPTO"][:1]:
-            crypto_data = self.get_crypto_data(symbol, "USD")
-            if crypto_data:
-                results["crypto"].append(crypto_data)
+        for category, fetch, args in plan:
+            data = fetch(*args)
+            if data:
+                results[category].append(data)
         
         total_collected = sum(len(data_list) for data_list in results.values())
         self.logger.info(f"✅ Alpha Vantage 데이터 수집 완료: {total_collected}개 항목")
@@ -0,0 +1,99 @@
+"""
+다중 패턴 키워드 매처 모듈
+여러 키워드 사전을 Aho-Corasick 오토마톤 하나로 컴파일해 문서당 한 번의 스캔으로 모든 일치 항목을 찾음
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+class KeywordMatcher:
+    """Aho-Corasick 기반 부분 문자열 키워드 매처
+
+    - 기존 `keyword in text.lower()` 검사와 같은 의미 (단어 경계 없이 부분 문자열 일치, 겹치는 일치 포함)
+    - 그룹(사전)별 키워드를 한 오토마톤에 넣고, 문서 길이에 비례하는 한 번의 스캔으로 전체 일치를 계산
+    - 같은 키워드가 여러 그룹에 있어도 한 번만 등록
+    """
+
+    def __init__(self, groups: Dict[str, Iterable[str]]):
+        # 그룹 -> 정의 순서대로의 (원래 키워드, 소문자 키워드)
+        self.groups: Dict[str, List[Tuple[str, str]]] = {}
+        self._keywords: List[str] = []
+        keyword_ids: Dict[str, int] = {}
+
+        for group, keywords in groups.items():
+            entries = []
+            for keyword in keywords:
+                lowered = keyword.lower()
+                if not lowered:
+                    continue
+                if lowered not in keyword_ids:
+                    keyword_ids[lowered] = len(self._keywords)
+                    self._keywords.append(lowered)
+                entries.append((keyword, lowered))
+            self.groups[group] = entries
+
+        self._build(keyword_ids)
+
+    def _build(self, keyword_ids: Dict[str, int]):
+        """트라이 구성 후 BFS로 실패 링크와 출력 집합 계산"""
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[int, ...]] = [()]
+        outputs: List[List[int]] = [[]]
+
+        for keyword, keyword_id in keyword_ids.items():
+            node = 0
+            for char in keyword:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    outputs.append([])
+                node = next_node
+            outputs[node].append(keyword_id)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                outputs[child].extend(outputs[self._fail[child]])
+
+        self._output = [tuple(ids) for ids in outputs]
+
+    def matched(self, text: str) -> Set[str]:
+        """문서에 부분 문자열로 등장하는 모든 (소문자) 키워드"""
+        goto, fail, output = self._goto, self._fail, self._output
+        found: Set[int] = set()
+        node = 0
+        for char in text.lower():
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if output[node]:
+                found.update(output[node])
+        keywords = self._keywords
+        return {keywords[i] for i in found}
+
+    def find(self, text: str, groups: Optional[Iterable[str]] = None) -> Dict[str, List[str]]:
+        """그룹별 일치 키워드 (원래 표기, 정의 순서 유지)"""
+        hits = self.matched(text)
+        names = self.groups.keys() if groups is None else groups
+        return {
+            group: [keyword for keyword, lowered in self.groups.get(group, []) if lowered in hits]
+            for group in names
+        }
+
+    def count(self, text: str, group: str) -> int:
+        """그룹에서 문서에 등장한 키워드 수"""
+        hits = self.matched(text)
+        return sum(1 for _, lowered in self.groups.get(group, []) if lowered in hits)
+
@@ -11,18 +11,21 @@ from dataclasses import asdict
 
 from .data_collector import EconomicDataCollector, MarketData
 from .event_detector import EventDetector, EconomicEvent
+from .event_journal import EventJournal, get_event_journal
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config.monitoring_config import ECONOMIC_INDICATORS, MONITORING_CONFIG
 
 class EconomicMonitor:
-    def __init__(self):
+    def __init__(self, event_journal: Optional[EventJournal] = None):
         self.logger = self._setup_logging()
         self.data_collector = EconomicDataCollector()
         self.event_detector = EventDetector()
+        self.event_journal = event_journal or get_event_journal()
         self.is_running = False
         self.monitoring_symbols = self._get_monitoring_symbols()
+        self._last_rotation_date = None
         
     def _setup_logging(self) -> logging.Logger:
         """로깅 설정"""
@@ -67,6 +70,11 @@ class EconomicMonitor:
         cycle_start = datetime.now()
         self.logger.info(f"모니터링 사이클 시작: {cycle_start}")
         
+        # 날짜가 바뀌면 지난 이벤트 세그먼트 압축/만료 처리
+        if self._last_rotation_date != cycle_start.date():
+            self.event_journal.rotate()
+            self._last_rotation_date = cycle_start.date()
+        
         # 1. 데이터 수집
         market_data = await self._collect_market_data()
         if not market_data:
@@ -118,7 +126,7 @@ class EconomicMonitor:
                 await self._send_high_priority_alert(event)
     
     async def _save_event(self, event: EconomicEvent):
-        """이벤트를 파일에 저장"""
+        """이벤트를 저널에 저장 (일별 세그먼트에 한 줄 추가)"""
         try:
             event_data = {
                 'event_id': event.event_id,
@@ -135,21 +143,7 @@ class EconomicMonitor:
                 'market_context': event.market_context
             }
             
-            # 날짜별 파일에 저장
-            date_str = event.timestamp.strftime('%Y-%m-%d')
-            filename = f"/home/ec2-user/projects/ABP/economic_news_system/logs/events_{date_str}.json"
-            
-            # 파일에 추가
-            try:
-                with open(filename, 'r') as f:
-                    events_data = json.load(f)
-            except (FileNotFoundError, json.JSONDecodeError):
-                events_data = []
-            
-            events_data.append(event_data)
-            
-            with open(filename, 'w') as f:
-                json.dump(events_data, f, indent=2, ensure_ascii=False)
+            self.event_journal.append(event_data)
                 
         except Exception as e:
             self.logger.error(f"이벤트 저장 중 오류: {str(e)}")
@@ -211,32 +205,9 @@ class EconomicMonitor:
         self.logger.info("모니터링 중단 요청됨")
     
     async def get_recent_events(self, hours: int = 24) -> List[Dict]:
-        """최근 이벤트 조회"""
+        """최근 이벤트 조회 (최신순)"""
         try:
-            cutoff_time = datetime.now() - timedelta(hours=hours)
-            recent_events = []
-            
-            # 최근 며칠간의 이벤트 파일 확인
-            for i in range(3):  # 최근 3일
-                date = datetime.now() - timedelta(days=i)
-                date_str = date.strftime('%Y-%m-%d')
-                filename = f"/home/ec2-user/projects/ABP/economic_news_system/logs/events_{date_str}.json"
-                
-                try:
-                    with open(filename, 'r') as f:
-                        events_data = json.load(f)
-                        
-                    for event_data in events_data:
-                        event_time = datetime.fromisoformat(event_data['timestamp'])
-                        if event_time >= cutoff_time:
-                            recent_events.append(event_data)
-                            
-                except (FileNotFoundError, json.JSONDecodeError):
-                    continue
-            
-            # 시간순 정렬
-            recent_events.sort(key=lambda x: x['timestamp'], reverse=True)
-            return recent_events
+            return self.event_journal.get_recent_events(hours)
             
         except Exception as e:
             self.logger.error(f"최근 이벤트 조회 중 오류: {str(e)}")
@@ -0,0 +1,225 @@
+"""
+네트워크 메트릭 계산 모듈
+그래프 크기에 따라 정확/근사(피벗 표본) 중심성과 경로 길이를 계산하고, 그래프 구조별로 결과를 캐시
+"""
+
+import random
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import networkx as nx
+from networkx.algorithms import approximation
+
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.monitoring_config import MONITORING_CONFIG
+
+METRICS_MODE_AUTO = 'auto'
+METRICS_MODE_EXACT = 'exact'
+METRICS_MODE_APPROXIMATE = 'approximate'
+
+
+def graph_fingerprint(G: nx.Graph) -> str:
+    """그래프 구조(노드/엣지) 해시 - 속성이 달라도 구조가 같으면 같은 버전으로 취급"""
+    digest = hashlib.sha1(b'directed' if G.is_directed() else b'undirected')
+    for node in sorted(map(repr, G.nodes())):
+        digest.update(node.encode('utf-8'))
+        digest.update(b'\x00')
+    digest.update(b'\x01')
+    edges = ((repr(u), repr(v)) for u, v in G.edges())
+    if not G.is_directed():
+        edges = (tuple(sorted(edge)) for edge in edges)
+    for u, v in sorted(edges):
+        digest.update(f"{u}\x00{v}\x00".encode('utf-8'))
+    return digest.hexdigest()
+
+
+@dataclass
+class NetworkMetrics:
+    """네트워크 메트릭 계산 결과 (mode: 실제로 사용한 계산 방식)"""
+    mode: str
+    density: float
+    average_clustering: float
+    degree: Dict
+    betweenness: Dict
+    closeness: Dict
+    connected: bool
+    connected_components: int
+    largest_component_size: int
+    diameter: Optional[int] = None               # 근사 모드에서는 하한값
+    diameter_upper_bound: Optional[int] = None
+    average_path_length: Optional[float] = None  # 근사 모드에서는 피벗 표본 평균
+
+    def top(self, measure: str, n: int = 5) -> List[Tuple[object, float]]:
+        """중심성 상위 노드"""
+        return sorted(getattr(self, measure).items(), key=lambda x: x[1], reverse=True)[:n]
+
+
+class NetworkMetricsCalculator:
+    """네트워크 메트릭 계산기
+
+    - exact: networkx 정확 계산 (betweenness/closeness/diameter/평균 경로 길이 모두 O(VE))
+    - approximate: k개 피벗 BFS 표본으로 betweenness, closeness, 평균 경로 길이를 추정하고
+      지름은 [피벗 이심률 최댓값, 2 × 최소 이심률] 범위로 제한
+    - auto: 노드 수가 exact_node_limit 이하이면 exact, 넘으면 approximate
+    - 결과는 그래프 구조 해시와 계산 방식으로 LRU 캐시 (Streamlit 재실행 시 재계산 방지)
+    """
+
+    def __init__(self, mode: Optional[str] = None, exact_node_limit: Optional[int] = None,
+                 pivot_samples: Optional[int] = None, cache_size: int = 64, seed: int = 42):
+        self.logger = logging.getLogger(__name__)
+        self.mode = mode or MONITORING_CONFIG.get('network_metrics_mode', METRICS_MODE_AUTO)
+        if self.mode not in (METRICS_MODE_AUTO, METRICS_MODE_EXACT, METRICS_MODE_APPROXIMATE):
+            raise ValueError(f"지원하지 않는 메트릭 계산 방식: {self.mode}")
+        self.exact_node_limit = (exact_node_limit if exact_node_limit is not None
+                                 else MONITORING_CONFIG.get('network_exact_node_limit', 500))
+        self.pivot_samples = (pivot_samples if pivot_samples is not None
+                              else MONITORING_CONFIG.get('network_pivot_samples', 64))
+        self.cache_size = cache_size
+        self.seed = seed
+
+        self._cache: "OrderedDict[Tuple[str, str], NetworkMetrics]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0}
+
+    def resolve_mode(self, G: nx.Graph) -> str:
+        """그래프 크기에 따른 실제 계산 방식"""
+        if self.mode != METRICS_MODE_AUTO:
+            return self.mode
+        return METRICS_MODE_EXACT if G.number_of_nodes() <= self.exact_node_limit else METRICS_MODE_APPROXIMATE
+
+    def compute(self, G: nx.Graph) -> NetworkMetrics:
+        """메트릭 계산 (같은 구조의 그래프는 캐시된 결과 반환, 결과는 읽기 전용으로 사용)"""
+        mode = self.resolve_mode(G)
+        key = (graph_fingerprint(G), mode)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.stats['hits'] += 1
+                return cached
+            self.stats['misses'] += 1
+
+        if mode == METRICS_MODE_EXACT:
+            result = self._compute_exact(G)
+        else:
+            result = self._compute_approximate(G)
+
+        with self._lock:
+            self._cache[key] = result
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return result
+
+    def _components(self, G: nx.Graph) -> List[set]:
+        return list(nx.connected_components(G)) if G.number_of_nodes() else []
+
+    def _compute_exact(self, G: nx.Graph) -> NetworkMetrics:
+        components = self._components(G)
+        connected = len(components) == 1
+        return NetworkMetrics(
+            mode=METRICS_MODE_EXACT,
+            density=nx.density(G),
+            average_clustering=nx.average_clustering(G),
+            degree=nx.degree_centrality(G),
+            betweenness=nx.betweenness_centrality(G),
+            closeness=nx.closeness_centrality(G),
+            connected=connected,
+            connected_components=len(components),
+            largest_component_size=max((len(c) for c in components), default=0),
+            diameter=nx.diameter(G) if connected else None,
+            diameter_upper_bound=None,
+            average_path_length=nx.average_shortest_path_length(G) if connected else None
+        )
+
+    def _compute_approximate(self, G: nx.Graph) -> NetworkMetrics:
+        n = G.number_of_nodes()
+        rng = random.Random(self.seed)
+        nodes = list(G.nodes())
+        pivots = rng.sample(nodes, min(self.pivot_samples, n))
+
+        components = self._components(G)
+        component_size = {node: len(component) for component in components for node in component}
+        connected = len(components) == 1
+
+        # 피벗 BFS 거리 누적 (무방향 그래프이므로 d(p, v) = d(v, p))
+        distance_sum = dict.fromkeys(nodes, 0)
+        pivot_hits = dict.fromkeys(nodes, 0)
+        eccentricities = []
+        path_total, path_count = 0, 0
+        for pivot in pivots:
+            lengths = nx.single_source_shortest_path_length(G, pivot)
+            for node, distance in lengths.items():
+                distance_sum[node] += distance
+                pivot_hits[node] += 1
+            path_total += sum(lengths.values())
+            path_count += len(lengths) - 1
+            eccentricities.append((max(lengths.values()), pivot, lengths))
+
+        # closeness: 같은 성분의 피벗 거리 평균으로 성분 전체 거리 합을 추정 (networkx wf_improved 정규화)
+        closeness = {}
+        for node in nodes:
+            size = component_size[node]
+            if size <= 1:
+                closeness[node] = 0.0
+                continue
+            if pivot_hits[node] == 0:
+                # 피벗이 없는 작은 성분은 직접 계산
+                lengths = nx.single_source_shortest_path_length(G, node)
+                total = sum(lengths.values())
+            else:
+                total = distance_sum[node] * size / pivot_hits[node]
+            closeness[node] = ((size - 1) / total) * ((size - 1) / (n - 1)) if total > 0 else 0.0
+
+        diameter = upper_bound = average_path_length = None
+        if connected and eccentricities:
+            # 이중 탐색: 가장 먼 피벗의 가장 먼 노드에서 한 번 더 BFS해 하한을 높임
+            farthest_ecc, _, farthest_lengths = max(eccentricities, key=lambda item: item[0])
+            far_node = max(farthest_lengths, key=farthest_lengths.get)
+            diameter = max(farthest_ecc, nx.eccentricity(G, v=far_node))
+            upper_bound = min(2 * ecc for ecc, _, _ in eccentricities)
+            average_path_length = path_total / path_count if path_count else 0.0
+
+        return NetworkMetrics(
+            mode=METRICS_MODE_APPROXIMATE,
+            density=nx.density(G),
+            average_clustering=approximation.average_clustering(G, trials=1000, seed=self.seed) if n else 0.0,
+            degree=nx.degree_centrality(G),
+            betweenness=nx.betweenness_centrality(G, k=len(pivots), seed=self.seed),
+            closeness=closeness,
+            connected=connected,
+            connected_components=len(components),
+            largest_component_size=max((len(c) for c in components), default=0),
+            diameter=diameter,
+            diameter_upper_bound=upper_bound,
+            average_path_length=average_path_length
+        )
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self.stats, 'cached_graphs': len(self._cache)}
+
+
+_metrics_calculator: Optional[NetworkMetricsCalculator] = None
+_metrics_calculator_lock = threading.Lock()
+
+
+def get_network_metrics_calculator() -> NetworkMetricsCalculator:
+    """프로세스 전역 네트워크 메트릭 계산기 (설정 기반)"""
+    global _metrics_calculator
+    with _metrics_calculator_lock:
+        if _metrics_calculator is None:
+            _metrics_calculator = NetworkMetricsCalculator()
+        return _metrics_calculator
+
+
+def set_network_metrics_calculator(calculator: Optional[NetworkMetricsCalculator]):
+    """전역 네트워크 메트릭 계산기 교체 (테스트용)"""
+    global _metrics_calculator
+    with _metrics_calculator_lock:
+        _metrics_calculator = calculator
@@ -0,0 +1,250 @@
+"""
+공유 RSS 뉴스 풀 모듈
+각 피드를 갱신 주기마다 한 번만 (조건부 GET으로) 받아 모든 뉴스 소비자가 메모리에서 조회
+"""
+
+import re
+import time
+import hashlib
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+import feedparser
+
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.monitoring_config import MONITORING_CONFIG
+
+USER_AGENT = "Mozilla/5.0 (compatible; EconomicNewsSystem/1.0)"
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+|[가-힣]+")
+
+
+def _default_fetcher(url: str, etag: Optional[str], modified: Optional[str]):
+    """feedparser 조건부 GET (변경이 없으면 status 304와 빈 entries 반환)"""
+    return feedparser.parse(url, etag=etag, modified=modified, agent=USER_AGENT)
+
+
+def article_key(link: str, title: str) -> str:
+    """URL(없으면 제목) 해시 기반 기사 식별자"""
+    basis = (link or "").strip() or (title or "").strip().lower()
+    return hashlib.sha1(basis.encode('utf-8')).hexdigest()
+
+
+def _tokenize(text: str) -> Set[str]:
+    return set(_TOKEN_PATTERN.findall(text.lower()))
+
+
+@dataclass
+class FeedState:
+    """피드 1개의 마지막 수집 결과와 조건부 GET 검증자"""
+    url: str
+    title: str = 'Unknown'
+    entries: list = field(default_factory=list)
+    etag: Optional[str] = None
+    modified: Optional[str] = None
+    fetched_at: float = 0.0
+    last_status: Optional[int] = None
+
+
+@dataclass
+class PooledArticle:
+    """중복 제거된 기사 (여러 피드에 실린 기사는 처음 본 피드 기준)"""
+    article_id: str
+    title: str
+    summary: str
+    link: str
+    source: str
+    feed_url: str
+    published: datetime
+    entry: object  # 원본 feedparser 항목
+
+    @property
+    def text(self) -> str:
+        return f"{self.title} {self.summary}"
+
+
+class NewsPool:
+    """공유 RSS 뉴스 풀
+
+    - 수집: 갱신 주기가 지난 피드만 스레드 풀에서 동시에 조건부 GET (ETag / If-Modified-Since)
+    - 304 응답이나 수집 실패 시에는 이전 항목을 그대로 유지
+    - 기사는 URL/제목 해시로 중복 제거해 보관하고, 단어 역색인으로 키워드 조회
+    """
+
+    def __init__(self, refresh_interval: Optional[float] = None, max_workers: int = 8,
+                 fetcher: Optional[Callable] = None, max_articles: int = 2000):
+        self.logger = logging.getLogger(__name__)
+        self.refresh_interval = (refresh_interval if refresh_interval is not None
+                                 else MONITORING_CONFIG.get('news_refresh_interval', 300))
+        self.max_workers = max_workers
+        self.fetcher = fetcher or _default_fetcher
+        self.max_articles = max_articles
+
+        self._lock = threading.RLock()
+        self._feeds: Dict[str, FeedState] = {}
+        self._articles: Dict[str, PooledArticle] = {}
+        self._token_index: Dict[str, Set[str]] = {}
+        # 같은 피드를 여러 스레드가 동시에 받지 않도록 피드별 잠금
+        self._feed_locks: Dict[str, threading.Lock] = {}
+        self.stats = {'fetches': 0, 'not_modified': 0, 'errors': 0, 'fresh_hits': 0}
+
+    def _feed_lock(self, url: str) -> threading.Lock:
+        with self._lock:
+            return self._feed_locks.setdefault(url, threading.Lock())
+
+    def _is_fresh(self, state: Optional[FeedState], now: float) -> bool:
+        return state is not None and state.fetched_at > 0 and now - state.fetched_at < self.refresh_interval
+
+    def refresh(self, urls: Iterable[str], force: bool = False) -> Dict[str, FeedState]:
+        """피드 목록을 갱신하고 각 피드 상태 반환 (주기 안의 피드는 다운로드 생략)"""
+        urls = list(dict.fromkeys(urls))
+        stale = [url for url in urls if force or not self._is_fresh(self._feeds.get(url), time.time())]
+
+        if len(stale) > 1 and self.max_workers > 1:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(stale))) as executor:
+                list(executor.map(lambda url: self._fetch(url, force), stale))
+        else:
+            for url in stale:
+                self._fetch(url, force)
+
+        with self._lock:
+            return {url: self._feeds[url] for url in urls if url in self._feeds}
+
+    def get_feed(self, url: str) -> FeedState:
+        """피드 1개 상태 (필요할 때만 다운로드)"""
+        return self.refresh([url])[url]
+
+    def get_entries(self, url: str, max_items: Optional[int] = None) -> list:
+        """피드 원본 항목 목록 (feedparser 항목 그대로)"""
+        entries = self.get_feed(url).entries
+        return list(entries[:max_items] if max_items is not None else entries)
+
+    def _fetch(self, url: str, force: bool = False):
+        with self._feed_lock(url):
+            with self._lock:
+                state = self._feeds.get(url) or FeedState(url=url)
+            # 다른 스레드가 방금 받았으면 다시 받지 않음
+            if not force and self._is_fresh(state, time.time()):
+                with self._lock:
+                    self.stats['fresh_hits'] += 1
+                return
+
+            try:
+                result = self.fetcher(url, state.etag, state.modified)
+            except Exception as e:
+                self.logger.error(f"RSS 피드 수집 오류 ({url}): {e}")
+                with self._lock:
+                    self.stats['errors'] += 1
+                    state.fetched_at = time.time()
+                    self._feeds[url] = state
+                return
+
+            status = result.get('status')
+            with self._lock:
+                self.stats['fetches'] += 1
+                state.fetched_at = time.time()
+                state.last_status = status
+                if status == 304:
+                    self.stats['not_modified'] += 1
+                elif result.get('entries') or not state.entries:
+                    state.entries = list(result.get('entries', []))
+                    state.title = result.get('feed', {}).get('title', state.title)
+                    self._index_entries(url, state)
+                state.etag = result.get('etag', state.etag)
+                state.modified = result.get('modified', state.modified)
+                self._feeds[url] = state
+
+    def _index_entries(self, url: str, state: FeedState):
+        """새로 받은 항목을 중복 제거 기사 집합과 단어 역색인에 반영"""
+        for entry in state.entries:
+            title = entry.get('title', '')
+            link = entry.get('link', '')
+            key = article_key(link, title)
+            if key in self._articles:
+                continue
+
+            published = datetime.now()
+            if entry.get('published_parsed'):
+                published = datetime(*entry['published_parsed'][:6])
+
+            article = PooledArticle(article_id=key, title=title, summary=entry.get('summary', ''),
+                                    link=link, source=state.title, feed_url=url,
+                                    published=published, entry=entry)
+            self._articles[key] = article
+            for token in _tokenize(article.text):
+                self._token_index.setdefault(token, set()).add(key)
+
+        if len(self._articles) > self.max_articles:
+            self._prune()
+
+    def _prune(self):
+        """기사 수 상한을 넘으면 오래된 기사부터 역색인과 함께 제거"""
+        ordered = sorted(self._articles.values(), key=lambda a: a.published)
+        for article in ordered[:len(self._articles) - self.max_articles]:
+            del self._articles[article.article_id]
+            for token in _tokenize(article.text):
+                keys = self._token_index.get(token)
+                if keys is not None:
+                    keys.discard(article.article_id)
+                    if not keys:
+                        del self._token_index[token]
+
+    def articles(self, feed_urls: Optional[Iterable[str]] = None,
+                 predicate: Optional[Callable[[PooledArticle], bool]] = None,
+                 limit: Optional[int] = None) -> List[PooledArticle]:
+        """중복 제거된 기사 목록 (최신순, 피드/조건 필터)"""
+        with self._lock:
+            candidates = list(self._articles.values())
+        if feed_urls is not None:
+            feed_urls = set(feed_urls)
+            candidates = [a for a in candidates if a.feed_url in feed_urls]
+        if predicate is not None:
+            candidates = [a for a in candidates if predicate(a)]
+        candidates.sort(key=lambda a: a.published, reverse=True)
+        return candidates[:limit] if limit is not None else candidates
+
+    def search(self, terms: Iterable[str], limit: Optional[int] = None) -> List[PooledArticle]:
+        """단어/구문 중 하나라도 포함한 기사 (역색인으로 후보를 고른 뒤 구문 확인)"""
+        matched: Set[str] = set()
+        with self._lock:
+            for term in terms:
+                tokens = _tokenize(term)
+                if not tokens:
+                    continue
+                candidates = set.intersection(*(self._token_index.get(t, set()) for t in tokens))
+                if len(tokens) > 1:
+                    phrase = term.lower()
+                    candidates = {k for k in candidates if phrase in self._articles[k].text.lower()}
+                matched |= candidates
+            found = [self._articles[k] for k in matched]
+        found.sort(key=lambda a: a.published, reverse=True)
+        return found[:limit] if limit is not None else found
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self.stats, 'feeds': len(self._feeds), 'articles': len(self._articles)}
+
+
+_news_pool: Optional[NewsPool] = None
+_news_pool_lock = threading.Lock()
+
+
+def get_news_pool() -> NewsPool:
+    """프로세스 전역 뉴스 풀"""
+    global _news_pool
+    with _news_pool_lock:
+        if _news_pool is None:
+            _news_pool = NewsPool()
+        return _news_pool
+
+
+def set_news_pool(pool: Optional[NewsPool]):
+    """전역 뉴스 풀 교체 (테스트용)"""
+    global _news_pool
+    with _news_pool_lock:
+        _news_pool = pool
@@ -8,13 +8,14 @@ import feedparser
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
-from textblob import TextBlob
 import re
 import time
 import os
 
 # Reddit 수집기 import
 from data_monitoring.reddit_collector import RedditEconomicCollector
+from data_monitoring.news_pool import get_news_pool
+from data_monitoring.sentiment_service import get_sentiment_service
 
 class EnhancedNewsCollector:
     """강화된 뉴스 및 소셜미디어 수집기 (실제 Reddit 데이터 포함)"""
@@ -80,6 +81,9 @@ class EnhancedNewsCollector:
         
         total_articles = 0
         
+        # 모든 피드를 공유 뉴스 풀에서 한 번에 (동시에, 조건부 GET으로) 갱신
+        get_news_pool().refresh(source["url"] for sources in self.news_sources.values() for source in sources)
+        
         for category, sources in self.news_sources.items():
             category_articles = []
             
@@ -87,20 +91,20 @@ class EnhancedNewsCollector:
                 try:
                     articles = self._fetch_rss_feed(source["url"], max_items_per_source)
                     
-                    for article in articles:
+                    # 감정 분석 (소스 단위로 한 번에 배치 처리)
+                    texts = [article["title"] + " " + article.get("summary", "") for article in articles]
+                    sentiments = get_sentiment_service().score_batch(texts)
+                    
+                    for article, sentiment in zip(articles, sentiments):
                         article["source_name"] = source["name"]
                         article["category"] = category
-                        
-                        # 감정 분석 추가
-                        article["sentiment"] = self._analyze_sentiment(article["title"] + " " + article.get("summary", ""))
+                        article["sentiment"] = sentiment.to_dict()
                         
                         # 키워드 분류
                         article["topics"] = self._classify_topics(article["title"] + " " + article.get("summary", ""))
                         
                         category_articles.append(article)
                     
-                    time.sleep(0.5)  # Rate limiting
-                    
                 except Exception as e:
                     self.logger.error(f"❌ {source['name']} 수집 오류: {e}")
                     continue
@@ -118,27 +122,22 @@ class EnhancedNewsCollector:
         return news_data
     
     def _fetch_rss_feed(self, url: str, max_items: int) -> List[Dict[str, Any]]:
-        """RSS 피드에서 뉴스 수집"""
+        """RSS 피드에서 뉴스 수집 (공유 뉴스 풀의 중복 제거된 기사 사용, 여러 피드에 실린 기사는 처음 본 피드에만 포함)"""
         try:
-            feed = feedparser.parse(url)
             articles = []
             
-            for entry in feed.entries[:max_items]:
+            for pooled in get_news_pool().articles(feed_urls=[url], limit=max_items):
+                entry = pooled.entry
                 article = {
-                    "title": entry.get("title", ""),
-                    "link": entry.get("link", ""),
+                    "title": pooled.title,
+                    "link": pooled.link,
                     "published": entry.get("published", ""),
-                    "summary": entry.get("summary", ""),
+                    "summary": pooled.summary,
                     "author": entry.get("author", ""),
-                    "published_parsed": entry.get("published_parsed", None)
+                    "published_parsed": entry.get("published_parsed", None),
+                    "published_datetime": pooled.published
                 }
                 
-                # 발행 시간 정규화
-                if article["published_parsed"]:
-                    article["published_datetime"] = datetime(*article["published_parsed"][:6])
-                else:
-                    article["published_datetime"] = datetime.now()
-                
                 articles.append(article)
             
             return articles
@@ -148,29 +147,8 @@ class EnhancedNewsCollector:
             return []
     
     def _analyze_sentiment(self, text: str) -> Dict[str, Any]:
-        """텍스트 감정 분석"""
-        try:
-            blob = TextBlob(text)
-            polarity = blob.sentiment.polarity
-            subjectivity = blob.sentiment.subjectivity
-            
-            # 감정 라벨링
-            if polarity > 0.1:
-                label = "positive"
-            elif polarity < -0.1:
-                label = "negative"
-            else:
-                label = "neutral"
-            
-            return {
-                "polarity": round(polarity, 3),
-                "subjectivity": round(subjectivity, 3),
-                "label": label
-            }
-            
-        except Exception as e:
-            self.logger.debug(f"감정 분석 오류: {e}")
-            return {"polarity": 0, "subjectivity": 0, "label": "neutral"}
+        """텍스트 감정 분석 (배치 감정 분석 서비스 사용)"""
+        return get_sentiment_service().score(text).to_dict()
     
     def _classify_topics(self, text: str) -> List[str]:
         """키워드 기반 주제 분류"""
@@ -14,9 +14,33 @@ from dotenv import load_dotenv
 import time
 import re
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_monitoring.keyword_matcher import KeywordMatcher
+from data_monitoring.sentiment_service import BatchSentimentService, METHOD_LEXICON
+
 # .env 파일 로드
 load_dotenv()
 
+# 경제 관련성 판단 키워드
+ECONOMIC_KEYWORDS = [
+    'economy', 'economic', 'finance', 'financial', 'market', 'stock', 'investment',
+    'inflation', 'recession', 'gdp', 'fed', 'interest rate', 'monetary policy',
+    'fiscal policy', 'unemployment', 'employment', 'trade', 'currency', 'dollar',
+    'bitcoin', 'cryptocurrency', 'real estate', 'housing', 'mortgage'
+]
+ECONOMIC_KEYWORD_MATCHER = KeywordMatcher({'economic': ECONOMIC_KEYWORDS})
+
+# 포스트/댓글 감정 분석용 키워드 사전 (배치 감정 분석 서비스의 사전 방식 사용)
+# 기존과 같이 등장한 키워드 종류 수로 비교 (같은 단어 반복은 한 번만 셈)
+POST_SENTIMENT_SERVICE = BatchSentimentService(
+    method=METHOD_LEXICON,
+    distinct_terms=True,
+    positive=['good', 'great', 'excellent', 'positive', 'bullish', 'growth', 'profit',
+              'success', 'opportunity', 'optimistic', 'recovery', 'improvement'],
+    negative=['bad', 'terrible', 'negative', 'bearish', 'loss', 'crash', 'decline',
+              'recession', 'crisis', 'worry', 'concern', 'risk', 'problem']
+)
+
 class RealRedditCollector:
     """실제 Reddit 데이터만 수집하는 클래스"""
     
@@ -212,22 +236,8 @@ class RealRedditCollector:
     def _analyze_post_sentiment(self, title: str, selftext: str) -> Dict[str, Any]:
         """포스트 감정 분석 (키워드 기반)"""
         
-        text = f"{title} {selftext}".lower()
-        
-        # 긍정적 키워드
-        positive_keywords = [
-            'good', 'great', 'excellent', 'positive', 'bullish', 'growth', 'profit',
-            'success', 'opportunity', 'optimistic', 'recovery', 'improvement'
-        ]
-        
-        # 부정적 키워드  
-        negative_keywords = [
-            'bad', 'terrible', 'negative', 'bearish', 'loss', 'crash', 'decline',
-            'recession', 'crisis', 'worry', 'concern', 'risk', 'problem'
-        ]
-        
-        positive_count = sum(1 for keyword in positive_keywords if keyword in text)
-        negative_count = sum(1 for keyword in negative_keywords if keyword in text)
+        result = POST_SENTIMENT_SERVICE.score(f"{title} {selftext}")
+        positive_count, negative_count = result.positive, result.negative
         
         if positive_count > negative_count:
             sentiment = 'positive'
@@ -253,19 +263,10 @@ class RealRedditCollector:
     def _calculate_economic_relevance(self, title: str, selftext: str) -> float:
         """경제 관련성 점수 계산"""
         
-        text = f"{title} {selftext}".lower()
-        
-        economic_keywords = [
-            'economy', 'economic', 'finance', 'financial', 'market', 'stock', 'investment',
-            'inflation', 'recession', 'gdp', 'fed', 'interest rate', 'monetary policy',
-            'fiscal policy', 'unemployment', 'employment', 'trade', 'currency', 'dollar',
-            'bitcoin', 'cryptocurrency', 'real estate', 'housing', 'mortgage'
-        ]
+        text = f"{title} {selftext}"
         
-        relevance_score = 0
-        for keyword in economic_keywords:
-            if keyword in text:
-                relevance_score += 1
+        # 경제 키워드 사전은 한 번만 컴파일해 두고 문서당 한 번 스캔
+        relevance_score = ECONOMIC_KEYWORD_MATCHER.count(text, 'economic')
         
         # 0-1 사이로 정규화
         return min(relevance_score / 5.0, 1.0)
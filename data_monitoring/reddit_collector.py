@@ -8,10 +8,13 @@ import praw
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
-from textblob import TextBlob
 import time
 import re
 
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_monitoring.sentiment_service import get_sentiment_service
+
 class RedditEconomicCollector:
     """Reddit 경제 관련 데이터 수집기"""
     
@@ -227,26 +230,8 @@ class RedditEconomicCollector:
         return any(keyword in text_lower for keyword in self.economic_keywords)
     
     def _analyze_sentiment(self, text: str) -> Dict[str, Any]:
-        """텍스트 감정 분석"""
-        try:
-            blob = TextBlob(text)
-            polarity = blob.sentiment.polarity
-            subjectivity = blob.sentiment.subjectivity
-            
-            if polarity > 0.1:
-                label = "positive"
-            elif polarity < -0.1:
-                label = "negative"
-            else:
-                label = "neutral"
-            
-            return {
-                'polarity': round(polarity, 3),
-                'subjectivity': round(subjectivity, 3),
-                'label': label
-            }
-        except:
-            return {'polarity': 0, 'subjectivity': 0, 'label': 'neutral'}
+        """텍스트 감정 분석 (배치 감정 분석 서비스 사용)"""
+        return get_sentiment_service().score(text).to_dict()
     
     def _extract_economic_topics(self, text: str) -> List[str]:
         """경제 주제 추출"""
@@ -4,11 +4,10 @@
 
 import re
 import requests
-import feedparser
 import numpy as np
 import pandas as pd
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime, timedelta
 import logging
@@ -17,6 +16,12 @@ import aiohttp
 from bs4 import BeautifulSoup
 import json
 
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_monitoring.news_pool import NewsPool, PooledArticle, article_key, get_news_pool
+from data_monitoring.keyword_matcher import KeywordMatcher
+
 class SentimentScore(Enum):
     VERY_POSITIVE = "very_positive"  # 0.6 ~ 1.0
     POSITIVE = "positive"            # 0.2 ~ 0.6
@@ -58,11 +63,36 @@ class MarketSentiment:
     # 주요 뉴스 항목들
     key_news: Optional[List[NewsItem]] = None
 
+@dataclass
+class NewsSnapshot:
+    """한 분석 주기 동안 여러 심볼이 공유하는 뉴스 피드/공포탐욕 지수"""
+    feeds: List[Tuple[str, str, list]]  # (피드 URL, 피드 제목, 최신 항목들)
+    fear_greed_index: float = 50.0
+    fetched_at: datetime = field(default_factory=datetime.now)
+
 class SentimentAnalyzer:
     """시장 감정 분석 클래스"""
     
-    def __init__(self):
+    # 심볼별 회사명/관련어 (관련성 판단용)
+    SYMBOL_ALIASES = {
+        'aapl': ['apple', 'iphone', 'mac', 'ipad'],
+        'googl': ['google', 'alphabet', 'android', 'youtube'],
+        'msft': ['microsoft', 'windows', 'azure', 'office'],
+        'tsla': ['tesla', 'elon musk', 'electric vehicle', 'ev'],
+        'nvda': ['nvidia', 'gpu', 'ai chip', 'graphics'],
+        '^gspc': ['s&p 500', 'sp500', 'market index'],
+        '^ixic': ['nasdaq', 'tech stock', 'technology'],
+        '^vix': ['vix', 'volatility', 'fear index']
+    }
+    
+    # 일반적인 시장 관련 키워드
+    MARKET_KEYWORDS = ['stock', 'market', 'trading', 'investor', 'economy', 'financial']
+    
+    def __init__(self, news_pool: Optional[NewsPool] = None):
         self.logger = logging.getLogger(__name__)
+        self._news_pool = news_pool
+        # 기사 ID -> 감정 점수/키워드를 계산한 NewsItem (여러 심볼/피드에 걸친 기사도 한 번만 처리)
+        self._scored_news: Dict[str, NewsItem] = {}
         
         # 감정 분석용 키워드 사전
         self.positive_keywords = {
@@ -86,12 +116,36 @@ class SentimentAnalyzer:
             "https://rss.cnn.com/rss/money_latest.rss",
             "https://feeds.marketwatch.com/marketwatch/topstories/"
         ]
+        
+        # 감정/관련성 키워드 사전을 한 번에 컴파일 (문서당 한 번 스캔)
+        self.keyword_matcher = KeywordMatcher({
+            'positive': sorted(self.positive_keywords),
+            'negative': sorted(self.negative_keywords),
+            'market': self.MARKET_KEYWORDS,
+            **{f"alias:{symbol}": aliases for symbol, aliases in self.SYMBOL_ALIASES.items()}
+        })
+    
+    @property
+    def news_pool(self) -> NewsPool:
+        """피드를 갱신 주기마다 한 번만 받는 공유 뉴스 풀"""
+        if self._news_pool is None:
+            self._news_pool = get_news_pool()
+        return self._news_pool
     
-    async def analyze_market_sentiment(self, symbol: str) -> Optional[MarketSentiment]:
-        """특정 심볼에 대한 시장 감정 분석"""
+    async def fetch_news_snapshot(self) -> NewsSnapshot:
+        """모든 뉴스 피드와 공포/탐욕 지수를 한 번에 수집 (피드는 공유 뉴스 풀에서 동시에 갱신)"""
+        feeds_task = asyncio.ensure_future(asyncio.to_thread(self.news_pool.refresh, self.news_feeds))
+        fear_greed_index = await self._calculate_fear_greed_index()
+        states = await feeds_task
+        feeds = [(url, states[url].title, states[url].entries[:10]) for url in self.news_feeds if url in states]
+        return NewsSnapshot(feeds=feeds, fear_greed_index=fear_greed_index)
+    
+    async def analyze_market_sentiment(self, symbol: str,
+                                       snapshot: Optional[NewsSnapshot] = None) -> Optional[MarketSentiment]:
+        """특정 심볼에 대한 시장 감정 분석 (snapshot이 있으면 네트워크 없이 메모리에서 필터링)"""
         try:
             # 뉴스 데이터 수집
-            news_items = await self._collect_news_data(symbol)
+            news_items = await self._collect_news_data(symbol, snapshot)
             
             if not news_items:
                 self.logger.warning(f"No news data found for {symbol}")
@@ -101,7 +155,10 @@ class SentimentAnalyzer:
             news_sentiment = self._analyze_news_sentiment(news_items)
             
             # VIX 기반 공포/탐욕 지수 계산
-            fear_greed_index = await self._calculate_fear_greed_index()
+            if snapshot is not None:
+                fear_greed_index = snapshot.fear_greed_index
+            else:
+                fear_greed_index = await self._calculate_fear_greed_index()
             
             # 감정 추이 분석
             sentiment_trend = self._analyze_sentiment_trend(symbol, news_sentiment)
@@ -134,18 +191,17 @@ class SentimentAnalyzer:
             self.logger.error(f"Error analyzing sentiment for {symbol}: {str(e)}")
             return None
     
-    async def _collect_news_data(self, symbol: str) -> List[NewsItem]:
+    async def _collect_news_data(self, symbol: str, snapshot: Optional[NewsSnapshot] = None) -> List[NewsItem]:
         """뉴스 데이터 수집"""
         news_items = []
         
-        # RSS 피드에서 뉴스 수집
-        for feed_url in self.news_feeds:
-            try:
-                feed_items = await self._parse_rss_feed(feed_url, symbol)
-                news_items.extend(feed_items)
-            except Exception as e:
-                self.logger.error(f"Error parsing feed {feed_url}: {str(e)}")
-                continue
+        if snapshot is not None:
+            # 주기 내 공유 스냅샷에서 관련 뉴스만 골라냄
+            for feed_url, feed_title, entries in snapshot.feeds:
+                news_items.extend(self._entries_to_news(feed_title, entries, symbol))
+        else:
+            # 공유 뉴스 풀의 중복 제거된 기사에서 관련 뉴스 조회 (갱신 주기 안이면 다운로드 없음)
+            news_items = await self._search_pooled_news(symbol)
         
         # 중복 제거 및 날짜순 정렬
         unique_news = {}
@@ -161,45 +217,67 @@ class SentimentAnalyzer:
         
         return sorted_news[:20]  # 최신 20개만 반환
     
-    async def _parse_rss_feed(self, feed_url: str, symbol: str) -> List[NewsItem]:
-        """RSS 피드 파싱"""
+    async def _search_pooled_news(self, symbol: str) -> List[NewsItem]:
+        """공유 뉴스 풀에서 심볼 관련 기사 조회 (피드 간 중복 기사는 한 번만 처리)"""
+        try:
+            await asyncio.to_thread(self.news_pool.refresh, self.news_feeds)
+            articles = self.news_pool.articles(
+                feed_urls=self.news_feeds,
+                predicate=lambda article: self._is_relevant_to_symbol(article.text, symbol)
+            )
+            return [self._score_article(article) for article in articles]
+        except Exception as e:
+            self.logger.error(f"Error searching pooled news for {symbol}: {str(e)}")
+            return []
+    
+    def _score_article(self, article: PooledArticle) -> NewsItem:
+        """기사 감정 점수/키워드 계산 (기사 ID별로 한 번만)"""
+        news_item = self._scored_news.get(article.article_id)
+        if news_item is None:
+            if len(self._scored_news) >= self.news_pool.max_articles:
+                self._scored_news.clear()
+            news_item = NewsItem(
+                title=article.title,
+                content=article.summary,
+                source=article.source,
+                published_date=article.published,
+                url=article.link,
+                sentiment_score=self._calculate_text_sentiment(article.text),
+                keywords=self._extract_keywords(article.text)
+            )
+            self._scored_news[article.article_id] = news_item
+        return news_item
+    
+    def _entries_to_news(self, source: str, entries: list, symbol: str) -> List[NewsItem]:
+        """피드 항목 중 심볼과 관련된 것만 NewsItem으로 변환"""
         news_items = []
         
-        try:
-            # RSS 피드 파싱
-            feed = feedparser.parse(feed_url)
-            
-            for entry in feed.entries[:10]:  # 최신 10개만 처리
+        for entry in entries[:10]:  # 최신 10개만 처리
+            try:
                 # 심볼 관련성 확인
-                if not self._is_relevant_to_symbol(entry.title + " " + entry.get('summary', ''), symbol):
-                    continue
-                
-                # 감정 점수 계산
                 content = entry.title + " " + entry.get('summary', '')
-                sentiment_score = self._calculate_text_sentiment(content)
-                
-                # 키워드 추출
-                keywords = self._extract_keywords(content)
+                if not self._is_relevant_to_symbol(content, symbol):
+                    continue
                 
                 # 발행 날짜 파싱
                 published_date = datetime.now()
                 if hasattr(entry, 'published_parsed') and entry.published_parsed:
                     published_date = datetime(*entry.published_parsed[:6])
                 
-                news_item = NewsItem(
+                article = PooledArticle(
+                    article_id=article_key(entry.get('link', ''), entry.title),
                     title=entry.title,
-                    content=entry.get('summary', ''),
-                    source=feed.feed.get('title', 'Unknown'),
-                    published_date=published_date,
-                    url=entry.get('link', ''),
-                    sentiment_score=sentiment_score,
-                    keywords=keywords
+                    summary=entry.get('summary', ''),
+                    link=entry.get('link', ''),
+                    source=source,
+                    feed_url='',
+                    published=published_date,
+                    entry=entry
                 )
-                
-                news_items.append(news_item)
-                
-        except Exception as e:
-            self.logger.error(f"Error parsing RSS feed {feed_url}: {str(e)}")
+                news_items.append(self._score_article(article))
+            except Exception as e:
+                self.logger.error(f"Error parsing RSS entry from {source}: {str(e)}")
+                break
         
         return news_items
     
@@ -212,33 +290,15 @@ class SentimentAnalyzer:
         if symbol_lower in text_lower:
             return True
         
-        # 회사명 매칭 (간단한 매핑)
-        symbol_mappings = {
-            'aapl': ['apple', 'iphone', 'mac', 'ipad'],
-            'googl': ['google', 'alphabet', 'android', 'youtube'],
-            'msft': ['microsoft', 'windows', 'azure', 'office'],
-            'tsla': ['tesla', 'elon musk', 'electric vehicle', 'ev'],
-            'nvda': ['nvidia', 'gpu', 'ai chip', 'graphics'],
-            '^gspc': ['s&p 500', 'sp500', 'market index'],
-            '^ixic': ['nasdaq', 'tech stock', 'technology'],
-            '^vix': ['vix', 'volatility', 'fear index']
-        }
-        
-        if symbol_lower in symbol_mappings:
-            for keyword in symbol_mappings[symbol_lower]:
-                if keyword in text_lower:
-                    return True
-        
-        # 일반적인 시장 관련 키워드
-        market_keywords = ['stock', 'market', 'trading', 'investor', 'economy', 'financial']
-        return any(keyword in text_lower for keyword in market_keywords)
+        # 회사명 매칭 및 일반적인 시장 관련 키워드 (한 번의 스캔으로 확인)
+        hits = self.keyword_matcher.find(text_lower, [f"alias:{symbol_lower}", 'market'])
+        return any(hits.values())
     
     def _calculate_text_sentiment(self, text: str) -> float:
         """텍스트의 감정 점수 계산 (간단한 키워드 기반)"""
-        text_lower = text.lower()
-        
-        positive_count = sum(1 for word in self.positive_keywords if word in text_lower)
-        negative_count = sum(1 for word in self.negative_keywords if word in text_lower)
+        hits = self.keyword_matcher.find(text, ['positive', 'negative'])
+        positive_count = len(hits['positive'])
+        negative_count = len(hits['negative'])
         
         total_words = len(text.split())
         
@@ -0,0 +1,278 @@
+"""
+배치 감정 분석 서비스 모듈
+여러 텍스트를 한 번에 받아 감정 점수를 계산 (텍스트 해시 캐시, 대량 배치는 프로세스 풀로 분산)
+"""
+
+import re
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+try:
+    from textblob import TextBlob
+    TEXTBLOB_AVAILABLE = True
+except ImportError:
+    # TextBlob이 없으면 사전 기반 점수로 대체
+    TextBlob = None
+    TEXTBLOB_AVAILABLE = False
+
+METHOD_TEXTBLOB = 'textblob'
+METHOD_LEXICON = 'lexicon'
+
+# 기본 감정 사전 (수집기들이 쓰던 키워드를 합친 것)
+DEFAULT_POSITIVE_TERMS = [
+    'gain', 'gains', 'rise', 'surge', 'rally', 'boost', 'strong', 'growth', 'positive', 'bullish',
+    'optimistic', 'recovery', 'improve', 'improvement', 'advance', 'profit', 'earnings', 'beat',
+    'robust', 'solid', 'confident', 'breakthrough', 'success', 'record', 'good', 'great',
+    'excellent', 'opportunity',
+    '상승', '급등', '호조', '성장', '수익', '이익', '강세', '긍정', '낙관'
+]
+DEFAULT_NEGATIVE_TERMS = [
+    'fall', 'drop', 'decline', 'crash', 'weak', 'loss', 'losses', 'negative', 'bearish',
+    'pessimistic', 'recession', 'crisis', 'concern', 'worry', 'fear', 'risk', 'uncertainty',
+    'volatile', 'pressure', 'struggle', 'disappointing', 'poor', 'bad', 'terrible', 'problem',
+    '하락', '급락', '부진', '손실', '약세', '우려', '불안', '위험', '부정'
+]
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9']+|[가-힣]+")
+
+
+@dataclass
+class SentimentResult:
+    polarity: float      # -1.0 (부정) ~ 1.0 (긍정)
+    subjectivity: float  # 0.0 (객관적) ~ 1.0 (주관적)
+    label: str           # positive / negative / neutral
+    positive: int = 0    # 사전 방식에서 일치한 긍정 단어 수
+    negative: int = 0    # 사전 방식에서 일치한 부정 단어 수
+
+    def to_dict(self, digits: Optional[int] = 3) -> Dict[str, object]:
+        """수집기들이 쓰던 {'polarity', 'subjectivity', 'label'} 형식"""
+        polarity, subjectivity = self.polarity, self.subjectivity
+        if digits is not None:
+            polarity, subjectivity = round(polarity, digits), round(subjectivity, digits)
+        return {'polarity': polarity, 'subjectivity': subjectivity, 'label': self.label}
+
+
+NEUTRAL_RESULT = SentimentResult(polarity=0.0, subjectivity=0.0, label='neutral')
+
+
+def sentiment_label(polarity: float, threshold: float = 0.1) -> str:
+    if polarity > threshold:
+        return 'positive'
+    if polarity < -threshold:
+        return 'negative'
+    return 'neutral'
+
+
+def build_lexicon(positive: Iterable[str], negative: Iterable[str]) -> Dict[str, float]:
+    """긍정 +1 / 부정 -1 가중치 사전"""
+    weights = {term.lower(): 1.0 for term in positive}
+    weights.update({term.lower(): -1.0 for term in negative})
+    return weights
+
+
+def score_lexicon(texts: List[str], weights: Dict[str, float], distinct: bool = False) -> List[SentimentResult]:
+    """사전 기반 배치 점수 계산
+
+    텍스트마다 한 번 토큰화한 뒤 배치 전체 토큰을 어휘 ID 배열로 바꾸고,
+    가중치 조회와 문서별 합계를 numpy 연산으로 한 번에 처리.
+    distinct=True면 같은 사전 단어가 여러 번 나와도 문서당 한 번만 셈
+    (예: "bad bad bad good"은 긍정 1 / 부정 1로 중립)
+    """
+    if not texts:
+        return []
+
+    vocabulary: Dict[str, int] = {}
+    token_ids: List[int] = []
+    lengths = np.zeros(len(texts), dtype=np.int64)
+    for i, text in enumerate(texts):
+        tokens = _TOKEN_PATTERN.findall((text or '').lower())
+        lengths[i] = len(tokens)
+        for token in tokens:
+            token_ids.append(vocabulary.setdefault(token, len(vocabulary)))
+
+    # 어휘별 가중치와 일치한 사전 단어 (복수형 's'는 단수형 사전 항목으로도 조회)
+    terms: Dict[str, int] = {}
+    vocab_weights = np.zeros(len(vocabulary), dtype=np.float64)
+    vocab_terms = np.full(len(vocabulary), -1, dtype=np.int64)
+    for token, index in vocabulary.items():
+        term = token if token in weights else None
+        if term is None and token.endswith('s') and token[:-1] in weights:
+            term = token[:-1]
+        if term is not None:
+            vocab_weights[index] = weights[term]
+            vocab_terms[index] = terms.setdefault(term, len(terms))
+
+    doc_index = np.repeat(np.arange(len(texts)), lengths)
+    token_ids = np.asarray(token_ids, dtype=np.int64)
+    token_weights = vocab_weights[token_ids]
+    n = len(texts)
+
+    if distinct and terms:
+        # (문서, 사전 단어) 쌍을 한 번씩만 남김
+        token_terms = vocab_terms[token_ids]
+        matched_mask = token_terms >= 0
+        pairs = np.unique(doc_index[matched_mask] * len(terms) + token_terms[matched_mask])
+        doc_index = pairs // len(terms)
+        term_weights = np.array([weights[term] for term in terms], dtype=np.float64)
+        token_weights = term_weights[pairs % len(terms)]
+    positive = np.bincount(doc_index, weights=(token_weights > 0).astype(np.float64), minlength=n)
+    negative = np.bincount(doc_index, weights=(token_weights < 0).astype(np.float64), minlength=n)
+    total = np.bincount(doc_index, weights=token_weights, minlength=n)
+
+    matched = positive + negative
+    polarity = np.divide(total, matched, out=np.zeros(n), where=matched > 0)
+    subjectivity = np.divide(matched, lengths, out=np.zeros(n), where=lengths > 0)
+    polarity = np.clip(polarity, -1.0, 1.0)
+
+    return [
+        SentimentResult(polarity=float(polarity[i]), subjectivity=float(subjectivity[i]),
+                        label=sentiment_label(polarity[i]),
+                        positive=int(positive[i]), negative=int(negative[i]))
+        for i in range(n)
+    ]
+
+
+def score_textblob(texts: List[str]) -> List[SentimentResult]:
+    """TextBlob(pattern 사전) 기반 점수 계산"""
+    results = []
+    for text in texts:
+        try:
+            sentiment = TextBlob(text).sentiment
+            results.append(SentimentResult(polarity=sentiment.polarity, subjectivity=sentiment.subjectivity,
+                                           label=sentiment_label(sentiment.polarity)))
+        except Exception:
+            results.append(NEUTRAL_RESULT)
+    return results
+
+
+def _score_chunk(method: str, weights: Dict[str, float], texts: List[str],
+                 distinct: bool = False) -> List[SentimentResult]:
+    """프로세스 풀 작업 단위 (모듈 수준 함수여야 pickle 가능)"""
+    if method == METHOD_TEXTBLOB:
+        return score_textblob(texts)
+    return score_lexicon(texts, weights, distinct)
+
+
+class BatchSentimentService:
+    """배치 감정 분석 서비스
+
+    - method: 'textblob' (설치된 경우 기본값) 또는 'lexicon' (사전 기반, numpy 벡터화)
+    - distinct_terms: 사전 방식에서 같은 단어의 반복을 문서당 한 번만 셈 (기본은 출현마다)
+    - 캐시: 텍스트 해시 -> 결과 LRU, 같은 배치 안의 중복 텍스트도 한 번만 계산
+    - 대량 배치(process_threshold 이상)는 chunk_size 단위로 프로세스 풀에 분산
+    """
+
+    def __init__(self, method: Optional[str] = None,
+                 positive: Optional[Iterable[str]] = None, negative: Optional[Iterable[str]] = None,
+                 cache_size: int = 20000, process_threshold: int = 5000,
+                 chunk_size: int = 1000, max_workers: Optional[int] = None,
+                 distinct_terms: bool = False):
+        self.logger = logging.getLogger(__name__)
+        method = method or (METHOD_TEXTBLOB if TEXTBLOB_AVAILABLE else METHOD_LEXICON)
+        if method == METHOD_TEXTBLOB and not TEXTBLOB_AVAILABLE:
+            self.logger.warning("TextBlob이 설치되어 있지 않아 사전 기반 감정 분석을 사용합니다")
+            method = METHOD_LEXICON
+        self.method = method
+        self.weights = build_lexicon(positive if positive is not None else DEFAULT_POSITIVE_TERMS,
+                                     negative if negative is not None else DEFAULT_NEGATIVE_TERMS)
+        self.cache_size = cache_size
+        self.process_threshold = process_threshold
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self.distinct_terms = distinct_terms
+
+        self._cache: "OrderedDict[str, SentimentResult]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {'requests': 0, 'cache_hits': 0, 'computed': 0, 'process_batches': 0}
+
+    @staticmethod
+    def _key(text: str) -> str:
+        return hashlib.sha1((text or '').encode('utf-8')).hexdigest()
+
+    def score_batch(self, texts: List[str]) -> List[SentimentResult]:
+        """텍스트 목록의 감정 점수 (입력 순서 유지)"""
+        keys = [self._key(text) for text in texts]
+        results: Dict[str, SentimentResult] = {}
+        pending: Dict[str, str] = {}
+
+        with self._lock:
+            self.stats['requests'] += len(texts)
+            for key, text in zip(keys, texts):
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    results[key] = cached
+                    self.stats['cache_hits'] += 1
+                elif key not in results:
+                    pending[key] = text
+
+        if pending:
+            computed = self._compute(list(pending.values()))
+            with self._lock:
+                self.stats['computed'] += len(computed)
+                for key, result in zip(pending, computed):
+                    results[key] = result
+                    self._cache[key] = result
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        return [results[key] for key in keys]
+
+    def _compute(self, texts: List[str]) -> List[SentimentResult]:
+        if len(texts) < self.process_threshold:
+            return _score_chunk(self.method, self.weights, texts, self.distinct_terms)
+
+        chunks = [texts[i:i + self.chunk_size] for i in range(0, len(texts), self.chunk_size)]
+        try:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                parts = list(executor.map(_score_chunk, [self.method] * len(chunks),
+                                          [self.weights] * len(chunks), chunks,
+                                          [self.distinct_terms] * len(chunks)))
+            with self._lock:
+                self.stats['process_batches'] += 1
+            return [result for part in parts for result in part]
+        except Exception as e:
+            # 프로세스 생성이 막힌 환경에서는 현재 프로세스에서 계산
+            self.logger.warning(f"프로세스 풀 감정 분석 실패, 단일 프로세스로 계산합니다: {e}")
+            return _score_chunk(self.method, self.weights, texts, self.distinct_terms)
+
+    def score(self, text: str) -> SentimentResult:
+        """텍스트 1건의 감정 점수"""
+        return self.score_batch([text])[0]
+
+    def polarities(self, texts: List[str]) -> List[float]:
+        """텍스트 목록의 극성 값만 반환"""
+        return [result.polarity for result in self.score_batch(texts)]
+
+    def get_stats(self) -> Dict[str, object]:
+        with self._lock:
+            requests = self.stats['requests']
+            return {**self.stats, 'method': self.method, 'cached_entries': len(self._cache),
+                    'hit_rate': self.stats['cache_hits'] / requests if requests else 0.0}
+
+
+_sentiment_service: Optional[BatchSentimentService] = None
+_sentiment_service_lock = threading.Lock()
+
+
+def get_sentiment_service() -> BatchSentimentService:
+    """프로세스 전역 감정 분석 서비스 (기본 사전/방식)"""
+    global _sentiment_service
+    with _sentiment_service_lock:
+        if _sentiment_service is None:
+            _sentiment_service = BatchSentimentService()
+        return _sentiment_service
+
+
+def set_sentiment_service(service: Optional[BatchSentimentService]):
+    """전역 감정 분석 서비스 교체 (테스트용)"""
+    global _sentiment_service
+    with _sentiment_service_lock:
+        _sentiment_service = service
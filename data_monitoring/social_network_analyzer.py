@@ -12,7 +12,12 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple
 from collections import Counter, defaultdict
 import re
-from textblob import TextBlob
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_monitoring.keyword_matcher import KeywordMatcher
+from data_monitoring.network_metrics import get_network_metrics_calculator
 
 class SocialNetworkAnalyzer:
     """소셜 네트워크 분석기"""
@@ -78,6 +83,35 @@ class SocialNetworkAnalyzer:
             'criticism': ['criticize', 'oppose', 'against', 'dispute', 'conflict']
         }
         
+        # 추가적인 패턴 매칭 (약어, 변형 등) - 대표 엔티티 이름으로 정규화
+        self.entity_aliases = {
+            'institutions': {
+                'federal reserve': ['fed', 'federal reserve', 'central bank'],
+                'sec': ['securities and exchange commission', 'sec'],
+                'treasury': ['treasury department', 'treasury', 'us treasury'],
+                'ecb': ['european central bank', 'ecb']
+            },
+            'concepts': {
+                'interest rates': ['interest rate', 'rates', 'fed rate', 'federal funds rate'],
+                'inflation': ['inflation', 'cpi', 'consumer price index', 'price increases'],
+                'recession': ['recession', 'economic downturn', 'contraction'],
+                'stock market': ['stock market', 'equity market', 'stocks', 'shares']
+            }
+        }
+        
+        # 엔티티는 전체 이름 또는 3글자 이상 단어 중 하나가 등장하면 일치
+        self._entity_terms = {
+            category: [(entity, [entity.lower()] + [w for w in entity.lower().split() if len(w) > 2])
+                       for entity in entities]
+            for category, entities in self.economic_entities.items()
+        }
+        self.entity_matcher = KeywordMatcher({
+            **{category: [term for _, terms in entries for term in terms]
+               for category, entries in self._entity_terms.items()},
+            **{f"alias:{category}": [p for patterns in pattern_dict.values() for p in patterns]
+               for category, pattern_dict in self.entity_aliases.items()}
+        })
+        
         self.logger.info("✅ 소셜 네트워크 분석기 초기화 완료")
     
     def extract_entities_from_text(self, text: str) -> Dict[str, List[str]]:
@@ -96,38 +130,23 @@ class SocialNetworkAnalyzer:
             'concepts': []
         }
         
-        for category, entities in self.economic_entities.items():
-            for entity in entities:
-                entity_lower = entity.lower()
-                
+        # 모든 엔티티/별칭 사전을 한 번의 스캔으로 확인
+        hits = self.entity_matcher.matched(text_clean_lower)
+        
+        for category, entries in self._entity_terms.items():
+            for entity, terms in entries:
                 # 정확한 매칭과 부분 매칭 모두 고려
-                if (entity_lower in text_clean_lower or 
-                    any(word in text_clean_lower for word in entity_lower.split() if len(word) > 2)):
+                if any(term in hits for term in terms):
                     
                     # 중복 제거
                     if entity not in found_entities[category]:
                         found_entities[category].append(entity)
         
         # 추가적인 패턴 매칭 (약어, 변형 등)
-        additional_patterns = {
-            'institutions': {
-                'federal reserve': ['fed', 'federal reserve', 'central bank'],
-                'sec': ['securities and exchange commission', 'sec'],
-                'treasury': ['treasury department', 'treasury', 'us treasury'],
-                'ecb': ['european central bank', 'ecb']
-            },
-            'concepts': {
-                'interest rates': ['interest rate', 'rates', 'fed rate', 'federal funds rate'],
-                'inflation': ['inflation', 'cpi', 'consumer price index', 'price increases'],
-                'recession': ['recession', 'economic downturn', 'contraction'],
-                'stock market': ['stock market', 'equity market', 'stocks', 'shares']
-            }
-        }
-        
-        for category, pattern_dict in additional_patterns.items():
+        for category, pattern_dict in self.entity_aliases.items():
             for main_entity, patterns in pattern_dict.items():
                 for pattern in patterns:
-                    if pattern in text_clean_lower:
+                    if pattern in hits:
                         # 메인 엔티티 이름으로 정규화
                         if main_entity not in [e.lower() for e in found_entities[category]]:
                             found_entities[category].append(main_entity.title())
@@ -304,36 +323,32 @@ class SocialNetworkAnalyzer:
         if len(G.nodes()) == 0:
             return {}
         
+        # 그래프 크기에 따라 정확/근사 계산 (같은 구조의 그래프는 캐시 사용)
+        result = get_network_metrics_calculator().compute(G)
+        
         metrics = {
             'nodes_count': len(G.nodes()),
             'edges_count': len(G.edges()),
-            'density': nx.density(G),
-            'average_clustering': nx.average_clustering(G),
+            'density': result.density,
+            'average_clustering': result.average_clustering,
+            'metrics_mode': result.mode,
         }
         
         if len(G.nodes()) > 0:
             # 중심성 측정
-            degree_centrality = nx.degree_centrality(G)
-            betweenness_centrality = nx.betweenness_centrality(G)
-            closeness_centrality = nx.closeness_centrality(G)
-            
             metrics.update({
-                'top_degree_centrality': sorted(degree_centrality.items(), 
-                                               key=lambda x: x[1], reverse=True)[:5],
-                'top_betweenness_centrality': sorted(betweenness_centrality.items(), 
-                                                   key=lambda x: x[1], reverse=True)[:5],
-                'top_closeness_centrality': sorted(closeness_centrality.items(), 
-                                                 key=lambda x: x[1], reverse=True)[:5]
+                'top_degree_centrality': result.top('degree'),
+                'top_betweenness_centrality': result.top('betweenness'),
+                'top_closeness_centrality': result.top('closeness')
             })
         
         # 연결성 분석
-        if nx.is_connected(G):
-            metrics['diameter'] = nx.diameter(G)
-            metrics['average_path_length'] = nx.average_shortest_path_length(G)
+        if result.connected:
+            metrics['diameter'] = result.diameter
+            metrics['average_path_length'] = result.average_path_length
         else:
-            metrics['connected_components'] = nx.number_connected_components(G)
-            largest_cc = max(nx.connected_components(G), key=len)
-            metrics['largest_component_size'] = len(largest_cc)
+            metrics['connected_components'] = result.connected_components
+            metrics['largest_component_size'] = result.largest_component_size
         
         return metrics
     
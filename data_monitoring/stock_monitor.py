@@ -15,6 +15,10 @@ import aiohttp
 from dataclasses import dataclass
 import requests
 import json
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_monitoring.alphavantage_cache import query_alphavantage
 
 @dataclass
 class StockData:
@@ -112,8 +116,10 @@ class StockMonitor:
                 'apikey': self.alpha_vantage_key
             }
             
-            response = requests.get(url, params=params, timeout=10)
-            data = response.json()
+            # 응답 캐시 → 공유 호출 한도 스케줄러 순서로 조회
+            data = query_alphavantage(params, url, timeout=10)
+            if data is None:
+                return {}
             
             if 'top_gainers' in data:
                 return {
@@ -13,6 +13,10 @@ import requests
 import json
 import time
 from dataclasses import dataclass
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_monitoring.alphavantage_cache import query_alphavantage
 
 @dataclass
 class StockData:
@@ -142,8 +146,10 @@ class StockMonitorWithProgress:
                 'apikey': self.alpha_vantage_key
             }
             
-            response = requests.get(url, params=params, timeout=10)
-            data = response.json()
+            # 응답 캐시 → 공유 호출 한도 스케줄러 순서로 조회
+            data = query_alphavantage(params, url, timeout=10)
+            if data is None:
+                return {}
             
             if callback:
                 callback.update_progress(1, 1, "Alpha Vantage 데이터 처리 완료")
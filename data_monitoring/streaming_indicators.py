@@ -0,0 +1,401 @@
+"""
+스트리밍(증분) 기술적 지표 모듈
+봉이 하나 들어올 때마다 O(1)로 EMA, Wilder RSI, MACD, 볼린저 밴드, 거래량 평균을 갱신
+상태는 JSON으로 저장/복원할 수 있어 연속 모니터링을 재시작해도 처음부터 다시 계산하지 않음
+"""
+
+import os
+import json
+import math
+import logging
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+import pandas as pd
+
+
+class StreamingEMA:
+    """지수이동평균 (pandas ewm(span, adjust=True)와 동일한 가중치)"""
+
+    def __init__(self, span: int):
+        self.span = span
+        self.decay = 1.0 - 2.0 / (span + 1.0)
+        self.numerator = 0.0
+        self.denominator = 0.0
+
+    def update(self, value: float) -> Optional[float]:
+        self.numerator = self.numerator * self.decay + value
+        self.denominator = self.denominator * self.decay + 1.0
+        return self.value
+
+    @property
+    def value(self) -> Optional[float]:
+        return self.numerator / self.denominator if self.denominator else None
+
+    def get_state(self) -> Dict[str, Any]:
+        return {'span': self.span, 'numerator': self.numerator, 'denominator': self.denominator}
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "StreamingEMA":
+        ema = cls(state['span'])
+        ema.numerator = state['numerator']
+        ema.denominator = state['denominator']
+        return ema
+
+
+class StreamingRSI:
+    """Wilder 방식 RSI (첫 period개는 단순평균, 이후 지수 평활)"""
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self.prev_close: Optional[float] = None
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+        self.count = 0
+
+    def update(self, close: float) -> Optional[float]:
+        if self.prev_close is not None:
+            change = close - self.prev_close
+            gain = max(change, 0.0)
+            loss = max(-change, 0.0)
+            self.count += 1
+
+            if self.count <= self.period:
+                # 초기 구간은 누적 평균
+                self.avg_gain += (gain - self.avg_gain) / self.count
+                self.avg_loss += (loss - self.avg_loss) / self.count
+            else:
+                self.avg_gain = (self.avg_gain * (self.period - 1) + gain) / self.period
+                self.avg_loss = (self.avg_loss * (self.period - 1) + loss) / self.period
+
+        self.prev_close = close
+        return self.value
+
+    @property
+    def value(self) -> Optional[float]:
+        if self.count < self.period:
+            return None
+        if self.avg_loss == 0:
+            return 100.0 if self.avg_gain > 0 else 50.0
+        return 100.0 - 100.0 / (1.0 + self.avg_gain / self.avg_loss)
+
+    def get_state(self) -> Dict[str, Any]:
+        return {
+            'period': self.period, 'prev_close': self.prev_close,
+            'avg_gain': self.avg_gain, 'avg_loss': self.avg_loss, 'count': self.count
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "StreamingRSI":
+        rsi = cls(state['period'])
+        rsi.prev_close = state['prev_close']
+        rsi.avg_gain = state['avg_gain']
+        rsi.avg_loss = state['avg_loss']
+        rsi.count = state['count']
+        return rsi
+
+
+class StreamingMACD:
+    """MACD = EMA(fast) - EMA(slow), 신호선 = EMA(signal) of MACD"""
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self.fast = StreamingEMA(fast)
+        self.slow = StreamingEMA(slow)
+        self.signal = StreamingEMA(signal)
+        self.macd: Optional[float] = None
+
+    def update(self, close: float) -> Dict[str, Optional[float]]:
+        self.macd = self.fast.update(close) - self.slow.update(close)
+        self.signal.update(self.macd)
+        return self.value
+
+    @property
+    def value(self) -> Dict[str, Optional[float]]:
+        signal = self.signal.value
+        histogram = self.macd - signal if self.macd is not None and signal is not None else None
+        return {'macd': self.macd, 'macd_signal': signal, 'macd_histogram': histogram}
+
+    def get_state(self) -> Dict[str, Any]:
+        return {
+            'fast': self.fast.get_state(), 'slow': self.slow.get_state(),
+            'signal': self.signal.get_state(), 'macd': self.macd
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "StreamingMACD":
+        macd = cls()
+        macd.fast = StreamingEMA.from_state(state['fast'])
+        macd.slow = StreamingEMA.from_state(state['slow'])
+        macd.signal = StreamingEMA.from_state(state['signal'])
+        macd.macd = state['macd']
+        return macd
+
+
+class RollingWindow:
+    """고정 길이 윈도우의 합/제곱합을 유지해 평균과 표준편차를 O(1)로 계산"""
+
+    # 누적 합의 부동소수점 오차를 없애기 위해 주기적으로 합을 다시 계산
+    RESYNC_INTERVAL = 1000
+
+    def __init__(self, window: int):
+        self.window = window
+        self.values: deque = deque(maxlen=window)
+        self.total = 0.0
+        self.total_sq = 0.0
+        self._updates = 0
+
+    def update(self, value: float) -> Optional[float]:
+        if len(self.values) == self.window:
+            oldest = self.values[0]
+            self.total -= oldest
+            self.total_sq -= oldest * oldest
+        self.values.append(value)
+        self.total += value
+        self.total_sq += value * value
+
+        self._updates += 1
+        if self._updates % self.RESYNC_INTERVAL == 0:
+            self.total = sum(self.values)
+            self.total_sq = sum(v * v for v in self.values)
+        return self.mean
+
+    @property
+    def is_full(self) -> bool:
+        return len(self.values) == self.window
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / len(self.values) if self.is_full else None
+
+    @property
+    def std(self) -> Optional[float]:
+        """표본 표준편차 (ddof=1)"""
+        if not self.is_full or self.window < 2:
+            return None
+        n = self.window
+        variance = (self.total_sq - self.total * self.total / n) / (n - 1)
+        return math.sqrt(max(variance, 0.0))
+
+    def get_state(self) -> Dict[str, Any]:
+        return {'window': self.window, 'values': list(self.values)}
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "RollingWindow":
+        rolling = cls(state['window'])
+        for value in state['values']:
+            rolling.update(value)
+        return rolling
+
+
+class StreamingBollinger:
+    """볼린저 밴드 (이동평균 ± k × 표준편차)"""
+
+    def __init__(self, period: int = 20, std_dev: float = 2):
+        self.std_dev = std_dev
+        self.window = RollingWindow(period)
+
+    def update(self, close: float) -> Dict[str, Optional[float]]:
+        self.window.update(close)
+        return self.value
+
+    @property
+    def value(self) -> Dict[str, Optional[float]]:
+        middle = self.window.mean
+        std = self.window.std
+        if middle is None or std is None:
+            return {'bollinger_upper': None, 'bollinger_middle': None,
+                    'bollinger_lower': None, 'bollinger_width': None}
+        upper = middle + std * self.std_dev
+        lower = middle - std * self.std_dev
+        return {
+            'bollinger_upper': upper,
+            'bollinger_middle': middle,
+            'bollinger_lower': lower,
+            'bollinger_width': (upper - lower) / middle * 100 if middle else None
+        }
+
+    def get_state(self) -> Dict[str, Any]:
+        return {'std_dev': self.std_dev, 'window': self.window.get_state()}
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "StreamingBollinger":
+        bollinger = cls(state['window']['window'], state['std_dev'])
+        bollinger.window = RollingWindow.from_state(state['window'])
+        return bollinger
+
+
+class StreamingIndicatorSet:
+    """한 심볼의 스트리밍 지표 묶음
+
+    이미 반영한 시각 이전의 봉은 무시하므로 같은 인트라데이 구간을 반복해서 넣어도 안전
+    """
+
+    def __init__(self, symbol: str, volume_window: int = 20):
+        self.symbol = symbol
+        self.ema_12 = StreamingEMA(12)
+        self.ema_26 = StreamingEMA(26)
+        self.rsi = StreamingRSI(14)
+        self.macd = StreamingMACD(12, 26, 9)
+        self.bollinger = StreamingBollinger(20, 2)
+        self.volume = RollingWindow(volume_window)
+        self.last_timestamp: Optional[datetime] = None
+        self.last_close: Optional[float] = None
+        self.last_volume: Optional[float] = None
+        self.bars_processed = 0
+
+    def update(self, timestamp: datetime, close: float, volume: float = 0.0) -> bool:
+        """봉 하나 반영 (이미 반영한 시각이거나 종가/거래량이 NaN·무한대면 False)"""
+        if self.last_timestamp is not None and timestamp <= self.last_timestamp:
+            return False
+        # 결측 봉 하나가 EMA/RSI 등 누적 상태를 영구히 NaN으로 만들지 않도록 건너뜀
+        if not (math.isfinite(close) and math.isfinite(volume)):
+            return False
+
+        self.ema_12.update(close)
+        self.ema_26.update(close)
+        self.rsi.update(close)
+        self.macd.update(close)
+        self.bollinger.update(close)
+        self.volume.update(volume)
+
+        self.last_timestamp = timestamp
+        self.last_close = close
+        self.last_volume = volume
+        self.bars_processed += 1
+        return True
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 지표 값"""
+        volume_avg = self.volume.mean
+        return {
+            'symbol': self.symbol,
+            'timestamp': self.last_timestamp.isoformat() if self.last_timestamp else None,
+            'close': self.last_close,
+            'ema_12': self.ema_12.value,
+            'ema_26': self.ema_26.value,
+            'rsi': self.rsi.value,
+            **self.macd.value,
+            **self.bollinger.value,
+            'volume_avg': volume_avg,
+            'volume_ratio': self.last_volume / volume_avg if volume_avg else None,
+            'bars_processed': self.bars_processed
+        }
+
+    def get_state(self) -> Dict[str, Any]:
+        return {
+            'symbol': self.symbol,
+            'ema_12': self.ema_12.get_state(),
+            'ema_26': self.ema_26.get_state(),
+            'rsi': self.rsi.get_state(),
+            'macd': self.macd.get_state(),
+            'bollinger': self.bollinger.get_state(),
+            'volume': self.volume.get_state(),
+            'last_timestamp': self.last_timestamp.isoformat() if self.last_timestamp else None,
+            'last_close': self.last_close,
+            'last_volume': self.last_volume,
+            'bars_processed': self.bars_processed
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "StreamingIndicatorSet":
+        indicator_set = cls(state['symbol'], state['volume']['window'])
+        indicator_set.ema_12 = StreamingEMA.from_state(state['ema_12'])
+        indicator_set.ema_26 = StreamingEMA.from_state(state['ema_26'])
+        indicator_set.rsi = StreamingRSI.from_state(state['rsi'])
+        indicator_set.macd = StreamingMACD.from_state(state['macd'])
+        indicator_set.bollinger = StreamingBollinger.from_state(state['bollinger'])
+        indicator_set.volume = RollingWindow.from_state(state['volume'])
+        if state.get('last_timestamp'):
+            indicator_set.last_timestamp = datetime.fromisoformat(state['last_timestamp'])
+        indicator_set.last_close = state.get('last_close')
+        indicator_set.last_volume = state.get('last_volume')
+        indicator_set.bars_processed = state.get('bars_processed', 0)
+        return indicator_set
+
+
+class StreamingIndicatorBank:
+    """여러 심볼의 스트리밍 지표 관리 및 체크포인트 저장/복원"""
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        self.indicators: Dict[str, StreamingIndicatorSet] = {}
+
+    def get(self, symbol: str) -> StreamingIndicatorSet:
+        if symbol not in self.indicators:
+            self.indicators[symbol] = StreamingIndicatorSet(symbol)
+        return self.indicators[symbol]
+
+    def update_bar(self, symbol: str, timestamp: datetime, close: float, volume: float = 0.0) -> bool:
+        return self.get(symbol).update(_naive(timestamp), close, volume)
+
+    def update_from_intraday(self, points: Iterable) -> int:
+        """AlphaVantageCollector.get_intraday_data 결과(IntradayData 목록) 반영"""
+        applied = 0
+        # 수집기는 최신순으로 돌려주므로 시간순으로 다시 정렬
+        for point in sorted(points, key=lambda p: p.timestamp):
+            if self.update_bar(point.symbol, point.timestamp, point.close_price, point.volume):
+                applied += 1
+        return applied
+
+    def update_from_frame(self, symbol: str, data: pd.DataFrame, include_last: bool = False) -> int:
+        """OHLCV DataFrame에서 아직 반영하지 않은 봉만 반영
+
+        마지막 봉은 아직 진행 중일 수 있으므로 기본적으로 제외하고,
+        종가/거래량이 결측(NaN)인 봉은 반영하지 않음
+        """
+        if data is None or data.empty:
+            return 0
+
+        frame = data if include_last else data.iloc[:-1]
+        indicator_set = self.get(symbol)
+        if indicator_set.last_timestamp is not None:
+            index = frame.index.tz_localize(None) if frame.index.tz is not None else frame.index
+            frame = frame[index > indicator_set.last_timestamp]
+
+        applied = 0
+        for timestamp, close, volume in zip(frame.index, frame['Close'], frame['Volume']):
+            if indicator_set.update(_naive(timestamp), float(close), float(volume)):
+                applied += 1
+        return applied
+
+    def snapshot(self, symbols: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        targets = symbols if symbols is not None else list(self.indicators.keys())
+        return {symbol: self.indicators[symbol].snapshot() for symbol in targets if symbol in self.indicators}
+
+    def save(self, path: str):
+        """체크포인트 저장 (임시 파일에 쓴 뒤 교체)"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        state = {
+            'saved_at': datetime.now().isoformat(),
+            'indicators': {symbol: s.get_state() for symbol, s in self.indicators.items()}
+        }
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "StreamingIndicatorBank":
+        """체크포인트 복원 (파일이 없거나 손상되면 빈 상태)"""
+        bank = cls()
+        try:
+            with open(path, 'r') as f:
+                state = json.load(f)
+            for symbol, indicator_state in state.get('indicators', {}).items():
+                bank.indicators[symbol] = StreamingIndicatorSet.from_state(indicator_state)
+        except FileNotFoundError:
+            pass
+        except (json.JSONDecodeError, KeyError) as e:
+            bank.logger.warning(f"스트리밍 지표 체크포인트 복원 실패: {e}")
+        return bank
+
+
+def _naive(timestamp) -> datetime:
+    """시간대 정보를 제거한 datetime (체크포인트 비교용)"""
+    if isinstance(timestamp, pd.Timestamp):
+        timestamp = timestamp.tz_localize(None) if timestamp.tzinfo else timestamp
+        return timestamp.to_pydatetime()
+    return timestamp.replace(tzinfo=None) if timestamp.tzinfo else timestamp
@@ -10,6 +10,11 @@ from enum import Enum
 import logging
 import yfinance as yf
 from datetime import datetime, timedelta
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_monitoring.history_cache import HistoryCache, get_history_cache
+from data_monitoring.indicators import compute_indicators
 
 class TechnicalSignal(Enum):
     STRONG_BUY = "strong_buy"
@@ -56,15 +61,15 @@ class TechnicalIndicators:
 class TechnicalAnalyzer:
     """기술적 분석 지표 계산 클래스"""
     
-    def __init__(self):
+    def __init__(self, history_cache: Optional[HistoryCache] = None):
         self.logger = logging.getLogger(__name__)
+        self.history_cache = history_cache or get_history_cache()
     
     def analyze_symbol(self, symbol: str, period: str = "6mo") -> Optional[TechnicalIndicators]:
         """심볼에 대한 기술적 분석 수행"""
         try:
-            # 데이터 수집
-            ticker = yf.Ticker(symbol)
-            hist = ticker.history(period=period)
+            # 데이터 수집 (공유 히스토리 캐시)
+            hist = self.history_cache.get_history(symbol, period=period)
             
             if hist.empty or len(hist) < 50:
                 self.logger.warning(f"Insufficient data for {symbol}")
@@ -72,117 +77,112 @@ class TechnicalAnalyzer:
             
             # 각 지표 계산
             indicators = self._calculate_all_indicators(hist)
-            
-            # 종합 신호 계산
-            overall_signal, signal_strength = self._calculate_overall_signal(indicators)
-            
-            return TechnicalIndicators(
-                symbol=symbol,
-                timestamp=datetime.now(),
-                **indicators,
-                overall_signal=overall_signal,
-                signal_strength=signal_strength
-            )
+            return self._build_result(symbol, indicators)
             
         except Exception as e:
             self.logger.error(f"Error analyzing {symbol}: {str(e)}")
             return None
     
-    def _calculate_all_indicators(self, data: pd.DataFrame) -> Dict:
-        """모든 기술적 지표 계산"""
-        close = data['Close']
-        high = data['High']
-        low = data['Low']
-        volume = data['Volume']
-        
-        indicators = {}
-        
-        # 이동평균
-        indicators['sma_20'] = close.rolling(window=20).mean().iloc[-1]
-        indicators['sma_50'] = close.rolling(window=50).mean().iloc[-1]
-        indicators['ema_12'] = close.ewm(span=12).mean().iloc[-1]
-        indicators['ema_26'] = close.ewm(span=26).mean().iloc[-1]
-        
-        # RSI 계산
-        indicators['rsi'] = self._calculate_rsi(close)
-        
-        # MACD 계산
-        macd_data = self._calculate_macd(close)
-        indicators.update(macd_data)
-        
-        # 볼린저 밴드 계산
-        bollinger_data = self._calculate_bollinger_bands(close)
-        indicators.update(bollinger_data)
-        
-        # 거래량 지표
-        indicators['volume_sma'] = volume.rolling(window=20).mean().iloc[-1]
-        indicators['volume_ratio'] = volume.iloc[-1] / indicators['volume_sma'] if indicators['volume_sma'] > 0 else 1.0
-        
-        # 지지/저항 레벨
-        support_resistance = self._calculate_support_resistance(high, low, close)
-        indicators.update(support_resistance)
-        
-        return indicators
-    
-    def _calculate_rsi(self, close: pd.Series, period: int = 14) -> float:
-        """RSI 계산"""
-        delta = close.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-        
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
-        
-        return rsi.iloc[-1] if not pd.isna(rsi.iloc[-1]) else 50.0
+    def analyze_symbols(self, symbols: List[str], period: str = "6mo") -> Dict[str, TechnicalIndicators]:
+        """여러 심볼을 (시간 × 심볼) 행렬로 묶어 한 번에 기술적 분석"""
+        histories = {}
+        for symbol in symbols:
+            try:
+                hist = self.history_cache.get_history(symbol, period=period)
+            except Exception as e:
+                self.logger.error(f"Error collecting data for {symbol}: {str(e)}")
+                continue
+            
+            if hist.empty or len(hist) < 50:
+                self.logger.warning(f"Insufficient data for {symbol}")
+                continue
+            histories[symbol] = hist
+        
+        if not histories:
+            return {}
+        
+        results = {}
+        for symbol, indicators in self._calculate_batch_indicators(histories).items():
+            try:
+                results[symbol] = self._build_result(symbol, indicators)
+            except Exception as e:
+                self.logger.error(f"Error analyzing {symbol}: {str(e)}")
+        return results
     
-    def _calculate_macd(self, close: pd.Series) -> Dict:
-        """MACD 계산"""
-        ema_12 = close.ewm(span=12).mean()
-        ema_26 = close.ewm(span=26).mean()
-        
-        macd = ema_12 - ema_26
-        macd_signal = macd.ewm(span=9).mean()
-        macd_histogram = macd - macd_signal
-        
-        return {
-            'macd': macd.iloc[-1] if not pd.isna(macd.iloc[-1]) else 0.0,
-            'macd_signal': macd_signal.iloc[-1] if not pd.isna(macd_signal.iloc[-1]) else 0.0,
-            'macd_histogram': macd_histogram.iloc[-1] if not pd.isna(macd_histogram.iloc[-1]) else 0.0
-        }
+    def _build_result(self, symbol: str, indicators: Dict) -> TechnicalIndicators:
+        """지표 값과 종합 신호로 결과 객체 생성"""
+        overall_signal, signal_strength = self._calculate_overall_signal(indicators)
+        
+        return TechnicalIndicators(
+            symbol=symbol,
+            timestamp=datetime.now(),
+            **indicators,
+            overall_signal=overall_signal,
+            signal_strength=signal_strength
+        )
     
-    def _calculate_bollinger_bands(self, close: pd.Series, period: int = 20, std_dev: int = 2) -> Dict:
-        """볼린저 밴드 계산"""
-        sma = close.rolling(window=period).mean()
-        std = close.rolling(window=period).std()
-        
-        upper = sma + (std * std_dev)
-        lower = sma - (std * std_dev)
-        width = ((upper - lower) / sma) * 100
-        
-        return {
-            'bollinger_upper': upper.iloc[-1] if not pd.isna(upper.iloc[-1]) else close.iloc[-1] * 1.02,
-            'bollinger_middle': sma.iloc[-1] if not pd.isna(sma.iloc[-1]) else close.iloc[-1],
-            'bollinger_lower': lower.iloc[-1] if not pd.isna(lower.iloc[-1]) else close.iloc[-1] * 0.98,
-            'bollinger_width': width.iloc[-1] if not pd.isna(width.iloc[-1]) else 4.0
-        }
+    def _calculate_all_indicators(self, data: pd.DataFrame) -> Dict:
+        """모든 기술적 지표 계산"""
+        return self._calculate_batch_indicators({'_': data})['_']
     
-    def _calculate_support_resistance(self, high: pd.Series, low: pd.Series, close: pd.Series) -> Dict:
-        """지지/저항 레벨 계산"""
-        # 최근 20일간의 고점/저점 분석
-        recent_high = high.rolling(window=20).max().iloc[-1]
-        recent_low = low.rolling(window=20).min().iloc[-1]
-        
-        # 피벗 포인트 계산
-        pivot = (recent_high + recent_low + close.iloc[-1]) / 3
-        
-        # 지지/저항 레벨 (단순화된 계산)
+    def _calculate_batch_indicators(self, histories: Dict[str, pd.DataFrame]) -> Dict[str, Dict]:
+        """심볼별 OHLCV를 끝을 맞춘 행렬로 쌓아 모든 지표를 한 번에 계산"""
+        symbols = list(histories.keys())
+        length = max(len(hist) for hist in histories.values())
+        
+        def stack(column: str) -> np.ndarray:
+            # 거래소마다 달력이 다르므로 날짜 대신 봉 순서 기준으로 오른쪽 정렬
+            matrix = np.full((length, len(symbols)), np.nan)
+            for j, symbol in enumerate(symbols):
+                values = histories[symbol][column].to_numpy(dtype=float)
+                matrix[length - len(values):, j] = values
+            return matrix
+        
+        close = stack('Close')
+        volume = stack('Volume')
+        values = compute_indicators(close, volume, last_only=True)
+        
+        # 지지/저항 레벨 (최근 20일 고점/저점 기반 피벗)
+        recent_high = np.max(stack('High')[-20:], axis=0)
+        recent_low = np.min(stack('Low')[-20:], axis=0)
+        last_close = close[-1]
+        pivot = (recent_high + recent_low + last_close) / 3
         resistance = pivot + (recent_high - recent_low) * 0.618  # 피보나치 비율 적용
         support = pivot - (recent_high - recent_low) * 0.618
         
-        return {
-            'support_level': max(support, recent_low),
-            'resistance_level': min(resistance, recent_high)
-        }
+        def value_or(name: str, j: int, default: float) -> float:
+            value = values[name][j]
+            return default if np.isnan(value) else float(value)
+        
+        results = {}
+        for j, symbol in enumerate(symbols):
+            price = float(last_close[j])
+            volume_sma = float(values['volume_sma'][j])
+            results[symbol] = {
+                # 추세 지표
+                'sma_20': float(values['sma_20'][j]),
+                'sma_50': float(values['sma_50'][j]),
+                'ema_12': float(values['ema_12'][j]),
+                'ema_26': float(values['ema_26'][j]),
+                # 모멘텀 지표
+                'rsi': value_or('rsi', j, 50.0),
+                'macd': value_or('macd', j, 0.0),
+                'macd_signal': value_or('macd_signal', j, 0.0),
+                'macd_histogram': value_or('macd_histogram', j, 0.0),
+                # 변동성 지표
+                'bollinger_upper': value_or('bollinger_upper', j, price * 1.02),
+                'bollinger_middle': value_or('bollinger_middle', j, price),
+                'bollinger_lower': value_or('bollinger_lower', j, price * 0.98),
+                'bollinger_width': value_or('bollinger_width', j, 4.0),
+                # 거래량 지표
+                'volume_sma': volume_sma,
+                'volume_ratio': float(volume[-1, j] / volume_sma) if volume_sma > 0 else 1.0,
+                # 지지/저항 레벨
+                'support_level': float(max(support[j], recent_low[j])),
+                'resistance_level': float(min(resistance[j], recent_high[j]))
+            }
+        
+        return results
     
     def _calculate_overall_signal(self, indicators: Dict) -> Tuple[TechnicalSignal, float]:
         """종합 매매 신호 계산"""
@@ -12,6 +12,10 @@ from typing import Dict, List, Any, Optional
 import os
 import time
 import json
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_monitoring.sentiment_service import get_sentiment_service
 
 class TwitterAPICollector:
     """Twitter API v2를 사용한 데이터 수집기"""
@@ -140,21 +144,8 @@ class TwitterAPICollector:
         return result
     
     def _analyze_tweet_sentiment(self, text: str) -> Dict[str, Any]:
-        """트윗 감정 분석"""
-        try:
-            from textblob import TextBlob
-            
-            blob = TextBlob(text)
-            sentiment = blob.sentiment
-            
-            return {
-                'polarity': sentiment.polarity,      # -1 (부정) ~ 1 (긍정)
-                'subjectivity': sentiment.subjectivity,  # 0 (객관적) ~ 1 (주관적)
-                'label': 'positive' if sentiment.polarity > 0.1 else 'negative' if sentiment.polarity < -0.1 else 'neutral'
-            }
-        except Exception as e:
-            self.logger.warning(f"감정 분석 오류: {e}")
-            return {'polarity': 0, 'subjectivity': 0, 'label': 'neutral'}
+        """트윗 감정 분석 (배치 감정 분석 서비스 사용)"""
+        return get_sentiment_service().score(text).to_dict(digits=None)
     
     def _generate_twitter_summary(self, tweets: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Twitter 데이터 요약 생성"""
@@ -25,6 +25,8 @@ load_dotenv()
 # 경로 설정
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from data_monitoring.event_store import EventStore, get_event_store
+
 class EventSeverity(Enum):
     """이벤트 심각도"""
     LOW = "low"
@@ -490,11 +492,12 @@ class SlackNotifier:
 class EventMonitoringSystem:
     """통합 이벤트 모니터링 시스템"""
     
-    def __init__(self):
+    def __init__(self, event_store: Optional[EventStore] = None):
         """초기화"""
         self.logger = logging.getLogger(__name__)
         self.detector = EventDetector()
         self.notifier = SlackNotifier()
+        self.event_store = event_store or get_event_store()
         
         self.logger.info("✅ 통합 이벤트 모니터링 시스템 초기화 완료")
     
@@ -532,6 +535,12 @@ class EventMonitoringSystem:
                     'timestamp': event.timestamp.isoformat()
                 })
             
+            # 대시보드 조회용 이벤트 저장소에 기록
+            try:
+                self.event_store.add_events(events, source='event_detection_slack_system')
+            except Exception as e:
+                self.logger.warning(f"⚠️ 이벤트 저장소 기록 실패: {e}")
+            
             # Slack 알림 전송
             if events:
                 # 개별 중요 이벤트 알림
@@ -11,6 +11,7 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import asyncio
 import json
+import math
 import os
 import sys
 from datetime import datetime, timedelta
@@ -27,6 +28,8 @@ load_dotenv()
 # 프로젝트 루트 경로 추가
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from data_monitoring.event_store import get_event_store
+
 # 페이지 설정
 st.set_page_config(
     page_title="🤖 경제 뉴스 통합 시스템",
@@ -328,11 +331,21 @@ def render_events_section():
     """이벤트 섹션 렌더링"""
     st.markdown("## 🚨 실시간 이벤트 감지")
     
-    # 실제 이벤트 데이터 가져오기
-    events = st.session_state.monitoring_data.get('events', [])
-    total_events = len(events)
-    critical_events = sum(1 for e in events if e.get('severity', 0) > 0.7)
-    processed_events = sum(1 for e in events if e.get('processed', False))
+    # 이벤트 저장소에서 최근 24시간 이벤트 조회 (인덱스 조회라 이력이 쌓여도 로딩 시간 일정)
+    try:
+        store = get_event_store()
+        since = datetime.now() - timedelta(hours=24)
+        events = store.recent(10)  # 최신순
+        total_events = store.count(start=since)
+        critical_events = store.count(start=since, min_severity=math.nextafter(0.7, 1.0))  # 기존 기준(> 0.7)과 동일
+        processed_events = store.count(start=since, processed=True)
+    except Exception as e:
+        print(f"이벤트 저장소 조회 오류: {e}")
+        # 저장소를 쓸 수 없으면 세션에 남은 최근 이벤트 사용
+        events = list(reversed(st.session_state.monitoring_data.get('events', [])))
+        total_events = len(events)
+        critical_events = sum(1 for e in events if e.get('severity', 0) > 0.7)
+        processed_events = sum(1 for e in events if e.get('processed', False))
     
     # 이벤트 감지 상태
     col1, col2, col3 = st.columns(3)
@@ -349,7 +362,7 @@ def render_events_section():
     if events:
         # 실제 이벤트 데이터를 DataFrame으로 변환
         events_data = []
-        for event in events[-10:]:  # 최근 10개만 표시
+        for event in events[:10]:  # 최근 10개만 표시
             severity_emoji = {
                 'low': '🟢',
                 'medium': '🟡', 
@@ -371,7 +384,7 @@ def render_events_section():
         
         # 최신 이벤트 상세 정보
         if st.button("🔍 최신 이벤트 상세 보기"):
-            latest_event = events[-1]
+            latest_event = events[0]
             with st.expander(f"{latest_event.get('symbol', 'N/A')} {latest_event.get('description', '')}", expanded=True):
                 col1, col2 = st.columns(2)
                 with col1:
@@ -763,12 +776,19 @@ def monitoring_worker():
                                     'volume_ratio': round(volume_ratio, 2),
                                     'timestamp': datetime.now().isoformat()
                                 }
+                                event['event_id'] = f"{symbol}_{event_type}_{event['timestamp']}"
                                 detected_events.append(event)
                     
                     except Exception as e:
                         print(f"심볼 {symbol} 처리 오류: {e}")
                         continue
                 
+                # 이벤트 저장소에 기록
+                try:
+                    get_event_store().add_events(detected_events, source='integrated_dashboard')
+                except Exception as e:
+                    print(f"이벤트 저장소 기록 오류: {e}")
+                
                 # 감지된 이벤트 처리
                 for event in detected_events:
                     if event.get('severity', 0) > 0.6:  # 임계값 이상인 경우
@@ -914,6 +934,13 @@ def generate_article_from_event(event: Dict[str, Any]):
         # 세션 상태에 추가
         st.session_state.articles_list.insert(0, article)
         
+        # 원본 이벤트를 처리 완료로 표시
+        if event.get('event_id'):
+            try:
+                get_event_store().mark_processed(event['event_id'])
+            except Exception as e:
+                print(f"이벤트 처리 완료 표시 오류: {e}")
+        
         # Slack 알림 전송
         send_article_notification(article)
         
@@ -47,10 +47,11 @@ except ImportError as e:
 class StreamlitProgressTracker:
     """Streamlit용 진행률 추적기"""
     
-    def __init__(self, progress_bar, status_text, log_container):
+    def __init__(self, progress_bar, status_text, log_container, preview_container=None):
         self.progress_bar = progress_bar
         self.status_text = status_text
         self.log_container = log_container
+        self.preview_container = preview_container
         self.logs = []
         self.start_time = time.time()
         self.current_step = 0
@@ -91,6 +92,27 @@ class StreamlitProgressTracker:
         except:
             pass
 
+    def update_article_preview(self, sections: dict, done: bool = False):
+        """스트리밍 중인 기사 섹션 미리보기 갱신"""
+        if self.preview_container is None:
+            return
+        
+        parts = []
+        if sections.get('title'):
+            parts.append(f"### {sections['title']}")
+        for key in ('lead', 'body'):
+            if sections.get(key):
+                parts.append(sections[key])
+        if sections.get('conclusion'):
+            parts.append(f"**결론:** {sections['conclusion']}")
+        if not done:
+            parts.append("_✍️ 작성 중..._")
+        
+        try:
+            self.preview_container.markdown("\n\n".join(parts))
+        except:
+            pass
+
 def collect_event_data_with_progress(tracker):
     """이벤트 데이터 수집"""
     tracker.update_step("이벤트 감지", "경제 이벤트 스캔 중...")
@@ -253,48 +275,51 @@ def create_market_trend_chart(events):
 def create_real_stock_chart(symbols):
     """실제 주식 데이터를 사용한 차트 생성"""
     try:
-        import yfinance as yf
-        from datetime import datetime, timedelta
+        import plotly.io as pio
+        from data_monitoring.history_cache import get_history_cache
+        from utils.chart_cache import get_chart_cache, fingerprint
         
         if not symbols:
             return None
             
-        # 최근 5일간의 데이터 가져오기
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=5)
-        
+        # 최근 5일간의 데이터 가져오기 (공유 히스토리 캐시)
         stock_data = {}
         for symbol in symbols[:5]:  # 최대 5개 종목
             try:
-                ticker = yf.Ticker(symbol)
-                hist = ticker.history(start=start_date, end=end_date)
+                hist = get_history_cache().get_history(symbol, period="5d")
                 if not hist.empty:
-                    stock_data[symbol] = hist['Close'].tolist()
+                    stock_data[symbol] = hist['Close']
             except:
                 continue
         
         if stock_data:
-            fig = go.Figure()
-            
-            for symbol, prices in stock_data.items():
-                dates = [start_date + timedelta(days=i) for i in range(len(prices))]
-                fig.add_trace(go.Scatter(
-                    x=dates,
-                    y=prices,
-                    mode='lines+markers',
-                    name=symbol,
-                    line=dict(width=2)
-                ))
+            def render(chart_path):
+                fig = go.Figure()
+                
+                for symbol, prices in stock_data.items():
+                    fig.add_trace(go.Scatter(
+                        x=prices.index,
+                        y=prices.tolist(),
+                        mode='lines+markers',
+                        name=symbol,
+                        line=dict(width=2)
+                    ))
+                
+                fig.update_layout(
+                    title="주요 종목 최근 5일 가격 추이",
+                    xaxis_title="날짜",
+                    yaxis_title="주가 ($)",
+                    height=400,
+                    showlegend=True
+                )
+                fig.write_json(chart_path)
             
-            fig.update_layout(
-                title="주요 종목 최근 5일 가격 추이",
-                xaxis_title="날짜",
-                yaxis_title="주가 ($)",
-                height=400,
-                showlegend=True
+            # 같은 종목/데이터로 이미 만든 차트는 저장된 JSON에서 바로 복원
+            chart_path = get_chart_cache().get_or_render(
+                'recent_prices', '_'.join(stock_data), fingerprint(*stock_data.values()),
+                render, 'output/charts', ext='json'
             )
-            
-            return fig
+            return pio.read_json(chart_path) if chart_path else None
         
         return None
         
@@ -822,8 +847,10 @@ def generate_article_with_agents(events, tracker):
         context = StrandContext(
             strand_id=f"streamlit_article_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
             input_data={
+                "event": events[0] if events else None,  # 에이전트는 대표 이벤트 하나를 기준으로 작성
                 "events": events,
-                "request_type": "comprehensive_article"
+                "request_type": "comprehensive_article",
+                "article_stream_callback": tracker.update_article_preview
             }
         )
         
@@ -835,7 +862,6 @@ def generate_article_with_agents(events, tracker):
             analysis_result = orchestrator.execute_data_analysis(context)
             if analysis_result:
                 tracker.add_log("✅ 데이터 분석 완료", "SUCCESS")
-                context.add_data("analysis", analysis_result)
             else:
                 tracker.add_log("⚠️ 데이터 분석 결과가 비어있음", "WARNING")
         except Exception as analysis_error:
@@ -853,7 +879,6 @@ def generate_article_with_agents(events, tracker):
             article_result = orchestrator.execute_article_writing(context)
             if article_result:
                 tracker.add_log("✅ 기사 작성 완료", "SUCCESS")
-                context.add_data("article", article_result)
             else:
                 tracker.add_log("❌ 기사 작성 결과가 비어있음", "ERROR")
                 tracker.add_log("🔄 대체 시스템으로 전환합니다", "INFO")
@@ -872,7 +897,6 @@ def generate_article_with_agents(events, tracker):
         image_result = orchestrator.execute_image_generation(context)
         if image_result:
             tracker.add_log("✅ 이미지 생성 완료", "SUCCESS")
-            context.add_data("images", image_result)
         else:
             tracker.add_log("⚠️ 이미지 생성 부분 실패", "WARNING")
         
@@ -885,7 +909,6 @@ def generate_article_with_agents(events, tracker):
         review_result = orchestrator.execute_review(context)
         if review_result:
             tracker.add_log("✅ 기사 검수 완료", "SUCCESS")
-            context.add_data("review", review_result)
         else:
             tracker.add_log("⚠️ 검수 부분 실패", "WARNING")
         
@@ -898,7 +921,6 @@ def generate_article_with_agents(events, tracker):
         ad_result = orchestrator.execute_ad_recommendation(context)
         if ad_result:
             tracker.add_log("✅ 광고 추천 완료", "SUCCESS")
-            context.add_data("ads", ad_result)
         else:
             tracker.add_log("⚠️ 광고 추천 부분 실패", "WARNING")
         
@@ -1505,8 +1527,12 @@ def show_ai_article_generator():
         st.markdown("#### 📝 실시간 로그")
         log_container = st.empty()
         
+        # 기사 미리보기 (스트리밍으로 작성되는 내용 표시)
+        st.markdown("#### 📰 기사 미리보기")
+        preview_container = st.empty()
+        
         # 진행률 추적기 초기화
-        tracker = StreamlitProgressTracker(progress_bar, status_text, log_container)
+        tracker = StreamlitProgressTracker(progress_bar, status_text, log_container, preview_container)
         
         try:
             # 1. 이벤트 감지
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+고도화 이벤트 탐지 동시 실행 테스트 (가짜 수집기/분석기 사용, 네트워크 없음)
+"""
+
+import sys
+import os
+import time
+import asyncio
+import tempfile
+import threading
+import feedparser
+from datetime import datetime
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from data_monitoring.advanced_event_detector_part2 import AdvancedEventDetectorExtended
+from data_monitoring.data_collector import MarketData
+from data_monitoring.event_store import EventStore
+from data_monitoring.sentiment_analysis import SentimentAnalyzer, NewsSnapshot
+
+SYMBOLS = ["AAPL", "MSFT", "TSLA", "NVDA", "AAPL"]
+DELAY = 0.2
+
+
+class SlowCollector:
+    """시세 다운로드 지연을 흉내 내고 동시 실행 수를 기록"""
+
+    def __init__(self, fail_symbol=None):
+        self.fail_symbol = fail_symbol
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def collect_yahoo_finance_data(self, symbol, period="1d"):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(DELAY)
+            if symbol == self.fail_symbol:
+                raise RuntimeError("download failed")
+            return MarketData(symbol=symbol, name=symbol, timestamp=datetime.now(),
+                              current_price=100.0, previous_close=100.0, change_percent=0.0,
+                              volume=1000, high_24h=101.0, low_24h=99.0)
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+class SlowTechnicalAnalyzer:
+    def __init__(self):
+        self.calls = []
+
+    def analyze_symbol(self, symbol, period="6mo"):
+        self.calls.append(symbol)
+        time.sleep(DELAY)
+        return None
+
+
+class FakeCorrelationAnalyzer:
+    def detect_correlation_breaks(self, symbols):
+        return []
+
+    def analyze_sector_correlations(self):
+        return {}
+
+
+class CountingSentimentAnalyzer(SentimentAnalyzer):
+    """피드를 한 번만 수집하는지 확인하는 감정 분석기"""
+
+    def __init__(self):
+        super().__init__()
+        self.snapshot_fetches = 0
+        self.feed_fetches = 0
+
+    async def fetch_news_snapshot(self):
+        self.snapshot_fetches += 1
+        entries = [
+            feedparser.FeedParserDict(title="Apple iPhone sales surge", summary="record profit", link="a"),
+            feedparser.FeedParserDict(title="Tesla shares drop", summary="weak demand concern", link="b"),
+        ]
+        return NewsSnapshot(feeds=[("fake://feed", "Fake Feed", entries)], fear_greed_index=50.0)
+
+    async def _search_pooled_news(self, symbol):
+        self.feed_fetches += 1
+        return []
+
+
+def make_detector(max_workers, store, collector=None):
+    detector = AdvancedEventDetectorExtended(event_store=store, max_workers=max_workers)
+    detector.data_collector = collector or SlowCollector()
+    detector.technical_analyzer = SlowTechnicalAnalyzer()
+    detector.correlation_analyzer = FakeCorrelationAnalyzer()
+    detector.sentiment_analyzer = CountingSentimentAnalyzer()
+    return detector
+
+
+def run_timed(detector):
+    started = time.perf_counter()
+    asyncio.run(detector.detect_advanced_events(SYMBOLS))
+    return time.perf_counter() - started
+
+
+def test_wall_time_scales_with_workers():
+    """워커 수를 늘리면 심볼 분석 시간이 줄어듦"""
+    with tempfile.TemporaryDirectory() as tmp:
+        store = EventStore(os.path.join(tmp, "events.sqlite"))
+        sequential = make_detector(1, store)
+        parallel = make_detector(4, store)
+
+        sequential_time = run_timed(sequential)
+        parallel_time = run_timed(parallel)
+
+    # 중복 심볼은 한 번만 분석
+    assert sorted(parallel.technical_analyzer.calls) == ["AAPL", "MSFT", "NVDA", "TSLA"]
+    assert sequential.data_collector.max_active == 1
+    assert parallel.data_collector.max_active == 4
+    # 순차: 4심볼 x (시세 + 기술적 분석) = 1.6초, 병렬: 약 0.4초
+    assert sequential_time > 1.5, sequential_time
+    assert parallel_time < sequential_time / 2, (sequential_time, parallel_time)
+    print("✅ 워커 수 대비 실행 시간 테스트 통과")
+
+
+def test_news_fetched_once_and_failures_isolated():
+    """뉴스는 주기당 한 번만 수집하고, 실패한 심볼만 제외"""
+    with tempfile.TemporaryDirectory() as tmp:
+        store = EventStore(os.path.join(tmp, "events.sqlite"))
+        detector = make_detector(4, store, SlowCollector(fail_symbol="MSFT"))
+        asyncio.run(detector.detect_advanced_events(SYMBOLS))
+
+    assert detector.sentiment_analyzer.snapshot_fetches == 1
+    assert detector.sentiment_analyzer.feed_fetches == 0
+    assert sorted(detector.technical_analyzer.calls) == ["AAPL", "NVDA", "TSLA"]
+    print("✅ 뉴스 1회 수집/실패 격리 테스트 통과")
+
+
+def test_snapshot_filters_relevant_news():
+    """공유 스냅샷에서 심볼별 관련 뉴스만 메모리에서 골라냄"""
+    analyzer = CountingSentimentAnalyzer()
+    snapshot = asyncio.run(analyzer.fetch_news_snapshot())
+    news = asyncio.run(analyzer._collect_news_data("TSLA", snapshot))
+    assert [item.title for item in news] == ["Tesla shares drop"]
+    assert news[0].source == "Fake Feed"
+    assert analyzer.feed_fetches == 0
+    print("✅ 스냅샷 관련 뉴스 필터링 테스트 통과")
+
+
+def main():
+    print("🧪 고도화 이벤트 탐지 동시 실행 테스트 시작...")
+    test_wall_time_scales_with_workers()
+    test_news_fetched_once_and_failures_isolated()
+    test_snapshot_filters_relevant_news()
+    print("🎉 모든 테스트 통과!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Alpha Vantage 응답 캐시 테스트 (함수별 TTL, stale-while-revalidate, 실패 시 대체, 오프라인 모드)
+"""
+
+import sys
+import os
+import tempfile
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from data_monitoring.alphavantage_cache import (
+    AlphaVantageResponseCache, make_request_key, set_alphavantage_cache, DAY
+)
+from data_monitoring.alphavantage_scheduler import AlphaVantageScheduler, set_alphavantage_scheduler
+from data_monitoring.alphavantage_collector import AlphaVantageCollector
+
+
+class FakeClock:
+    def __init__(self, now=1_700_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class FakeFetcher:
+    """호출 횟수와 갱신 여부를 기록하는 가짜 API 호출"""
+
+    def __init__(self, response=None, error=None):
+        self.response = response
+        self.error = error
+        self.calls = []
+
+    def __call__(self, revalidate):
+        self.calls.append(revalidate)
+        if self.error:
+            raise self.error
+        return self.response
+
+
+def make_cache(tmp, **kwargs):
+    return AlphaVantageResponseCache(db_path=os.path.join(tmp, 'av.sqlite'), **kwargs)
+
+
+def test_request_key():
+    """API 키와 파라미터 순서는 캐시 키에 영향을 주지 않음"""
+    a = {'function': 'RSI', 'symbol': 'AAPL', 'apikey': 'one'}
+    b = {'apikey': 'two', 'symbol': 'AAPL', 'function': 'RSI'}
+    assert make_request_key(a) == make_request_key(b)
+    assert make_request_key(a) != make_request_key({**a, 'symbol': 'MSFT'})
+    print("✅ 캐시 키 테스트 통과")
+
+
+def test_per_function_ttl():
+    """신선한 응답은 재사용하고, TTL은 함수마다 다름"""
+    clock = FakeClock()
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = make_cache(tmp, clock=clock, stale_factor=0)
+        gdp = {'function': 'REAL_GDP', 'interval': 'quarterly'}
+        intraday = {'function': 'TIME_SERIES_INTRADAY', 'symbol': 'AAPL'}
+        fetcher = FakeFetcher({'data': [1]})
+
+        assert cache.fetch(gdp, fetcher) == {'data': [1]}
+        assert cache.fetch(intraday, fetcher) == {'data': [1]}
+        assert len(fetcher.calls) == 2
+
+        clock.now += DAY
+        cache.fetch(gdp, fetcher)
+        assert len(fetcher.calls) == 2  # 경제 지표는 아직 신선
+        cache.fetch(intraday, fetcher)
+        assert len(fetcher.calls) == 3  # 장중 시세는 만료
+        assert cache.get_stats()['hits'] == 1
+    print("✅ 함수별 TTL 테스트 통과")
+
+
+def test_stale_while_revalidate():
+    """만료 직후에는 저장된 응답을 즉시 반환하고 백그라운드에서 한 번만 갱신"""
+    clock = FakeClock()
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = make_cache(tmp, clock=clock, stale_factor=4)
+        params = {'function': 'MARKET_STATUS'}
+        cache.put(params, {'markets': ['old']})
+
+        clock.now += cache.ttl_for('MARKET_STATUS') + 1
+        fetcher = FakeFetcher({'markets': ['new']})
+        assert cache.fetch(params, fetcher) == {'markets': ['old']}
+        cache.wait_for_revalidations(5)
+        assert fetcher.calls == [True]
+        assert cache.fetch(params, fetcher) == {'markets': ['new']}
+        assert cache.get_stats()['revalidations'] == 1
+
+        # 갱신 창을 넘으면 바로 가져옴
+        clock.now += cache.ttl_for('MARKET_STATUS') * 10
+        assert cache.fetch(params, FakeFetcher({'markets': ['newest']})) == {'markets': ['newest']}
+    print("✅ stale-while-revalidate 테스트 통과")
+
+
+def test_fallback_and_error_responses():
+    """요청 실패/한도 초과/한도 안내 응답이면 남은 캐시를 사용하고, 안내 응답은 저장하지 않음"""
+    clock = FakeClock()
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = make_cache(tmp, clock=clock, stale_factor=0)
+        params = {'function': 'INSIDER_TRANSACTIONS', 'symbol': 'IBM'}
+        note = {'Note': 'API call frequency exceeded'}
+
+        assert cache.fetch(params, FakeFetcher(note)) == note
+        assert cache.get_entry(params) is None
+
+        cache.put(params, {'data': ['cached']})
+        clock.now += 2 * DAY
+        assert cache.fetch(params, FakeFetcher(note)) == {'data': ['cached']}
+        assert cache.fetch(params, FakeFetcher(None)) == {'data': ['cached']}
+        assert cache.fetch(params, FakeFetcher(error=ConnectionError('down'))) == {'data': ['cached']}
+        assert cache.get_stats()['fallbacks'] == 3
+
+        try:
+            cache.fetch({'function': 'OVERVIEW', 'symbol': 'IBM'}, FakeFetcher(error=ConnectionError('down')))
+            assert False, "캐시가 없으면 예외를 그대로 전달해야 함"
+        except ConnectionError:
+            pass
+    print("✅ 실패 대체 테스트 통과")
+
+
+def test_offline_mode():
+    """오프라인 모드는 나이와 관계없이 캐시만 사용하고 API를 호출하지 않음"""
+    clock = FakeClock()
+    with tempfile.TemporaryDirectory() as tmp:
+        make_cache(tmp, clock=clock).put({'function': 'CPI'}, {'data': [3.1]})
+        clock.now += 365 * DAY
+        offline = make_cache(tmp, clock=clock, offline=True)
+        fetcher = FakeFetcher({'data': ['network']})
+        assert offline.fetch({'function': 'CPI'}, fetcher) == {'data': [3.1]}
+        assert offline.fetch({'function': 'REAL_GDP'}, fetcher) is None
+        assert fetcher.calls == []
+    print("✅ 오프라인 모드 테스트 통과")
+
+
+class CachedCollector(AlphaVantageCollector):
+    def _load_api_key(self):
+        return 'cache-test-key'
+
+
+def test_collector_uses_cache():
+    """수집기는 캐시된 경제 지표를 API 호출 한도 소모 없이 사용"""
+    scheduler = AlphaVantageScheduler(calls_per_minute=5, calls_per_day=25)
+    set_alphavantage_scheduler('cache-test-key', scheduler)
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = make_cache(tmp, offline=True)
+        for name, interval, value in [("REAL_GDP", "quarterly", "5.4"), ("UNEMPLOYMENT", "monthly", "3.9"),
+                                      ("INFLATION", "monthly", "4.1")]:
+            params = {"function": name, "interval": interval, "apikey": "recorded-key", "datatype": "json"}
+            cache.put(params, {"data": [{"date": "2024-01-01", "value": value}]})
+        set_alphavantage_cache(cache)
+        try:
+            indicators = CachedCollector().get_economic_indicators()
+        finally:
+            set_alphavantage_cache(None)
+            set_alphavantage_scheduler('cache-test-key', None)
+
+    assert [(i.name, i.value) for i in indicators] == [("REAL_GDP", 5.4), ("UNEMPLOYMENT", 3.9), ("INFLATION", 4.1)]
+    assert scheduler.status().used_today == 0
+    print("✅ 수집기 캐시 연동 테스트 통과")
+
+
+def main():
+    print("🧪 Alpha Vantage 응답 캐시 테스트 시작...")
+    test_request_key()
+    test_per_function_ttl()
+    test_stale_while_revalidate()
+    test_fallback_and_error_responses()
+    test_offline_mode()
+    test_collector_uses_cache()
+    print("🎉 모든 테스트 통과!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Alpha Vantage 요청 스케줄러 테스트 (토큰 버킷, 일일 한도, 우선순위, 비동기 획득, 예산 기반 우선순위 수집)
+"""
+
+import sys
+import os
+import time
+import asyncio
+import tempfile
+import threading
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from data_monitoring.alphavantage_scheduler import (
+    AlphaVantageScheduler, get_alphavantage_scheduler, set_alphavantage_scheduler,
+    PRIORITY_CRITICAL, PRIORITY_LOW, PRIORITY_NORMAL
+)
+from data_monitoring.integrated_alphavantage_collector import IntegratedAlphaVantageCollector
+
+
+class FakeClock:
+    def __init__(self, now=1_700_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_rate():
+    """분당 5회 한도: 버스트 1이면 12초마다 1회"""
+    clock = FakeClock()
+    scheduler = AlphaVantageScheduler(calls_per_minute=5, calls_per_day=100, burst=1, clock=clock)
+    assert scheduler.acquire(timeout=0)
+    assert not scheduler.acquire(timeout=0)
+
+    clock.now += 11.9
+    assert not scheduler.acquire(timeout=0)
+    clock.now += 0.1
+    assert scheduler.acquire(timeout=0)
+
+    # 버스트만큼은 연속 호출 허용
+    clock.now += 3600
+    bursty = AlphaVantageScheduler(calls_per_minute=5, calls_per_day=100, burst=3, clock=clock)
+    assert [bursty.acquire(timeout=0) for _ in range(4)] == [True, True, True, False]
+    print("✅ 토큰 버킷 테스트 통과")
+
+
+def test_daily_quota():
+    """일일 한도를 넘으면 대기하지 않고 거절, 날짜가 바뀌면 초기화"""
+    clock = FakeClock()
+    scheduler = AlphaVantageScheduler(calls_per_minute=60, calls_per_day=3, burst=1, clock=clock)
+    for _ in range(3):
+        assert scheduler.acquire(timeout=0)
+        clock.now += 1
+
+    started = time.monotonic()
+    assert not scheduler.acquire()
+    assert time.monotonic() - started < 0.5
+    status = scheduler.status()
+    assert status.used_today == 3 and status.remaining_today == 0 and status.total_rejected == 1
+    assert scheduler.calls_available(3600) == 0
+
+    clock.now += 86400
+    assert scheduler.calls_available(60) == 3
+    assert scheduler.acquire(timeout=0)
+    print("✅ 일일 한도 테스트 통과")
+
+
+def test_priority_order():
+    """대기 중인 요청은 우선순위 순서로 토큰을 받음"""
+    scheduler = AlphaVantageScheduler(calls_per_minute=600, calls_per_day=100, burst=1)
+    assert scheduler.acquire()
+
+    order = []
+    threads = []
+    for priority, name in [(PRIORITY_LOW, 'low'), (PRIORITY_NORMAL, 'normal'), (PRIORITY_CRITICAL, 'critical')]:
+        thread = threading.Thread(target=lambda p=priority, n=name: scheduler.acquire(p) and order.append(n))
+        threads.append(thread)
+    # 토큰이 바닥난 상태에서 세 요청을 모두 대기열에 넣은 뒤 순서 확인
+    with scheduler._lock:
+        for thread in threads:
+            thread.start()
+        scheduler._state['tokens'] = -2.0
+    for thread in threads:
+        thread.join(timeout=5)
+    assert order == ['critical', 'normal', 'low'], order
+    print("✅ 우선순위 테스트 통과")
+
+
+def test_async_acquire():
+    """비동기 획득은 이벤트 루프를 막지 않음"""
+    scheduler = AlphaVantageScheduler(calls_per_minute=600, calls_per_day=100, burst=1)
+    ticks = []
+
+    async def ticker():
+        for _ in range(5):
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.02)
+
+    async def run():
+        results = await asyncio.gather(scheduler.acquire_async(), scheduler.acquire_async(), ticker())
+        return results[:2]
+
+    assert asyncio.run(run()) == [True, True]
+    assert len(ticks) == 5
+    assert scheduler.status().total_granted == 2
+    print("✅ 비동기 획득 테스트 통과")
+
+
+def test_cross_process_state():
+    """잠금 파일 상태를 공유하는 스케줄러끼리 한도를 함께 사용"""
+    clock = FakeClock()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'quota.json')
+        first = AlphaVantageScheduler(calls_per_minute=5, calls_per_day=2, burst=2, state_path=path, clock=clock)
+        second = AlphaVantageScheduler(calls_per_minute=5, calls_per_day=2, burst=2, state_path=path, clock=clock)
+        assert first.acquire(timeout=0)
+        assert second.status().used_today == 1
+        assert second.acquire(timeout=0)
+        assert not first.acquire(timeout=0)
+    print("✅ 프로세스 간 상태 공유 테스트 통과")
+
+
+class FakeCollector(IntegratedAlphaVantageCollector):
+    """네트워크 없이 호출만 기록하는 수집기"""
+
+    def _load_api_key(self):
+        return 'test-key'
+
+    def get_stock_data(self, symbol):
+        return self._record(symbol)
+
+    def get_forex_data(self, from_currency, to_currency):
+        return self._record(f"{from_currency}{to_currency}")
+
+    def get_crypto_data(self, symbol, market="USD"):
+        return self._record(symbol)
+
+    def _record(self, name):
+        if not self.scheduler.acquire(function="TIME_SERIES_INTRADAY"):
+            return None
+        self.calls.append(name)
+        return name
+
+
+def test_priority_collection_budget():
+    """우선순위 수집은 고정 개수 대신 남은 예산만큼 카테고리를 번갈아 수집"""
+    scheduler = AlphaVantageScheduler(calls_per_minute=6000, calls_per_day=20, burst=10)
+    set_alphavantage_scheduler('test-key', scheduler)
+    try:
+        collector = FakeCollector()
+        collector.calls = []
+        assert collector.scheduler is scheduler is get_alphavantage_scheduler('test-key')
+
+        results = collector.collect_priority_data(max_calls=6)
+        assert collector.calls == ['AAPL', 'SPY', 'USDKRW', 'BTC', 'MSFT', 'QQQ']
+        assert [len(results[k]) for k in ('stocks', 'indices', 'forex', 'crypto')] == [2, 2, 1, 1]
+
+        # 예산을 생략하면 남은 일일 한도(14회)까지 수집 (분당 한도는 수집 시간 창 안에서 충분)
+        collector.calls = []
+        results = collector.collect_priority_data()
+        assert len(collector.calls) == 14
+        assert collector.calls[:4] == ['AAPL', 'SPY', 'USDKRW', 'BTC']
+        assert scheduler.status().remaining_today == 0
+        assert collector.collect_priority_data() == {"stocks": [], "indices": [], "forex": [], "crypto": []}
+    finally:
+        set_alphavantage_scheduler('test-key', None)
+    print("✅ 예산 기반 우선순위 수집 테스트 통과")
+
+
+def main():
+    print("🧪 Alpha Vantage 요청 스케줄러 테스트 시작...")
+    test_token_bucket_rate()
+    test_daily_quota()
+    test_priority_order()
+    test_async_acquire()
+    test_cross_process_state()
+    test_priority_collection_budget()
+    print("🎉 모든 테스트 통과!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+스트리밍 기사 생성 테스트 (가짜 스트리밍 LLM 사용)
+"""
+
+import sys
+import os
+import asyncio
+import tempfile
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from agents.article_writer_strand import ArticleWriterStrand, ArticleStreamParser
+from agents.llm_pool import BedrockClientPool, set_llm_pool
+from agents.orchestrator_strand import OrchestratorStrand
+from agents.strands_framework import StrandContext, StrandStatus
+from agents import orchestrator_strand
+
+SAMPLE_RESPONSE = """TITLE: 애플 주가 5% 급등
+LEAD: 애플이 실적 발표 이후
+강한 상승세를 보였습니다.
+BODY: 첫 번째 문단입니다.
+
+두 번째 문단입니다.
+CONCLUSION: 지속적인 관찰이 필요합니다.
+IMAGE_PROMPT: apple stock chart rising"""
+
+
+class FakeChunk:
+    def __init__(self, content):
+        self.content = content
+
+
+class FakeStreamingLLM:
+    """응답을 몇 글자씩 나눠서 스트리밍하는 LLM"""
+
+    def __init__(self, text, size=7):
+        self.text = text
+        self.size = size
+
+    async def astream(self, messages):
+        for i in range(0, len(self.text), self.size):
+            await asyncio.sleep(0)
+            yield FakeChunk(self.text[i:i + self.size])
+
+
+class FakePool(BedrockClientPool):
+    def __init__(self, llm):
+        super().__init__(cache_enabled=False)
+        self.fake_llm = llm
+
+    def get_llm(self, model_id, model_kwargs=None):
+        return self.fake_llm
+
+
+def test_incremental_parse_matches_full_parse():
+    """조각 단위 파싱 결과가 전체 파싱 결과와 일치"""
+    writer = ArticleWriterStrand()
+    expected = asyncio.run(writer._parse_article_response(SAMPLE_RESPONSE))
+
+    for size in (1, 3, 16):
+        parser = ArticleStreamParser()
+        for i in range(0, len(SAMPLE_RESPONSE), size):
+            parser.feed(SAMPLE_RESPONSE[i:i + size])
+        parser.close()
+        for name in ('title', 'lead', 'body', 'conclusion', 'image_prompt'):
+            assert parser.sections[name] == expected[name], (size, name)
+
+    assert expected['lead'] == "애플이 실적 발표 이후 강한 상승세를 보였습니다."
+    print("✅ 점진 파싱 일치 테스트 통과")
+
+
+def test_partial_sections_are_streamed():
+    """스트리밍 중 부분 섹션이 순서대로 전달됨"""
+    set_llm_pool(FakePool(FakeStreamingLLM(SAMPLE_RESPONSE)))
+    try:
+        writer = ArticleWriterStrand()
+        writer.stream_update_interval = 0
+        updates = []
+
+        def on_partial(sections, done):
+            updates.append((dict(sections), done))
+
+        text = asyncio.run(writer._stream_article_text("system", "user", on_partial))
+    finally:
+        set_llm_pool(None)
+
+    assert text == SAMPLE_RESPONSE
+    assert updates[-1][1] is True
+    assert updates[-1][0]['conclusion'] == "지속적인 관찰이 필요합니다."
+    # 본문이 나오기 전에 제목이 먼저 전달되어야 함
+    first_title = next(i for i, (sections, _) in enumerate(updates) if sections['title'])
+    first_body = next(i for i, (sections, _) in enumerate(updates) if sections['body'])
+    assert first_title < first_body
+    assert not any(done for _, done in updates[:-1])
+    print("✅ 부분 섹션 스트리밍 테스트 통과")
+
+
+def test_orchestrator_step_streams_to_callback():
+    """Streamlit이 쓰는 단계별 실행 경로에서도 콜백이 섹션을 받음"""
+    set_llm_pool(FakePool(FakeStreamingLLM(SAMPLE_RESPONSE)))
+    try:
+        orchestrator = OrchestratorStrand()
+        orchestrator.article_writer.stream_update_interval = 0
+        updates = []
+        context = StrandContext(
+            strand_id="test_streaming_step",
+            input_data={
+                'event': {'symbol': 'AAPL', 'event_type': 'price_change', 'change_percent': 5.0},
+                'article_stream_callback': lambda sections, done: updates.append((dict(sections), done)),
+            }
+        )
+        article = orchestrator.execute_article_writing(context)
+    finally:
+        set_llm_pool(None)
+
+    assert article['title'] == "애플 주가 5% 급등"
+    assert context.results['article_writer'] is article
+    assert len(updates) > 1 and updates[-1][1] is True
+    assert updates[-1][0]['body'] == article['body']
+    print("✅ 오케스트레이터 단계 실행 스트리밍 테스트 통과")
+
+
+def test_live_html_only_with_callback():
+    """실시간 HTML은 콜백이 있을 때만 기록하고 최종 기사 저장 후 삭제"""
+    sections = {'title': "애플 주가 5% 급등", 'lead': "", 'body': "첫 번째 문단입니다.",
+                'conclusion': "", 'image_prompt': ""}
+    event = {'symbol': 'AAPL', 'event_type': 'price_change'}
+    seen = []
+
+    async def fake_execute_strand(strand_id, input_data, workflow):
+        callback = input_data.get('article_stream_callback')
+        live_existed = False
+        if callback:
+            await callback(sections, False)
+            live_existed = os.path.exists(os.path.join(orchestrator.output_dirs['articles'], "AAPL_live.html"))
+        seen.append((callback is not None, live_existed))
+        context = StrandContext(strand_id=strand_id, input_data=input_data, status=StrandStatus.COMPLETED)
+        context.results['article_writer'] = dict(sections)
+        return context
+
+    orchestrator = OrchestratorStrand()
+    original = orchestrator_strand.orchestrator.execute_strand
+    orchestrator_strand.orchestrator.execute_strand = fake_execute_strand
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            orchestrator.output_dirs = {'articles': tmp, 'streamlit': tmp}
+            previews = []
+            asyncio.run(orchestrator.process(StrandContext(strand_id="t1", input_data={'event': event})))
+            asyncio.run(orchestrator.process(StrandContext(strand_id="t2", input_data={
+                'event': event, 'article_stream_callback': lambda s, done: previews.append(done)})))
+            assert not os.path.exists(os.path.join(tmp, "AAPL_live.html"))
+    finally:
+        orchestrator_strand.orchestrator.execute_strand = original
+
+    assert seen == [(False, False), (True, True)]
+    assert previews == [False]
+    print("✅ 실시간 HTML 기록/정리 테스트 통과")
+
+
+def main():
+    print("🧪 스트리밍 기사 생성 테스트 시작...")
+    test_incremental_parse_matches_full_parse()
+    test_partial_sections_are_streamed()
+    test_orchestrator_step_streams_to_callback()
+    test_live_html_only_with_callback()
+    print("🎉 모든 테스트 통과!")
+
+
+if __name__ == "__main__":
+    main()
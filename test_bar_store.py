@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+로컬 OHLCV 봉 저장소 테스트 (네트워크 없이 다운로드 대체)
+"""
+
+import sys
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from data_monitoring.bar_store import BarStore
+
+
+def make_bars(end: str, periods: int, start_price: float = 100.0) -> pd.DataFrame:
+    index = pd.bdate_range(end=end, periods=periods, tz="America/New_York")
+    close = start_price + np.arange(len(index), dtype=float)
+    return pd.DataFrame({
+        'Open': close, 'High': close + 1, 'Low': close - 1,
+        'Close': close, 'Volume': np.full(len(index), 1000)
+    }, index=index)
+
+
+class FakeBarStore(BarStore):
+    """다운로드 요청을 기록하고 가짜 데이터를 돌려주는 저장소"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.downloads = []
+        self.today = "2024-06-28"
+
+    def _download(self, symbol, interval, period=None, start=None):
+        self.downloads.append({'period': period, 'start': start})
+        full = make_bars(self.today, 130)
+        if start is not None:
+            return full[full.index >= start]
+        return full.tail(70 if period == "3mo" else 22)
+
+
+def test_warm_start_reads_local_data():
+    """저장된 데이터는 갱신 주기 안에서 다운로드 없이 응답"""
+    with tempfile.TemporaryDirectory() as tmp:
+        store = FakeBarStore(base_dir=tmp, min_refresh_seconds=3600)
+        first = store.get_history("^GSPC", period="1mo")
+
+        fresh = FakeBarStore(base_dir=tmp, min_refresh_seconds=3600)
+        second = fresh.get_history("^GSPC", period="1mo")
+
+        assert len(fresh.downloads) == 0
+        assert second['Close'].tolist() == first['Close'].tolist()
+        print("✅ 로컬 웜 스타트 테스트 통과")
+
+
+def test_only_tail_is_downloaded():
+    """갱신 시 마지막 저장 봉 이후 구간만 다운로드"""
+    with tempfile.TemporaryDirectory() as tmp:
+        store = FakeBarStore(base_dir=tmp, min_refresh_seconds=0)
+        store.get_history("AAPL", period="1mo")
+        last_stored = store.load("AAPL").index[-1]
+
+        store.today = "2024-07-03"
+        data = store.get_history("AAPL", period="1mo")
+
+        assert store.downloads[-1]['start'] == last_stored
+        assert data.index[-1].strftime('%Y-%m-%d') == "2024-07-03"
+        assert not data.index.duplicated().any()
+        print("✅ 꼬리 구간 증분 다운로드 테스트 통과")
+
+
+def test_wider_period_backfills():
+    """저장 구간보다 넓은 요청은 전체를 다시 받아 구간 확장"""
+    with tempfile.TemporaryDirectory() as tmp:
+        store = FakeBarStore(base_dir=tmp, min_refresh_seconds=3600)
+        store.get_history("MSFT", period="1mo")
+        data = store.get_history("MSFT", period="3mo")
+
+        assert [d['period'] for d in store.downloads] == ["1mo", "3mo"]
+        assert len(data) > 22
+        assert store.list_symbols() == ["MSFT"]
+        print("✅ 넓은 구간 백필 테스트 통과")
+
+
+def main():
+    print("🧪 봉 데이터 저장소 테스트 시작...")
+    test_warm_start_reads_local_data()
+    test_only_tail_is_downloaded()
+    test_wider_period_backfills()
+    print("🎉 모든 테스트 통과!")
+
+
+if __name__ == "__main__":
+    main()
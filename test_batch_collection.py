@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+다중 심볼 배치 시세 수집 및 info 캐시 테스트 (yf.download / Ticker를 가짜로 교체, 네트워크 없음)
+"""
+
+import sys
+import os
+import time
+import asyncio
+import threading
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from data_monitoring import data_collector
+from data_monitoring.data_collector import EconomicDataCollector, InfoCache, MarketData
+
+INFO = {
+    'AAPL': {'longName': 'Apple Inc.', 'marketCap': 3_000_000_000_000, 'sector': 'Technology'},
+    'MSFT': {'longName': 'Microsoft Corporation', 'marketCap': 2_800_000_000_000},
+    'TSLA': {'longName': 'Tesla, Inc.', 'marketCap': 700_000_000_000},
+}
+
+
+def make_wide_frame():
+    """yf.download(group_by='column') 형태의 (필드, 심볼) 열 프레임"""
+    index = pd.bdate_range("2024-06-24", periods=5)
+    close = {
+        'AAPL': [100.0, 101.0, 102.0, 104.0, 106.0],
+        'MSFT': [200.0, 202.0, 204.0, 210.0, np.nan],  # 마지막 날 휴장
+        'NVDA': [np.nan] * 5,  # 데이터 없음
+    }
+    frames = {}
+    for symbol, values in close.items():
+        values = np.array(values)
+        frames[('Close', symbol)] = values
+        frames[('High', symbol)] = values + 1
+        frames[('Low', symbol)] = values - 1
+        frames[('Open', symbol)] = values
+        frames[('Volume', symbol)] = np.where(np.isnan(values), np.nan, 1_000.0)
+    return pd.DataFrame(frames, index=index)
+
+
+class FakeYFinance:
+    """yf.download / yf.Ticker 호출을 기록하는 가짜 구현"""
+
+    def __init__(self):
+        self.downloads = []
+        self.info_calls = []
+        self.history_calls = []
+        self.lock = threading.Lock()
+        self.fail_info = False
+
+    def download(self, symbols, **kwargs):
+        self.downloads.append(list(symbols))
+        return make_wide_frame()
+
+    def Ticker(self, symbol):
+        fake = self
+
+        class FakeTicker:
+            @property
+            def info(self):
+                with fake.lock:
+                    fake.info_calls.append(symbol)
+                if fake.fail_info:
+                    raise ConnectionError("info 요청 실패")
+                return dict(INFO.get(symbol, {}))
+
+            def history(self, period="2d"):
+                fake.history_calls.append(symbol)
+                if symbol != 'TSLA':
+                    return pd.DataFrame()
+                index = pd.bdate_range("2024-06-27", periods=2)
+                return pd.DataFrame({'Open': [250.0, 255.0], 'High': [251.0, 260.0], 'Low': [249.0, 254.0],
+                                     'Close': [250.0, 255.0], 'Volume': [5_000, 6_000]}, index=index)
+
+        return FakeTicker()
+
+
+class patched_yfinance:
+    """data_collector가 쓰는 yf.download / yf.Ticker를 잠시 교체"""
+
+    def __init__(self, fake):
+        self.fake = fake
+
+    def __enter__(self):
+        self.saved = (data_collector.yf.download, data_collector.yf.Ticker)
+        data_collector.yf.download = self.fake.download
+        data_collector.yf.Ticker = self.fake.Ticker
+        return self.fake
+
+    def __exit__(self, *exc):
+        data_collector.yf.download, data_collector.yf.Ticker = self.saved
+
+
+def make_collector(ttl_seconds=3600):
+    collector = EconomicDataCollector()
+    collector.info_cache = InfoCache(ttl_seconds=ttl_seconds)
+    return collector
+
+
+def test_batch_split_into_market_data():
+    """한 번의 다운로드 결과를 심볼별 MarketData로 분리 (심볼별 마지막 유효 봉 기준)"""
+    with patched_yfinance(FakeYFinance()) as fake:
+        collector = make_collector()
+        results = collector.collect_batch_data(['AAPL', 'MSFT', 'NVDA', 'BAD'])
+
+    assert fake.downloads == [['AAPL', 'MSFT', 'NVDA', 'BAD']]
+    assert set(results) == {'AAPL', 'MSFT'}  # 데이터가 없거나 프레임에 없는 심볼은 제외
+
+    aapl = results['AAPL']
+    assert isinstance(aapl, MarketData)
+    assert aapl.name == 'Apple Inc.' and aapl.market_cap == INFO['AAPL']['marketCap']
+    assert aapl.current_price == 106.0 and aapl.previous_close == 104.0
+    assert np.isclose(aapl.change_percent, (106.0 - 104.0) / 104.0 * 100)
+    assert aapl.high_24h == 107.0 and aapl.low_24h == 105.0 and aapl.volume == 1_000
+
+    msft = results['MSFT']
+    assert msft.current_price == 210.0 and msft.previous_close == 204.0
+    print("✅ 배치 프레임 분리 테스트 통과")
+
+
+def test_info_cache_hit_and_expiry():
+    """info는 심볼당 한 번만 받고, 만료되면 다시 받으며, 실패 시 이전 값 사용"""
+    with patched_yfinance(FakeYFinance()) as fake:
+        collector = make_collector(ttl_seconds=0.2)
+        collector.collect_batch_data(['AAPL', 'MSFT'])
+        collector.collect_batch_data(['AAPL', 'MSFT'])
+        assert sorted(fake.info_calls) == ['AAPL', 'MSFT']
+
+        cache = collector.info_cache
+        assert cache.get('AAPL') == {'longName': 'Apple Inc.', 'marketCap': INFO['AAPL']['marketCap']}
+        assert fake.info_calls.count('AAPL') == 1
+
+        time.sleep(0.25)
+        cache.get('AAPL')
+        assert fake.info_calls.count('AAPL') == 2
+
+        time.sleep(0.25)
+        fake.fail_info = True
+        assert cache.get('AAPL')['longName'] == 'Apple Inc.'
+        assert cache.get('NVDA') == {} and cache.get_cached('NVDA') is None
+    print("✅ info 캐시 적중/만료 테스트 통과")
+
+
+def test_missing_symbols_fall_back_to_individual():
+    """배치에서 빠진 심볼만 개별 수집으로 보완"""
+    with patched_yfinance(FakeYFinance()) as fake:
+        collector = make_collector()
+        results = asyncio.run(collector.collect_multiple_symbols(['AAPL', 'MSFT', 'TSLA', 'BAD']))
+
+    assert len(fake.downloads) == 1
+    assert sorted(fake.history_calls) == ['BAD', 'TSLA']
+    assert set(results) == {'AAPL', 'MSFT', 'TSLA'}
+    assert results['TSLA'].current_price == 255.0 and results['TSLA'].name == 'Tesla, Inc.'
+    print("✅ 누락 심볼 개별 수집 테스트 통과")
+
+
+def main():
+    print("🧪 배치 시세 수집 테스트 시작...")
+    test_batch_split_into_market_data()
+    test_info_cache_hit_and_expiry()
+    test_missing_symbols_fall_back_to_individual()
+    print("🎉 모든 테스트 통과!")
+
+
+if __name__ == "__main__":
+    main()
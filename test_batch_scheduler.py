@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+다중 이벤트 배치 스케줄러 테스트 (가짜 처리 함수 사용)
+"""
+
+import sys
+import os
+import asyncio
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from agents.batch_scheduler import EventBatchScheduler, ResourceLimiter
+
+
+def make_events():
+    return [
+        {'symbol': 'AAPL', 'severity': 0.3},
+        {'symbol': 'TSLA', 'severity': 0.9},
+        {'symbol': 'MSFT', 'severity': 'medium'},
+        {'symbol': 'NVDA', 'severity': 'critical'},
+        {'symbol': 'FAIL', 'severity': 0.1},
+    ]
+
+
+def test_priority_and_concurrency_limit():
+    """심각도 순으로 시작하고 동시 실행 수를 넘지 않음"""
+    started = []
+    state = {'active': 0, 'peak': 0}
+
+    async def handler(index, event):
+        started.append(event['symbol'])
+        state['active'] += 1
+        state['peak'] = max(state['peak'], state['active'])
+        await asyncio.sleep(0.01)
+        state['active'] -= 1
+        if event['symbol'] == 'FAIL':
+            raise ValueError("처리 실패")
+        return {'symbol': event['symbol']}
+
+    scheduler = EventBatchScheduler(handler, max_concurrent_events=2)
+    results = asyncio.run(scheduler.run(make_events()))
+
+    assert started == ['NVDA', 'TSLA', 'MSFT', 'AAPL', 'FAIL']
+    assert state['peak'] == 2
+    assert [r.index for r in results] == [0, 1, 2, 3, 4]
+    assert [r.success for r in results] == [True, True, True, True, False]
+    assert all(r.duration_seconds > 0 for r in results)
+    print("✅ 우선순위/동시 실행 제한 테스트 통과")
+
+
+def test_results_stream_as_completed():
+    """먼저 끝난 이벤트부터 스트리밍"""
+    delays = {'NVDA': 0.05, 'TSLA': 0.01}
+
+    async def handler(index, event):
+        await asyncio.sleep(delays[event['symbol']])
+        return {'symbol': event['symbol']}
+
+    async def collect():
+        scheduler = EventBatchScheduler(handler, max_concurrent_events=2)
+        events = [{'symbol': 'NVDA', 'severity': 0.9}, {'symbol': 'TSLA', 'severity': 0.5}]
+        return [r.result['symbol'] async for r in scheduler.iter_results(events)]
+
+    assert asyncio.run(collect()) == ['TSLA', 'NVDA']
+    print("✅ 완료 순서 스트리밍 테스트 통과")
+
+
+def test_resource_limiter():
+    """자원별 한도와 사용 통계"""
+    limiter = ResourceLimiter({'llm': 1})
+
+    async def call():
+        async with limiter.limit('llm'):
+            await asyncio.sleep(0.01)
+
+    async def run_all():
+        await asyncio.gather(*(call() for _ in range(3)))
+
+    asyncio.run(run_all())
+    # 새 이벤트 루프에서도 다시 사용 가능
+    asyncio.run(run_all())
+
+    stats = limiter.get_stats()['llm']
+    assert stats['peak'] == 1
+    assert stats['acquired'] == 6
+    assert stats['wait_seconds'] > 0
+    print("✅ 자원 제한기 테스트 통과")
+
+
+def main():
+    print("🧪 배치 스케줄러 테스트 시작...")
+    test_priority_and_concurrency_limit()
+    test_results_stream_as_completed()
+    test_resource_limiter()
+    print("🎉 모든 테스트 통과!")
+
+
+if __name__ == "__main__":
+    main()
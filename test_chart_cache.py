@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+차트 산출물 캐시 테스트 (데이터 지문, 적중 시 렌더링 생략, 동시 요청 병합, 나이/크기 기준 정리, 분석 에이전트 연동)
+"""
+
+import sys
+import os
+import time
+import asyncio
+import tempfile
+import threading
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils.chart_cache import ChartArtifactCache, fingerprint
+from data_monitoring.history_cache import HistoryCache
+from utils.chart_renderer import ChartRenderService
+from agents.data_analysis_strand import DataAnalysisStrand
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = time.time()
+
+    def __call__(self):
+        return self.now
+
+
+class CountingRenderer:
+    """렌더링 횟수를 기록하고 고정 크기 파일을 쓰는 가짜 렌더러"""
+
+    def __init__(self, size=100, delay=0.0):
+        self.size = size
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, path):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        with open(path, 'wb') as f:
+            f.write(b'x' * self.size)
+
+
+def make_history(days=30, seed=0):
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2024-01-01", periods=days, freq="B")
+    close = 100 + np.cumsum(rng.normal(0, 1, days))
+    return pd.DataFrame({
+        'Open': close - 0.5, 'High': close + 1, 'Low': close - 1,
+        'Close': close, 'Volume': rng.integers(1_000, 5_000, days).astype(float),
+    }, index=index)
+
+
+def test_fingerprint():
+    """같은 데이터는 같은 지문, 값이 하나라도 바뀌면 다른 지문"""
+    hist = make_history()
+    assert fingerprint(hist) == fingerprint(hist.copy())
+    changed = hist.copy()
+    changed.iloc[-1, changed.columns.get_loc('Close')] += 0.01
+    assert fingerprint(hist) != fingerprint(changed)
+    assert fingerprint({'a': 1, 'b': 2}) == fingerprint({'b': 2, 'a': 1})
+    assert fingerprint(hist, True) != fingerprint(hist, False)
+    print("✅ 데이터 지문 테스트 통과")
+
+
+def test_hit_skips_render():
+    """같은 키는 한 번만 렌더링하고, 스타일 버전이 바뀌면 다시 렌더링"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ChartArtifactCache()
+        render = CountingRenderer()
+        data_hash = fingerprint(make_history())
+
+        first = cache.get_or_render('price', 'AAPL', data_hash, render, tmp)
+        second = cache.get_or_render('price', 'AAPL', data_hash, render, tmp)
+        assert first == second and os.path.exists(first) and render.calls == 1
+        assert cache.get_or_render('price', 'MSFT', data_hash, render, tmp) != first
+        assert render.calls == 2
+
+        # 프로세스를 다시 시작해도 파일 이름으로 적중
+        assert ChartArtifactCache().get_or_render('price', 'AAPL', data_hash, render, tmp) == first
+        assert render.calls == 2
+
+        restyled = ChartArtifactCache(style_version=2).get_or_render('price', 'AAPL', data_hash, render, tmp)
+        assert restyled != first and render.calls == 3
+        assert cache.get_stats()['hits'] == 1
+        assert not [name for name in os.listdir(tmp) if '.tmp.' in name]
+    print("✅ 캐시 적중 테스트 통과")
+
+
+def test_concurrent_requests_render_once():
+    """같은 차트를 동시에 요청해도 렌더링은 한 번"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ChartArtifactCache()
+        render = CountingRenderer(delay=0.1)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(
+            cache.get_or_render('price', 'AAPL', 'hash', render, tmp))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert render.calls == 1 and len(set(results)) == 1
+    print("✅ 동시 요청 병합 테스트 통과")
+
+
+def test_render_failure():
+    """렌더링 예외는 호출 측으로 전달되고 반쯤 쓴 파일은 남지 않음"""
+    def broken(path):
+        with open(path, 'w') as f:
+            f.write('partial')
+        raise ValueError("render failed")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ChartArtifactCache()
+        try:
+            cache.get_or_render('price', 'AAPL', 'hash', broken, tmp)
+            assert False, "렌더링 예외를 그대로 전달해야 함"
+        except ValueError:
+            pass
+        assert os.listdir(tmp) == []
+        assert cache.get_or_render('price', 'AAPL', 'hash', lambda path: None, tmp) is None
+    print("✅ 렌더링 실패 테스트 통과")
+
+
+def test_eviction_by_age_and_size():
+    """오래 안 쓴 파일은 삭제하고, 크기 상한을 넘으면 오래된 순으로 삭제"""
+    clock = FakeClock()
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ChartArtifactCache(max_bytes=350, max_age=3600, evict_interval=0, clock=clock)
+        render = CountingRenderer(size=100)
+
+        legacy = os.path.join(tmp, "AAPL_price_20240101_000000.png")
+        with open(legacy, 'wb') as f:
+            f.write(b'x' * 100)
+        os.utime(legacy, (clock.now - 7200, clock.now - 7200))
+
+        paths = []
+        for i in range(4):
+            clock.now += 10
+            paths.append(cache.get_or_render('price', f'S{i}', 'hash', render, tmp))
+
+        assert not os.path.exists(legacy)  # 나이 초과
+        assert not os.path.exists(paths[0])  # 크기 상한 초과 시 가장 오래된 파일
+        assert all(os.path.exists(path) for path in paths[1:])
+        assert cache.get_stats()['evictions'] == 2
+
+        # 적중하면 사용 시각이 갱신되어 정리 대상에서 밀려남
+        clock.now += 10
+        cache.get_or_render('price', 'S1', 'hash', render, tmp)
+        clock.now += 10
+        cache.get_or_render('price', 'S4', 'hash', render, tmp)
+        assert os.path.exists(paths[1]) and not os.path.exists(paths[2])
+    print("✅ 캐시 정리 테스트 통과")
+
+
+def test_data_analysis_charts_reused():
+    """같은 심볼 기사를 다시 만들 때 분석 차트는 렌더링 없이 같은 파일 반환"""
+    histories = {'AAPL': make_history(seed=1), 'SPY': make_history(seed=2)}
+    history_cache = HistoryCache(fetcher=lambda symbol, period, interval: histories[symbol])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        chart_cache = ChartArtifactCache()
+        renderer = ChartRenderService(chart_cache=chart_cache, use_processes=False)
+        strand = DataAnalysisStrand(history_cache=history_cache, chart_renderer=renderer)
+        strand.charts_dir = tmp
+        analysis = {'technical_indicators': {'sma_20': 101.0, 'bb_upper': 105.0, 'bb_lower': 95.0}}
+
+        started = time.perf_counter()
+        first = asyncio.run(strand._generate_charts('AAPL', analysis))
+        cold = time.perf_counter() - started
+        started = time.perf_counter()
+        second = asyncio.run(strand._generate_charts('AAPL', analysis))
+        warm = time.perf_counter() - started
+
+        assert len(first) == 4 and first == second
+        stats = chart_cache.get_stats()
+        assert stats['renders'] == 4 and stats['hits'] == 4
+
+        # 새 봉이 추가되면 해당 차트는 다시 렌더링
+        histories['AAPL'] = make_history(days=31, seed=1)
+        history_cache.invalidate('AAPL')
+        third = asyncio.run(strand._generate_charts('AAPL', analysis))
+        assert set(third).isdisjoint(first)
+        renderer.shutdown()
+    print(f"✅ 분석 차트 재사용 테스트 통과 (콜드 {cold:.3f}초, 웜 {warm:.4f}초)")
+
+
+def main():
+    print("🧪 차트 산출물 캐시 테스트 시작...")
+    test_fingerprint()
+    test_hit_skips_render()
+    test_concurrent_requests_render_once()
+    test_render_failure()
+    test_eviction_by_age_and_size()
+    test_data_analysis_charts_reused()
+    print("🎉 모든 테스트 통과!")
+
+
+if __name__ == "__main__":
+    main()
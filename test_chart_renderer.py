@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+차트 렌더링 서비스 테스트 (예열된 워커 프로세스, 이벤트 루프 비차단, 캐시 재사용, 실패 전파, 이미지 에이전트 연동)
+"""
+
+import sys
+import os
+import time
+import signal
+import asyncio
+import tempfile
+import threading
+from datetime import datetime
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils.chart_cache import ChartArtifactCache
+from utils.chart_renderer import ChartRenderService, ChartSpec, RENDERERS, render_spec
+from agents import image_generator_strand
+from agents.image_generator_strand import ImageGeneratorStrand
+
+
+def worker_state():
+    """워커 프로세스 상태 (PID, 백엔드, 미리 로드된 모듈)"""
+    import matplotlib
+    return os.getpid(), matplotlib.get_backend().lower(), 'plotly.graph_objects' in sys.modules, 'wordcloud' in sys.modules
+
+
+def make_history(days=30, seed=0):
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2024-01-01", periods=days, freq="B")
+    close = 100 + np.cumsum(rng.normal(0, 1, days))
+    return pd.DataFrame({
+        'Open': close - 0.5, 'High': close + 1, 'Low': close - 1,
+        'Close': close, 'Volume': rng.integers(1_000, 5_000, days).astype(float),
+    }, index=index)
+
+
+def make_specs(symbol='AAPL'):
+    hist = make_history()
+    close = hist['Close']
+    words = ['애플', '주가', '상승', 'market', 'volume', 'earnings', '실적', '발표', '거래량', '급증'] * 5
+    return [
+        ChartSpec('price_volume', symbol, {'hist': hist}, fmt='html'),
+        ChartSpec('technical', symbol, {'close': close, 'sma_20': close.rolling(20).mean()}, fmt='html'),
+        ChartSpec('recent', symbol, {'close': close.tail(7)}, fmt='html'),
+        ChartSpec('comparison', symbol, {'close': close, 'market_close': close * 0.9 + 5}, fmt='html'),
+        ChartSpec('article_illustration', symbol, {'title': '애플 급등', 'lead': '실적 발표', 'event_type': 'price_change',
+                                                   'image_prompt': 'financial illustration'}),
+        ChartSpec('volume_spike', symbol, {'volume_ratio': 3.2, 'timestamp': '2024-01-01T10:00:00',
+                                           'severity': 'HIGH', 'description': '거래량 급증'}),
+        ChartSpec('price_change', symbol, {'change_percent': -4.1, 'current_price': 180.5, 'rsi': 28.0, 'sma_20': 190.0}),
+        ChartSpec('volatility', symbol, {'volatility': 45.0}),
+        ChartSpec('default', symbol, {'title': '경제 뉴스', 'event_type': 'news'}),
+        ChartSpec('wordcloud', symbol, {'words': words}),
+        ChartSpec('fallback', symbol, {'title': '경제 뉴스'}),
+    ]
+
+
+def test_all_renderers():
+    """모든 차트 종류가 명세만으로 파일을 생성"""
+    specs = make_specs()
+    assert {spec.chart_type for spec in specs} == set(RENDERERS)
+    with tempfile.TemporaryDirectory() as tmp:
+        for spec in specs:
+            path = render_spec(spec, os.path.join(tmp, f"{spec.chart_type}.{spec.fmt}"))
+            assert os.path.getsize(path) > 0, spec.chart_type
+    print("✅ 렌더러 테스트 통과")
+
+
+def test_warm_worker_processes():
+    """워커는 별도 프로세스에서 Agg 백엔드와 렌더링 라이브러리를 미리 로드"""
+    service = ChartRenderService(max_workers=2)
+    try:
+        pids = service.start(wait=True)
+        assert pids and os.getpid() not in pids
+        pid, backend, plotly_loaded, wordcloud_loaded = service._submit(worker_state).result(timeout=60)
+        assert pid != os.getpid() and backend == 'agg' and plotly_loaded and wordcloud_loaded
+    finally:
+        service.shutdown()
+    print(f"✅ 워커 예열 테스트 통과 (워커 PID {sorted(set(pids))})")
+
+
+def test_event_loop_not_blocked():
+    """렌더링 중에도 이벤트 루프의 다른 작업이 계속 진행되고, 같은 명세는 캐시 재사용"""
+    with tempfile.TemporaryDirectory() as tmp:
+        service = ChartRenderService(max_workers=2, chart_cache=ChartArtifactCache())
+        try:
+            service.start(wait=True)
+
+            async def run():
+                gaps = []
+                done = asyncio.Event()
+
+                async def heartbeat():
+                    last = time.perf_counter()
+                    while not done.is_set():
+                        await asyncio.sleep(0.01)
+                        now = time.perf_counter()
+                        gaps.append(now - last)
+                        last = now
+
+                ticker = asyncio.create_task(heartbeat())
+                started = time.perf_counter()
+                results = await service.render_many(make_specs(), tmp)
+                elapsed = time.perf_counter() - started
+                done.set()
+                await ticker
+                return results, elapsed, gaps
+
+            results, elapsed, gaps = asyncio.run(run())
+            assert all(isinstance(path, str) and os.path.exists(path) for path in results), results
+            assert max(gaps) < 0.25, max(gaps)
+            assert len(gaps) > elapsed / 0.05  # 렌더링 내내 심장박동이 이어짐
+            assert service.get_stats()['rendered'] == len(results)
+
+            # 같은 명세를 다시 (동시에) 요청하면 렌더링 없이 같은 파일
+            again = asyncio.run(service.render_many(make_specs() + make_specs(), tmp))
+            assert again == results + results
+            assert service.get_stats()['rendered'] == len(results)
+        finally:
+            service.shutdown()
+    print(f"✅ 이벤트 루프 비차단 테스트 통과 (렌더링 {elapsed:.2f}초, 최대 지연 {max(gaps) * 1000:.0f}ms)")
+
+
+def test_failure_propagates():
+    """렌더링 실패는 호출 측으로 전달되고 render_many에서는 예외 객체로 반환"""
+    with tempfile.TemporaryDirectory() as tmp:
+        service = ChartRenderService(max_workers=1, chart_cache=ChartArtifactCache())
+        try:
+            try:
+                asyncio.run(service.render(ChartSpec('unknown', 'AAPL'), tmp))
+                assert False, "알 수 없는 차트 종류는 예외를 전달해야 함"
+            except ValueError:
+                pass
+            results = asyncio.run(service.render_many(
+                [ChartSpec('unknown', 'AAPL'), ChartSpec('fallback', 'AAPL', {'title': 'ok'})], tmp))
+            assert isinstance(results[0], ValueError) and os.path.exists(results[1])
+            assert service.get_stats()['failed'] == 2
+        finally:
+            service.shutdown()
+    print("✅ 실패 전파 테스트 통과")
+
+
+def test_worker_crash_restarts_once():
+    """렌더링 중 워커가 죽으면 풀은 한 번만 재시작되고 모든 차트가 완성됨"""
+    service = ChartRenderService(max_workers=1, use_processes=False)
+    try:
+        broken = service._get_executor()
+        error = BrokenProcessPool("worker died")
+        service._restart(broken, error)
+        replacement = service._get_executor()
+        service._restart(broken, error)  # 같은 풀에서 실패한 다른 작업
+        service._restart(None, error)
+        assert service._get_executor() is replacement and service.get_stats()['pool_restarts'] == 1
+    finally:
+        service.shutdown()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        service = ChartRenderService(max_workers=2, chart_cache=ChartArtifactCache())
+        try:
+            pids = service.start(wait=True)
+
+            def kill_worker():
+                while service.stats['requests'] == 0:
+                    time.sleep(0.01)
+                time.sleep(0.1)
+                os.kill(pids[0], signal.SIGKILL)
+
+            killer = threading.Thread(target=kill_worker)
+            killer.start()
+            specs = make_specs('AAPL') + make_specs('MSFT') + make_specs('NVDA')
+            results = asyncio.run(service.render_many(specs, tmp))
+            killer.join()
+            assert all(isinstance(path, str) and os.path.exists(path) for path in results), results
+            assert service.get_stats()['pool_restarts'] == 1
+        finally:
+            service.shutdown()
+    print("✅ 워커 비정상 종료 복구 테스트 통과")
+
+
+def test_image_strand_uses_service():
+    """이미지 에이전트는 명세를 만들어 서비스에 넘기고, 같은 기사는 다시 그리지 않음"""
+    article = {'title': 'AAPL 급등', 'lead': '애플 주가가 크게 올랐다',
+               'body': '애플 가격 거래량 시장 실적 발표 투자자 반응 ' * 10, 'conclusion': '결론'}
+    event = {'event_type': 'price_change', 'change_percent': 3.2, 'symbol': 'AAPL', 'timestamp': '2024-01-02T10:00:00'}
+    analysis = {'raw_data': {'current_price': 190.0}, 'technical_indicators': {'rsi': 60.0, 'sma_20': 180.0}}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        service = ChartRenderService(max_workers=2, chart_cache=ChartArtifactCache())
+        try:
+            strand = ImageGeneratorStrand(chart_renderer=service)
+            strand.images_dir = tmp
+
+            async def generate():
+                return await asyncio.gather(
+                    strand._generate_article_based_image(article, 'AAPL', event),
+                    strand._create_price_change_image('AAPL', event, analysis),
+                    strand._create_wordcloud(article, 'AAPL'),
+                )
+
+            first = asyncio.run(generate())
+            second = asyncio.run(generate())
+            assert all(path.endswith('.png') and os.path.exists(path) for path in first)
+            assert first == second and service.get_stats()['rendered'] == 3
+
+            # 렌더링 실패 시 폴백 이미지
+            fallback = asyncio.run(strand._create_price_change_image('AAPL', {'change_percent': 'bad'}, None))
+            assert os.path.exists(fallback) and 'fallback' in os.path.basename(fallback)
+        finally:
+            service.shutdown()
+    print("✅ 이미지 에이전트 연동 테스트 통과")
+
+
+class RecordingRenderService(ChartRenderService):
+    """렌더링 요청된 명세를 기록하는 서비스"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.specs = []
+
+    async def render(self, spec, directory):
+        self.specs.append(spec)
+        return await super().render(spec, directory)
+
+
+class FakeDatetime(datetime):
+    """now()가 지정한 시각을 반환하는 datetime"""
+    current = datetime(2024, 1, 1, 10, 0)
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls.current
+
+
+def test_display_time_in_cache_key():
+    """같은 입력이라도 다른 시각에 만들면 이전 시각이 찍힌 캐시 이미지를 돌려주지 않음"""
+    saved = image_generator_strand.datetime
+    image_generator_strand.datetime = FakeDatetime
+    with tempfile.TemporaryDirectory() as tmp:
+        service = RecordingRenderService(use_processes=False, chart_cache=ChartArtifactCache())
+        try:
+            strand = ImageGeneratorStrand(chart_renderer=service)
+            strand.images_dir = tmp
+            event = {'event_type': 'high_volatility', 'symbol': 'AAPL'}
+            article = {'title': 'AAPL 변동성 확대'}
+
+            # 통계가 없으면 변동성은 기본값 25.0이라 입력이 같음: 분석 시각으로 구분
+            first = asyncio.run(strand._create_volatility_image(
+                'AAPL', event, {'analysis_timestamp': '2024-01-01T10:00:00'}))
+            again = asyncio.run(strand._create_volatility_image(
+                'AAPL', event, {'analysis_timestamp': '2024-01-01T10:00:30'}))
+            later = asyncio.run(strand._create_volatility_image(
+                'AAPL', event, {'analysis_timestamp': '2024-01-03T09:00:00'}))
+            assert first == again and later != first
+            assert service.specs[-1].data['display_time'] == '2024-01-03 09:00'
+
+            # 이벤트/분석 시각이 없으면 현재 시각
+            default_first = asyncio.run(strand._create_default_image('AAPL', {'event_type': 'news'}, article))
+            FakeDatetime.current = datetime(2024, 1, 8, 10, 0)
+            default_later = asyncio.run(strand._create_default_image('AAPL', {'event_type': 'news'}, article))
+            assert default_later != default_first
+            assert service.specs[-1].data['display_time'] == '2024-01-08 10:00'
+
+            # 렌더링 실패 시 폴백 이미지도 같은 시각을 키에 포함
+            fallback = asyncio.run(strand._create_price_change_image(
+                'AAPL', {'change_percent': 'bad', 'timestamp': '2024-01-09T15:30:00'}, None))
+            assert service.specs[-1].chart_type == 'fallback'
+            assert service.specs[-1].data['display_time'] == '2024-01-09 15:30'
+            assert all(os.path.exists(path) for path in (first, later, default_first, default_later, fallback))
+            assert service.get_stats()['rendered'] == 5
+        finally:
+            image_generator_strand.datetime = saved
+            FakeDatetime.current = datetime(2024, 1, 1, 10, 0)
+            service.shutdown()
+    print("✅ 이미지 표시 시각 캐시 키 테스트 통과")
+
+
+def main():
+    print("🧪 차트 렌더링 서비스 테스트 시작...")
+    test_all_renderers()
+    test_warm_worker_processes()
+    test_event_loop_not_blocked()
+    test_failure_propagates()
+    test_worker_crash_restarts_once()
+    test_image_strand_uses_service()
+    test_display_time_in_cache_key()
+    print("🎉 모든 테스트 통과!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+희소 행렬 기반 개념 동시 출현 계산 테스트 (기존 이중 루프 누적과 결과 비교)
+"""
+
+import sys
+import os
+import time
+import random
+from collections import defaultdict
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from data_monitoring.cooccurrence import CooccurrenceMatrix
+from data_monitoring.enhanced_economic_network_analyzer import EnhancedEconomicNetworkAnalyzer
+from data_monitoring.enhanced_social_network_analyzer import EnhancedSocialNetworkAnalyzer
+
+CONCEPTS = ["inflation", "monetary_policy", "stock_market", "technology", "energy", "labor_market"]
+
+
+def random_documents(count, seed):
+    rng = random.Random(seed)
+    return [{c: rng.uniform(0.1, 5.0) for c in rng.sample(CONCEPTS, rng.randint(0, 4))} for _ in range(count)]
+
+
+def pairwise_loop(documents, weights, sqrt):
+    """기존 분석기들의 이중 루프 누적 방식"""
+    totals = defaultdict(float)
+    for scores, weight in zip(documents, weights):
+        names = list(scores)
+        for i, c1 in enumerate(names):
+            for c2 in names[i + 1:]:
+                value = scores[c1] * scores[c2]
+                totals[frozenset((c1, c2))] += (value ** 0.5 if sqrt else value) * weight
+    return totals
+
+
+def test_matches_pairwise_loop():
+    """가중/비가중, 제곱근 변환 모두 이중 루프 결과와 동일"""
+    documents = random_documents(400, seed=1)
+    weights = [random.Random(i).choice([1.0, 0.5]) for i in range(len(documents))]
+    for sqrt in (False, True):
+        matrix = CooccurrenceMatrix(transform='sqrt' if sqrt else None)
+        matrix.add_documents(documents, weights)
+        expected = pairwise_loop(documents, weights, sqrt)
+        edges = {frozenset((c1, c2)): w for c1, c2, w in matrix.edges()}
+        assert edges.keys() == {k for k, v in expected.items() if v > 0}
+        for key, value in expected.items():
+            assert abs(edges[key] - value) < 1e-9
+        c1, c2 = sorted(next(iter(expected)))
+        assert abs(matrix.weight(c1, c2) - matrix.weight(c2, c1)) < 1e-12
+    print("✅ 이중 루프 일치 테스트 통과")
+
+
+def test_incremental_updates():
+    """나눠서 추가해도 (중간에 새 개념이 생겨도) 한 번에 추가한 결과와 동일"""
+    documents = random_documents(300, seed=2)
+    once = CooccurrenceMatrix()
+    once.add_documents(documents)
+
+    incremental = CooccurrenceMatrix()
+    incremental.add_documents([{c: s for c, s in d.items() if c != "labor_market"} for d in documents[:100]])
+    incremental.matrix()
+    incremental.add_documents([{"labor_market": d["labor_market"]} for d in documents[:100] if "labor_market" in d])
+    incremental.matrix()
+    incremental.add_documents(documents[100:])
+
+    # 첫 100건은 labor_market을 분리해 넣었으므로 그 쌍만 다름
+    expected = pairwise_loop(documents[:100], [1.0] * 100, False)
+    for c1, c2, weight in once.edges():
+        diff = 0.0 if "labor_market" not in (c1, c2) else expected.get(frozenset((c1, c2)), 0.0)
+        assert abs(incremental.weight(c1, c2) - (weight - diff)) < 1e-9
+    assert incremental.document_count == once.document_count + sum("labor_market" in d for d in documents[:100])
+    print("✅ 증분 갱신 테스트 통과")
+
+
+def test_economic_analyzer_edges():
+    """경제 개념 분석기 엣지 강도가 기존 계산과 동일"""
+    analyzer = EnhancedEconomicNetworkAnalyzer()
+    texts = [
+        "Fed raises interest rates as inflation stays high and stock market falls",
+        "Tech stocks rally on AI earnings while oil prices push inflation",
+        "Jobs report shows unemployment falling, consumer spending strong",
+        "Federal Reserve monetary policy weighs on housing market and mortgage rates",
+    ] * 3
+    result = analyzer.analyze_concept_relationships(texts)
+
+    documents = [{c: d['score'] for c, d in analyzer.extract_economic_concepts(t)[0].items()} for t in texts]
+    expected = {k: v for k, v in pairwise_loop(documents, [1.0] * len(texts), True).items() if v > 0.5}
+    graph = result['graph']
+    assert {frozenset(edge) for edge in graph.edges()} == set(expected)
+    for c1, c2, data in graph.edges(data=True):
+        assert abs(data['strength'] - expected[frozenset((c1, c2))]) < 1e-9
+    print(f"✅ 경제 개념 분석기 테스트 통과 ({graph.number_of_edges()}개 엣지)")
+
+
+def test_reddit_scale():
+    """수만 건의 Reddit 포스트/댓글 네트워크를 수 초 안에 구축"""
+    analyzer = EnhancedSocialNetworkAnalyzer()
+    rng = random.Random(3)
+    phrases = ["interest rate hike", "inflation data", "stock market crash", "tech earnings",
+               "oil prices", "housing market", "bitcoin rally", "unemployment claims", "gdp growth"]
+    posts = [{'title': " and ".join(rng.sample(phrases, 3)), 'selftext': "discussion thread", 'score': 1}
+             for _ in range(15000)]
+    comments = [{'body': "I think " + " and ".join(rng.sample(phrases, 2)) + " matter", 'score': 1}
+                for _ in range(15000)]
+
+    started = time.perf_counter()
+    result = analyzer.build_concept_network_from_reddit(
+        {'subreddits': {'economics': {'posts': posts, 'comments': comments}}})
+    elapsed = time.perf_counter() - started
+    assert result['total_relationships'] > 0
+    assert elapsed < 10.0, elapsed
+    print(f"✅ 대량 네트워크 구축 테스트 통과 ({elapsed:.1f}초)")
+
+
+def main():
+    print("🧪 개념 동시 출현 행렬 테스트 시작...")
+    test_matches_pairwise_loop()
+    test_incremental_updates()
+    test_economic_analyzer_edges()
+    test_reddit_scale()
+    print("🎉 모든 테스트 통과!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+롤링 상관관계 엔진 테스트 (pandas/scipy 계산과 결과 비교, 가짜 히스토리 캐시 사용)
+"""
+
+import sys
+import os
+import time
+
+import numpy as np
+import pandas as pd
+from scipy.stats import pearsonr
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from data_monitoring.correlation_engine import RollingCorrelationEngine
+from data_monitoring.correlation_analysis import CorrelationAnalyzer
+
+
+def make_prices(symbols, days=70, seed=0):
+    """공통 요인을 섞은 가상 종가 패널"""
+    rng = np.random.default_rng(seed)
+    market = rng.normal(0, 0.01, days)
+    returns = np.column_stack([market * rng.uniform(-1, 1.5) + rng.normal(0, 0.01, days) for _ in symbols])
+    index = pd.bdate_range("2024-01-01", periods=days)
+    return pd.DataFrame(100 * np.cumprod(1 + returns, axis=0), index=index, columns=symbols)
+
+
+class FakeHistoryCache:
+    def __init__(self, prices):
+        self.prices = prices
+        self.calls = 0
+
+    def get_history(self, symbol, period="1mo", interval="1d"):
+        self.calls += 1
+        if symbol not in self.prices.columns:
+            return pd.DataFrame()
+        return pd.DataFrame({'Close': self.prices[symbol]})
+
+
+def test_matches_pandas():
+    """전체/윈도우 상관관계와 p-value가 pandas, scipy 결과와 동일"""
+    prices = make_prices([f"S{i}" for i in range(30)])
+    engine = RollingCorrelationEngine.from_prices(prices)
+    returns = prices.pct_change().dropna()
+
+    assert np.allclose(engine.correlation_array(), returns.corr().to_numpy())
+    assert np.allclose(engine.correlation_array(20), returns.tail(20).corr().to_numpy())
+    assert np.allclose(engine.correlation_array(7), returns.tail(7).corr().to_numpy())
+    r, p = pearsonr(returns["S0"], returns["S5"])
+    assert abs(engine.p_values()[0, 5] - p) < 1e-9
+
+    timestamps, rolling = engine.rolling_correlations(10)
+    expected = returns["S1"].rolling(10).corr(returns["S2"]).dropna()
+    assert list(timestamps) == list(expected.index)
+    assert np.allclose(rolling[:, 1, 2], expected.to_numpy())
+    print("✅ pandas/scipy 일치 테스트 통과")
+
+
+def test_incremental_update():
+    """새 봉을 하나씩 추가한 결과가 처음부터 다시 계산한 결과와 동일"""
+    prices = make_prices(["A", "B", "C", "D"], days=120, seed=1)
+    engine = RollingCorrelationEngine.from_prices(prices.iloc[:60], max_history=40)
+    assert engine.extend(prices.iloc[50:]) == 60
+    assert engine.extend(prices) == 0
+
+    fresh = RollingCorrelationEngine.from_prices(prices, max_history=40)
+    assert len(engine) == len(fresh) == 40
+    for window in (None, 5, 20):
+        assert np.allclose(engine.correlation_array(window), fresh.correlation_array(window))
+    print("✅ 증분 갱신 테스트 통과")
+
+
+def test_find_breaks_in_bulk():
+    """기준 상관관계와 일괄 비교한 결과가 쌍별 비교와 동일"""
+    prices = make_prices([f"S{i}" for i in range(12)], seed=2)
+    engine = RollingCorrelationEngine.from_prices(prices)
+    corr = engine.correlation(20)
+    expected = {("S0", "S1"): 0.9, ("S3", "S2"): -0.5, ("S4", "S5"): float(corr.loc["S4", "S5"]),
+                ("S0", "MISSING"): 0.5}
+
+    found = {(s1, s2): actual for s1, s2, _, actual, _ in engine.find_breaks(expected, 0.2, window=20)}
+    loop = {pair: corr.loc[pair] for pair, value in expected.items()
+            if "MISSING" not in pair and abs(corr.loc[pair] - value) > 0.2}
+    assert found.keys() == loop.keys() and ("S4", "S5") not in found
+    assert all(abs(found[pair] - loop[pair]) < 1e-12 for pair in found)
+    print("✅ 일괄 이탈 후보 테스트 통과")
+
+
+def test_analyzer_uses_engine():
+    """분석기 결과가 쌍별 pearsonr 계산과 같고, 다음 호출은 새 봉만 반영"""
+    symbols = ["^GSPC", "^IXIC", "^DJI", "^VIX", "AAPL"]
+    prices = make_prices(symbols, days=64, seed=3)
+    prices["^IXIC"] = prices["^GSPC"] * (1 + np.random.default_rng(9).normal(0, 0.02, len(prices)))
+    cache = FakeHistoryCache(prices.iloc[:-1])
+    analyzer = CorrelationAnalyzer(history_cache=cache)
+
+    correlations = analyzer.analyze_market_correlations(symbols)
+    returns = prices.iloc[:-1].pct_change().dropna()
+    assert len(correlations) == 10
+    for pair in correlations.values():
+        r, p = pearsonr(returns[pair.symbol1], returns[pair.symbol2])
+        assert abs(pair.correlation - r) < 1e-9 and abs(pair.p_value - p) < 1e-9
+        r_1m = pearsonr(returns[pair.symbol1].tail(20), returns[pair.symbol2].tail(20))[0]
+        assert abs(pair.correlation_1m - r_1m) < 1e-9
+        assert 0.0 <= pair.stability_score <= 1.0
+
+    engine = next(iter(analyzer._engines.values()))
+    cache.prices = prices
+    breaks = analyzer.detect_correlation_breaks(symbols)
+    assert next(iter(analyzer._engines.values())) is engine and engine.last_timestamp == prices.index[-1]
+    # 가상 데이터에서는 ^GSPC와 ^IXIC 상관관계가 기준(0.85)보다 크게 낮음
+    assert ("^GSPC", "^IXIC") in {(b.symbol1, b.symbol2) for b in breaks}
+    print("✅ 분석기 연동 테스트 통과")
+
+
+def test_large_universe():
+    """150개 심볼 유니버스도 빠르게 분석"""
+    symbols = [f"T{i:03d}" for i in range(150)]
+    analyzer = CorrelationAnalyzer(history_cache=FakeHistoryCache(make_prices(symbols, seed=4)))
+    started = time.perf_counter()
+    correlations = analyzer.analyze_market_correlations(symbols)
+    elapsed = time.perf_counter() - started
+    assert len(correlations) == 150 * 149 // 2
+    assert elapsed < 5.0, elapsed
+    print(f"✅ 대규모 유니버스 테스트 통과 ({len(correlations):,}쌍, {elapsed:.2f}초)")
+
+
+def main():
+    print("🧪 롤링 상관관계 엔진 테스트 시작...")
+    test_matches_pandas()
+    test_incremental_update()
+    test_find_breaks_in_bulk()
+    test_analyzer_uses_engine()
+    test_large_universe()
+    print("🎉 모든 테스트 통과!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+이벤트 탐지 주기 컨텍스트 테스트 (가짜 히스토리 fetcher 사용, 네트워크 없음)
+"""
+
+import sys
+import os
+import time
+import tempfile
+import threading
+import numpy as np
+import pandas as pd
+from datetime import datetime
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from data_monitoring.data_collector import MarketData
+from data_monitoring.event_detector import EventDetector, EventType
+from data_monitoring.event_store import EventStore
+from data_monitoring.history_cache import HistoryCache, period_to_days
+
+SYMBOLS = ["^KS11", "^KQ11", "^GSPC"]
+
+
+def make_slow_fetcher(calls, delay=0.2):
+    """호출을 기록하고 다운로드 지연을 흉내 내는 fetcher"""
+    lock = threading.Lock()
+
+    def fetcher(symbol, period, interval):
+        with lock:
+            calls.append((symbol, period))
+        time.sleep(delay)
+        index = pd.bdate_range(end="2024-06-28", periods=int(period_to_days(period)))
+        close = np.linspace(100, 110, len(index))
+        return pd.DataFrame({
+            'Open': close, 'High': close + 1, 'Low': close - 1,
+            'Close': close, 'Volume': np.full(len(index), 1000)
+        }, index=index)
+    return fetcher
+
+
+def make_market_data(symbol: str) -> MarketData:
+    # 급등 + 거래량 급증 + 높은 변동성을 동시에 일으키는 데이터
+    return MarketData(symbol=symbol, name=symbol, timestamp=datetime.now(),
+                      current_price=110.0, previous_close=100.0, change_percent=10.0,
+                      volume=10000, high_24h=115.0, low_24h=100.0)
+
+
+def test_history_fetched_once_per_symbol():
+    """한 심볼에서 여러 이벤트가 나와도 히스토리/지표는 한 번만 계산"""
+    calls = []
+    with tempfile.TemporaryDirectory() as tmp:
+        detector = EventDetector(history_cache=HistoryCache(fetcher=make_slow_fetcher(calls)),
+                                 event_store=EventStore(os.path.join(tmp, "events.sqlite")))
+        market_data = {symbol: make_market_data(symbol) for symbol in SYMBOLS}
+
+        started = time.perf_counter()
+        events = detector.detect_events(market_data)
+        elapsed = time.perf_counter() - started
+
+    assert sorted(c[0] for c in calls) == sorted(SYMBOLS)
+    assert detector.last_cycle.stats == {'history_fetches': 3, 'indicator_computations': 3}
+    assert len(events) == 9
+    assert {e.event_type for e in events} == {EventType.SURGE, EventType.VOLUME_SPIKE, EventType.VOLATILITY}
+    assert all(e.technical_indicators.get('rsi') is not None for e in events)
+    # 심볼별 다운로드가 병렬로 진행되어 순차 실행(0.6초)보다 빠름
+    assert elapsed < 0.5, elapsed
+    print("✅ 주기 내 1회 계산/병렬 탐지 테스트 통과")
+
+
+def test_sequential_mode_matches_parallel():
+    """max_workers=1 순차 실행도 같은 이벤트를 탐지"""
+    with tempfile.TemporaryDirectory() as tmp:
+        store = EventStore(os.path.join(tmp, "events.sqlite"))
+        market_data = {symbol: make_market_data(symbol) for symbol in SYMBOLS}
+        parallel = EventDetector(history_cache=HistoryCache(fetcher=make_slow_fetcher([], 0)),
+                                 event_store=store)
+        sequential = EventDetector(history_cache=HistoryCache(fetcher=make_slow_fetcher([], 0)),
+                                   event_store=store, max_workers=1)
+
+        key = lambda e: (e.symbol, e.event_type.value, round(e.severity, 6))
+        assert sorted(map(key, parallel.detect_events(market_data))) == \
+            sorted(map(key, sequential.detect_events(market_data)))
+    print("✅ 순차/병렬 결과 일치 테스트 통과")
+
+
+def main():
+    print("🧪 이벤트 탐지 주기 컨텍스트 테스트 시작...")
+    test_history_fetched_once_per_symbol()
+    test_sequential_mode_matches_parallel()
+    print("🎉 모든 테스트 통과!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+추가 전용 이벤트 저널 테스트 (임시 디렉토리 사용)
+"""
+
+import sys
+import os
+import json
+import tempfile
+import multiprocessing
+from datetime import datetime, timedelta
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from data_monitoring.event_journal import EventJournal
+
+
+def make_event(event_id: str, timestamp: datetime, symbol: str = "AAPL") -> dict:
+    return {
+        'event_id': event_id,
+        'symbol': symbol,
+        'event_type': 'surge',
+        'severity': 0.5,
+        'timestamp': timestamp.isoformat(),
+    }
+
+
+def append_events(base_dir: str, prefix: str, count: int):
+    """다른 프로세스에서 같은 세그먼트에 이벤트 추가"""
+    journal = EventJournal(base_dir=base_dir)
+    now = datetime(2024, 6, 28, 12, 0)
+    for i in range(count):
+        journal.append(make_event(f"{prefix}-{i}", now - timedelta(seconds=i), symbol=prefix * 50))
+
+
+def test_recent_events_use_time_index():
+    """최근 이벤트 조회는 기간 안의 이벤트만 최신순으로 반환"""
+    now = datetime(2024, 6, 28, 12, 0)
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = EventJournal(base_dir=tmp)
+        for i in range(48):
+            journal.append(make_event(f"e{i}", now - timedelta(hours=i)))
+
+        recent = journal.get_recent_events(hours=5, now=now)
+        assert [e['event_id'] for e in recent] == ['e0', 'e1', 'e2', 'e3', 'e4', 'e5']
+        assert journal.list_segments() == ['2024-06-26', '2024-06-27', '2024-06-28']
+
+        # 새 인스턴스(재시작)에서도 사이드카 인덱스로 동일하게 조회
+        reopened = EventJournal(base_dir=tmp)
+        assert reopened.get_recent_events(hours=5, now=now) == recent
+    print("✅ 시간 인덱스 조회 테스트 통과")
+
+
+def test_torn_write_recovery():
+    """마지막 줄이 잘린 세그먼트도 복구 후 계속 추가 가능"""
+    now = datetime(2024, 6, 28, 12, 0)
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = EventJournal(base_dir=tmp)
+        journal.append(make_event("ok", now - timedelta(minutes=10)))
+
+        # 비정상 종료로 세그먼트에 반쯤 쓰인 줄이 남은 상황
+        with open(os.path.join(tmp, "events_2024-06-28.jsonl"), 'a') as f:
+            f.write('{"event_id": "torn", "timest')
+
+        reopened = EventJournal(base_dir=tmp)
+        reopened.append(make_event("after", now - timedelta(minutes=5)))
+        ids = [e['event_id'] for e in reopened.get_recent_events(hours=1, now=now)]
+        assert ids == ['after', 'ok']
+    print("✅ 잘린 쓰기 복구 테스트 통과")
+
+
+def test_rotation_compacts_and_expires():
+    """지난 세그먼트는 정렬/중복 제거되고, 보관 기간이 지나면 삭제"""
+    today = datetime(2024, 6, 28, 12, 0)
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = EventJournal(base_dir=tmp)
+        yesterday = today - timedelta(days=1)
+        journal.append(make_event("late", yesterday.replace(hour=15)))
+        journal.append(make_event("early", yesterday.replace(hour=9)))
+        journal.append(make_event("early", yesterday.replace(hour=9)))
+        journal.append(make_event("old", today - timedelta(days=40)))
+        journal.append(make_event("today", today))
+
+        result = journal.rotate(retention_days=30, today=today)
+        assert result['compacted'] == ['2024-06-27']
+        assert len(result['deleted']) == 1
+
+        with open(os.path.join(tmp, "events_2024-06-27.jsonl")) as f:
+            assert [json.loads(line)['event_id'] for line in f] == ['early', 'late']
+        ids = [e['event_id'] for e in journal.get_recent_events(hours=48, now=today)]
+        assert ids == ['today', 'late', 'early']
+    print("✅ 세그먼트 압축/만료 테스트 통과")
+
+
+def test_multi_process_appends():
+    """여러 프로세스가 동시에 추가해도 줄이 섞이지 않고 인덱스 오프셋이 정확"""
+    processes, count = 4, 300
+    with tempfile.TemporaryDirectory() as tmp:
+        ctx = multiprocessing.get_context('spawn')
+        workers = [ctx.Process(target=append_events, args=(tmp, f"p{n}", count)) for n in range(processes)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=120)
+            assert worker.exitcode == 0
+
+        with open(os.path.join(tmp, "events_2024-06-28.jsonl"), 'rb') as f:
+            segment = f.read()
+        lines = segment.splitlines()
+        assert len(lines) == processes * count
+        ids = {json.loads(line)['event_id'] for line in lines}
+        assert len(ids) == processes * count
+
+        # 사이드카 인덱스의 모든 오프셋이 줄의 시작을 가리켜야 함
+        with open(os.path.join(tmp, "events_2024-06-28.idx")) as f:
+            offsets = [int(row.split("\t")[1]) for row in f]
+        assert len(offsets) == processes * count
+        for offset in offsets:
+            assert offset == 0 or segment[offset - 1:offset] == b"\n", offset
+        assert sorted(offsets) == sorted({offset for offset in offsets})
+    print("✅ 다중 프로세스 추가 테스트 통과")
+
+
+def main():
+    print("🧪 이벤트 저널 테스트 시작...")
+    test_recent_events_use_time_index()
+    test_torn_write_recovery()
+    test_rotation_compacts_and_expires()
+    test_multi_process_appends()
+    print("🎉 모든 테스트 통과!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+이벤트 저장소 테스트 (임시 SQLite 파일 사용)
+"""
+
+import sys
+import os
+import tempfile
+from datetime import datetime, timedelta
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from data_monitoring.event_store import EventStore
+from data_monitoring.event_detector import EconomicEvent, EventType
+
+
+def make_event(i: int, now: datetime) -> EconomicEvent:
+    return EconomicEvent(
+        event_id=f"e{i}",
+        symbol=["AAPL", "TSLA", "^VIX"][i % 3],
+        name="테스트",
+        event_type=[EventType.SURGE, EventType.DROP][i % 2],
+        severity=(i % 10) / 10,
+        timestamp=now - timedelta(minutes=i),
+        current_price=100.0 + i,
+        change_percent=1.5,
+        volume=1000,
+        description=f"이벤트 {i}",
+        technical_indicators={'rsi': 55.0},
+        market_context={},
+    )
+
+
+def test_query_filters_and_pagination():
+    """최근 N개, 심볼/유형/심각도/기간 조건과 페이지네이션"""
+    now = datetime(2024, 6, 28, 12, 0)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = EventStore(os.path.join(tmp, "events.sqlite"))
+        assert store.add_events([make_event(i, now) for i in range(30)], source='test') == 30
+        # 같은 event_id는 다시 저장되지 않음
+        assert store.add_events([make_event(0, now)]) == 0
+
+        assert [e['event_id'] for e in store.recent(3)] == ['e0', 'e1', 'e2']
+        assert store.recent(1)[0]['event_type'] == 'surge'
+        assert store.recent(1)[0]['timestamp'] == now.isoformat()
+
+        page1 = store.by_symbol("TSLA", limit=4)
+        page2 = store.by_symbol("TSLA", limit=4, offset=4)
+        assert [e['event_id'] for e in page1 + page2] == ['e1', 'e4', 'e7', 'e10', 'e13', 'e16', 'e19', 'e22']
+
+        severe = store.query(min_severity=0.8, event_type='drop')
+        assert {e['event_id'] for e in severe} == {'e9', 'e19', 'e29'}
+
+        window = store.query(start=now - timedelta(minutes=5), end=now - timedelta(minutes=3))
+        assert [e['event_id'] for e in window] == ['e3', 'e4', 'e5']
+        assert store.count(symbol="AAPL") == 10
+    print("✅ 조건 조회/페이지네이션 테스트 통과")
+
+
+def test_string_severity_and_processed_flag():
+    """문자열 심각도 정규화와 처리 완료 표시가 재시작 후에도 유지"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "events.sqlite")
+        store = EventStore(path)
+        store.add_event({'symbol': 'BTC-USD', 'type': 'price_change', 'severity': 'critical',
+                         'timestamp': datetime.now().isoformat()})
+        event = store.recent(1)[0]
+        assert event['event_type'] == 'price_change'
+        assert event['severity_level'] == 'critical'
+        assert store.count(min_severity=0.9) == 1
+        assert event['processed'] is False
+
+        assert store.mark_processed(event['event_id'])
+        store.close()
+
+        reopened = EventStore(path)
+        assert reopened.recent(1)[0]['processed'] is True
+        assert reopened.count(processed=True) == 1
+    print("✅ 문자열 심각도/처리 표시 테스트 통과")
+
+
+def main():
+    print("🧪 이벤트 저장소 테스트 시작...")
+    test_query_filters_and_pagination()
+    test_string_severity_and_processed_flag()
+    print("🎉 모든 테스트 통과!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+비동기 FRED 클라이언트 테스트 (로컬 가짜 FRED 서버 사용: 동시 조회, 증분 조회, 개정치 반영, 호출 제한)
+"""
+
+import sys
+import os
+import time
+import asyncio
+import tempfile
+import threading
+from datetime import date, timedelta
+
+from aiohttp import web
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from data_monitoring.fred_client import (
+    AsyncFredClient, FredSeriesStore, SlidingWindowRateLimiter, get_rate_limiter, merge_observations,
+    set_rate_limiter
+)
+from data_monitoring.fred_data_collector import FREDDataCollector
+
+LATENCY = 0.05  # 요청당 응답 지연(초)
+
+
+class FakeFredServer:
+    """series / series/observations 엔드포인트만 흉내 내는 로컬 서버"""
+
+    def __init__(self, series_ids):
+        self.series = {}
+        for i, series_id in enumerate(series_ids):
+            start = date(2020, 1, 1)
+            self.series[series_id] = {
+                "last_updated": "2024-01-01 08:00:00-06",
+                "observations": [{"date": (start + timedelta(days=31 * m)).replace(day=1).isoformat(),
+                                  "value": str(100 + i + m)} for m in range(48)],
+            }
+        self.requests = []
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+
+    def start(self):
+        app = web.Application()
+        app.router.add_get("/fred/series", self.handle_series)
+        app.router.add_get("/fred/series/observations", self.handle_observations)
+        self.runner = web.AppRunner(app)
+        self.thread.start()
+        asyncio.run_coroutine_threadsafe(self.runner.setup(), self.loop).result()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        asyncio.run_coroutine_threadsafe(site.start(), self.loop).result()
+        self.port = site._server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{self.port}/fred"
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self.runner.cleanup(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+    async def handle_series(self, request):
+        series_id = request.query["series_id"]
+        self.requests.append(("series", series_id, None))
+        await asyncio.sleep(LATENCY)
+        data = self.series[series_id]
+        return web.json_response({"seriess": [{
+            "id": series_id, "title": f"{series_id} title", "units": "Percent",
+            "frequency": "Monthly", "frequency_short": "M", "last_updated": data["last_updated"]}]})
+
+    async def handle_observations(self, request):
+        series_id = request.query["series_id"]
+        start = request.query.get("observation_start")
+        self.requests.append(("observations", series_id, start))
+        await asyncio.sleep(LATENCY)
+        observations = [obs for obs in self.series[series_id]["observations"] if not start or obs["date"] >= start]
+        return web.json_response({"observations": observations})
+
+    def count(self, kind=None):
+        return sum(1 for k, _, _ in self.requests if kind is None or k == kind)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = time.time()
+
+    def __call__(self):
+        return self.now
+
+
+def test_merge_observations():
+    """같은 날짜는 새 값으로 교체하고 날짜순 정렬"""
+    merged = merge_observations([{"date": "2024-01-01", "value": 1.0}, {"date": "2024-02-01", "value": 2.0}],
+                                [{"date": "2024-02-01", "value": 2.5}, {"date": "2024-03-01", "value": 3.0}])
+    assert [obs["value"] for obs in merged] == [1.0, 2.5, 3.0]
+    print("✅ 관측값 병합 테스트 통과")
+
+
+def test_rate_limiter():
+    """슬라이딩 윈도우 안에서는 max_requests개까지만 통과"""
+    limiter = SlidingWindowRateLimiter(max_requests=3, period=0.3)
+
+    async def run():
+        started = time.monotonic()
+        times = []
+        for _ in range(6):
+            await limiter.acquire()
+            times.append(time.monotonic() - started)
+        return times
+
+    times = asyncio.run(run())
+    assert max(times[:3]) < 0.1
+    assert times[3] >= 0.29 and times[5] < 0.5
+    print("✅ 호출 제한 테스트 통과")
+
+
+def test_shared_rate_limiter():
+    """같은 API 키의 클라이언트는 호출 제한기를 공유하므로 클라이언트를 새로 만들어도 윈도우가 이어짐"""
+    set_rate_limiter("shared-key", SlidingWindowRateLimiter(max_requests=3, period=0.3))
+    try:
+        first = AsyncFredClient("shared-key", "http://127.0.0.1:1")
+        second = AsyncFredClient("shared-key", "http://127.0.0.1:1")
+        other = AsyncFredClient("other-key", "http://127.0.0.1:1")
+        assert first.limiter is second.limiter is get_rate_limiter("shared-key")
+        assert other.limiter is not first.limiter
+
+        async def acquire(count):
+            started = time.monotonic()
+            client = AsyncFredClient("shared-key", "http://127.0.0.1:1")
+            for _ in range(count):
+                await client.limiter.acquire()
+            return time.monotonic() - started
+
+        # 동기 호출마다 새 루프/새 클라이언트를 만드는 수집기 경로와 같은 방식
+        assert asyncio.run(acquire(3)) < 0.1
+        assert asyncio.run(acquire(1)) >= 0.2
+    finally:
+        set_rate_limiter("shared-key", None)
+        set_rate_limiter("other-key", None)
+    print("✅ 호출 제한기 공유 테스트 통과")
+
+
+def test_incremental_refresh():
+    """재확인 간격 안에는 로컬만, 이후에는 바뀐 시리즈만 마지막 저장일 근처부터 조회"""
+    server = FakeFredServer(["FEDFUNDS", "UNRATE"])
+    base_url = server.start()
+    clock = FakeClock()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            store = FredSeriesStore(tmp)
+
+            async def refresh():
+                async with AsyncFredClient("key", base_url, store=store, revision_lookback=2, clock=clock) as client:
+                    return await client.refresh_many(["FEDFUNDS", "UNRATE"]), client.stats
+
+            records, _ = asyncio.run(refresh())
+            assert len(records["FEDFUNDS"]["observations"]) == 48 and server.count() == 4
+
+            # 재확인 간격 안: 요청 없음
+            records, stats = asyncio.run(refresh())
+            assert server.count() == 4 and stats["local_reads"] == 2
+
+            # 간격 이후, last_updated 변화 없음: 메타데이터만 조회
+            clock.now += 13 * 3600
+            asyncio.run(refresh())
+            assert server.count("series") == 4 and server.count("observations") == 2
+
+            # 새 관측값 + 직전 값 개정: 개정 확인 구간부터만 조회
+            fed = server.series["FEDFUNDS"]
+            fed["last_updated"] = "2024-02-01 08:00:00-06"
+            fed["observations"][-1]["value"] = "999"
+            fed["observations"].append({"date": "2024-01-01", "value": "150"})
+            clock.now += 13 * 3600
+            records, stats = asyncio.run(refresh())
+            assert server.requests[-1] == ("observations", "FEDFUNDS", fed["observations"][-4]["date"])
+            observations = records["FEDFUNDS"]["observations"]
+            assert len(observations) == 49 and observations[-1]["value"] == 150.0 and observations[-2]["value"] == 999.0
+            assert stats["incremental_fetches"] == 1 and stats["unchanged"] == 1
+    finally:
+        server.stop()
+    print("✅ 증분 조회 테스트 통과")
+
+
+def test_collector_parallel_and_warm():
+    """수집기 전체 지표 최신화: 콜드는 동시 조회, 웜은 1초 안에 네트워크 없이 완료"""
+    collector = FREDDataCollector("test-key")
+    server = FakeFredServer(list(collector.key_series.values()))
+    collector.base_url = server.start()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            collector.series_store = FredSeriesStore(tmp)
+
+            started = time.perf_counter()
+            cold = collector.collect_key_indicators()
+            cold_elapsed = time.perf_counter() - started
+            serial_estimate = LATENCY * 2 * len(collector.key_series)
+            assert cold["summary"]["collected_indicators"] == len(collector.key_series)
+            assert server.count() == 2 * len(collector.key_series)
+            assert cold_elapsed < serial_estimate / 2, (cold_elapsed, serial_estimate)
+
+            started = time.perf_counter()
+            warm = collector.collect_key_indicators()
+            warm_elapsed = time.perf_counter() - started
+            assert server.count() == 2 * len(collector.key_series)
+            assert warm_elapsed < 1.0, warm_elapsed
+            assert warm["indicators"] == cold["indicators"]
+
+            fedfunds = warm["indicators"]["federal_funds_rate"]
+            assert fedfunds["title"] == "FEDFUNDS title" and fedfunds["data_points"] == 12
+            assert fedfunds["latest_date"] > fedfunds["historical_data"][1]["date"]
+            assert collector.get_series_data("FEDFUNDS", limit=5)[0]["value"] == fedfunds["latest_value"]
+            assert collector.get_series_info("FEDFUNDS")["frequency"] == "Monthly"
+    finally:
+        server.stop()
+    print(f"✅ 수집기 동시 조회 테스트 통과 (콜드 {cold_elapsed:.2f}초, 웜 {warm_elapsed:.3f}초)")
+
+
+def main():
+    print("🧪 비동기 FRED 클라이언트 테스트 시작...")
+    test_merge_observations()
+    test_rate_limiter()
+    test_shared_rate_limiter()
+    test_incremental_refresh()
+    test_collector_parallel_and_warm()
+    print("🎉 모든 테스트 통과!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+공유 OHLCV 히스토리 캐시 테스트 (네트워크 없이 가짜 fetcher 사용)
+"""
+
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from data_monitoring.history_cache import HistoryCache, period_to_days
+
+
+def make_fake_fetcher(calls):
+    """호출 기록을 남기는 가짜 데이터 fetcher"""
+    def fetcher(symbol, period, interval):
+        calls.append((symbol, period, interval))
+        days = int(period_to_days(period))
+        index = pd.bdate_range(end="2024-06-28", periods=days, tz="America/New_York")
+        close = np.linspace(100, 110, len(index))
+        return pd.DataFrame({
+            'Open': close, 'High': close + 1, 'Low': close - 1,
+            'Close': close, 'Volume': np.full(len(index), 1000)
+        }, index=index)
+    return fetcher
+
+
+def test_narrower_period_is_sliced_from_cache():
+    """넓은 구간을 받은 뒤 좁은 구간 요청은 다운로드 없이 응답"""
+    calls = []
+    cache = HistoryCache(fetcher=make_fake_fetcher(calls))
+
+    wide = cache.get_history("AAPL", period="3mo")
+    narrow = cache.get_history("AAPL", period="1mo")
+    two_days = cache.get_history("AAPL", period="2d")
+
+    assert len(calls) == 1
+    assert len(narrow) < len(wide)
+    assert narrow.index[-1] == wide.index[-1]
+    assert len(two_days) == 2
+    assert cache.get_stats()['hits'] == 2
+    print("✅ 좁은 구간 슬라이싱 테스트 통과")
+
+
+def test_wider_period_triggers_refetch():
+    """캐시보다 넓은 구간 요청은 다시 다운로드"""
+    calls = []
+    cache = HistoryCache(fetcher=make_fake_fetcher(calls))
+
+    cache.get_history("MSFT", period="1mo")
+    cache.get_history("MSFT", period="6mo")
+    cache.get_history("MSFT", period="3mo")
+
+    assert [c[1] for c in calls] == ["1mo", "6mo"]
+    print("✅ 넓은 구간 재다운로드 테스트 통과")
+
+
+def test_ttl_and_lru_eviction():
+    """TTL 만료 시 재다운로드, 최대 항목 초과 시 LRU 제거"""
+    calls = []
+    cache = HistoryCache(max_entries=2, ttl_seconds={'1d': 0}, fetcher=make_fake_fetcher(calls))
+
+    cache.get_history("A", period="1mo")
+    cache.get_history("A", period="1mo")
+    assert len(calls) == 2  # TTL 0초 → 매번 만료
+
+    cache.get_history("B", period="1mo")
+    cache.get_history("C", period="1mo")
+    stats = cache.get_stats()
+    assert stats['entries'] == 2
+    assert stats['evictions'] == 1
+    print("✅ TTL/LRU 테스트 통과")
+
+
+def main():
+    print("🧪 히스토리 캐시 테스트 시작...")
+    test_narrower_period_is_sliced_from_cache()
+    test_wider_period_triggers_refetch()
+    test_ttl_and_lru_eviction()
+    print("🎉 모든 테스트 통과!")
+
+
+if __name__ == "__main__":
+    main()
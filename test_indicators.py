@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+벡터화 지표 엔진 테스트 (기존 pandas 계산식과 결과 비교)
+"""
+
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from data_monitoring.indicators import compute_indicators, latest_indicator_frame
+
+
+def make_prices(rows: int = 120, symbols: int = 4, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        100 + rng.standard_normal((rows, symbols)).cumsum(axis=0),
+        columns=[f"SYM{i}" for i in range(symbols)]
+    )
+
+
+def pandas_reference(close: pd.Series) -> dict:
+    """기존 모듈들이 사용하던 pandas 계산식"""
+    delta = close.diff()
+    gain = delta.where(delta > 0, 0).rolling(window=14).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
+    macd = close.ewm(span=12).mean() - close.ewm(span=26).mean()
+    sma = close.rolling(window=20).mean()
+    std = close.rolling(window=20).std()
+    return {
+        'sma_20': sma,
+        'sma_50': close.rolling(window=50).mean(),
+        'ema_12': close.ewm(span=12).mean(),
+        'rsi': 100 - (100 / (1 + gain / loss)),
+        'macd': macd,
+        'macd_signal': macd.ewm(span=9).mean(),
+        'bollinger_upper': sma + std * 2,
+        'bollinger_lower': sma - std * 2,
+    }
+
+
+def test_full_series_matches_pandas():
+    """전체 시계열 결과가 pandas 구현과 일치"""
+    prices = make_prices()
+    result = compute_indicators(prices.values, last_only=False)
+
+    for j, symbol in enumerate(prices.columns):
+        for name, expected in pandas_reference(prices[symbol]).items():
+            assert np.allclose(result[name][:, j], expected.values, equal_nan=True), name
+    print("✅ 전체 시계열 일치 테스트 통과")
+
+
+def test_last_only_matches_full_series():
+    """마지막 값 전용 경로가 전체 계산의 마지막 행과 일치"""
+    prices = make_prices(seed=1)
+    volume = pd.DataFrame(np.full(prices.shape, 1000.0), columns=prices.columns)
+    full = compute_indicators(prices.values, volume.values, last_only=False)
+    last = compute_indicators(prices.values, volume.values, last_only=True)
+
+    for name in last:
+        assert np.allclose(last[name], full[name][-1], equal_nan=True), name
+    print("✅ 마지막 값 경로 일치 테스트 통과")
+
+
+def test_latest_indicator_frame():
+    """심볼별 최신 지표 표 생성"""
+    prices = make_prices(symbols=3)
+    frame = latest_indicator_frame(prices)
+
+    assert list(frame.index) == list(prices.columns)
+    assert {'rsi', 'macd', 'bollinger_width'}.issubset(frame.columns)
+    print("✅ 최신 지표 표 테스트 통과")
+
+
+def main():
+    print("🧪 지표 엔진 테스트 시작...")
+    test_full_series_matches_pandas()
+    test_last_only_matches_full_series()
+    test_latest_indicator_frame()
+    print("🎉 모든 테스트 통과!")
+
+
+if __name__ == "__main__":
+    main()
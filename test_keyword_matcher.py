@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+다중 패턴 키워드 매처 테스트 (단순 부분 문자열 검사와 결과 비교)
+"""
+
+import sys
+import os
+import time
+import random
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from data_monitoring.keyword_matcher import KeywordMatcher
+from data_monitoring.sentiment_analysis import SentimentAnalyzer
+
+WORDS = ["fed", "federal reserve", "rate", "interest rate", "rates", "ever", "ev", "every",
+         "market", "stock", "stocks", "금리", "기준금리", "inflation", "cpi", "apple", "the", "a"]
+
+
+def naive_find(groups, text):
+    text_lower = text.lower()
+    return {group: [k for k in keywords if k.lower() in text_lower] for group, keywords in groups.items()}
+
+
+def test_matches_naive_substring_scan():
+    """겹치거나 접두/접미 관계인 키워드도 단순 검사와 동일하게 찾음"""
+    rng = random.Random(42)
+    groups = {
+        'a': ["fed", "Federal Reserve", "rate", "interest rate", "ev", "every"],
+        'b': ["rates", "ate", "기준금리", "금리", "CPI", "re"],
+        'c': ["market", "stock", "stocks", "rate"],
+    }
+    matcher = KeywordMatcher(groups)
+    for _ in range(500):
+        text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(0, 12)))
+        text = text.replace(" ", rng.choice([" ", "", "-"]), rng.randint(0, 3))
+        assert matcher.find(text) == naive_find(groups, text), text
+    assert matcher.count("Interest rates and the FED", 'a') == 3
+    print("✅ 단순 검사 일치 테스트 통과")
+
+
+def test_sentiment_results_unchanged():
+    """감정 점수/관련성 판단 결과가 기존 구현과 동일"""
+    analyzer = SentimentAnalyzer()
+    texts = [
+        "Apple shares surge to record high on strong earnings",
+        "Tesla stock drops amid weak EV demand and rising concern",
+        "코스피 급등, 외국인 매수세 강세",
+        "Nothing relevant here",
+    ]
+    for text in texts:
+        text_lower = text.lower()
+        positive = sum(1 for w in analyzer.positive_keywords if w in text_lower)
+        negative = sum(1 for w in analyzer.negative_keywords if w in text_lower)
+        expected = max(-1.0, min(1.0, (positive - negative) / len(text.split()) * 10))
+        assert abs(analyzer._calculate_text_sentiment(text) - expected) < 1e-12, text
+
+    assert analyzer._is_relevant_to_symbol("Elon Musk unveils new EV", "TSLA")
+    assert analyzer._is_relevant_to_symbol("Quarterly results out", "AAPL") is False
+    assert analyzer._is_relevant_to_symbol("Stock futures rise", "XYZ")
+    print("✅ 감정 분석 결과 보존 테스트 통과")
+
+
+def test_throughput():
+    """짧은 문서 수천 건을 1초 안팎에 처리"""
+    analyzer = SentimentAnalyzer()
+    rng = random.Random(0)
+    docs = [" ".join(rng.choice(WORDS + ["gain", "loss", "fear", "record"]) for _ in range(40))
+            for _ in range(3000)]
+    started = time.perf_counter()
+    for doc in docs:
+        analyzer._calculate_text_sentiment(doc)
+    elapsed = time.perf_counter() - started
+    assert elapsed < 3.0, elapsed
+    print(f"✅ 처리량 테스트 통과 ({len(docs) / elapsed:,.0f} docs/s)")
+
+
+def main():
+    print("🧪 키워드 매처 테스트 시작...")
+    test_matches_naive_substring_scan()
+    test_sentiment_results_unchanged()
+    test_throughput()
+    print("🎉 모든 테스트 통과!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+LLM 응답 캐시 테스트 (임시 SQLite 파일 사용)
+"""
+
+import sys
+import os
+import asyncio
+import tempfile
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from agents.llm_cache import LLMResponseCache, make_cache_key
+from test_llm_pool import FakeLLM, FakePool
+
+
+def test_key_depends_on_all_inputs():
+    """모델/프롬프트/파라미터가 달라지면 키도 달라짐"""
+    base = make_cache_key("model", "system", "user", {'temperature': 0.7})
+    assert base == make_cache_key("model", "system", "user", {'temperature': 0.7})
+    assert base != make_cache_key("model", "system", "user", {'temperature': 0.2})
+    assert base != make_cache_key("other", "system", "user", {'temperature': 0.7})
+    assert base != make_cache_key("model", "system", "user2", {'temperature': 0.7})
+    print("✅ 캐시 키 테스트 통과")
+
+
+def test_repeat_call_served_from_cache():
+    """같은 입력으로 다시 호출하면 LLM을 부르지 않음 (새 프로세스 가정)"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "llm_cache.sqlite")
+        first_llm = FakeLLM()
+        first = FakePool(first_llm, cache=LLMResponseCache(path), cache_enabled=True)
+        asyncio.run(first.invoke("model", "system", "기사 작성"))
+
+        second_llm = FakeLLM()
+        second = FakePool(second_llm, cache=LLMResponseCache(path), cache_enabled=True)
+        result = asyncio.run(second.invoke("model", "system", "기사 작성"))
+        assert result == "응답: 기사 작성"
+        assert second_llm.calls == 0
+        assert second.cache.get_stats()['hits'] == 1
+
+        # 우회 플래그를 주면 새로 생성
+        asyncio.run(second.invoke("model", "system", "기사 작성", use_cache=False))
+        assert second_llm.calls == 1
+    print("✅ 캐시 재사용/우회 테스트 통과")
+
+
+def test_size_based_eviction():
+    """크기 상한을 넘으면 가장 오래 안 쓴 항목부터 삭제"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = LLMResponseCache(os.path.join(tmp, "llm_cache.sqlite"), max_bytes=250)
+        for i in range(3):
+            cache.put(f"key{i}", "x" * 100)
+            cache.get("key0")  # key0은 계속 사용
+
+        assert cache.get("key0") is not None
+        assert cache.get("key1") is None
+        assert cache.get("key2") is not None
+        stats = cache.get_stats()
+        assert stats['evictions'] == 1
+        assert stats['total_bytes'] <= 250
+    print("✅ 크기 기반 삭제 테스트 통과")
+
+
+def main():
+    print("🧪 LLM 응답 캐시 테스트 시작...")
+    test_key_depends_on_all_inputs()
+    test_repeat_call_served_from_cache()
+    test_size_based_eviction()
+    print("🎉 모든 테스트 통과!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+공유 Bedrock 클라이언트 풀 테스트 (가짜 LLM 사용, AWS 호출 없음)
+"""
+
+import sys
+import os
+import asyncio
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from agents.llm_pool import BedrockClientPool, AdaptiveConcurrencyLimiter
+
+
+class FakeResponse:
+    def __init__(self, content):
+        self.content = content
+
+
+class FakeLLM:
+    """호출 횟수를 기록하고, 지정한 횟수만큼 스로틀링 오류를 내는 LLM"""
+
+    def __init__(self, throttle_times: int = 0):
+        self.calls = 0
+        self.throttle_times = throttle_times
+
+    async def ainvoke(self, messages):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        if self.throttle_times > 0:
+            self.throttle_times -= 1
+            raise Exception("An error occurred (ThrottlingException) when calling the InvokeModel operation")
+        return FakeResponse(f"응답: {messages[-1][1]}")
+
+
+class FakePool(BedrockClientPool):
+    def __init__(self, llm, **kwargs):
+        kwargs.setdefault('cache_enabled', False)
+        super().__init__(base_backoff=0.01, **kwargs)
+        self.fake_llm = llm
+
+    def get_llm(self, model_id, model_kwargs=None):
+        return self.fake_llm
+
+
+def test_identical_prompts_are_coalesced():
+    """동시에 들어온 동일 프롬프트는 한 번만 호출"""
+    llm = FakeLLM()
+    pool = FakePool(llm)
+
+    async def run():
+        return await asyncio.gather(*(pool.invoke("model", "system", "같은 질문") for _ in range(5)),
+                                    pool.invoke("model", "system", "다른 질문"))
+
+    results = asyncio.run(run())
+    assert llm.calls == 2
+    assert results[:5] == ["응답: 같은 질문"] * 5
+    assert pool.stats['coalesced'] == 4
+    print("✅ 동일 프롬프트 병합 테스트 통과")
+
+
+def test_throttling_backoff_and_limit():
+    """스로틀링 시 재시도하고 동시 호출 한도를 줄임"""
+    llm = FakeLLM(throttle_times=2)
+    pool = FakePool(llm, limiter=AdaptiveConcurrencyLimiter(initial=8))
+
+    result = asyncio.run(pool.invoke("model", "system", "질문"))
+    assert result == "응답: 질문"
+    assert llm.calls == 3
+    assert pool.stats['retries'] == 2
+    assert pool.limiter.limit == 2
+    print("✅ 스로틀링 백오프 테스트 통과")
+
+
+def test_adaptive_limit_recovers():
+    """연속 성공 시 한도가 다시 늘어남"""
+    limiter = AdaptiveConcurrencyLimiter(initial=4, increase_after=2)
+    limiter.on_throttle()
+    assert limiter.limit == 2
+    for _ in range(4):
+        limiter.on_success()
+    assert limiter.limit == 4
+    print("✅ 동시 호출 한도 회복 테스트 통과")
+
+
+def main():
+    print("🧪 Bedrock 클라이언트 풀 테스트 시작...")
+    test_identical_prompts_are_coalesced()
+    test_throttling_backoff_and_limit()
+    test_adaptive_limit_recovers()
+    print("🎉 모든 테스트 통과!")
+
+
+if __name__ == "__main__":
+    main()
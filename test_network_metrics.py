@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+네트워크 메트릭 계산기 테스트 (정확/근사 계산, 크기 기반 자동 전환, 그래프 버전 캐시)
+"""
+
+import sys
+import os
+import time
+
+import networkx as nx
+import numpy as np
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from data_monitoring.network_metrics import (
+    NetworkMetricsCalculator, METRICS_MODE_EXACT, METRICS_MODE_APPROXIMATE
+)
+
+
+def test_exact_matches_networkx():
+    """exact 모드는 networkx 정확 계산과 동일"""
+    G = nx.karate_club_graph()
+    result = NetworkMetricsCalculator(mode=METRICS_MODE_EXACT).compute(G)
+    assert result.betweenness == nx.betweenness_centrality(G)
+    assert result.closeness == nx.closeness_centrality(G)
+    assert result.diameter == nx.diameter(G)
+    assert result.average_path_length == nx.average_shortest_path_length(G)
+    assert result.top('degree', 1)[0][0] == 33
+    print("✅ 정확 계산 테스트 통과")
+
+
+def test_approximation_quality():
+    """근사 계산: 지름은 범위 안, 평균 경로/근접 중심성은 정확값에 근접, 상위 매개 노드 일치"""
+    G = nx.connected_watts_strogatz_graph(800, 6, 0.1, seed=1)
+    exact = NetworkMetricsCalculator(mode=METRICS_MODE_EXACT).compute(G)
+    approx = NetworkMetricsCalculator(mode=METRICS_MODE_APPROXIMATE, pivot_samples=100).compute(G)
+
+    assert approx.diameter <= exact.diameter <= approx.diameter_upper_bound
+    assert abs(approx.average_path_length - exact.average_path_length) / exact.average_path_length < 0.05
+    nodes = list(G.nodes())
+    closeness_error = max(abs(approx.closeness[n] - exact.closeness[n]) / exact.closeness[n] for n in nodes)
+    assert closeness_error < 0.15, closeness_error
+    correlation = np.corrcoef([exact.betweenness[n] for n in nodes], [approx.betweenness[n] for n in nodes])[0, 1]
+    assert correlation > 0.8, correlation
+
+    # 피벗이 전체 노드를 덮으면 근접 중심성은 정확값과 같음
+    full = NetworkMetricsCalculator(mode=METRICS_MODE_APPROXIMATE, pivot_samples=len(nodes)).compute(G)
+    assert all(abs(full.closeness[n] - exact.closeness[n]) < 1e-12 for n in nodes)
+    print(f"✅ 근사 품질 테스트 통과 (근접 중심성 최대 오차 {closeness_error:.1%}, 매개 중심성 상관 {correlation:.2f})")
+
+
+def test_disconnected_graph():
+    """피벗이 닿지 않는 작은 성분도 근접 중심성을 계산"""
+    G = nx.disjoint_union(nx.path_graph(300), nx.path_graph(3))
+    G.add_node('isolated')
+    exact = NetworkMetricsCalculator(mode=METRICS_MODE_EXACT).compute(G)
+    approx = NetworkMetricsCalculator(mode=METRICS_MODE_APPROXIMATE, pivot_samples=5).compute(G)
+    assert approx.connected is False and approx.connected_components == 3
+    assert approx.largest_component_size == 300 and approx.diameter is None
+    for node in (300, 301, 302, 'isolated'):
+        assert abs(approx.closeness[node] - exact.closeness[node]) < 1e-12
+    print("✅ 비연결 그래프 테스트 통과")
+
+
+def test_auto_policy_and_speed():
+    """노드 수에 따라 자동 전환하고, 큰 그래프도 빠르게 계산"""
+    calculator = NetworkMetricsCalculator(exact_node_limit=500, pivot_samples=64)
+    assert calculator.resolve_mode(nx.path_graph(100)) == METRICS_MODE_EXACT
+
+    G = nx.barabasi_albert_graph(5000, 3, seed=2)
+    assert calculator.resolve_mode(G) == METRICS_MODE_APPROXIMATE
+    started = time.perf_counter()
+    result = calculator.compute(G)
+    elapsed = time.perf_counter() - started
+    assert result.mode == METRICS_MODE_APPROXIMATE and result.average_path_length > 0
+    assert elapsed < 10.0, elapsed
+    print(f"✅ 자동 전환/속도 테스트 통과 (5000 노드 {elapsed:.1f}초)")
+
+
+def test_cache_per_graph_version():
+    """구조가 같은 그래프는 캐시 사용, 엣지가 바뀌면 다시 계산"""
+    calculator = NetworkMetricsCalculator()
+    G = nx.karate_club_graph()
+    first = calculator.compute(G)
+
+    H = nx.Graph()
+    H.add_edges_from(reversed([(v, u) for u, v in G.edges()]), weight=2.0)
+    assert calculator.compute(H) is first
+    assert calculator.get_stats()['hits'] == 1
+
+    H.add_edge(0, 9)
+    assert calculator.compute(H) is not first
+    assert calculator.get_stats()['misses'] == 2
+    print("✅ 그래프 버전 캐시 테스트 통과")
+
+
+def main():
+    print("🧪 네트워크 메트릭 계산기 테스트 시작...")
+    test_exact_matches_networkx()
+    test_approximation_quality()
+    test_disconnected_graph()
+    test_auto_policy_and_speed()
+    test_cache_per_graph_version()
+    print("🎉 모든 테스트 통과!")
+
+
+if __name__ == "__main__":
+    main()
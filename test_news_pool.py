@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+공유 RSS 뉴스 풀 테스트 (가짜 fetcher 사용, 네트워크 없음)
+"""
+
+import sys
+import os
+import time
+import asyncio
+import threading
+import feedparser
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from data_monitoring.news_pool import NewsPool
+from data_monitoring.sentiment_analysis import SentimentAnalyzer
+
+FEEDS = {
+    "fake://markets": [("Apple iPhone sales surge", "https://news/apple"),
+                       ("Fed holds interest rate", "https://news/fed")],
+    "fake://business": [("Tesla shares drop on weak demand", "https://news/tesla"),
+                        ("Fed holds interest rate", "https://news/fed")],
+}
+
+
+class FakeFetcher:
+    """ETag가 같으면 304를 돌려주는 조건부 GET 흉내"""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, url, etag, modified):
+        with self.lock:
+            self.calls.append((url, etag))
+        time.sleep(self.delay)
+        if etag == f"v1-{url}":
+            return feedparser.FeedParserDict(status=304, entries=[], etag=etag)
+        entries = [feedparser.FeedParserDict(title=title, link=link, summary="")
+                   for title, link in FEEDS[url]]
+        return feedparser.FeedParserDict(status=200, etag=f"v1-{url}", entries=entries,
+                                         feed=feedparser.FeedParserDict(title=url.split("//")[1]))
+
+
+def test_refresh_interval_and_conditional_get():
+    """갱신 주기 안에는 다시 받지 않고, 주기가 지나면 ETag로 304 처리"""
+    fetcher = FakeFetcher()
+    pool = NewsPool(refresh_interval=60, fetcher=fetcher)
+
+    pool.refresh(FEEDS)
+    pool.refresh(FEEDS)
+    assert len(fetcher.calls) == 2
+
+    pool.refresh(FEEDS, force=True)
+    assert sorted(etag for _, etag in fetcher.calls[2:]) == ["v1-fake://business", "v1-fake://markets"]
+    assert pool.get_stats()['not_modified'] == 2
+    # 304 이후에도 이전 항목 유지
+    assert len(pool.get_entries("fake://markets")) == 2
+    print("✅ 갱신 주기/조건부 GET 테스트 통과")
+
+
+def test_dedup_and_search():
+    """여러 피드에 실린 기사는 한 번만 보관하고 역색인으로 조회"""
+    pool = NewsPool(fetcher=FakeFetcher())
+    pool.refresh(FEEDS)
+
+    assert pool.get_stats()['articles'] == 3
+    assert [a.title for a in pool.search(["interest rate"])] == ["Fed holds interest rate"]
+    assert {a.title for a in pool.search(["tesla", "apple"])} == {"Apple iPhone sales surge",
+                                                                   "Tesla shares drop on weak demand"}
+    assert pool.search(["rate interest"]) == []
+    print("✅ 중복 제거/검색 테스트 통과")
+
+
+def test_parallel_fetch():
+    """피드는 동시에 다운로드"""
+    fetcher = FakeFetcher(delay=0.2)
+    pool = NewsPool(fetcher=fetcher)
+    started = time.perf_counter()
+    pool.refresh(FEEDS)
+    assert time.perf_counter() - started < 0.35
+    print("✅ 병렬 수집 테스트 통과")
+
+
+def test_sentiment_fetches_each_feed_once():
+    """여러 심볼을 분석해도 피드 다운로드는 피드 수만큼만"""
+    fetcher = FakeFetcher()
+    analyzer = SentimentAnalyzer(news_pool=NewsPool(fetcher=fetcher))
+    analyzer.news_feeds = list(FEEDS)
+
+    async def run():
+        for symbol in ("AAPL", "TSLA", "MSFT"):
+            await analyzer._collect_news_data(symbol)
+
+    asyncio.run(run())
+    assert sorted(url for url, _ in fetcher.calls) == sorted(FEEDS)
+    print("✅ 감정 분석 피드 1회 수집 테스트 통과")
+
+
+def test_sentiment_scores_pooled_articles_once():
+    """여러 피드에 실린 기사와 여러 심볼에 걸친 기사는 감정 점수를 한 번만 계산"""
+    feeds = {
+        "fake://markets": [("Stock market rally lifts Apple", "https://news/rally"),
+                           ("Tesla shares drop on weak demand", "https://news/tesla")],
+        "fake://business": [("Stock market rally lifts Apple", "https://news/rally")],
+    }
+
+    def fetcher(url, etag, modified):
+        entries = [feedparser.FeedParserDict(title=title, link=link, summary="") for title, link in feeds[url]]
+        return feedparser.FeedParserDict(status=200, entries=entries,
+                                         feed=feedparser.FeedParserDict(title=url.split("//")[1]))
+
+    class CountingAnalyzer(SentimentAnalyzer):
+        def __init__(self, news_pool):
+            super().__init__(news_pool=news_pool)
+            self.scored = []
+
+        def _calculate_text_sentiment(self, text):
+            self.scored.append(text)
+            return super()._calculate_text_sentiment(text)
+
+    analyzer = CountingAnalyzer(NewsPool(fetcher=fetcher))
+    analyzer.news_feeds = list(feeds)
+
+    async def run():
+        return {symbol: await analyzer._collect_news_data(symbol) for symbol in ("AAPL", "TSLA", "MSFT")}
+
+    news = asyncio.run(run())
+    assert [item.title for item in news["AAPL"]] == ["Stock market rally lifts Apple"]
+    assert {item.title for item in news["TSLA"]} == {"Stock market rally lifts Apple",
+                                                     "Tesla shares drop on weak demand"}
+    assert sorted(analyzer.scored) == ["Stock market rally lifts Apple ", "Tesla shares drop on weak demand "]
+    print("✅ 감정 분석 기사 1회 처리 테스트 통과")
+
+
+def main():
+    print("🧪 공유 뉴스 풀 테스트 시작...")
+    test_refresh_interval_and_conditional_get()
+    test_dedup_and_search()
+    test_parallel_fetch()
+    test_sentiment_fetches_each_feed_once()
+    test_sentiment_scores_pooled_articles_once()
+    print("🎉 모든 테스트 통과!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+배치 감정 분석 서비스 테스트 (사전 방식, 캐시, 프로세스 풀 분산)
+"""
+
+import sys
+import os
+import random
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from data_monitoring.sentiment_service import BatchSentimentService, METHOD_LEXICON
+
+WORDS = ["stocks", "surge", "gains", "fall", "fears", "fed", "rate", "market", "record",
+         "crash", "strong", "weak", "the", "on", "상승", "하락", "코스피"]
+
+
+def test_lexicon_scores():
+    """토큰 단위 사전 조회 (복수형 포함) 점수 계산"""
+    service = BatchSentimentService(method=METHOD_LEXICON, positive=["gain", "strong"], negative=["fall", "weak"])
+    results = service.score_batch(["Strong gains today", "Stocks fall on weak data", "", "Nothing here"])
+
+    assert (results[0].positive, results[0].negative) == (2, 0)
+    assert results[0].polarity == 1.0 and results[0].label == 'positive'
+    assert abs(results[0].subjectivity - 2 / 3) < 1e-12
+    assert (results[1].positive, results[1].negative, results[1].label) == (0, 2, 'negative')
+    assert results[2].polarity == 0.0 and results[2].label == 'neutral'
+    assert results[3].subjectivity == 0.0
+    # 부분 문자열은 일치로 보지 않음
+    assert service.score("weakness").negative == 0
+    print("✅ 사전 점수 테스트 통과")
+
+
+def test_batch_matches_single_and_cache():
+    """배치 결과는 한 건씩 계산한 결과와 같고, 같은 텍스트는 다시 계산하지 않음"""
+    rng = random.Random(7)
+    texts = [" ".join(rng.choice(WORDS) for _ in range(rng.randint(0, 15))) for _ in range(300)]
+
+    batch = BatchSentimentService(method=METHOD_LEXICON).score_batch(texts)
+    single = [BatchSentimentService(method=METHOD_LEXICON).score(text) for text in texts]
+    assert batch == single
+
+    service = BatchSentimentService(method=METHOD_LEXICON)
+    service.score_batch(texts)
+    computed = service.get_stats()['computed']
+    assert computed == len(set(texts))
+    service.score_batch(texts)
+    stats = service.get_stats()
+    assert stats['computed'] == computed
+    assert stats['cache_hits'] >= len(texts)
+    print("✅ 배치/단건 일치 및 캐시 테스트 통과")
+
+
+def test_process_pool_matches_serial():
+    """대량 배치의 프로세스 풀 분산 결과는 단일 프로세스 결과와 같음"""
+    rng = random.Random(11)
+    texts = [f"{i} " + " ".join(rng.choice(WORDS) for _ in range(20)) for i in range(600)]
+
+    serial = BatchSentimentService(method=METHOD_LEXICON).score_batch(texts)
+    pooled_service = BatchSentimentService(method=METHOD_LEXICON, process_threshold=100,
+                                           chunk_size=150, max_workers=2)
+    pooled = pooled_service.score_batch(texts)
+    assert pooled == serial
+    print(f"✅ 프로세스 풀 테스트 통과 (분산 배치 {pooled_service.get_stats()['process_batches']}회)")
+
+
+def test_distinct_terms():
+    """distinct_terms=True면 같은 사전 단어 반복은 문서당 한 번만 셈 (Reddit 수집기 방식)"""
+    kwargs = dict(method=METHOD_LEXICON, positive=["good", "profit"], negative=["bad", "risk"])
+    per_occurrence = BatchSentimentService(**kwargs).score("bad bad bad good")
+    assert (per_occurrence.positive, per_occurrence.negative, per_occurrence.label) == (1, 3, 'negative')
+
+    service = BatchSentimentService(distinct_terms=True, **kwargs)
+    distinct = service.score("bad bad bad good")
+    assert (distinct.positive, distinct.negative, distinct.label) == (1, 1, 'neutral')
+    # 복수형도 같은 사전 단어로 취급
+    assert service.score("risks and risk, profits").negative == 1
+
+    rng = random.Random(3)
+    texts = [" ".join(rng.choice(WORDS + ["good", "bad", "risks"]) for _ in range(rng.randint(0, 20)))
+             for _ in range(400)]
+    batch = BatchSentimentService(distinct_terms=True, **kwargs).score_batch(texts)
+    assert batch == [BatchSentimentService(distinct_terms=True, **kwargs).score(text) for text in texts]
+    pooled = BatchSentimentService(distinct_terms=True, process_threshold=100, chunk_size=150,
+                                   max_workers=2, **kwargs).score_batch(texts)
+    assert pooled == batch
+    for text, result in zip(texts, batch):
+        tokens = set(text.split())
+        assert result.negative == len({t.rstrip('s') for t in tokens} & {"bad", "risk"}), text
+    print("✅ 사전 단어 중복 제외 테스트 통과")
+
+
+def main():
+    print("🧪 배치 감정 분석 서비스 테스트 시작...")
+    test_lexicon_scores()
+    test_batch_matches_single_and_cache()
+    test_process_pool_matches_serial()
+    test_distinct_terms()
+    print("🎉 모든 테스트 통과!")
+
+
+if __name__ == "__main__":
+    main()
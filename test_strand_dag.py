@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Strand 의존성 그래프 실행 테스트 (가짜 에이전트 사용, LLM 호출 없음)
+"""
+
+import sys
+import os
+import time
+import asyncio
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from agents.strands_framework import BaseStrandAgent, StrandOrchestrator, StrandStatus
+
+
+class StubAgent(BaseStrandAgent):
+    """지정한 시간만큼 기다린 뒤 결과를 반환(또는 실패)하는 에이전트"""
+
+    def __init__(self, agent_id, delay=0.1, dependencies=None, fail=False, timeout=None, timeline=None):
+        super().__init__(agent_id=agent_id, name=agent_id)
+        self.delay = delay
+        self.dependencies = dependencies or []
+        self.fail = fail
+        self.timeout = timeout
+        self.timeline = timeline if timeline is not None else {}
+
+    def get_capabilities(self):
+        return []
+
+    async def process(self, context, message=None):
+        started = time.perf_counter()
+        try:
+            await asyncio.sleep(self.delay)
+            if self.fail:
+                raise ValueError(f"{self.agent_id} 실패")
+            return {'agent': self.agent_id}
+        finally:
+            self.timeline[self.agent_id] = (started, time.perf_counter())
+
+
+def make_orchestrator(*agents):
+    orchestrator = StrandOrchestrator()
+    for agent in agents:
+        orchestrator.register_agent(agent)
+    return orchestrator
+
+
+def test_independent_agents_run_concurrently():
+    """선행 관계가 없는 에이전트는 동시에, 하위 에이전트는 선행 에이전트가 끝난 뒤 실행"""
+    timeline = {}
+    orchestrator = make_orchestrator(
+        StubAgent('data', 0.2, timeline=timeline),
+        StubAgent('news', 0.2, timeline=timeline),
+        StubAgent('article', 0.1, ['data', 'news'], timeline=timeline),
+        StubAgent('image', 0.1, ['article'], timeline=timeline),
+        StubAgent('ads', 0.1, ['article'], timeline=timeline),
+    )
+    workflow = ['data', 'news', 'article', 'image', 'ads']
+
+    started = time.perf_counter()
+    context = asyncio.run(orchestrator.execute_strand('dag', {}, workflow))
+    elapsed = time.perf_counter() - started
+
+    assert context.status == StrandStatus.COMPLETED, context.error
+    assert set(context.results) == set(workflow)
+    # 순차 실행이면 0.7초, 그래프 실행이면 약 0.4초
+    assert elapsed < 0.6, elapsed
+    assert timeline['article'][0] >= max(timeline['data'][1], timeline['news'][1])
+    assert timeline['image'][0] >= timeline['article'][1] and timeline['ads'][0] >= timeline['article'][1]
+    assert timeline['news'][0] < timeline['data'][1] and timeline['ads'][0] < timeline['image'][1]
+    print(f"✅ 동시 실행/의존 순서 테스트 통과 ({elapsed:.2f}초)")
+
+
+def test_failure_cancels_only_dependents():
+    """실패한 에이전트의 하위 에이전트만 취소하고 관련 없는 분기는 완료"""
+    orchestrator = make_orchestrator(
+        StubAgent('data', 0.05, fail=True),
+        StubAgent('article', 0.05, ['data']),
+        StubAgent('review', 0.05, ['article']),
+        StubAgent('ads', 0.1),
+    )
+    context = asyncio.run(orchestrator.execute_strand('dag', {}, ['data', 'article', 'review', 'ads']))
+
+    assert context.status == StrandStatus.FAILED and 'data 실패' in context.error
+    assert context.agent_status == {
+        'data': StrandStatus.FAILED,
+        'article': StrandStatus.CANCELLED,
+        'review': StrandStatus.CANCELLED,
+        'ads': StrandStatus.COMPLETED,
+    }
+    assert set(context.results) == {'ads'}
+    print("✅ 실패 시 하위 에이전트 취소 테스트 통과")
+
+
+def test_timeout_cancels_only_dependents():
+    """제한 시간을 넘긴 에이전트는 실패 처리되고 하위 에이전트만 취소"""
+    timeline = {}
+    orchestrator = make_orchestrator(
+        StubAgent('slow', 5.0, timeout=0.1, timeline=timeline),
+        StubAgent('child', 0.05, ['slow'], timeline=timeline),
+        StubAgent('other', 0.2, timeline=timeline),
+        StubAgent('other_child', 0.05, ['other'], timeline=timeline),
+    )
+
+    started = time.perf_counter()
+    context = asyncio.run(orchestrator.execute_strand('dag', {}, ['slow', 'child', 'other', 'other_child']))
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 1.0, elapsed
+    assert context.status == StrandStatus.FAILED and '시간 초과' in context.error
+    assert context.agent_status['slow'] == StrandStatus.FAILED
+    assert context.agent_status['child'] == StrandStatus.CANCELLED and 'child' not in timeline
+    assert context.agent_status['other'] == StrandStatus.COMPLETED
+    assert context.agent_status['other_child'] == StrandStatus.COMPLETED
+    print(f"✅ 시간 초과 시 하위 에이전트 취소 테스트 통과 ({elapsed:.2f}초)")
+
+
+def test_sequential_mode_and_cycles():
+    """parallel=False면 workflow 순서대로 하나씩, 순환 의존성은 실행 전에 실패"""
+    timeline = {}
+    orchestrator = make_orchestrator(
+        StubAgent('a', 0.05, timeline=timeline),
+        StubAgent('b', 0.05, timeline=timeline),
+        StubAgent('c', 0.05, timeline=timeline),
+    )
+    context = asyncio.run(orchestrator.execute_strand('seq', {}, ['a', 'b', 'c'], parallel=False))
+    assert context.status == StrandStatus.COMPLETED
+    assert timeline['a'][1] <= timeline['b'][0] and timeline['b'][1] <= timeline['c'][0]
+
+    cyclic = make_orchestrator(StubAgent('x', 0.01, ['y']), StubAgent('y', 0.01, ['x']))
+    context = asyncio.run(cyclic.execute_strand('cycle', {}, ['x', 'y']))
+    assert context.status == StrandStatus.FAILED and '순환 의존성' in context.error
+    assert not context.results
+    print("✅ 순차 실행/순환 의존성 테스트 통과")
+
+
+def main():
+    print("🧪 Strand 의존성 그래프 실행 테스트 시작...")
+    test_independent_agents_run_concurrently()
+    test_failure_cancels_only_dependents()
+    test_timeout_cancels_only_dependents()
+    test_sequential_mode_and_cycles()
+    print("🎉 모든 테스트 통과!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+스트리밍(증분) 지표 테스트 - 일괄 계산 결과 및 체크포인트 복원 비교
+"""
+
+import sys
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from data_monitoring.indicators import compute_indicators
+from data_monitoring.streaming_indicators import StreamingIndicatorBank, StreamingRSI
+
+
+def make_bars(rows: int = 200, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 + rng.standard_normal(rows).cumsum()
+    index = pd.date_range("2024-06-28 09:30", periods=rows, freq="5min", tz="America/New_York")
+    return pd.DataFrame({'Close': close, 'Volume': rng.integers(100, 1000, rows).astype(float)}, index=index)
+
+
+def test_streaming_matches_batch_engine():
+    """EMA/MACD/볼린저/거래량 평균이 일괄 계산 엔진과 일치"""
+    bars = make_bars()
+    bank = StreamingIndicatorBank()
+    bank.update_from_frame("AAPL", bars, include_last=True)
+
+    snapshot = bank.snapshot()["AAPL"]
+    batch = compute_indicators(bars['Close'].values, bars['Volume'].values, last_only=True)
+
+    for name in ['ema_12', 'ema_26', 'macd', 'macd_signal', 'bollinger_upper', 'bollinger_lower']:
+        assert np.isclose(snapshot[name], batch[name][0]), name
+    assert np.isclose(snapshot['volume_avg'], batch['volume_sma'][0])
+    print("✅ 일괄 계산 일치 테스트 통과")
+
+
+def test_wilder_rsi_matches_reference():
+    """Wilder RSI가 표준 계산식과 일치"""
+    close = make_bars(seed=2)['Close']
+    rsi = StreamingRSI(14)
+    for value in close:
+        rsi.update(value)
+
+    delta = close.diff().dropna()
+    gain, loss = delta.clip(lower=0).values, (-delta.clip(upper=0)).values
+    avg_gain, avg_loss = gain[:14].mean(), loss[:14].mean()
+    for g, l in zip(gain[14:], loss[14:]):
+        avg_gain = (avg_gain * 13 + g) / 14
+        avg_loss = (avg_loss * 13 + l) / 14
+    expected = 100 - 100 / (1 + avg_gain / avg_loss)
+
+    assert np.isclose(rsi.value, expected)
+    print("✅ Wilder RSI 테스트 통과")
+
+
+def test_checkpoint_resume_and_duplicate_bars():
+    """체크포인트 복원 후 이어서 갱신한 결과가 한 번에 갱신한 결과와 동일"""
+    bars = make_bars(seed=3)
+    full = StreamingIndicatorBank()
+    full.update_from_frame("MSFT", bars, include_last=True)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "streaming.json")
+        first = StreamingIndicatorBank()
+        first.update_from_frame("MSFT", bars.iloc[:120], include_last=True)
+        first.save(path)
+
+        resumed = StreamingIndicatorBank.load(path)
+        # 이미 반영한 봉이 다시 들어와도 무시되어야 함
+        applied = resumed.update_from_frame("MSFT", bars, include_last=True)
+
+    assert applied == len(bars) - 120
+    expected = full.snapshot()["MSFT"]
+    actual = resumed.snapshot()["MSFT"]
+    for name in ['ema_12', 'rsi', 'macd', 'bollinger_middle', 'volume_avg']:
+        assert np.isclose(actual[name], expected[name]), name
+    print("✅ 체크포인트 복원 테스트 통과")
+
+
+def test_nan_bars_skipped():
+    """종가/거래량이 NaN인 봉은 건너뛰고 지표 상태를 오염시키지 않음"""
+    bars = make_bars(seed=4)
+    gappy = bars.copy()
+    gappy.iloc[50, gappy.columns.get_loc('Close')] = np.nan
+    gappy.iloc[80, gappy.columns.get_loc('Volume')] = np.nan
+    gappy.iloc[81, gappy.columns.get_loc('Close')] = np.inf
+
+    bank = StreamingIndicatorBank()
+    applied = bank.update_from_frame("AAPL", gappy, include_last=True)
+    assert applied == len(bars) - 3
+
+    expected = StreamingIndicatorBank()
+    expected.update_from_frame("AAPL", bars.drop(bars.index[[50, 80, 81]]), include_last=True)
+    actual = bank.snapshot()["AAPL"]
+    for name in ['ema_12', 'ema_26', 'rsi', 'macd', 'bollinger_upper', 'volume_avg']:
+        assert np.isfinite(actual[name]), name
+        assert np.isclose(actual[name], expected.snapshot()["AAPL"][name]), name
+
+    # 결측 봉은 시각도 반영하지 않으므로 같은 시각의 정상 값이 나중에 들어오면 반영
+    next_time = (bars.index[-1] + pd.Timedelta(minutes=5)).to_pydatetime()
+    assert not bank.update_bar("AAPL", next_time, float('nan'), 100.0)
+    assert bank.update_bar("AAPL", next_time, 101.0, 100.0)
+    print("✅ 결측 봉 건너뛰기 테스트 통과")
+
+
+def main():
+    print("🧪 스트리밍 지표 테스트 시작...")
+    test_streaming_matches_batch_engine()
+    test_wilder_rsi_matches_reference()
+    test_checkpoint_resume_and_duplicate_bars()
+    test_nan_bars_skipped()
+    print("🎉 모든 테스트 통과!")
+
+
+if __name__ == "__main__":
+    main()
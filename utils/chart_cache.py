@@ -0,0 +1,227 @@
+"""
+차트 산출물 캐시
+(차트 종류, 심볼, 데이터 지문, 스타일 버전)으로 파일 이름을 정해서
+같은 데이터로 다시 그릴 때는 렌더링을 생략하고 기존 파일 경로를 반환하고,
+output/charts, output/images 아래 파일은 마지막 사용 시각/전체 크기 기준으로 정리
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+CHART_STYLE_VERSION = 1  # 차트 모양(색상, 레이아웃, 해상도 등)을 바꾸면 올려서 기존 파일을 무효화
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # 디렉토리별 파일 크기 합계 상한 (초과 시 오래 안 쓴 파일부터 삭제)
+DEFAULT_MAX_AGE = 7 * 24 * 3600  # 이 시간(초) 동안 쓰지 않은 파일은 삭제
+DEFAULT_EVICT_INTERVAL = 60.0  # 같은 디렉토리를 다시 정리하기까지 최소 간격(초)
+
+
+def _update_hash(digest, part: Any):
+    if isinstance(part, pd.DataFrame):
+        digest.update(b'frame')
+        digest.update(json.dumps([str(c) for c in part.columns]).encode('utf-8'))
+        digest.update(pd.util.hash_pandas_object(part, index=True).values.tobytes())
+    elif isinstance(part, pd.Series):
+        digest.update(b'series')
+        digest.update(str(part.name).encode('utf-8'))
+        digest.update(pd.util.hash_pandas_object(part, index=True).values.tobytes())
+    elif isinstance(part, np.ndarray):
+        digest.update(f"array{part.dtype}{part.shape}".encode('utf-8'))
+        digest.update(np.ascontiguousarray(part).tobytes())
+    elif isinstance(part, dict):
+        digest.update(b'dict')
+        for key in sorted(part, key=str):
+            digest.update(str(key).encode('utf-8'))
+            _update_hash(digest, part[key])
+    elif isinstance(part, (list, tuple)):
+        digest.update(b'list')
+        for item in part:
+            _update_hash(digest, item)
+    else:
+        digest.update(json.dumps(part, sort_keys=True, ensure_ascii=False, default=str).encode('utf-8'))
+    digest.update(b'\x00')
+
+
+def fingerprint(*parts: Any) -> str:
+    """차트 입력 데이터 지문 (DataFrame/Series는 인덱스 포함 값 해시, dict는 키별로 재귀, 나머지는 JSON 직렬화)"""
+    digest = hashlib.sha256()
+    for part in parts:
+        _update_hash(digest, part)
+    return digest.hexdigest()
+
+
+def make_chart_key(chart_type: str, symbol: str, data_hash: str,
+                   style_version: int = CHART_STYLE_VERSION) -> str:
+    """차트 산출물 캐시 키 (SHA-256)"""
+    payload = json.dumps([chart_type, symbol, data_hash, style_version], ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class ChartArtifactCache:
+    """렌더링 결과 파일 캐시
+
+    - 파일 이름에 캐시 키가 들어가므로 별도 인덱스 없이 파일 존재 여부로 적중을 판단
+      (프로세스를 다시 시작해도 같은 데이터의 차트는 재사용)
+    - 적중 시 파일 수정 시각을 갱신해서 정리 순서를 '마지막 사용' 기준으로 유지
+    - 같은 키를 동시에 요청하면 한 번만 렌더링하고, 임시 파일에 쓴 뒤 교체해서 반쯤 쓴 파일을 반환하지 않음
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, max_age: float = DEFAULT_MAX_AGE,
+                 evict_interval: float = DEFAULT_EVICT_INTERVAL, enabled: bool = True,
+                 style_version: int = CHART_STYLE_VERSION, clock: Callable[[], float] = time.time):
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.evict_interval = evict_interval
+        self.enabled = enabled
+        self.style_version = style_version
+        self.clock = clock
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._last_evict: Dict[str, float] = {}
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'renders': 0,
+            'evictions': 0,
+            'errors': 0,
+        }
+
+    def artifact_path(self, directory: str, chart_type: str, symbol: str, data_hash: str,
+                      ext: str = 'png') -> str:
+        """캐시 키가 들어간 결정적 파일 경로"""
+        key = make_chart_key(chart_type, symbol, data_hash, self.style_version)
+        safe_symbol = "".join(c if c.isalnum() or c in "-_" else "_" for c in symbol) or "chart"
+        return os.path.join(directory, f"{safe_symbol}_{chart_type}_{key[:16]}.{ext}")
+
+    def get_or_render(self, chart_type: str, symbol: str, data_hash: str, render: Callable[[str], Any],
+                      directory: str, ext: str = 'png') -> Optional[str]:
+        """캐시된 파일 경로 반환, 없으면 render(임시 경로)로 그린 뒤 저장
+
+        render 예외는 그대로 전달 (호출 측의 기존 오류 처리/폴백 유지)
+        """
+        os.makedirs(directory, exist_ok=True)
+        path = self.artifact_path(directory, chart_type, symbol, data_hash, ext)
+
+        with self._get_key_lock(path):
+            if self.enabled and self._is_valid(path):
+                self._touch(path)
+                self.stats['hits'] += 1
+                return path
+
+            self.stats['misses'] += 1
+            root, _ = os.path.splitext(path)
+            tmp_path = f"{root}.{os.getpid()}.{threading.get_ident()}.tmp.{ext}"
+            try:
+                render(tmp_path)
+                if not os.path.exists(tmp_path):
+                    self.stats['errors'] += 1
+                    self.logger.warning(f"⚠️ 차트 렌더링 결과 파일 없음: {chart_type} {symbol}")
+                    return None
+                os.replace(tmp_path, path)
+                self._touch(path)
+                self.stats['renders'] += 1
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+        self._maybe_evict(directory)
+        return path
+
+    def _touch(self, path: str):
+        now = self.clock()
+        try:
+            os.utime(path, (now, now))
+        except OSError:
+            pass
+
+    def _is_valid(self, path: str) -> bool:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        return stat.st_size > 0 and self.clock() - stat.st_mtime <= self.max_age
+
+    def _get_key_lock(self, path: str) -> threading.Lock:
+        with self._lock:
+            if path not in self._key_locks:
+                self._key_locks[path] = threading.Lock()
+            return self._key_locks[path]
+
+    def _maybe_evict(self, directory: str):
+        now = self.clock()
+        with self._lock:
+            if now - self._last_evict.get(directory, float('-inf')) < self.evict_interval:
+                return
+            self._last_evict[directory] = now
+        self.evict(directory)
+
+    def evict(self, directory: str) -> int:
+        """디렉토리의 오래 안 쓴 파일 삭제 (나이 초과분 먼저, 그래도 크기 상한을 넘으면 오래된 순)"""
+        try:
+            entries = [entry for entry in os.scandir(directory) if entry.is_file()]
+        except OSError:
+            return 0
+
+        now = self.clock()
+        files = []
+        for entry in entries:
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, entry.path))
+        files.sort()
+
+        total = sum(size for _, size, _ in files)
+        removed = 0
+        for mtime, size, path in files:
+            if now - mtime <= self.max_age and total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+
+        if removed:
+            self.stats['evictions'] += removed
+            self.logger.info(f"🧹 차트 캐시 정리: {directory} 파일 {removed}개 삭제")
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """적중률과 렌더링 현황"""
+        lookups = self.stats['hits'] + self.stats['misses']
+        return {
+            **self.stats,
+            'hit_rate': self.stats['hits'] / lookups if lookups else 0.0,
+            'max_bytes': self.max_bytes,
+            'max_age': self.max_age,
+        }
+
+
+_chart_cache: Optional[ChartArtifactCache] = None
+_chart_cache_lock = threading.Lock()
+
+
+def get_chart_cache() -> ChartArtifactCache:
+    """프로세스 전역 차트 산출물 캐시"""
+    global _chart_cache
+    with _chart_cache_lock:
+        if _chart_cache is None:
+            _chart_cache = ChartArtifactCache()
+        return _chart_cache
+
+
+def set_chart_cache(cache: Optional[ChartArtifactCache]):
+    """전역 차트 산출물 캐시 교체 (None이면 다음 조회 시 기본값으로 생성)"""
+    global _chart_cache
+    with _chart_cache_lock:
+        _chart_cache = cache
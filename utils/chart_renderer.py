@@ -0,0 +1,746 @@
+"""
+차트 렌더링 서비스
+matplotlib/WordCloud/Plotly 렌더링을 프로세스 풀의 워커에서 실행해서 이벤트 루프를 막지 않음.
+워커는 시작 시 Agg 백엔드, 폰트 설정, 렌더링 라이브러리를 미리 로드하고,
+호출 측은 선언적 차트 명세(ChartSpec)를 넘겨 결과 파일 경로를 비동기로 받음 (차트 산출물 캐시 경유)
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import platform
+import threading
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.font_manager as fm
+import matplotlib.patches as patches
+import matplotlib.pyplot as plt
+import numpy as np
+
+from .chart_cache import ChartArtifactCache, get_chart_cache, fingerprint
+
+# 기본 워커 수 (이벤트 루프/LLM 호출용으로 코어 1개는 남김)
+DEFAULT_RENDER_WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))
+
+# 기사 이미지 공통 스타일 (워커마다 rc_context로 적용)
+IMAGE_RC = {
+    'font.family': 'DejaVu Sans',
+    'font.size': 10,
+    'axes.titlesize': 14,
+    'axes.labelsize': 12,
+}
+
+
+def setup_matplotlib_fonts():
+    """matplotlib 폰트 설정"""
+    if platform.system() == 'Linux':
+        # Linux에서 사용 가능한 폰트들 시도
+        font_candidates = [
+            'NanumGothic', 'NanumBarunGothic', 'DejaVu Sans',
+            'Liberation Sans', 'Arial', 'sans-serif'
+        ]
+
+        for font_name in font_candidates:
+            try:
+                # 폰트가 존재하는지 확인
+                font_path = fm.findfont(fm.FontProperties(family=font_name))
+                if font_path:
+                    plt.rcParams['font.family'] = font_name
+                    break
+            except:
+                continue
+        else:
+            # 모든 폰트가 실패한 경우 기본 설정
+            plt.rcParams['font.family'] = 'sans-serif'
+
+    # 공통 설정
+    plt.rcParams['axes.unicode_minus'] = False
+    plt.rcParams['font.size'] = 12
+    plt.rcParams['axes.titlesize'] = 16
+    plt.rcParams['axes.labelsize'] = 14
+    plt.rcParams['xtick.labelsize'] = 12
+    plt.rcParams['ytick.labelsize'] = 12
+    plt.rcParams['legend.fontsize'] = 12
+
+
+@dataclass
+class ChartSpec:
+    """선언적 차트 명세
+
+    chart_type은 RENDERERS의 키, data는 렌더러 입력 (워커 프로세스로 전달되므로 피클 가능해야 함).
+    캐시 키는 (chart_type, symbol, data 지문, 스타일 버전)이므로 렌더러는 data 밖의 값(현재 시각 등)을 그리면 안 됨.
+    이미지에 시각을 표시하려면 data['display_time']으로 전달
+    """
+    chart_type: str
+    symbol: str
+    data: Dict[str, Any] = field(default_factory=dict)
+    fmt: str = 'png'
+
+    def fingerprint(self) -> str:
+        return fingerprint(self.data)
+
+
+# ---------------------------------------------------------------------------
+# Plotly 분석 차트 (HTML)
+# ---------------------------------------------------------------------------
+
+def _render_price_volume(spec: ChartSpec, path: str):
+    """가격/거래량 차트"""
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    symbol, hist = spec.symbol, spec.data['hist']
+    fig = make_subplots(
+        rows=2, cols=1,
+        shared_xaxes=True,
+        vertical_spacing=0.1,
+        subplot_titles=(f'{symbol} 가격', '거래량'),
+        row_width=[0.7, 0.3]
+    )
+
+    # 가격 차트
+    fig.add_trace(
+        go.Candlestick(
+            x=hist.index,
+            open=hist['Open'],
+            high=hist['High'],
+            low=hist['Low'],
+            close=hist['Close'],
+            name='가격'
+        ),
+        row=1, col=1
+    )
+
+    # 거래량 차트
+    fig.add_trace(
+        go.Bar(
+            x=hist.index,
+            y=hist['Volume'],
+            name='거래량',
+            marker_color='lightblue'
+        ),
+        row=2, col=1
+    )
+
+    fig.update_layout(
+        title=f'{symbol} 가격 및 거래량',
+        xaxis_rangeslider_visible=False,
+        height=600
+    )
+
+    fig.write_html(path)
+
+
+def _render_technical(spec: ChartSpec, path: str):
+    """기술적 분석 차트 (지표 시계열은 명세에 포함, 없으면 해당 선 생략)"""
+    import plotly.graph_objects as go
+
+    symbol, close = spec.symbol, spec.data['close']
+    fig = go.Figure()
+
+    # 가격 라인
+    fig.add_trace(go.Scatter(
+        x=close.index,
+        y=close,
+        mode='lines',
+        name='종가',
+        line=dict(color='blue')
+    ))
+
+    # 이동평균선
+    if spec.data.get('sma_20') is not None:
+        fig.add_trace(go.Scatter(
+            x=close.index,
+            y=spec.data['sma_20'],
+            mode='lines',
+            name='SMA 20',
+            line=dict(color='orange', dash='dash')
+        ))
+
+    # 볼린저 밴드
+    if spec.data.get('bollinger_upper') is not None and spec.data.get('bollinger_lower') is not None:
+        fig.add_trace(go.Scatter(
+            x=close.index,
+            y=spec.data['bollinger_upper'],
+            mode='lines',
+            name='볼린저 상단',
+            line=dict(color='red', dash='dot')
+        ))
+
+        fig.add_trace(go.Scatter(
+            x=close.index,
+            y=spec.data['bollinger_lower'],
+            mode='lines',
+            name='볼린저 하단',
+            line=dict(color='red', dash='dot'),
+            fill='tonexty',
+            fillcolor='rgba(255,0,0,0.1)'
+        ))
+
+    fig.update_layout(
+        title=f'{symbol} 기술적 분석',
+        xaxis_title='날짜',
+        yaxis_title='가격',
+        height=500
+    )
+
+    fig.write_html(path)
+
+
+def _render_recent(spec: ChartSpec, path: str):
+    """최근 동향 차트"""
+    import plotly.graph_objects as go
+
+    symbol, recent_close = spec.symbol, spec.data['close']
+    fig = go.Figure()
+
+    fig.add_trace(go.Scatter(
+        x=recent_close.index,
+        y=recent_close,
+        mode='lines+markers',
+        name='종가',
+        line=dict(color='green', width=3),
+        marker=dict(size=8)
+    ))
+
+    fig.update_layout(
+        title=f'{symbol} 최근 {len(recent_close)}일 동향',
+        xaxis_title='날짜',
+        yaxis_title='가격',
+        height=400
+    )
+
+    fig.write_html(path)
+
+
+def _render_comparison(spec: ChartSpec, path: str):
+    """시장 비교 차트 (첫날을 100으로 정규화)"""
+    import plotly.graph_objects as go
+
+    symbol, close, market_close = spec.symbol, spec.data['close'], spec.data['market_close']
+    market = spec.data.get('market_symbol', 'SPY')
+    symbol_normalized = (close / close.iloc[0]) * 100
+    market_normalized = (market_close / market_close.iloc[0]) * 100
+
+    fig = go.Figure()
+
+    fig.add_trace(go.Scatter(
+        x=close.index,
+        y=symbol_normalized,
+        mode='lines',
+        name=symbol,
+        line=dict(color='blue')
+    ))
+
+    fig.add_trace(go.Scatter(
+        x=market_close.index,
+        y=market_normalized,
+        mode='lines',
+        name=f'{market} (시장)',
+        line=dict(color='red')
+    ))
+
+    fig.update_layout(
+        title=f'{symbol} vs 시장({market}) 비교',
+        xaxis_title='날짜',
+        yaxis_title='정규화된 가격 (시작일=100)',
+        height=400
+    )
+
+    fig.write_html(path)
+
+
+# ---------------------------------------------------------------------------
+# matplotlib/WordCloud 기사 이미지 (PNG)
+# ---------------------------------------------------------------------------
+
+def _render_article_illustration(spec: ChartSpec, path: str):
+    """기사 내용 기반 정보 이미지"""
+    data = spec.data
+    fig, ax = plt.subplots(1, 1, figsize=(12, 8))
+
+    # 배경 설정
+    ax.set_facecolor('#f8f9fa')
+    fig.patch.set_facecolor('#ffffff')
+
+    # 제목
+    ax.text(0.5, 0.85, data.get('title') or '경제 뉴스', ha='center', va='center',
+           fontsize=20, fontweight='bold', transform=ax.transAxes,
+           bbox=dict(boxstyle='round,pad=0.5', facecolor='lightblue', alpha=0.8))
+
+    # 주요 내용 요약
+    lead_text = (data.get('lead') or '')[:200] + "..."
+    ax.text(0.5, 0.65, lead_text, ha='center', va='center',
+           fontsize=14, transform=ax.transAxes, wrap=True,
+           bbox=dict(boxstyle='round,pad=0.5', facecolor='lightyellow', alpha=0.7))
+
+    # 심볼 및 이벤트 정보
+    info_text = f"심볼: {spec.symbol}\n이벤트: {data.get('event_type', 'N/A')}"
+    if data.get('display_time'):
+        info_text += f"\n이벤트 시간: {data['display_time']}"
+    ax.text(0.5, 0.35, info_text, ha='center', va='center',
+           fontsize=12, transform=ax.transAxes,
+           bbox=dict(boxstyle='round,pad=0.5', facecolor='lightgreen', alpha=0.7))
+
+    # 이미지 프롬프트 표시
+    image_prompt = data.get('image_prompt')
+    if image_prompt:
+        ax.text(0.5, 0.15, f"이미지 컨셉: {image_prompt[:100]}...",
+               ha='center', va='center', fontsize=10,
+               transform=ax.transAxes, style='italic',
+               bbox=dict(boxstyle='round,pad=0.3', facecolor='lightgray', alpha=0.5))
+
+    # 장식 요소 추가
+    ax.add_patch(patches.Rectangle((0.05, 0.05), 0.9, 0.9,
+                                 linewidth=3, edgecolor='navy',
+                                 facecolor='none', transform=ax.transAxes))
+
+    ax.set_xlim(0, 1)
+    ax.set_ylim(0, 1)
+    ax.axis('off')
+
+    plt.tight_layout()
+    plt.savefig(path, dpi=150, bbox_inches='tight', facecolor='white')
+
+
+def _render_volume_spike(spec: ChartSpec, path: str):
+    """거래량 급증 이미지"""
+    symbol, data = spec.symbol, spec.data
+    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 8))
+
+    # 상단: 거래량 비교 차트
+    volume_ratio = data.get('volume_ratio')
+    if volume_ratio:
+        categories = ['평균 거래량', '현재 거래량']
+        values = [1.0, volume_ratio]
+        colors = ['lightblue', 'red' if volume_ratio > 2 else 'orange']
+
+        bars = ax1.bar(categories, values, color=colors, alpha=0.7)
+        ax1.set_title(f'{symbol} 거래량 비교', fontsize=16, fontweight='bold')
+        ax1.set_ylabel('거래량 비율')
+        ax1.grid(True, alpha=0.3)
+
+        # 값 표시
+        for bar, value in zip(bars, values):
+            height = bar.get_height()
+            ax1.text(bar.get_x() + bar.get_width()/2., height + 0.1,
+                    f'{value:.1f}배', ha='center', va='bottom', fontweight='bold')
+
+    # 하단: 이벤트 정보
+    ax2.axis('off')
+
+    # 정보 박스 생성
+    info_text = f"""
+거래량 급증 이벤트
+
+심볼: {symbol}
+이벤트 시간: {data.get('timestamp', 'Unknown')}
+심각도: {data.get('severity', 'Unknown')}
+설명: {data.get('description', 'N/A')}
+    """.strip()
+
+    # 텍스트 박스 추가
+    props = dict(boxstyle='round', facecolor='lightgray', alpha=0.8)
+    ax2.text(0.05, 0.95, info_text, transform=ax2.transAxes, fontsize=11,
+            verticalalignment='top', bbox=props, family='monospace')
+
+    plt.tight_layout()
+    plt.savefig(path, dpi=150, bbox_inches='tight')
+
+
+def _render_price_change(spec: ChartSpec, path: str):
+    """가격 변동 이미지"""
+    symbol, data = spec.symbol, spec.data
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 6))
+
+    # 좌측: 가격 변동 화살표
+    change_percent = data.get('change_percent', 0)
+
+    if change_percent > 0:
+        # 상승 화살표
+        ax1.arrow(0.5, 0.2, 0, 0.6, head_width=0.1, head_length=0.1,
+                 fc='green', ec='green', linewidth=3)
+        ax1.text(0.5, 0.1, f'+{change_percent:.1f}%', ha='center', va='center',
+                fontsize=20, fontweight='bold', color='green')
+        direction_text = "상승"
+    else:
+        # 하락 화살표
+        ax1.arrow(0.5, 0.8, 0, -0.6, head_width=0.1, head_length=0.1,
+                 fc='red', ec='red', linewidth=3)
+        ax1.text(0.5, 0.9, f'{change_percent:.1f}%', ha='center', va='center',
+                fontsize=20, fontweight='bold', color='red')
+        direction_text = "하락"
+
+    ax1.set_xlim(0, 1)
+    ax1.set_ylim(0, 1)
+    ax1.set_title(f'{symbol} 가격 {direction_text}', fontsize=16, fontweight='bold')
+    ax1.axis('off')
+
+    # 우측: 기술적 정보
+    ax2.axis('off')
+
+    info_lines = [f"{symbol} 가격 변동 분석", ""]
+
+    if data.get('current_price'):
+        info_lines.append(f"현재가: ${data['current_price']:.2f}")
+
+    rsi = data.get('rsi')
+    if rsi:
+        rsi_status = "과매수" if rsi > 70 else "과매도" if rsi < 30 else "중립"
+        info_lines.append(f"RSI: {rsi:.1f} ({rsi_status})")
+
+    if data.get('sma_20'):
+        info_lines.append(f"20일 이평: ${data['sma_20']:.2f}")
+
+    if data.get('display_time'):
+        info_lines.extend(["", f"분석 시간: {data['display_time']}"])
+
+    info_text = "\n".join(info_lines)
+    ax2.text(0.05, 0.95, info_text, transform=ax2.transAxes, fontsize=12,
+            verticalalignment='top', family='monospace')
+
+    plt.tight_layout()
+    plt.savefig(path, dpi=150, bbox_inches='tight')
+
+
+def _render_volatility(spec: ChartSpec, path: str):
+    """변동성 게이지 이미지 (volatility는 연율 %)"""
+    symbol, data = spec.symbol, spec.data
+    volatility = data.get('volatility', 25.0)
+    fig, ax = plt.subplots(1, 1, figsize=(10, 8))
+
+    # 게이지 차트 생성
+    theta = np.linspace(0, np.pi, 100)
+
+    # 배경 호
+    ax.plot(np.cos(theta), np.sin(theta), 'k-', linewidth=8, alpha=0.3)
+
+    # 변동성 수준에 따른 색상 구간
+    low_theta = theta[theta <= np.pi/3]
+    med_theta = theta[(theta > np.pi/3) & (theta <= 2*np.pi/3)]
+    high_theta = theta[theta > 2*np.pi/3]
+
+    ax.plot(np.cos(low_theta), np.sin(low_theta), 'g-', linewidth=8, label='낮음 (0-20%)')
+    ax.plot(np.cos(med_theta), np.sin(med_theta), 'y-', linewidth=8, label='보통 (20-40%)')
+    ax.plot(np.cos(high_theta), np.sin(high_theta), 'r-', linewidth=8, label='높음 (40%+)')
+
+    # 현재 변동성 위치 표시
+    vol_angle = np.pi * (1 - min(volatility / 60, 1))  # 60%를 최대로 정규화
+    needle_x = np.cos(vol_angle)
+    needle_y = np.sin(vol_angle)
+
+    ax.arrow(0, 0, needle_x*0.8, needle_y*0.8, head_width=0.05, head_length=0.05,
+            fc='black', ec='black', linewidth=3)
+
+    # 중앙에 변동성 값 표시
+    ax.text(0, -0.3, f'{volatility:.1f}%', ha='center', va='center',
+           fontsize=24, fontweight='bold')
+    ax.text(0, -0.45, '연율 변동성', ha='center', va='center',
+           fontsize=14)
+
+    ax.set_xlim(-1.2, 1.2)
+    ax.set_ylim(-0.6, 1.2)
+    ax.set_aspect('equal')
+    ax.axis('off')
+    ax.set_title(f'{symbol} 변동성 분석', fontsize=18, fontweight='bold', pad=20)
+    ax.legend(loc='upper right')
+
+    # 추가 정보 텍스트
+    info_text = f"""
+변동성 수준: {'높음' if volatility > 40 else '보통' if volatility > 20 else '낮음'}
+위험도: {'고위험' if volatility > 40 else '중위험' if volatility > 20 else '저위험'}
+    """.strip()
+    if data.get('display_time'):
+        info_text += f"\n분석 시간: {data['display_time']}"
+
+    ax.text(-1.1, -0.5, info_text, fontsize=10, verticalalignment='top',
+           bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.7))
+
+    plt.tight_layout()
+    plt.savefig(path, dpi=150, bbox_inches='tight')
+
+
+def _render_default(spec: ChartSpec, path: str):
+    """기본 정보 이미지"""
+    data = spec.data
+    fig, ax = plt.subplots(1, 1, figsize=(10, 6))
+
+    # 심플한 정보 표시 이미지
+    ax.text(0.5, 0.7, spec.symbol, ha='center', va='center',
+           fontsize=36, fontweight='bold', transform=ax.transAxes)
+
+    ax.text(0.5, 0.5, data.get('title') or '경제 뉴스', ha='center', va='center',
+           fontsize=16, transform=ax.transAxes, wrap=True)
+
+    ax.text(0.5, 0.3, f"이벤트: {data.get('event_type', 'Unknown')}",
+           ha='center', va='center', fontsize=14, transform=ax.transAxes)
+
+    if data.get('display_time'):
+        ax.text(0.5, 0.1, f"이벤트 시간: {data['display_time']}",
+               ha='center', va='center', fontsize=12, transform=ax.transAxes)
+
+    ax.set_xlim(0, 1)
+    ax.set_ylim(0, 1)
+    ax.axis('off')
+
+    # 배경 색상
+    ax.add_patch(patches.Rectangle((0, 0), 1, 1, facecolor='lightblue', alpha=0.3))
+
+    plt.tight_layout()
+    plt.savefig(path, dpi=150, bbox_inches='tight')
+
+
+def _render_wordcloud(spec: ChartSpec, path: str):
+    """기사 키워드 워드클라우드 (words는 불용어 제거 후 단어 목록)"""
+    from wordcloud import WordCloud
+
+    wordcloud = WordCloud(
+        width=800, height=400,
+        background_color='white',
+        max_words=50,
+        font_path=None,  # 시스템 기본 폰트 사용
+        colormap='viridis'
+    ).generate(' '.join(spec.data['words']))
+
+    plt.figure(figsize=(10, 5))
+    plt.imshow(wordcloud, interpolation='bilinear')
+    plt.axis('off')
+    plt.title(f'{spec.symbol} 기사 키워드', fontsize=16, fontweight='bold', pad=20)
+    plt.tight_layout()
+    plt.savefig(path, dpi=150, bbox_inches='tight')
+
+
+def _render_fallback(spec: ChartSpec, path: str):
+    """간단한 폴백 이미지"""
+    fig, ax = plt.subplots(1, 1, figsize=(8, 6))
+
+    ax.text(0.5, 0.6, spec.symbol, ha='center', va='center',
+           fontsize=32, fontweight='bold', transform=ax.transAxes)
+
+    ax.text(0.5, 0.4, spec.data.get('title', ''), ha='center', va='center',
+           fontsize=18, transform=ax.transAxes)
+
+    if spec.data.get('display_time'):
+        ax.text(0.5, 0.2, f"기준 시간: {spec.data['display_time']}",
+               ha='center', va='center', fontsize=12, transform=ax.transAxes)
+
+    ax.set_xlim(0, 1)
+    ax.set_ylim(0, 1)
+    ax.axis('off')
+
+    plt.tight_layout()
+    plt.savefig(path, dpi=150, bbox_inches='tight')
+
+
+# chart_type -> 렌더러 (렌더러는 워커에서 이름으로 찾으므로 모듈 최상위 함수여야 함)
+RENDERERS: Dict[str, Callable[[ChartSpec, str], None]] = {
+    'price_volume': _render_price_volume,
+    'technical': _render_technical,
+    'recent': _render_recent,
+    'comparison': _render_comparison,
+    'article_illustration': _render_article_illustration,
+    'volume_spike': _render_volume_spike,
+    'price_change': _render_price_change,
+    'volatility': _render_volatility,
+    'default': _render_default,
+    'wordcloud': _render_wordcloud,
+    'fallback': _render_fallback,
+}
+
+
+def render_spec(spec: ChartSpec, path: str) -> str:
+    """명세 하나를 path에 렌더링 (워커 프로세스에서 실행)"""
+    renderer = RENDERERS.get(spec.chart_type)
+    if renderer is None:
+        raise ValueError(f"알 수 없는 차트 종류: {spec.chart_type}")
+    try:
+        with plt.rc_context(IMAGE_RC if spec.fmt == 'png' else {}):
+            renderer(spec, path)
+    finally:
+        plt.close('all')
+    return path
+
+
+def _init_worker():
+    """워커 시작 시 백엔드/폰트/렌더링 라이브러리 미리 로드"""
+    matplotlib.use('Agg')
+    setup_matplotlib_fonts()
+    import plotly.graph_objects  # noqa: F401
+    import plotly.io  # noqa: F401
+    import wordcloud  # noqa: F401
+
+
+def _worker_ping() -> int:
+    time.sleep(0.05)  # 한 워커가 모든 예열 요청을 가져가지 않도록 잠시 점유
+    return os.getpid()
+
+
+class ChartRenderService:
+    """프로세스 풀 기반 차트 렌더링 서비스
+
+    - render(spec, directory): 차트 산출물 캐시에 있으면 바로 경로 반환, 없으면 워커에서 렌더링
+      (같은 명세를 동시에 요청하면 한 번만 렌더링)
+    - render_many(): 여러 명세를 워커 수만큼 병렬 렌더링
+    - 워커가 비정상 종료되면 풀을 다시 만들어 한 번 재시도하고,
+      프로세스를 띄울 수 없는 환경이면 단일 스레드 워커로 대체 (pyplot 전역 상태는 스레드 안전하지 않음)
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, chart_cache: Optional[ChartArtifactCache] = None,
+                 use_processes: bool = True):
+        self.max_workers = max_workers or DEFAULT_RENDER_WORKERS
+        self.chart_cache = chart_cache or get_chart_cache()
+        self.use_processes = use_processes
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._executor: Optional[Executor] = None
+        self._warmup: List[Future] = []
+        # 워커 결과를 기다리는 스레드 (캐시의 키별 잠금/원자적 교체를 그대로 쓰기 위해 이벤트 루프 밖에서 대기)
+        self._waiters = ThreadPoolExecutor(max_workers=max(4, self.max_workers * 2),
+                                           thread_name_prefix='chart-render-wait')
+        self.stats = {
+            'requests': 0,
+            'rendered': 0,
+            'failed': 0,
+            'pool_restarts': 0,
+            'render_seconds': 0.0,
+        }
+
+    def _create_executor(self) -> Executor:
+        if self.use_processes:
+            return ProcessPoolExecutor(max_workers=self.max_workers,
+                                       mp_context=multiprocessing.get_context('spawn'),
+                                       initializer=_init_worker)
+        return ThreadPoolExecutor(max_workers=1, initializer=_init_worker,
+                                  thread_name_prefix='chart-render')
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = self._create_executor()
+            return self._executor
+
+    def _restart(self, broken: Optional[Executor], error: Exception):
+        """고장 난 풀을 버리고 다음 제출 때 새로 만들게 함 (이미 교체된 풀이면 무시)"""
+        with self._lock:
+            if broken is None or self._executor is not broken:
+                return
+            self.stats['pool_restarts'] += 1
+            if isinstance(error, OSError) and self.use_processes:
+                self.logger.warning(f"⚠️ 렌더링 워커 프로세스를 띄울 수 없어 스레드로 대체합니다: {error}")
+                self.use_processes = False
+            else:
+                self.logger.warning(f"⚠️ 렌더링 워커 풀 재시작: {error}")
+            broken.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            self._warmup = []
+
+    def _submit_tracked(self, fn: Callable, *args) -> Tuple[Executor, Future]:
+        """작업 제출 후 (실제로 받은 풀, Future) 반환 (제출이 실패하면 풀을 재시작하고 한 번 재시도)"""
+        executor = self._get_executor()
+        try:
+            return executor, executor.submit(fn, *args)
+        except (BrokenProcessPool, OSError, RuntimeError) as e:
+            self._restart(executor, e)
+            executor = self._get_executor()
+            return executor, executor.submit(fn, *args)
+
+    def _submit(self, fn: Callable, *args) -> Future:
+        return self._submit_tracked(fn, *args)[1]
+
+    def start(self, wait: bool = False, timeout: float = 120.0) -> List[int]:
+        """워커 예열 (첫 차트 전에 프로세스 기동과 라이브러리/폰트 로딩을 끝냄, 여러 번 호출해도 한 번만 예열)
+
+        워커는 메인 모듈을 다시 import하므로 import/생성 시점이 아니라 실제 작업 시작 시 호출해야 함.
+        wait=True면 예열이 끝날 때까지 기다리고 응답한 워커 PID 목록 반환
+        """
+        with self._lock:
+            started = bool(self._warmup)
+        if not started:
+            futures = [self._submit(_worker_ping) for _ in range(self.max_workers)]
+            with self._lock:
+                self._warmup = self._warmup or futures
+        if not wait:
+            return []
+        return [future.result(timeout=timeout) for future in list(self._warmup)]
+
+    def _render_blocking(self, spec: ChartSpec, tmp_path: str):
+        started = time.perf_counter()
+        try:
+            executor, future = self._submit_tracked(render_spec, spec, tmp_path)
+            try:
+                future.result()
+            except BrokenProcessPool as e:
+                # 워커가 비정상 종료된 경우 새 풀에서 한 번 재시도
+                # (같은 풀에서 실패한 다른 작업이 이미 재시작했다면 새 풀을 다시 버리지 않음)
+                self._restart(executor, e)
+                self._submit(render_spec, spec, tmp_path).result()
+        except Exception:
+            self.stats['failed'] += 1
+            raise
+        self.stats['rendered'] += 1
+        self.stats['render_seconds'] += time.perf_counter() - started
+
+    def render_sync(self, spec: ChartSpec, directory: str) -> Optional[str]:
+        """명세를 렌더링해서 파일 경로 반환 (블로킹, 캐시 적중 시 렌더링 생략)"""
+        self.stats['requests'] += 1
+        return self.chart_cache.get_or_render(
+            spec.chart_type, spec.symbol, spec.fingerprint(),
+            lambda tmp_path: self._render_blocking(spec, tmp_path),
+            directory, ext=spec.fmt
+        )
+
+    async def render(self, spec: ChartSpec, directory: str) -> Optional[str]:
+        """명세를 렌더링해서 파일 경로 반환 (이벤트 루프는 막지 않음)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._waiters, self.render_sync, spec, directory)
+
+    async def render_many(self, specs: List[ChartSpec], directory: str) -> List[Any]:
+        """여러 명세 병렬 렌더링 (실패한 항목은 예외 객체로 반환)"""
+        return await asyncio.gather(*(self.render(spec, directory) for spec in specs),
+                                    return_exceptions=True)
+
+    def shutdown(self, wait: bool = True):
+        """워커 풀 종료"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=not wait)
+        self._waiters.shutdown(wait=wait)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """렌더링 현황과 캐시 통계"""
+        return {
+            **self.stats,
+            'max_workers': self.max_workers,
+            'use_processes': self.use_processes,
+            'cache': self.chart_cache.get_stats(),
+        }
+
+
+_chart_renderer: Optional[ChartRenderService] = None
+_chart_renderer_lock = threading.Lock()
+
+
+def get_chart_renderer() -> ChartRenderService:
+    """프로세스 전역 차트 렌더링 서비스 (워커는 첫 예열/렌더링 요청 시 기동)"""
+    global _chart_renderer
+    with _chart_renderer_lock:
+        if _chart_renderer is None:
+            _chart_renderer = ChartRenderService()
+        return _chart_renderer
+
+
+def set_chart_renderer(renderer: Optional[ChartRenderService]):
+    """전역 차트 렌더링 서비스 교체 (이전 서비스의 워커는 종료, None이면 다음 조회 시 기본값으로 생성)"""
+    global _chart_renderer
+    with _chart_renderer_lock:
+        previous, _chart_renderer = _chart_renderer, renderer
+    if previous is not None and previous is not renderer:
+        previous.shutdown(wait=False)
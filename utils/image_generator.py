@@ -15,6 +15,12 @@ import base64
 from typing import Dict, List, Optional, Tuple
 import logging
 import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_monitoring.indicators import indicator_series
+from data_monitoring.history_cache import get_history_cache
+from utils.chart_cache import get_chart_cache, fingerprint
 
 class ArticleImageGenerator:
     """기사용 이미지 생성 클래스"""
@@ -39,63 +45,70 @@ class ArticleImageGenerator:
         # 출력 디렉토리
         self.output_dir = "output/images"
         os.makedirs(self.output_dir, exist_ok=True)
+        
+        # 차트 산출물 캐시 (같은 데이터의 차트는 다시 그리지 않음)
+        self.chart_cache = get_chart_cache()
     
     def generate_stock_chart(self, symbol: str, period: str = "1mo") -> str:
         """주식 차트 생성"""
         try:
-            # 데이터 수집
-            ticker = yf.Ticker(symbol)
-            data = ticker.history(period=period)
+            # 데이터 수집 (공유 히스토리 캐시)
+            data = get_history_cache().get_history(symbol, period=period)
             
             if data.empty:
                 return None
             
-            # 차트 생성
-            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8), 
-                                          gridspec_kw={'height_ratios': [3, 1]})
-            
-            # 가격 차트
-            ax1.plot(data.index, data['Close'], color=self.colors['primary'], 
-                    linewidth=2, label='Close Price')
-            ax1.fill_between(data.index, data['Close'], alpha=0.3, 
-                           color=self.colors['primary'])
-            
-            # 이동평균선 추가
-            data['MA20'] = data['Close'].rolling(window=20).mean()
-            data['MA50'] = data['Close'].rolling(window=50).mean()
-            
-            ax1.plot(data.index, data['MA20'], color=self.colors['warning'], 
-                    linewidth=1, label='MA20', alpha=0.8)
-            ax1.plot(data.index, data['MA50'], color=self.colors['danger'], 
-                    linewidth=1, label='MA50', alpha=0.8)
-            
-            ax1.set_title(f'{symbol} Stock Price Chart', fontsize=16, fontweight='bold')
-            ax1.set_ylabel('Price ($)', fontsize=12)
-            ax1.legend()
-            ax1.grid(True, alpha=0.3)
-            
-            # 거래량 차트
-            colors = ['red' if close < open else 'green' 
-                     for close, open in zip(data['Close'], data['Open'])]
-            ax2.bar(data.index, data['Volume'], color=colors, alpha=0.6)
-            ax2.set_title('Trading Volume', fontsize=12)
-            ax2.set_ylabel('Volume', fontsize=10)
-            ax2.grid(True, alpha=0.3)
-            
-            plt.tight_layout()
-            
-            # 파일 저장
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{self.output_dir}/stock_chart_{symbol}_{timestamp}.png"
-            plt.savefig(filename, dpi=300, bbox_inches='tight')
-            plt.close()
-            
-            return filename
+            # 같은 데이터로 이미 그린 차트가 있으면 재사용 (캐시된 히스토리는 복사본에 이동평균 추가)
+            return self.chart_cache.get_or_render(
+                f'stock_chart_{period}', symbol, fingerprint(data),
+                lambda filename: self._render_stock_chart(symbol, data.copy(), filename),
+                self.output_dir
+            )
             
         except Exception as e:
             self.logger.error(f"주식 차트 생성 실패 {symbol}: {str(e)}")
             return None
     
+    def _render_stock_chart(self, symbol: str, data: pd.DataFrame, filename: str):
+        """주식 차트 렌더링 (가격/이동평균 + 거래량)"""
+        # 차트 생성
+        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8), 
+                                      gridspec_kw={'height_ratios': [3, 1]})
+        
+        # 가격 차트
+        ax1.plot(data.index, data['Close'], color=self.colors['primary'], 
+                linewidth=2, label='Close Price')
+        ax1.fill_between(data.index, data['Close'], alpha=0.3, 
+                       color=self.colors['primary'])
+        
+        # 이동평균선 추가
+        data['MA20'] = data['Close'].rolling(window=20).mean()
+        data['MA50'] = data['Close'].rolling(window=50).mean()
+        
+        ax1.plot(data.index, data['MA20'], color=self.colors['warning'], 
+                linewidth=1, label='MA20', alpha=0.8)
+        ax1.plot(data.index, data['MA50'], color=self.colors['danger'], 
+                linewidth=1, label='MA50', alpha=0.8)
+        
+        ax1.set_title(f'{symbol} Stock Price Chart', fontsize=16, fontweight='bold')
+        ax1.set_ylabel('Price ($)', fontsize=12)
+        ax1.legend()
+        ax1.grid(True, alpha=0.3)
+        
+        # 거래량 차트
+        colors = ['red' if close < open else 'green' 
+                 for close, open in zip(data['Close'], data['Open'])]
+        ax2.bar(data.index, data['Volume'], color=colors, alpha=0.6)
+        ax2.set_title('Trading Volume', fontsize=12)
+        ax2.set_ylabel('Volume', fontsize=10)
+        ax2.grid(True, alpha=0.3)
+        
+        plt.tight_layout()
+        
+        # 파일 저장
+        plt.savefig(filename, dpi=300, bbox_inches='tight')
+        plt.close()
+    
     def generate_market_overview_chart(self, symbols: List[str]) -> str:
         """시장 개요 차트 생성"""
         try:
@@ -295,27 +308,18 @@ class ArticleImageGenerator:
     
     def _calculate_rsi(self, prices: pd.Series, period: int = 14) -> pd.Series:
         """RSI 계산"""
-        delta = prices.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-        rs = gain / loss
-        return 100 - (100 / (1 + rs))
+        return indicator_series(prices, ['rsi'], params={'rsi_period': period})['rsi']
     
     def _calculate_macd(self, prices: pd.Series) -> Tuple[pd.Series, pd.Series]:
         """MACD 계산"""
-        ema12 = prices.ewm(span=12).mean()
-        ema26 = prices.ewm(span=26).mean()
-        macd = ema12 - ema26
-        signal = macd.ewm(span=9).mean()
-        return macd, signal
+        series = indicator_series(prices, ['macd', 'macd_signal'])
+        return series['macd'], series['macd_signal']
     
     def _calculate_bollinger_bands(self, prices: pd.Series, period: int = 20, std_dev: int = 2) -> Tuple[pd.Series, pd.Series]:
         """볼린저 밴드 계산"""
-        sma = prices.rolling(window=period).mean()
-        std = prices.rolling(window=period).std()
-        upper = sma + (std * std_dev)
-        lower = sma - (std * std_dev)
-        return upper, lower
+        series = indicator_series(prices, ['bollinger_upper', 'bollinger_lower'],
+                                  params={'bb_period': period, 'bb_std': std_dev})
+        return series['bollinger_upper'], series['bollinger_lower']
     
     def generate_article_images(self, article_data: Dict, symbols: List[str] = None) -> List[str]:
         """기사용 이미지 패키지 생성"""